@@ -15,6 +15,7 @@ from vectorbt.base import (
     indexing,
     reshape_fns
 )
+from vectorbt.utils import checks
 
 defaults.broadcasting['index_from'] = 'stack'
 defaults.broadcasting['columns_from'] = 'stack'
@@ -708,6 +709,35 @@ class TestArrayWrapper:
             pd.DataFrame(np.array([[0, 1, 2], [3, 4, 5]]), index=['x', 'y'], columns=['m', 'n', 'l'])
         )
 
+    def test_wrap_fast(self):
+        # no copies
+        a = np.array([[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]])
+        assert np.shares_memory(df4_wrapper.wrap(a).values, a)
+        assert np.shares_memory(df4_wrapper.wrap_reduced(a, index=['x', 'y', 'z']).values, a)
+        # metadata is resolved once
+        assert df4_wrapper.wrap(a).columns is df4_wrapper.wrap(a).columns
+        assert df4_grouped_wrapper_co.get_wrap_meta() is df4_grouped_wrapper_co.get_wrap_meta()
+        # raw arrays
+        np.testing.assert_array_equal(df4_wrapper.wrap(a, to_pd=False), a)
+        np.testing.assert_array_equal(sr2_wrapper.wrap(a[:, [0]], to_pd=False), a[:, 0])
+        np.testing.assert_array_equal(
+            df4_grouped_wrapper_co.wrap(a[:, :2], to_pd=False),
+            df4_grouped_wrapper_co.wrap(a[:, :2]).values
+        )
+        np.testing.assert_array_equal(df4_wrapper.wrap_reduced(a[0], to_pd=False), a[0])
+        np.testing.assert_array_equal(sr2_wrapper.wrap_reduced(a[:, [0]], to_pd=False), a[:, 0])
+        assert df4_grouped_wrapper_co.iloc[0].wrap_reduced(np.array([1]), to_pd=False) == 1
+        assert df4_grouped_wrapper_co.iloc[0].wrap_reduced(np.array([1]), to_pd=False).ndim == 0
+        # grouping is resolved by type
+        multi_wrapper = array_wrapper.ArrayWrapper(
+            index=df4.index,
+            columns=pd.MultiIndex.from_arrays([['a', 'a', 'b'], ['x', 'y', 'z']]),
+            ndim=2
+        )
+        assert len(multi_wrapper.get_wrap_meta(group_by=False)[0]) == 3
+        assert len(multi_wrapper.get_wrap_meta(group_by=0)[0]) == 2
+        assert df4_wrapper.wrap(a, dtype=np.int_, to_pd=False).dtype == np.int_
+
     def test_grouped_wrapping(self):
         pd.testing.assert_frame_equal(
             df4_grouped_wrapper_co.wrap(np.array([[1, 2], [3, 4], [5, 6]])),
@@ -1699,6 +1729,22 @@ class TestReshapeFns:
         assert not np.isfortran(a)
         assert not np.isfortran(b)
 
+    def test_broadcast_memmap(self, tmp_path):
+        a = np.memmap(str(tmp_path / 'a.dat'), dtype=np.float_, mode='w+', shape=(3, 1))
+        a[:] = np.arange(3)[:, None]
+        a.flush()
+        a = np.memmap(str(tmp_path / 'a.dat'), dtype=np.float_, mode='r', shape=(3, 1))
+        b = np.array([[1., 2.]])
+        new_a, new_b = reshape_fns.broadcast(a, b, require_kwargs=dict(requirements='W'))
+        assert checks.is_memmap(new_a)  # not copied
+        assert not new_a.flags.writeable
+        assert type(new_a) == np.ndarray
+        assert new_b.flags.writeable
+        np.testing.assert_array_equal(new_a, np.array([[0., 0.], [1., 1.], [2., 2.]]))
+        new_a, new_b = reshape_fns.broadcast(a, b, require_kwargs=dict(requirements='W'), keep_raw=True)
+        assert checks.is_memmap(new_a)
+        assert new_a.shape == (3, 1)
+
     def test_broadcast_meta(self):
         _0, _a2, _sr2, _df2 = reshape_fns.broadcast(0, a2, sr2, df2, keep_raw=True)
         assert _0 == 0
@@ -2279,6 +2325,10 @@ class TestCombineFns:
             combine_fns.apply_and_concat_one_nb(3, apply_func_nb, sr2.values, (10, 20, 30)),
             target
         )
+        np.testing.assert_array_equal(
+            combine_fns.apply_and_concat_one_parallel_nb(3, apply_func_nb, sr2.values, np.array([10, 20, 30])),
+            target
+        )
         # 2d
         target2 = np.array([
             [11, 12, 13, 21, 22, 23, 31, 32, 33],
@@ -2293,6 +2343,10 @@ class TestCombineFns:
             combine_fns.apply_and_concat_one_nb(3, apply_func_nb, df4.values, (10, 20, 30)),
             target2
         )
+        np.testing.assert_array_equal(
+            combine_fns.apply_and_concat_one_parallel_nb(3, apply_func_nb, df4.values, np.array([10, 20, 30])),
+            target2
+        )
 
     def test_apply_and_concat_multiple(self):
         def apply_func(i, x, a):
@@ -2319,6 +2373,9 @@ class TestCombineFns:
         a, b = combine_fns.apply_and_concat_multiple_nb(3, apply_func_nb, sr2.values, (10, 20, 30))
         np.testing.assert_array_equal(a, target_a)
         np.testing.assert_array_equal(b, target_b)
+        a, b = combine_fns.apply_and_concat_multiple_parallel_nb(3, apply_func_nb, sr2.values, np.array([10, 20, 30]))
+        np.testing.assert_array_equal(a, target_a)
+        np.testing.assert_array_equal(b, target_b)
         # 2d
         target_a = np.array([
             [1, 2, 3, 1, 2, 3, 1, 2, 3],
@@ -2336,6 +2393,9 @@ class TestCombineFns:
         a, b = combine_fns.apply_and_concat_multiple_nb(3, apply_func_nb, df4.values, (10, 20, 30))
         np.testing.assert_array_equal(a, target_a)
         np.testing.assert_array_equal(b, target_b)
+        a, b = combine_fns.apply_and_concat_multiple_parallel_nb(3, apply_func_nb, df4.values, np.array([10, 20, 30]))
+        np.testing.assert_array_equal(a, target_a)
+        np.testing.assert_array_equal(b, target_b)
 
     def test_combine_and_concat(self):
         def combine_func(x, y, a):
@@ -2505,6 +2565,23 @@ class TestAccessors:
         assert pd.Series([1, 2, 3]).vbt(freq='3D').freq == day_dt * 3
         assert pd.Series([1, 2, 3]).vbt(freq=np.timedelta64(4, 'D')).freq == day_dt * 4
 
+    def test_to_pd(self):
+        assert sr2.vbt.to_pd
+        assert not sr2.vbt(to_pd=False).to_pd
+        np.testing.assert_array_equal(sr2.vbt(to_pd=False).wrap(a2), sr2.values)
+        np.testing.assert_array_equal(df4.vbt(to_pd=False).wrap(a5), df4.values)
+        np.testing.assert_array_equal(df4.vbt(to_pd=False).wrap_reduced(a5[0]), df4.values[0])
+        pd.testing.assert_frame_equal(df4.vbt(to_pd=False).wrap(a5, to_pd=True), df4)
+        np.testing.assert_array_equal(
+            df4.vbt(to_pd=False).combine_with(a2, combine_func=np.add),
+            df4.vbt.combine_with(a2, combine_func=np.add).values
+        )
+        np.testing.assert_array_equal(
+            df4.vbt(to_pd=False).combine_with_multiple([a2, a5], combine_func=np.add, concat=True),
+            df4.vbt.combine_with_multiple([a2, a5], combine_func=np.add, concat=True).values
+        )
+        np.testing.assert_array_equal(df4.vbt(to_pd=False) + 1, (df4.vbt + 1).values)
+
     def test_props(self):
         assert sr1.vbt.is_series()
         assert not sr1.vbt.is_frame()
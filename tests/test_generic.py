@@ -5,6 +5,7 @@ from datetime import datetime
 import pytest
 from itertools import product
 
+import vectorbt as vbt
 from vectorbt.generic import nb
 from vectorbt.records.drawdowns import Drawdowns
 
@@ -34,11 +35,45 @@ def nanmean_nb(col, i, x):
 def nanmean_matrix_nb(i, x):
     return np.nanmean(x)
 
+@njit
+def nanmean_init_nb(col):
+    return np.zeros(2)
+
+@njit
+def nanmean_add_nb(col, i, state, value):
+    if not np.isnan(value):
+        state[0] += value
+        state[1] += 1
+
+@njit
+def nanmean_remove_nb(col, i, state, value):
+    if not np.isnan(value):
+        state[0] -= value
+        state[1] -= 1
+
+@njit
+def nanmean_result_nb(col, i, state):
+    if state[1] == 0:
+        return np.nan
+    return state[0] / state[1]
+
+nanmean_funcs = (nanmean_init_nb, nanmean_add_nb, nanmean_remove_nb, nanmean_result_nb)
+
 
 # ############# accessors.py ############# #
 
 
 class TestAccessors:
+    def test_to_pd(self):
+        np.testing.assert_array_equal(df.vbt(to_pd=False).rolling_mean(2), df.vbt.rolling_mean(2).values)
+        np.testing.assert_array_equal(df['a'].vbt(to_pd=False).cumsum(), df['a'].vbt.cumsum().values)
+        np.testing.assert_array_equal(df.vbt(to_pd=False).max(), df.vbt.max().values)
+        assert df['a'].vbt(to_pd=False).max() == df['a'].vbt.max()
+        np.testing.assert_array_equal(
+            df.vbt(to_pd=False).resample_apply('2d', nanmean_nb),
+            df.vbt.resample_apply('2d', nanmean_nb).values
+        )
+
     def test_split_into_ranges(self):
         pd.testing.assert_frame_equal(
             df['a'].vbt.split_into_ranges(n=2),
@@ -263,6 +298,27 @@ class TestAccessors:
             df.rolling(test_window, min_periods=test_minp).max()
         )
 
+    @pytest.mark.parametrize(
+        "test_window,test_minp",
+        list(product([1, 10, 50], [1, 5, None]))
+    )
+    def test_rolling_min_max_long(self, test_window, test_minp):
+        if test_minp is None:
+            test_minp = test_window
+        if test_minp > test_window:
+            return
+        np.random.seed(42)
+        long_df = pd.DataFrame(np.random.randint(0, 10, size=(200, 3)).astype(np.float_))
+        long_df[np.random.uniform(size=long_df.shape) < 0.1] = np.nan
+        pd.testing.assert_frame_equal(
+            long_df.vbt.rolling_min(test_window, minp=test_minp),
+            long_df.rolling(test_window, min_periods=test_minp).min()
+        )
+        pd.testing.assert_frame_equal(
+            long_df.vbt.rolling_max(test_window, minp=test_minp),
+            long_df.rolling(test_window, min_periods=test_minp).max()
+        )
+
     @pytest.mark.parametrize(
         "test_window,test_minp",
         list(product([1, 2, 3, 4, 5], [1, None]))
@@ -295,6 +351,16 @@ class TestAccessors:
             df.rolling(test_window, min_periods=test_minp).std(ddof=test_ddof)
         )
 
+    def test_rolling_out(self, tmp_path):
+        out = np.memmap(str(tmp_path / 'out.dat'), dtype=np.float_, mode='w+', shape=df.shape)
+        result = df.vbt.rolling_mean(2, minp=1, out=out)
+        pd.testing.assert_frame_equal(result, df.rolling(2, min_periods=1).mean())
+        np.testing.assert_array_equal(out, result.values)
+        pd.testing.assert_frame_equal(df.vbt.rolling_std(2, minp=1, out=out), df.vbt.rolling_std(2, minp=1))
+        np.testing.assert_array_equal(out, df.vbt.rolling_std(2, minp=1).values)
+        pd.testing.assert_frame_equal(df.vbt.ewm_mean(2, minp=1, out=out), df.vbt.ewm_mean(2, minp=1))
+        pd.testing.assert_frame_equal(df.vbt.expanding_max(out=out), df.vbt.expanding_max())
+
     @pytest.mark.parametrize(
         "test_window,test_minp,test_adjust",
         list(product([1, 2, 3, 4, 5], [1, None], [False, True]))
@@ -367,6 +433,22 @@ class TestAccessors:
             df.vbt.rolling_apply(test_window, nanmean_nb)
         )
 
+    @pytest.mark.parametrize(
+        "test_window",
+        [1, 2, 3, 4, 5],
+    )
+    def test_rolling_apply_incremental(self, test_window):
+        pd.testing.assert_series_equal(
+            df['a'].vbt.rolling_apply(test_window, nanmean_nb),
+            df['a'].vbt.rolling_apply(test_window, nanmean_funcs, incremental=True)
+        )
+        pd.testing.assert_frame_equal(
+            df.vbt.rolling_apply(test_window, nanmean_nb),
+            df.vbt.rolling_apply(test_window, nanmean_funcs, incremental=True)
+        )
+        with pytest.raises(Exception) as e_info:
+            df.vbt.rolling_apply(test_window, nanmean_funcs, on_matrix=True, incremental=True)
+
     def test_rolling_apply_on_matrix(self):
         pd.testing.assert_frame_equal(
             df.vbt.rolling_apply(3, nanmean_matrix_nb, on_matrix=True),
@@ -393,6 +475,17 @@ class TestAccessors:
             df.vbt.expanding_apply(nanmean_nb)
         )
 
+    def test_expanding_apply_incremental(self):
+        pd.testing.assert_frame_equal(
+            df.vbt.expanding_apply(nanmean_nb),
+            df.vbt.expanding_apply(nanmean_funcs, incremental=True)
+        )
+        pd.testing.assert_frame_equal(
+            df.vbt.expanding_apply(nanmean_nb),
+            df.vbt.expanding_apply(
+                (nanmean_init_nb, nanmean_add_nb, nanmean_result_nb), incremental=True)
+        )
+
     def test_expanding_apply_on_matrix(self):
         pd.testing.assert_frame_equal(
             df.vbt.expanding_apply(nanmean_matrix_nb, on_matrix=True),
@@ -553,6 +646,74 @@ class TestAccessors:
             df.vbt.reduce_to_array(min_and_max_nb, index=['min', 'max'], time_units=True)
         )
 
+    def test_parallel(self):
+        big_df = pd.DataFrame(np.random.RandomState(42).normal(size=(50, 30)))
+        big_df.iloc[::7, ::3] = np.nan
+
+        @njit
+        def sum_nb(col, a):
+            return np.nansum(a)
+
+        @njit
+        def min_and_max_nb(col, a):
+            result = np.empty(2)
+            result[0] = np.nanmin(a)
+            result[1] = np.nanmax(a)
+            return result
+
+        @njit
+        def every_nth_nb(col, a):
+            return a[::2]
+
+        @njit
+        def square_nb(col, i, a):
+            return a ** 2
+
+        @njit
+        def positive_nb(col, i, a):
+            return a > 0
+
+        for func in [
+            lambda x, **kwargs: x.vbt.rolling_min(5, **kwargs),
+            lambda x, **kwargs: x.vbt.rolling_max(5, **kwargs),
+            lambda x, **kwargs: x.vbt.rolling_mean(5, **kwargs),
+            lambda x, **kwargs: x.vbt.rolling_std(5, **kwargs),
+            lambda x, **kwargs: x.vbt.ewm_mean(5, **kwargs),
+            lambda x, **kwargs: x.vbt.ewm_std(5, **kwargs),
+            lambda x, **kwargs: x.vbt.expanding_min(**kwargs),
+            lambda x, **kwargs: x.vbt.expanding_max(**kwargs),
+            lambda x, **kwargs: x.vbt.expanding_mean(**kwargs),
+            lambda x, **kwargs: x.vbt.expanding_std(**kwargs),
+            lambda x, **kwargs: x.vbt.rolling_apply(5, nanmean_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.rolling_apply(5, nanmean_funcs, incremental=True, **kwargs),
+            lambda x, **kwargs: x.vbt.expanding_apply(nanmean_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.expanding_apply(nanmean_funcs, incremental=True, **kwargs),
+            lambda x, **kwargs: x.vbt.groupby_apply(np.arange(50) // 10, nanmean_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.applymap(square_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.filter(positive_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.apply_and_reduce(every_nth_nb, sum_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.reduce(sum_nb, **kwargs),
+            lambda x, **kwargs: x.vbt.reduce_to_array(min_and_max_nb, **kwargs)
+        ]:
+            for obj in [big_df, big_df[0]]:
+                result = func(obj, parallel=True)
+                target = func(obj)
+                if isinstance(target, pd.DataFrame):
+                    pd.testing.assert_frame_equal(result, target)
+                elif isinstance(target, pd.Series):
+                    pd.testing.assert_series_equal(result, target)
+                else:
+                    assert result == target
+
+        vbt.defaults.generic['parallel'] = True
+        try:
+            pd.testing.assert_frame_equal(
+                big_df.vbt.rolling_mean(5),
+                big_df.vbt.rolling_mean(5, parallel=False)
+            )
+        finally:
+            vbt.defaults.generic['parallel'] = False
+
     @pytest.mark.parametrize(
         "test_func,test_func_nb",
         [
@@ -859,6 +859,123 @@ class TestFactory:
             ).run(ts, [0, 1], 10, 100).out
         )
 
+    def test_parallel(self):
+        F = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], output_names=['out'])
+        F2 = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], output_names=['o1', 'o2'])
+
+        @njit
+        def apply_func_nb(ts, p, a, b):
+            return ts * p + a + b
+
+        @njit
+        def apply_func2_nb(ts, p, a, b):
+            return ts * p + a, ts * p + b
+
+        pd.testing.assert_frame_equal(
+            F.from_apply_func(apply_func_nb).run(ts, np.arange(10), 10, 100, parallel=True).out,
+            F.from_apply_func(apply_func_nb).run(ts, np.arange(10), 10, 100).out
+        )
+        ind = F2.from_apply_func(apply_func2_nb).run(ts, np.arange(10), 10, 100)
+        ind_parallel = F2.from_apply_func(apply_func2_nb).run(ts, np.arange(10), 10, 100, parallel=True)
+        pd.testing.assert_frame_equal(ind_parallel.o1, ind.o1)
+        pd.testing.assert_frame_equal(ind_parallel.o2, ind.o2)
+
+        F3 = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], in_output_names=['io'], output_names=['out'])
+
+        @njit
+        def apply_func3_nb(input_shape, ts, io, p, a):
+            io[:] = ts * p
+            return np.full(input_shape, p + a)
+
+        ind = F3.from_apply_func(apply_func3_nb).run(ts, [1, 2, 3], 10, forward_input_shape=True)
+        ind_parallel = F3.from_apply_func(apply_func3_nb).run(
+            ts, [1, 2, 3], 10, forward_input_shape=True, parallel=True)
+        pd.testing.assert_frame_equal(ind_parallel.io, ind.io)
+        pd.testing.assert_frame_equal(ind_parallel.out, ind.out)
+        pd.testing.assert_frame_equal(
+            vbt.MA.run(ts, [2, 3, 4], ewm=[False, True, False], parallel=True).ma,
+            vbt.MA.run(ts, [2, 3, 4], ewm=[False, True, False]).ma
+        )
+
+    def test_disk_cache(self, tmp_path):
+        F = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], output_names=['out'])
+        n_calls = []
+
+        def apply_func(ts, p, a, b=10):
+            n_calls.append(p)
+            return ts * p + a + b
+
+        cache_kwargs = dict(disk_cache=str(tmp_path), disk_cache_id='test_disk_cache')
+        target = F.from_apply_func(apply_func).run(ts, [0, 1, 2], 10, b=100).out
+        n_calls.clear()
+        pd.testing.assert_frame_equal(
+            F.from_apply_func(apply_func, **cache_kwargs).run(ts, [0, 1, 2], 10, b=100).out,
+            target
+        )
+        assert len(n_calls) == 3
+        pd.testing.assert_frame_equal(
+            F.from_apply_func(apply_func, **cache_kwargs).run(ts, [0, 1, 2], 10, b=100).out,
+            target
+        )
+        assert len(n_calls) == 3
+        F.from_apply_func(apply_func, **cache_kwargs).run(ts, [0, 1, 2], 10, b=200)
+        assert len(n_calls) == 6
+        F.from_apply_func(apply_func, **cache_kwargs).run(ts * 2, [0, 1, 2], 10, b=100)
+        assert len(n_calls) == 9
+        with pytest.raises(Exception) as e_info:
+            F.from_apply_func(apply_func, disk_cache=str(tmp_path)).run(ts, [0, 1, 2], 10, b=100)
+        with pytest.raises(Exception) as e_info:
+            F.from_apply_func(apply_func, **cache_kwargs).run(ts, [0, 1, 2], object(), b=100)
+
+        # enclosed apply_func is part of the key
+        def apply_func3(ts, p, a, b=10):
+            n_calls.append(p)
+            return ts * p + a + b + 1
+
+        n_calls.clear()
+        pd.testing.assert_frame_equal(
+            F.from_apply_func(apply_func3, **cache_kwargs).run(ts, [0, 1, 2], 10, b=100).out,
+            target + 1
+        )
+        assert len(n_calls) == 3
+
+        # cached outputs are writable like fresh ones
+        ma = vbt.MA.run(ts, window=2, disk_cache=str(tmp_path))
+        ma2 = vbt.MA.run(ts, window=2, disk_cache=str(tmp_path))
+        assert isinstance(ma2._ma, np.memmap)
+        ma2._ma[0, 0] = 5.
+        pd.testing.assert_frame_equal(vbt.MA.run(ts, window=2, disk_cache=str(tmp_path)).ma, ma.ma)
+
+        # in-place outputs are filled on a hit
+        F2 = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], in_output_names=['io'], output_names=['out'])
+
+        def apply_func2(ts, io, p):
+            n_calls.append(p)
+            io[:] = ts * p
+            return ts + p
+
+        n_calls.clear()
+        ind = F2.from_apply_func(apply_func2, **cache_kwargs).run(ts, [1, 2])
+        ind2 = F2.from_apply_func(apply_func2, **cache_kwargs).run(ts, [1, 2])
+        assert len(n_calls) == 2
+        pd.testing.assert_frame_equal(ind2.io, ind.io)
+        pd.testing.assert_frame_equal(ind2.out, ind.out)
+        assert not isinstance(ind2._io, np.memmap)
+
+    def test_float_dtype(self):
+        F = vbt.IndicatorFactory(input_names=['ts'], param_names=['p'], output_names=['out'])
+        target = F.from_apply_func(lambda ts, p: ts * p).run(ts, [1, 2]).out
+        ind = F.from_apply_func(lambda ts, p: ts * p).run(ts, [1, 2], float_dtype=np.float32)
+        assert (ind.out.dtypes == np.float32).all()
+        np.testing.assert_allclose(ind.out.values, target.values, rtol=1e-6)
+        vbt.defaults.indicators['float_dtype'] = np.float32
+        try:
+            assert (F.from_apply_func(lambda ts, p: ts * p).run(ts, [1, 2]).out.dtypes == np.float32).all()
+            assert (F.from_apply_func(lambda ts, p: ts * p).run(
+                ts, [1, 2], float_dtype=False).out.dtypes == np.float64).all()
+        finally:
+            vbt.defaults.indicators['float_dtype'] = None
+
     def test_pass_1d(self):
         F = vbt.IndicatorFactory(input_names=['ts'], output_names=['out'])
 
@@ -1508,6 +1625,12 @@ class TestBasic:
                 ], names=['ma_window', 'ma_ewm'])
             )
         )
+        # F-ordered input
+        close_df = pd.DataFrame({'a': close_ts, 'b': close_ts})
+        np.testing.assert_array_equal(
+            vbt.MA.run(close_df, window=(2, 3), ewm=(False, True), param_product=True).ma.values[:, ::2],
+            vbt.MA.run(close_ts, window=(2, 3), ewm=(False, True), param_product=True).ma.values
+        )
 
     def test_MSTD(self):
         pd.testing.assert_frame_equal(
@@ -2070,3 +2193,47 @@ class TestBasic:
                 name=close_ts.name
             )
         )
+
+    def test_rolling_from_sums(self):
+        a = np.random.uniform(size=(100, 3))
+        a[np.random.uniform(size=a.shape) < 0.1] = np.nan
+        cumsum, cumsum_sq, nancnt = vbt.indicators.nb.prefix_sums_nb(a)
+        for window in (1, 2, 10, 100):
+            np.testing.assert_array_equal(
+                vbt.indicators.nb.rolling_mean_from_sums_nb(cumsum, nancnt, window, minp=1),
+                vbt.generic.nb.rolling_mean_nb(a, window, minp=1)
+            )
+            np.testing.assert_array_equal(
+                vbt.indicators.nb.rolling_std_from_sums_nb(cumsum, cumsum_sq, nancnt, window, minp=1, ddof=1),
+                vbt.generic.nb.rolling_std_nb(a, window, minp=1, ddof=1)
+            )
+
+    @pytest.mark.parametrize(
+        "test_ind,test_inputs,test_params,test_outputs",
+        [
+            (vbt.MA, (close_ts,), dict(window=(2, 3), ewm=(False, True)), ('ma',)),
+            (vbt.MSTD, (close_ts,), dict(window=(2, 3), ewm=(False, True)), ('mstd',)),
+            (vbt.BBANDS, (close_ts,), dict(window=(2, 3), ewm=(False, True), alpha=(2., 3.)),
+             ('middle', 'upper', 'lower')),
+            (vbt.RSI, (close_ts,), dict(window=(2, 3), ewm=(False, True)), ('rsi',)),
+            (vbt.STOCH, (high_ts, low_ts, close_ts), dict(k_window=(2, 3), d_window=(2, 3), d_ewm=(False, True)),
+             ('percent_k', 'percent_d')),
+            (vbt.MACD, (close_ts,), dict(fast_window=(2, 3), slow_window=(3, 4), signal_window=(2, 3),
+                                         macd_ewm=(False, True), signal_ewm=(False, True)), ('macd', 'signal')),
+            (vbt.ATR, (high_ts, low_ts, close_ts), dict(window=(2, 3), ewm=(False, True)), ('tr', 'atr')),
+            (vbt.OBV, (close_ts, volume_ts), dict(), ('obv',))
+        ]
+    )
+    def test_update(self, test_ind, test_inputs, test_params, test_outputs):
+        test_inputs = [sr.astype(np.float_).vbt.tile(2, keys=['a', 'b']) for sr in test_inputs]
+        if len(test_params) > 0:
+            test_params['param_product'] = True
+        target = test_ind.run(*test_inputs, **test_params)
+        ind = test_ind.run(*[df.iloc[:3] for df in test_inputs], **test_params)
+        ind = ind.update(*[df.iloc[3:4] for df in test_inputs])
+        ind2 = ind.update(*[df.iloc[4:5] for df in test_inputs])  # doesn't modify state of ind
+        ind = ind.update(*[df.iloc[4:] for df in test_inputs])
+        for output_name in test_outputs:
+            pd.testing.assert_frame_equal(getattr(ind, output_name), getattr(target, output_name).iloc[4:])
+            pd.testing.assert_frame_equal(getattr(ind2, output_name), getattr(target, output_name).iloc[4:5])
+        pd.testing.assert_frame_equal(ind.close, target.close.iloc[4:])
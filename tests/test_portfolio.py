@@ -8,6 +8,7 @@ import pytest
 import vectorbt as vbt
 from vectorbt import defaults
 from vectorbt.utils.random import set_seed
+from vectorbt.utils import checks
 from vectorbt.base.array_wrapper import ArrayWrapper
 from vectorbt.portfolio.enums import (
     SizeType,
@@ -18,8 +19,17 @@ from vectorbt.portfolio.enums import (
     NoOrder,
     InitCashMode
 )
-from vectorbt.portfolio.nb import auto_call_seq_ctx_nb, build_call_seq_nb, build_call_seq
+from vectorbt.portfolio.nb import (
+    auto_call_seq_ctx_nb,
+    build_call_seq_nb,
+    build_call_seq,
+    simulate_nb,
+    simulate_row_wise_nb,
+    empty_prep_nb
+)
+from vectorbt.base.reshape_fns import flex_select_auto_nb
 from vectorbt.records import order_dt, trade_dt, position_dt
+from vectorbt.signals import nb as signals_nb
 
 from tests.utils import record_arrays_close
 
@@ -59,6 +69,41 @@ def test_build_call_seq_nb():
     set_seed(seed)
     out2 = build_call_seq((10, 10), group_counts, CallSeqType.Random)
     np.testing.assert_array_equal(out1, out2)
+    np.testing.assert_array_equal(
+        build_call_seq((10, 10), group_counts, CallSeqType.Default, keep_raw=True),
+        build_call_seq((10, 10), group_counts, CallSeqType.Default)[:1]
+    )
+    np.testing.assert_array_equal(
+        build_call_seq((10, 10), group_counts, CallSeqType.Reversed, keep_raw=True),
+        build_call_seq((10, 10), group_counts, CallSeqType.Reversed)[:1]
+    )
+    set_seed(seed)
+    out3 = build_call_seq((10, 10), group_counts, CallSeqType.Random, keep_raw=True)
+    np.testing.assert_array_equal(out1, out3)
+
+
+def test_flex_simulate_nb():
+    @njit
+    def flex_order_func_nb(oc):
+        return Order(1., SizeType.Shares, flex_select_auto_nb(oc.i, oc.col, oc.close, True), 0., 0., 0., 0.)
+
+    target_shape = (5, 3)
+    close = price.values[:, None]
+    group_counts = np.array([1, 1, 1])
+    init_cash = np.array([100., 100., 100.])
+    call_seq = build_call_seq(target_shape, group_counts)
+    active_mask = np.array([[True, False, True]])
+    min_size = np.full(target_shape[1], 1e-4)
+    for simulate_func_nb in (simulate_nb, simulate_row_wise_nb):
+        record_arrays_close(
+            simulate_func_nb(
+                target_shape, close, group_counts, init_cash, False, call_seq, active_mask, min_size,
+                empty_prep_nb, (), empty_prep_nb, (), empty_prep_nb, (), flex_order_func_nb, ()),
+            simulate_func_nb(
+                target_shape, np.tile(close, (1, 3)), group_counts, init_cash, False, call_seq,
+                np.tile(active_mask, (5, 1)), min_size,
+                empty_prep_nb, (), empty_prep_nb, (), empty_prep_nb, (), flex_order_func_nb, ())
+        )
 
 
 # ############# from_signals ############# #
@@ -161,6 +206,21 @@ class TestFromSignals:
         )
         assert portfolio.cash_sharing
 
+    def test_compact(self):
+        portfolio = vbt.Portfolio.from_signals(
+            price, entries_wide, exits_wide, group_by=np.array([0, 0, 1]), cash_sharing=True)
+        assert portfolio._call_seq.shape == (1, 3)
+        assert not portfolio.close.values.flags.writeable
+        pd.testing.assert_frame_equal(portfolio.close, price_wide)
+        np.testing.assert_array_equal(
+            portfolio.call_seq.values,
+            np.array([[0, 1, 0]] * 5)
+        )
+        np.testing.assert_array_equal(
+            portfolio[0].call_seq.values,
+            np.array([[0, 1]] * 5)
+        )
+
     def test_call_seq(self):
         portfolio = vbt.Portfolio.from_signals(
             price_wide, entries, exits, group_by=np.array([0, 0, 1]),
@@ -387,6 +447,228 @@ class TestFromSignals:
             ], dtype=order_dt)
         )
 
+    def test_parallel(self):
+        big_entries = big_price_wide.vbt.fshift(1) < big_price_wide
+        big_exits = big_price_wide.vbt.fshift(1) > big_price_wide
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, fees=0.01, parallel=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, fees=0.01, parallel=False).orders().records_arr
+        )
+        group_by = np.repeat(np.arange(10), 100)
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, parallel=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, parallel=False).orders().records_arr
+        )
+
+    def test_chunked(self):
+        big_entries = big_price_wide.vbt.fshift(1) < big_price_wide
+        big_exits = big_price_wide.vbt.fshift(1) > big_price_wide
+        portfolio = vbt.Portfolio.from_signals(
+            big_price, big_entries, big_exits, fees=np.arange(1000) / 10000)
+        portfolio_chunked = vbt.Portfolio.from_signals(
+            big_price, big_entries, big_exits, fees=np.arange(1000) / 10000, chunk_size=300)
+        record_arrays_close(
+            portfolio_chunked.orders().records_arr,
+            portfolio.orders().records_arr
+        )
+        pd.testing.assert_frame_equal(portfolio_chunked.close, portfolio.close)
+        pd.testing.assert_series_equal(portfolio_chunked.total_return(), portfolio.total_return())
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, fees=np.arange(1000) / 10000,
+                max_memory=1000 * order_dt.itemsize * 50,
+                parallel=True).orders().records_arr,
+            portfolio.orders().records_arr
+        )
+        group_by = np.repeat(np.arange(10), 100)
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, chunk_size=150).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True).orders().records_arr
+        )
+        portfolio = vbt.Portfolio.from_signals(
+            price_wide, entries, exits, size=[[1., 2., 3.]], chunk_size=1)
+        record_arrays_close(
+            portfolio.orders().records_arr,
+            np.array([
+                (0, 0, 1., 1., 0., 0), (0, 3, 1., 4., 0., 1),
+                (1, 0, 2., 1., 0., 0), (1, 3, 2., 4., 0., 1),
+                (2, 0, 3., 1., 0., 0), (2, 3, 3., 4., 0., 1)
+            ], dtype=order_dt)
+        )
+        pd.testing.assert_frame_equal(portfolio.close, price_wide)
+
+    def test_memmap(self, tmp_path):
+        big_entries = big_price_wide.vbt.fshift(1) < big_price_wide
+        big_exits = big_price_wide.vbt.fshift(1) > big_price_wide
+        mm_price = np.memmap(str(tmp_path / 'price.dat'), dtype=np.float_, mode='w+', shape=big_price.shape)
+        mm_price[:] = big_price.values
+        mm_price.flush()
+        mm_price = np.memmap(str(tmp_path / 'price.dat'), dtype=np.float_, mode='r', shape=big_price.shape)
+        portfolio = vbt.Portfolio.from_signals(
+            pd.DataFrame(mm_price), big_entries, big_exits, fees=0.01)
+        assert checks.is_memmap(portfolio.close)
+        record_arrays_close(
+            portfolio.orders().records_arr,
+            vbt.Portfolio.from_signals(big_price, big_entries, big_exits, fees=0.01).orders().records_arr
+        )
+
+    def test_packed(self):
+        big_entries = big_price_wide.vbt.fshift(1) < big_price_wide
+        big_exits = big_price_wide.vbt.fshift(1) > big_price_wide
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries.vbt.signals.pack(), big_exits.vbt.signals.pack(), fees=0.01
+            ).orders().records_arr,
+            vbt.Portfolio.from_signals(big_price_wide, big_entries, big_exits, fees=0.01).orders().records_arr
+        )
+        packed_entries = big_entries.vbt.signals.pack()
+        packed_exits = big_exits.vbt.signals.pack()
+        for kwargs in (
+            dict(parallel=True),
+            dict(chunk_size=300),
+            dict(sparse=True),
+            dict(group_by=np.arange(1000) // 10, cash_sharing=True)
+        ):
+            record_arrays_close(
+                vbt.Portfolio.from_signals(
+                    big_price_wide, packed_entries, big_exits, fees=0.01, **kwargs).orders().records_arr,
+                vbt.Portfolio.from_signals(
+                    big_price_wide, big_entries, big_exits, fees=0.01, **kwargs).orders().records_arr
+            )
+        pd.testing.assert_frame_equal(
+            vbt.Portfolio.from_signals(
+                big_price_wide, packed_entries, packed_exits, reduce_only=True, freq='1D'),
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, reduce_only=True, freq='1D')
+        )
+        # Other inputs are broadcast to the shape of packed signals
+        portfolio = vbt.Portfolio.from_signals(big_price_wide.iloc[:, 0], packed_entries, packed_exits)
+        pd.testing.assert_index_equal(portfolio.wrapper.columns, big_price_wide.columns)
+        record_arrays_close(
+            portfolio.orders().records_arr,
+            vbt.Portfolio.from_signals(big_price_wide.iloc[:, 0], big_entries, big_exits).orders().records_arr
+        )
+        with pytest.raises(Exception) as e_info:
+            vbt.Portfolio.from_signals(big_price_wide, packed_entries, packed_exits.iloc[:, :10])
+
+    def test_sparse(self):
+        big_entries = (big_price_wide.vbt.fshift(1) < big_price_wide) & (big_price_wide > 0.9)
+        big_exits = (big_price_wide.vbt.fshift(1) > big_price_wide) & (big_price_wide < 0.1)
+        fees = np.arange(1000) / 10000
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, fees=fees, sparse=True).orders().records_arr,
+            vbt.Portfolio.from_signals(big_price_wide, big_entries, big_exits, fees=fees).orders().records_arr
+        )
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, fees=fees, chunk_size=300, sparse=True).orders().records_arr,
+            vbt.Portfolio.from_signals(big_price_wide, big_entries, big_exits, fees=fees).orders().records_arr
+        )
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price[0], big_entries[0], big_exits[0], size=0.5, accumulate=True,
+                accumulate_exit_mode=AccumulateExitMode.Reduce, sparse=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price[0], big_entries[0], big_exits[0], size=0.5, accumulate=True,
+                accumulate_exit_mode=AccumulateExitMode.Reduce).orders().records_arr
+        )
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                price_wide, True, np.array([[False], [False], [True], [False], [True]]), size=1., accumulate=True,
+                conflict_mode=ConflictMode.ExitAndEntry, sparse=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                price_wide, True, np.array([[False], [False], [True], [False], [True]]), size=1., accumulate=True,
+                conflict_mode=ConflictMode.ExitAndEntry).orders().records_arr
+        )
+        group_by = np.repeat(np.arange(10), 100)
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, call_seq=CallSeqType.Reversed, sparse=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, call_seq=CallSeqType.Reversed).orders().records_arr
+        )
+        with pytest.raises(Exception) as e_info:
+            vbt.Portfolio.from_signals(big_price_wide, big_entries, big_exits, sparse=True, parallel=True)
+        # sparse signals are passed directly
+        sparse_entries = signals_nb.to_sparse_nb(big_entries.values)
+        sparse_exits = signals_nb.to_sparse_nb(big_exits.values)
+        for kwargs in (dict(), dict(chunk_size=300)):
+            record_arrays_close(
+                vbt.Portfolio.from_signals(
+                    big_price_wide, sparse_entries, sparse_exits, fees=fees, **kwargs).orders().records_arr,
+                vbt.Portfolio.from_signals(big_price_wide, big_entries, big_exits, fees=fees).orders().records_arr
+            )
+        record_arrays_close(
+            vbt.Portfolio.from_signals(
+                big_price_wide, sparse_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True).orders().records_arr,
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True).orders().records_arr
+        )
+        with pytest.raises(Exception) as e_info:
+            vbt.Portfolio.from_signals(big_price_wide, sparse_entries, sparse_exits, sparse=False)
+        with pytest.raises(Exception) as e_info:
+            vbt.Portfolio.from_signals(big_price_wide.iloc[:, :10], sparse_entries, sparse_exits)
+
+    def test_reduce_only(self):
+        big_entries = big_price_wide.vbt.fshift(1) < big_price_wide
+        big_exits = big_price_wide.vbt.fshift(1) > big_price_wide
+        fees = np.arange(1000) / 10000
+
+        def assert_metrics(metrics, portfolio):
+            np.testing.assert_allclose(metrics['total_return'], portfolio.total_return())
+            np.testing.assert_allclose(metrics['max_drawdown'], portfolio.max_drawdown())
+            np.testing.assert_allclose(metrics['sharpe_ratio'], portfolio.sharpe_ratio())
+            np.testing.assert_array_equal(metrics['num_trades'], portfolio.trades().count())
+            pd.testing.assert_index_equal(metrics.index, portfolio.wrapper.grouper.get_columns())
+
+        portfolio = vbt.Portfolio.from_signals(big_price, big_entries, big_exits, fees=fees)
+        metrics = vbt.Portfolio.from_signals(big_price, big_entries, big_exits, fees=fees, reduce_only=True)
+        assert list(metrics.columns) == ['total_return', 'max_drawdown', 'sharpe_ratio', 'num_trades']
+        assert_metrics(metrics, portfolio)
+        pd.testing.assert_frame_equal(
+            vbt.Portfolio.from_signals(
+                big_price, big_entries, big_exits, fees=fees, reduce_only=True, parallel=True),
+            metrics
+        )
+        pd.testing.assert_frame_equal(
+            vbt.Portfolio.from_signals(
+                big_price, big_entries, big_exits, fees=fees, reduce_only=True, chunk_size=300),
+            metrics
+        )
+        group_by = np.repeat(np.arange(10), 100)
+        assert_metrics(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by, reduce_only=True),
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by)
+        )
+        assert_metrics(
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True, reduce_only=True, chunk_size=150),
+            vbt.Portfolio.from_signals(
+                big_price_wide, big_entries, big_exits, size=0.1, group_by=group_by,
+                cash_sharing=True)
+        )
+        with pytest.raises(Exception) as e_info:
+            _ = vbt.Portfolio.from_signals(
+                price_wide, entries, exits, init_cash=InitCashMode.Auto, reduce_only=True)
+
 
 # ############# from_orders ############# #
 
@@ -866,6 +1148,30 @@ class TestFromOrders:
             ], dtype=order_dt)
         )
 
+    def test_parallel(self):
+        big_order_size = pd.DataFrame(
+            np.random.uniform(-1, 1, size=big_price_wide.shape),
+            index=big_price_wide.index,
+            columns=big_price_wide.columns
+        )
+        record_arrays_close(
+            vbt.Portfolio.from_orders(
+                big_price_wide, big_order_size, fees=0.01, parallel=True).orders().records_arr,
+            vbt.Portfolio.from_orders(
+                big_price_wide, big_order_size, fees=0.01, parallel=False).orders().records_arr
+        )
+        group_by = np.repeat(np.arange(10), 100)
+        record_arrays_close(
+            vbt.Portfolio.from_orders(
+                big_price_wide, big_order_size / 100, size_type=SizeType.TargetPercent,
+                val_price=big_price_wide, group_by=group_by, cash_sharing=True,
+                call_seq=CallSeqType.Auto, parallel=True).orders().records_arr,
+            vbt.Portfolio.from_orders(
+                big_price_wide, big_order_size / 100, size_type=SizeType.TargetPercent,
+                val_price=big_price_wide, group_by=group_by, cash_sharing=True,
+                call_seq=CallSeqType.Auto, parallel=False).orders().records_arr
+        )
+
 
 # ############# from_order_func ############# #
 
@@ -1422,6 +1728,64 @@ class TestFromOrderFunc:
         assert list(segment_lst) == [3, 6, 10, 13]
         assert list(order_lst) == [4, 7, 8, 11, 12, 14]
 
+    def test_update(self):
+        @njit
+        def prep_func_nb(simc):
+            return (np.full(simc.target_shape[1], 0),)
+
+        @njit
+        def row_prep_func_nb(rc, call_count):
+            return (call_count,)
+
+        @njit
+        def segment_prep_func_nb(sc, call_count):
+            return (call_count,)
+
+        @njit
+        def target_order_func_nb(oc, call_count, size):
+            call_count[oc.col] += 1
+            return Order(size[oc.i, oc.col], SizeType.TargetPercent, oc.close[oc.i, oc.col], 0.01, 0., 0., 0.)
+
+        big_close = pd.DataFrame(
+            np.random.uniform(1, 2, size=(20, 3)),
+            index=pd.date_range('2020-01-01', periods=20),
+            columns=['a', 'b', 'c']
+        )
+        size = np.random.uniform(0, 0.3, size=(20, 3))
+        size[0, :] = np.nan
+        for kwargs in (dict(), dict(group_by=np.array([0, 0, 1]), cash_sharing=True)):
+            portfolio = vbt.Portfolio.from_order_func(
+                big_close, target_order_func_nb, size, prep_func_nb=prep_func_nb,
+                row_prep_func_nb=row_prep_func_nb, segment_prep_func_nb=segment_prep_func_nb,
+                row_wise=True, **kwargs)
+            portfolio_part = vbt.Portfolio.from_order_func(
+                big_close.iloc[:12], target_order_func_nb, size[:12], prep_func_nb=prep_func_nb,
+                row_prep_func_nb=row_prep_func_nb, segment_prep_func_nb=segment_prep_func_nb,
+                row_wise=True, **kwargs)
+            assert portfolio_part.sim_state.next_row == 12
+            portfolio_updated = portfolio_part.update(
+                big_close.iloc[12:17], target_order_func_nb, size[12:17],
+                row_prep_func_nb=row_prep_func_nb, segment_prep_func_nb=segment_prep_func_nb)
+            portfolio_updated = portfolio_updated.update(
+                big_close.iloc[17:], target_order_func_nb, size[17:],
+                row_prep_func_nb=row_prep_func_nb, segment_prep_func_nb=segment_prep_func_nb)
+            np.testing.assert_array_equal(portfolio_part.sim_state.prep_out[0], np.full(3, 12))
+            assert len(portfolio_part.orders().records_arr) < len(portfolio.orders().records_arr)
+            record_arrays_close(
+                portfolio_updated.orders().records_arr,
+                portfolio.orders().records_arr
+            )
+            pd.testing.assert_frame_equal(portfolio_updated.close, portfolio.close)
+            pd.testing.assert_frame_equal(portfolio_updated.call_seq, portfolio.call_seq)
+            pd.testing.assert_series_equal(portfolio_updated.total_return(), portfolio.total_return())
+            assert portfolio_updated.sim_state.next_row == 20
+            assert portfolio_updated.sim_state.record_count == portfolio.sim_state.record_count
+            np.testing.assert_array_equal(portfolio_updated.sim_state.prep_out[0], np.full(3, 20))
+        assert portfolio_updated[0].sim_state is None
+        portfolio = vbt.Portfolio.from_order_func(price.iloc[:3], order_func_nb, np.inf)
+        with pytest.raises(Exception) as e_info:
+            _ = portfolio.update(price.iloc[3:], order_func_nb, np.inf)
+
 
 # ############# Portfolio ############# #
 
@@ -2588,3 +2952,30 @@ class TestPortfolio:
         pd.testing.assert_series_equal(portfolio['c'].stats(), portfolio.stats(column='c'))
         pd.testing.assert_series_equal(portfolio['c'].stats(), portfolio_grouped.stats(column='c', group_by=False))
         pd.testing.assert_series_equal(portfolio_grouped['second'].stats(), portfolio_grouped.stats(column='second'))
+        for _portfolio in (portfolio, portfolio_grouped):
+            stats_df = _portfolio.stats(agg_func=None, incl_unrealized=True, risk_free=0.01, required_return=0.1)
+            drawdowns = _portfolio.drawdowns()
+            trades = _portfolio.trades(incl_unrealized=True)
+            returns = _portfolio.returns()
+            targets = {
+                'Max. Drawdown [%]': -drawdowns.max_drawdown() * 100,
+                'Avg. Drawdown [%]': -drawdowns.avg_drawdown() * 100,
+                'Max. Drawdown Duration': drawdowns.max_duration(),
+                'Avg. Drawdown Duration': drawdowns.avg_duration(),
+                'Num. Trades': trades.count(),
+                'Win Rate [%]': trades.win_rate() * 100,
+                'Best Trade [%]': trades.returns.max() * 100,
+                'Worst Trade [%]': trades.returns.min() * 100,
+                'Avg. Trade [%]': trades.returns.mean() * 100,
+                'Max. Trade Duration': trades.duration.max(time_units=True),
+                'Avg. Trade Duration': trades.duration.mean(time_units=True),
+                'Expectancy': trades.expectancy(),
+                'SQN': trades.sqn(),
+                'Sharpe Ratio': _portfolio.sharpe_ratio(reuse_returns=returns, risk_free=0.01),
+                'Sortino Ratio': _portfolio.sortino_ratio(reuse_returns=returns, required_return=0.1),
+                'Calmar Ratio': _portfolio.calmar_ratio(reuse_returns=returns)
+            }
+            for k, v in targets.items():
+                pd.testing.assert_series_equal(stats_df[k], v, check_names=False)
+        with pytest.raises(Exception) as e_info:
+            portfolio.stats(levy_alpha=2.)
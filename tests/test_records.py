@@ -5,6 +5,7 @@ from numba import njit
 import pytest
 
 from vectorbt.base.array_wrapper import ArrayWrapper
+from vectorbt.records.base import compact_records_dtype
 from vectorbt.records import (
     drawdown_dt,
     order_dt,
@@ -118,6 +119,78 @@ class TestMappedArray:
                 [0, 3]
             ])
         )
+        np.testing.assert_array_equal(
+            mapped_array[['c', 'a']].col_index,
+            np.array([
+                [0, 3],
+                [3, 6]
+            ])
+        )
+        mask = mapped_array.mapped_arr >= mapped_array.mapped_arr.mean()
+        np.testing.assert_array_equal(
+            mapped_array.filter_by_mask(mask).col_index,
+            np.array([
+                [0, 1],
+                [1, 4],
+                [4, 5],
+                [-1, -1]
+            ])
+        )
+        np.testing.assert_array_equal(
+            mapped_array_grouped.get_col_index(),
+            np.array([
+                [0, 3],
+                [3, 9]
+            ])
+        )
+
+    def test_unsorted(self):
+        mapped_array2 = vbt.MappedArray(
+            wrapper,
+            [10., 11., 12., 13., 14.],
+            [2, 0, 2, 0, 1],
+            idx_arr=[0, 0, 1, 1, 0]
+        )
+        np.testing.assert_array_equal(mapped_array2.mapped_arr, np.array([11., 13., 14., 10., 12.]))
+        np.testing.assert_array_equal(mapped_array2.col_arr, np.array([0, 0, 1, 2, 2]))
+        np.testing.assert_array_equal(mapped_array2.idx_arr, np.array([0, 1, 0, 0, 1]))
+        np.testing.assert_array_equal(
+            mapped_array2.col_index,
+            np.array([
+                [0, 2],
+                [2, 3],
+                [3, 5],
+                [-1, -1]
+            ])
+        )
+        pd.testing.assert_series_equal(
+            mapped_array2.sum(),
+            pd.Series(np.array([24., 14., 22., 0.]), index=wrapper.columns)
+        )
+
+    def test_copy(self):
+        mapped_array2 = mapped_array.copy(
+            mapped_arr=np.array([10., 11., 12.]),
+            col_arr=np.array([1, 1, 1]),
+            idx_arr=np.array([0, 1, 2])
+        )
+        np.testing.assert_array_equal(
+            mapped_array2.col_index,
+            np.array([
+                [-1, -1],
+                [0, 3],
+                [-1, -1],
+                [-1, -1]
+            ])
+        )
+        pd.testing.assert_series_equal(
+            mapped_array2.count(),
+            pd.Series(np.array([0, 3, 0, 0]), index=wrapper.columns)
+        )
+        np.testing.assert_array_equal(
+            mapped_array.copy(wrapper=wrapper.copy()).col_index,
+            mapped_array.col_index
+        )
 
     def test_filter_by_mask(self):
         mask = mapped_array.mapped_arr >= mapped_array.mapped_arr.mean()
@@ -390,6 +463,49 @@ class TestMappedArray:
             )
         )
 
+    def test_reduce_parallel(self):
+        @njit
+        def mean_reduce_nb(col, a):
+            return np.mean(a)
+
+        @njit
+        def argmin_reduce_nb(col, a):
+            return np.argmin(a)
+
+        @njit
+        def min_max_reduce_nb(col, a):
+            return np.array([np.min(a), np.max(a)])
+
+        @njit
+        def idxmin_idxmax_reduce_nb(col, a):
+            return np.array([np.argmin(a), np.argmax(a)])
+
+        for _mapped_array in (mapped_array, mapped_array_grouped):
+            pd.testing.assert_series_equal(
+                _mapped_array.reduce(mean_reduce_nb, parallel=True),
+                _mapped_array.reduce(mean_reduce_nb, parallel=False)
+            )
+            pd.testing.assert_series_equal(
+                _mapped_array.reduce(argmin_reduce_nb, to_idx=True, parallel=True),
+                _mapped_array.reduce(argmin_reduce_nb, to_idx=True, parallel=False)
+            )
+            pd.testing.assert_frame_equal(
+                _mapped_array.reduce(min_max_reduce_nb, to_array=True, n_rows=2, parallel=True),
+                _mapped_array.reduce(min_max_reduce_nb, to_array=True, n_rows=2, parallel=False)
+            )
+            pd.testing.assert_frame_equal(
+                _mapped_array.reduce(idxmin_idxmax_reduce_nb, to_array=True, n_rows=2, to_idx=True, parallel=True),
+                _mapped_array.reduce(idxmin_idxmax_reduce_nb, to_array=True, n_rows=2, to_idx=True, parallel=False)
+            )
+        vbt.defaults.records['parallel'] = True
+        try:
+            pd.testing.assert_series_equal(
+                mapped_array.reduce(mean_reduce_nb),
+                pd.Series(np.array([11., 13.333333333333334, 11., np.nan]), index=wrapper.columns)
+            )
+        finally:
+            vbt.defaults.records['parallel'] = False
+
     def test_nst(self):
         pd.testing.assert_series_equal(
             mapped_array.nst(0),
@@ -774,6 +890,31 @@ class TestRecords:
             records['a'].col_index,
             target[0:1]
         )
+        np.testing.assert_array_equal(
+            records[['c', 'a']].col_index,
+            target[0:2]
+        )
+        records2 = vbt.records.Records(wrapper, records_arr[::-1])
+        np.testing.assert_array_equal(records2.records_arr['col'], records_arr['col'])
+        np.testing.assert_array_equal(records2.records_arr['idx'], records_arr['idx'][::-1])
+        np.testing.assert_array_equal(
+            records2.col_index,
+            target
+        )
+        records3 = records.copy(records_arr=records_arr[records_arr['col'] == 1])
+        np.testing.assert_array_equal(
+            records3.col_index,
+            np.array([
+                [-1, -1],
+                [0, 3],
+                [-1, -1],
+                [-1, -1]
+            ])
+        )
+        pd.testing.assert_series_equal(
+            records3.count(),
+            pd.Series(np.array([0, 3, 0, 0]), index=wrapper.columns)
+        )
 
     def test_filter_by_mask(self):
         mask = records.records_arr['some_field1'] >= records.records_arr['some_field1'].mean()
@@ -868,6 +1009,46 @@ class TestRecords:
         )
         assert records_grouped[0].count() == 3
 
+    def test_compact(self):
+        compact_dt = compact_records_dtype(example_dt)
+        assert compact_dt['col'] == np.int32
+        assert compact_dt['idx'] == np.int32
+        assert compact_dt['some_field1'] == np.float64
+        assert compact_records_dtype(order_dt)['size'] == np.float64
+        assert compact_records_dtype(order_dt).itemsize == 36
+        assert compact_records_dtype(trade_dt).itemsize == 76
+        assert compact_records_dtype(order_dt, float_dtype=np.float32)['price'] == np.float32
+        assert compact_records_dtype(order_dt, float_dtype=np.float32).itemsize == 24
+        assert compact_records_dtype(trade_dt, float_dtype=np.float32).itemsize == 48
+        vbt.defaults.records['compact'] = True
+        try:
+            _records = vbt.Records(wrapper, records_arr)
+            assert _records.records_arr.dtype == compact_dt
+            for field in example_dt.names:
+                np.testing.assert_array_equal(_records.records_arr[field], records_arr[field])
+            pd.testing.assert_series_equal(_records.count(), records.count())
+            record_arrays_close(_records['b'].records_arr, records['b'].records_arr.astype(compact_dt))
+            _trades = vbt.Trades.from_orders(vbt.Orders(wrapper2, order_records_arr, price))
+            assert _trades.records_arr.dtype == compact_records_dtype(trade_dt)
+            pd.testing.assert_series_equal(_trades.pnl.sum(), trades.pnl.sum())
+            # unsorted records are sorted while being cast
+            unsorted_records = vbt.Records(wrapper, records_arr[::-1])
+            assert unsorted_records.records_arr.dtype == compact_dt
+            np.testing.assert_array_equal(
+                unsorted_records.records_arr['col'],
+                np.sort(records_arr['col'])
+            )
+            pd.testing.assert_series_equal(unsorted_records.count(), records.count())
+            vbt.defaults.records['compact_float_dtype'] = np.float32
+            _orders = vbt.Orders(wrapper2, order_records_arr, price)
+            assert _orders.records_arr.dtype == compact_records_dtype(order_dt, float_dtype=np.float32)
+            _trades = vbt.Trades.from_orders(_orders)
+            assert _trades.records_arr['pnl'].dtype == np.float32
+            np.testing.assert_allclose(_trades.pnl.sum().values, trades.pnl.sum().values, rtol=1e-5)
+        finally:
+            vbt.defaults.records['compact'] = False
+            vbt.defaults.records['compact_float_dtype'] = None
+
     def test_indexing(self):
         record_arrays_close(
             records['a'].records_arr,
@@ -1714,6 +1895,14 @@ class TestEvents:
             pd.Series(np.array([4.4177491576436, 0.5405954574869949]), index=pd.Int64Index([0, 1], dtype='int64'))
         )
 
+    def test_metrics_parallel(self):
+        for _events in (events, events_grouped):
+            for metric in ('win_rate', 'profit_factor', 'expectancy', 'sqn'):
+                pd.testing.assert_series_equal(
+                    getattr(_events, metric)(parallel=True),
+                    getattr(_events, metric)(parallel=False)
+                )
+
     def test_status(self):
         np.testing.assert_array_almost_equal(
             events.status.mapped_arr,
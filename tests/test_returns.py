@@ -6,6 +6,7 @@ import empyrical
 
 from vectorbt import defaults
 from vectorbt.records.drawdowns import Drawdowns
+from vectorbt.returns import nb as returns_nb
 
 from tests.utils import isclose
 
@@ -33,6 +34,14 @@ factor_returns = pd.DataFrame({
     'c': ret['c'] * np.random.uniform(0.8, 1.2, ret.shape[0]) * 3
 })
 
+big_ret = pd.DataFrame(
+    np.random.RandomState(42).normal(0.001, 0.05, size=(50, 3)),
+    index=pd.date_range('2018-01-01', periods=50),
+    columns=['a', 'b', 'c']
+)
+big_ret.iloc[5, 0] = np.nan
+big_ret.iloc[10:13, 1] = np.nan
+
 
 # ############# accessors.py ############# #
 
@@ -47,6 +56,29 @@ class TestAccessors:
         assert pd.Series([1, 2, 3]).vbt.returns(freq='3D').freq == day_dt * 3
         assert pd.Series([1, 2, 3]).vbt.returns(freq=np.timedelta64(4, 'D')).freq == day_dt * 4
 
+    def test_to_pd(self):
+        np.testing.assert_array_equal(
+            ret.vbt.returns(to_pd=False).cumulative(),
+            ret.vbt.returns.cumulative().values
+        )
+        np.testing.assert_array_equal(
+            ret.vbt.returns(to_pd=False).sharpe_ratio(),
+            ret.vbt.returns.sharpe_ratio().values
+        )
+        np.testing.assert_array_equal(
+            ret.vbt.returns(to_pd=False).rolling_sharpe_ratio(3),
+            ret.vbt.returns.rolling_sharpe_ratio(3).values
+        )
+        np.testing.assert_array_equal(
+            ret.vbt.returns(to_pd=False).metrics(),
+            ret.vbt.returns.metrics().values
+        )
+        assert ret['a'].vbt.returns(to_pd=False).total() == ret['a'].vbt.returns.total()
+        pd.testing.assert_series_equal(
+            ret.vbt.returns(to_pd=False).drawdowns().max_drawdown(),
+            ret.vbt.returns.drawdowns().max_drawdown()
+        )
+
     def test_year_freq(self):
         assert ret.vbt.returns.year_freq == pd.to_timedelta(defaults.returns['year_freq'])
         assert ret['a'].vbt.returns.year_freq == pd.to_timedelta(defaults.returns['year_freq'])
@@ -324,6 +356,39 @@ class TestAccessors:
             pd.Series([res_a, res_b, res_c], index=ret.columns)
         )
 
+    @pytest.mark.parametrize(
+        "test_cutoff",
+        [0.05, 0.1, 0.5],
+    )
+    def test_tail_metrics(self, test_cutoff):
+        np.random.seed(42)
+        big_ret = np.random.normal(0.001, 0.05, size=(101, 3))
+        big_ret[5, 0] = np.nan
+        big_ret[10:60, 1] = np.nan
+        big_ret[:, 2] = np.nan
+        tail_ratio = np.empty(3, dtype=np.float_)
+        var = np.empty(3, dtype=np.float_)
+        cvar = np.empty(3, dtype=np.float_)
+        for col in range(3):
+            col_ret = big_ret[:, col]
+            cutoff_index = int((len(col_ret) - 1) * test_cutoff)
+            cvar[col] = np.mean(np.sort(col_ret)[:cutoff_index + 1])
+            col_ret = col_ret[~np.isnan(col_ret)]
+            if len(col_ret) == 0:
+                tail_ratio[col] = np.nan
+                var[col] = np.nan
+                continue
+            tail_ratio[col] = np.abs(np.percentile(col_ret, 95)) / np.abs(np.percentile(col_ret, 5))
+            var[col] = np.percentile(col_ret, 100 * test_cutoff)
+        cutoff = np.full(3, test_cutoff)
+        np.testing.assert_allclose(returns_nb.tail_ratio_nb(big_ret), tail_ratio)
+        np.testing.assert_allclose(returns_nb.value_at_risk_nb(big_ret, cutoff), var)
+        np.testing.assert_allclose(returns_nb.conditional_value_at_risk_nb(big_ret, cutoff), cvar)
+        np.testing.assert_allclose(
+            returns_nb.tail_metrics_nb(big_ret, cutoff),
+            np.array([tail_ratio, var, cvar])
+        )
+
     def test_capture(self):
         res_a = empyrical.capture(ret['a'], factor_returns['a'])
         res_b = empyrical.capture(ret['b'], factor_returns['b'])
@@ -394,6 +459,115 @@ class TestAccessors:
             pd.Series([res_a, res_b, res_c], index=ret.columns)
         )
 
+    @pytest.mark.parametrize(
+        "test_window,test_minp",
+        [(1, None), (3, None), (10, None), (10, 5)],
+    )
+    def test_rolling_metrics(self, test_window, test_minp):
+        minp = test_window if test_minp is None else test_minp
+        metrics = [
+            ('annualized', {}),
+            ('annualized_volatility', dict(levy_alpha=3.)),
+            ('calmar_ratio', {}),
+            ('sharpe_ratio', dict(risk_free=0.01)),
+            ('downside_risk', dict(required_return=0.01)),
+            ('sortino_ratio', dict(required_return=0.01)),
+            ('max_drawdown', {})
+        ]
+        for func_name, kwargs in metrics:
+            target = np.empty(big_ret.shape, dtype=np.float_)
+            for i in range(big_ret.shape[0]):
+                window_ret = big_ret.iloc[max(0, i + 1 - test_window):i + 1]
+                window_acc = window_ret.vbt.returns(freq='1 days')
+                target[i] = getattr(window_acc, func_name)(**kwargs).values
+                target[i, window_ret.count().values < minp] = np.nan
+            np.testing.assert_allclose(
+                getattr(big_ret.vbt.returns, 'rolling_' + func_name)(test_window, minp=test_minp, **kwargs).values,
+                target,
+                rtol=1e-6
+            )
+            pd.testing.assert_frame_equal(
+                getattr(big_ret.vbt.returns, 'expanding_' + func_name)(minp=minp, **kwargs),
+                getattr(big_ret.vbt.returns, 'rolling_' + func_name)(big_ret.shape[0], minp=minp, **kwargs)
+            )
+        pd.testing.assert_series_equal(
+            big_ret['a'].vbt.returns.rolling_sharpe_ratio(test_window, minp=test_minp),
+            big_ret.vbt.returns.rolling_sharpe_ratio(test_window, minp=test_minp)['a']
+        )
+
+    @pytest.mark.parametrize(
+        "test_window",
+        [1, 3, 5],
+    )
+    def test_rolling_non_positive_growth(self, test_window):
+        # Returns of -100% and below have no log growth factor
+        nonpos_ret = np.array([
+            [0.1, 0.1],
+            [-0.2, -1.5],
+            [0.05, 0.2],
+            [-1., 0.1],
+            [0.1, -0.3],
+            [0.2, 0.2],
+            [-0.1, 0.1],
+            [0.3, np.nan],
+            [np.nan, -2.],
+            [0.1, 0.1]
+        ])
+        target_mdd = np.empty(nonpos_ret.shape, dtype=np.float_)
+        target_calmar = np.empty(nonpos_ret.shape, dtype=np.float_)
+        for i in range(nonpos_ret.shape[0]):
+            window_ret = nonpos_ret[max(0, i + 1 - test_window):i + 1]
+            target_mdd[i] = returns_nb.max_drawdown_nb(window_ret)
+            target_calmar[i] = returns_nb.calmar_ratio_nb(window_ret, 252)
+            target_mdd[i, np.isnan(window_ret).all(axis=0)] = np.nan
+            target_calmar[i, np.isnan(window_ret).all(axis=0)] = np.nan
+        np.testing.assert_allclose(
+            returns_nb.rolling_max_drawdown_nb(nonpos_ret, test_window, minp=1),
+            target_mdd,
+            rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            returns_nb.rolling_calmar_ratio_nb(nonpos_ret, test_window, 252, minp=1),
+            target_calmar,
+            rtol=1e-6
+        )
+
+    def test_metrics(self):
+        kwargs = dict(risk_free=0.01, required_return=0.02, levy_alpha=3., cutoff=0.1)
+        metrics = [
+            ('total', {}),
+            ('annualized', {}),
+            ('annualized_volatility', dict(levy_alpha=3.)),
+            ('calmar_ratio', {}),
+            ('omega_ratio', dict(risk_free=0.01, required_return=0.02)),
+            ('sharpe_ratio', dict(risk_free=0.01)),
+            ('downside_risk', dict(required_return=0.02)),
+            ('sortino_ratio', dict(required_return=0.02)),
+            ('tail_ratio', {}),
+            ('value_at_risk', dict(cutoff=0.1)),
+            ('conditional_value_at_risk', dict(cutoff=0.1)),
+            ('max_drawdown', {})
+        ]
+        for test_ret in (ret, big_ret):
+            result = test_ret.vbt.returns.metrics(**kwargs)
+            assert list(result.index) == [func_name for func_name, _ in metrics]
+            for func_name, func_kwargs in metrics:
+                np.testing.assert_allclose(
+                    result.loc[func_name].values,
+                    getattr(test_ret.vbt.returns, func_name)(**func_kwargs).values,
+                    rtol=1e-6
+                )
+        result = ret['a'].vbt.returns.metrics(['sharpe_ratio', 'total'])
+        pd.testing.assert_index_equal(result.index, pd.Index(['sharpe_ratio', 'total']))
+        assert result.name == 'a'
+        np.testing.assert_allclose(
+            result.values,
+            [ret['a'].vbt.returns.sharpe_ratio(), ret['a'].vbt.returns.total()],
+            rtol=1e-6
+        )
+        with pytest.raises(Exception) as e_info:
+            ret.vbt.returns.metrics(['unknown'])
+
     def test_drawdowns(self):
         assert type(ret['a'].vbt.returns.drawdowns()) is Drawdowns
         assert ret['a'].vbt.returns.drawdowns().wrapper.freq == ret['a'].vbt.returns.freq
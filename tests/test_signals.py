@@ -50,6 +50,23 @@ class TestAccessors:
         assert pd.Series([False, True]).vbt.signals(freq='3D').freq == day_dt * 3
         assert pd.Series([False, True]).vbt.signals(freq=np.timedelta64(4, 'D')).freq == day_dt * 4
 
+    def test_to_pd(self):
+        np.testing.assert_array_equal(sig.vbt.signals(to_pd=False).rank(), sig.vbt.signals.rank().values)
+        np.testing.assert_array_equal(
+            sig.vbt.signals(to_pd=False).rank(reset_by=~sig),
+            sig.vbt.signals.rank(reset_by=~sig).values
+        )
+        np.testing.assert_array_equal(sig.vbt.signals(to_pd=False).first(), sig.vbt.signals.first().values)
+        np.testing.assert_array_equal(sig.vbt.signals(to_pd=False).nst(2), sig.vbt.signals.nst(2).values)
+        np.testing.assert_array_equal(
+            sig.vbt.signals(to_pd=False).generate_stop_exits(ts, 0.1),
+            sig.vbt.signals.generate_stop_exits(ts, 0.1).values
+        )
+        np.testing.assert_array_equal(
+            sig.vbt.signals(to_pd=False).avg_distance(),
+            sig.vbt.signals.avg_distance().values
+        )
+
     def test_shuffle(self):
         pd.testing.assert_series_equal(
             sig['a'].vbt.signals.shuffle(seed=seed),
@@ -1420,6 +1437,108 @@ class TestAccessors:
         )
 
 
+# ############# packed.py ############# #
+
+big_sig = pd.DataFrame(np.random.RandomState(seed).uniform(size=(21, 4)) > 0.6)
+packed_sig = sig.vbt.signals.pack()
+packed_big_sig = big_sig.vbt.signals.pack()
+
+
+class TestPackedSignals:
+    def test_pack(self):
+        np.testing.assert_array_equal(
+            packed_sig.packed,
+            np.array([[9, 18, 4]], dtype=np.uint8)
+        )
+        np.testing.assert_array_equal(
+            packed_big_sig.packed,
+            np.packbits(big_sig.values, axis=0, bitorder='little')
+        )
+        pd.testing.assert_frame_equal(packed_sig.unpack(), sig)
+        pd.testing.assert_frame_equal(packed_big_sig.unpack(), big_sig)
+        pd.testing.assert_series_equal(sig['a'].vbt.signals.pack().unpack(), sig['a'])
+        pd.testing.assert_frame_equal(packed_big_sig[[1, 2]].unpack(), big_sig[[1, 2]])
+        with pytest.raises(Exception) as e_info:
+            vbt.signals.PackedSignals(packed_sig.wrapper, np.zeros((2, 3), dtype=np.uint8))
+
+    def test_num_signals(self):
+        pd.testing.assert_series_equal(packed_sig.num_signals(), sig.vbt.signals.num_signals())
+        pd.testing.assert_series_equal(packed_big_sig.num_signals(), big_sig.vbt.signals.num_signals())
+
+    def test_map_reduce_between(self):
+        pd.testing.assert_series_equal(packed_sig.avg_distance(), sig.vbt.signals.avg_distance())
+        pd.testing.assert_series_equal(packed_big_sig.avg_distance(), big_sig.vbt.signals.avg_distance())
+        pd.testing.assert_series_equal(
+            packed_big_sig.avg_distance(to=(~packed_big_sig)),
+            big_sig.vbt.signals.avg_distance(to=~big_sig)
+        )
+
+    @pytest.mark.parametrize(
+        "test_kwargs",
+        [dict(), dict(after_false=True), dict(allow_gaps=True)],
+    )
+    def test_rank(self, test_kwargs):
+        pd.testing.assert_frame_equal(
+            packed_big_sig.rank(**test_kwargs),
+            big_sig.vbt.signals.rank(**test_kwargs)
+        )
+        pd.testing.assert_frame_equal(
+            packed_big_sig.rank(reset_by=~packed_big_sig, **test_kwargs),
+            big_sig.vbt.signals.rank(reset_by=~big_sig, **test_kwargs)
+        )
+        pd.testing.assert_frame_equal(
+            packed_big_sig.first(**test_kwargs).unpack(),
+            big_sig.vbt.signals.first(**test_kwargs)
+        )
+        pd.testing.assert_frame_equal(
+            packed_big_sig.nst(2, **test_kwargs).unpack(),
+            big_sig.vbt.signals.nst(2, **test_kwargs)
+        )
+        pd.testing.assert_frame_equal(
+            packed_big_sig.from_nst(2, **test_kwargs).unpack(),
+            big_sig.vbt.signals.from_nst(2, **test_kwargs)
+        )
+
+    def test_logical(self):
+        other = packed_big_sig.nst(1)
+        pd.testing.assert_frame_equal((packed_big_sig & other).unpack(), big_sig & other.unpack())
+        pd.testing.assert_frame_equal((packed_big_sig | other).unpack(), big_sig | other.unpack())
+        pd.testing.assert_frame_equal((packed_big_sig ^ other).unpack(), big_sig ^ other.unpack())
+        pd.testing.assert_frame_equal((~packed_big_sig).unpack(), ~big_sig)
+        np.testing.assert_array_equal((~packed_big_sig).packed[-1] >> 5, 0)
+        pd.testing.assert_frame_equal(
+            packed_big_sig.OR(other, ~other).unpack(),
+            big_sig.vbt.signals.OR(other.unpack(), ~other.unpack())
+        )
+        with pytest.raises(Exception) as e_info:
+            packed_big_sig & packed_sig
+
+
+# ############# sparse signals ############# #
+
+
+class TestSparseSignals:
+    def test_to_sparse(self):
+        idxs, col_index = nb.to_sparse_nb(sig.values)
+        np.testing.assert_array_equal(idxs, np.array([0, 3, 1, 4, 2]))
+        np.testing.assert_array_equal(col_index, np.array([[0, 2], [2, 4], [4, 5]]))
+        idxs, col_index = nb.to_sparse_nb(big_sig.values)
+        np.testing.assert_array_equal(idxs, np.nonzero(big_sig.values.T)[1])
+        np.testing.assert_array_equal(col_index[:, 1] - col_index[:, 0], big_sig.values.sum(axis=0))
+        np.testing.assert_array_equal(nb.from_sparse_nb(idxs, col_index, big_sig.shape[0]), big_sig.values)
+        idxs, col_index = nb.to_sparse_nb(np.full((5, 2), False))
+        assert idxs.shape == (0,)
+        np.testing.assert_array_equal(col_index, np.array([[0, 0], [0, 0]]))
+        np.testing.assert_array_equal(nb.from_sparse_nb(idxs, col_index, 5), np.full((5, 2), False))
+
+    def test_packed_to_sparse(self):
+        for a in (sig.values, big_sig.values, np.full((5, 2), False)):
+            idxs, col_index = nb.packed_to_sparse_nb(nb.pack_nb(a))
+            target_idxs, target_col_index = nb.to_sparse_nb(a)
+            np.testing.assert_array_equal(idxs, target_idxs)
+            np.testing.assert_array_equal(col_index, target_col_index)
+
+
 # ############# factory.py ############# #
 
 
@@ -2318,3 +2437,98 @@ class TestBasic:
             )
         )
 
+
+    def test_parallel(self):
+        big_ts = pd.DataFrame(np.random.RandomState(seed).uniform(0.5, 1.5, size=(100, 20))).cumprod()
+        big_entries = pd.DataFrame(np.random.RandomState(seed).uniform(size=(100, 20)) > 0.9)
+        stop = [0.05, -0.05, 0.1]
+
+        @njit
+        def col_func_nb(col, entries, exits, ts):
+            nb.generate_ex_col_nb(col, entries, 1, exits[:, col], nb.stop_choice_nb,
+                                  ts, -0.05, False, 1, True, None, True)
+
+        exits = np.full(big_entries.shape, False)
+        nb.apply_cols_parallel_nb(big_entries.shape[1], 0, col_func_nb, big_entries.values, exits, big_ts.values)
+        np.testing.assert_array_equal(
+            exits,
+            nb.generate_stop_ex_nb(big_entries.values, big_ts.values, -0.05, False, 1, True, True)
+        )
+
+        pd.testing.assert_frame_equal(
+            vbt.STEX.run(big_entries, big_ts, stop, trailing=[False, True], param_product=True, parallel=True).exits,
+            vbt.STEX.run(big_entries, big_ts, stop, trailing=[False, True], param_product=True).exits
+        )
+        stop_arrs = [np.full(big_ts.shape, 0.1), np.full(big_ts.shape, -0.1)]
+        pd.testing.assert_frame_equal(
+            vbt.STEX.run(big_entries, big_ts, stop_arrs, parallel=True).exits,
+            vbt.STEX.run(big_entries, big_ts, stop_arrs).exits
+        )
+        istex = vbt.ISTEX.run(big_entries, big_ts, stop, parallel=True)
+        istex_target = vbt.ISTEX.run(big_entries, big_ts, stop)
+        pd.testing.assert_frame_equal(istex.new_entries, istex_target.new_entries)
+        pd.testing.assert_frame_equal(istex.exits, istex_target.exits)
+        advstex = vbt.ADVSTEX.run(
+            big_entries, big_ts, big_ts * 1.1, big_ts * 0.9, big_ts, sl_stop=stop, tp_stop=0.1, parallel=True)
+        advstex_target = vbt.ADVSTEX.run(
+            big_entries, big_ts, big_ts * 1.1, big_ts * 0.9, big_ts, sl_stop=stop, tp_stop=0.1)
+        pd.testing.assert_frame_equal(advstex.exits, advstex_target.exits)
+        pd.testing.assert_frame_equal(advstex.hit_price, advstex_target.hit_price)
+        pd.testing.assert_frame_equal(advstex.stop_type, advstex_target.stop_type)
+
+        rprob = vbt.RPROB.run(entry_prob=[0.1, 0.2], exit_prob=0.1, input_shape=(100, 20), seed=seed, parallel=True)
+        rprob2 = vbt.RPROB.run(entry_prob=[0.1, 0.2], exit_prob=0.1, input_shape=(100, 20), seed=seed, parallel=True)
+        pd.testing.assert_frame_equal(rprob.entries, rprob2.entries)
+        pd.testing.assert_frame_equal(rprob.exits, rprob2.exits)
+        assert not (rprob.entries & rprob.exits).any().any()
+        rprobex = vbt.RPROBEX.run(big_entries, prob=[0.5, 1.], seed=seed, parallel=True)
+        rprobex2 = vbt.RPROBEX.run(big_entries, prob=[0.5, 1.], seed=seed, parallel=True)
+        pd.testing.assert_frame_equal(rprobex.exits, rprobex2.exits)
+        np.testing.assert_array_equal(
+            rprobex.exits.xs(1., level='rprobex_prob', axis=1).values,
+            vbt.RPROBEX.run(big_entries, prob=1.).exits.values
+        )
+
+    def test_grid(self):
+        big_ts = pd.DataFrame(np.random.RandomState(seed).uniform(0.5, 1.5, size=(100, 20))).cumprod()
+        big_entries = pd.DataFrame(np.random.RandomState(seed).uniform(size=(100, 20)) > 0.9)
+        stop = [0., 0.05, -0.05, 0.1]
+
+        for first in [True, False]:
+            for wait in [0, 1]:
+                pd.testing.assert_frame_equal(
+                    vbt.STEX.run(
+                        big_entries, big_ts, stop, trailing=[False, True], param_product=True,
+                        first=first, wait=wait).exits,
+                    vbt.STEX.run(
+                        big_entries, big_ts, stop, trailing=[False, True], param_product=True,
+                        first=first, wait=wait, use_grid=False).exits
+                )
+                for is_open_safe in [True, False]:
+                    advstex = vbt.ADVSTEX.run(
+                        big_entries, big_ts, big_ts * 1.1, big_ts * 0.9, big_ts,
+                        sl_stop=stop, ts_stop=[0., 0.1], tp_stop=[0., 0.1], param_product=True,
+                        first=first, wait=wait, is_open_safe=is_open_safe)
+                    advstex_target = vbt.ADVSTEX.run(
+                        big_entries, big_ts, big_ts * 1.1, big_ts * 0.9, big_ts,
+                        sl_stop=stop, ts_stop=[0., 0.1], tp_stop=[0., 0.1], param_product=True,
+                        first=first, wait=wait, is_open_safe=is_open_safe, use_grid=False)
+                    pd.testing.assert_frame_equal(advstex.exits, advstex_target.exits)
+                    pd.testing.assert_frame_equal(advstex.hit_price, advstex_target.hit_price)
+                    pd.testing.assert_frame_equal(advstex.stop_type, advstex_target.stop_type)
+        # element-wise stops fall back to the choice function
+        element_stop = [np.full(big_ts.shape, 0.1), np.full(big_ts.shape, -0.05)]
+        pd.testing.assert_frame_equal(
+            vbt.STEX.run(big_entries, big_ts, element_stop).exits,
+            vbt.STEX.run(big_entries, big_ts, element_stop, use_grid=False).exits
+        )
+        pd.testing.assert_frame_equal(
+            vbt.STEX.run(big_entries, big_ts, element_stop).exits,
+            vbt.STEX.run(big_entries, big_ts, [0.1, -0.05]).exits,
+            check_names=False, check_column_type=False
+        )
+        np.testing.assert_array_equal(
+            nb.generate_stop_ex_grid_nb(
+                big_entries.values, big_ts.values, np.array([-0.05]), np.array([True]), 1, True, True),
+            nb.generate_stop_ex_nb(big_entries.values, big_ts.values, -0.05, True, 1, True, True)
+        )
@@ -5,7 +5,7 @@ import pytest
 import os
 
 from vectorbt import defaults
-from vectorbt.utils import checks, config, decorators, math, array, random
+from vectorbt.utils import checks, config, decorators, math, array, random, disk_cache
 
 from tests.utils import hash
 
@@ -221,6 +221,17 @@ class TestChecks:
         assert checks.is_array(pd.Series([1, 2, 3]))
         assert checks.is_array(pd.DataFrame([1, 2, 3]))
 
+    def test_is_memmap(self, tmp_path):
+        a = np.memmap(str(tmp_path / 'a.dat'), dtype=np.float_, mode='w+', shape=(3, 2))
+        assert checks.is_memmap(a)
+        assert checks.is_memmap(a[:, 0])
+        assert checks.is_memmap(np.asarray(a))
+        assert checks.is_memmap(np.broadcast_to(a[:, :1], (3, 10)))
+        assert checks.is_memmap(pd.DataFrame(a))
+        assert not checks.is_memmap(np.array(a))
+        assert not checks.is_memmap(np.array([0]))
+        assert not checks.is_memmap(0)
+
     def test_is_numba_func(self):
         def test_func(x):
             return x
@@ -551,6 +562,26 @@ class TestArray:
         np.testing.assert_array_equal(np.sort(a), A)
         np.testing.assert_array_equal(a[I], A)
 
+    @pytest.mark.parametrize(
+        "test_k",
+        [0, 1, 500, 998, 999],
+    )
+    def test_select_nb(self, test_k):
+        a = np.random.uniform(size=1000)
+        a[::7] = 0.5  # duplicates
+        A = a.copy()
+        assert array.select_nb(A, test_k) == np.sort(a)[test_k]
+        assert np.all(A[:test_k] <= A[test_k])
+        assert np.all(A[test_k + 1:] >= A[test_k])
+        np.testing.assert_array_equal(np.sort(A), np.sort(a))
+
+    def test_select_ranks_nb(self):
+        a = np.random.uniform(size=1000)
+        A = a.copy()
+        ranks = np.array([0, 10, 10, 11, 500, 999])
+        array.select_ranks_nb(A, ranks)
+        np.testing.assert_array_equal(A[ranks], np.sort(a)[ranks])
+
     def test_get_ranges_arr(self):
         np.testing.assert_array_equal(
             array.get_ranges_arr(0, 3),
@@ -585,3 +616,58 @@ class TestRandom:
             assert test_seed_nb() == 0.3745401188473625
 
 
+# ############# disk_cache.py ############# #
+
+class TestDiskCache:
+    def test_hash_objs(self):
+        a = np.array([1., 2., 3.])
+        assert disk_cache.hash_objs(a, (1, 2)) == disk_cache.hash_objs(a.copy(), (1, 2))
+        assert disk_cache.hash_objs(a, (1, 2)) != disk_cache.hash_objs(a, (1, 3))
+        assert disk_cache.hash_objs(a) != disk_cache.hash_objs(a.astype(np.float32))
+        assert disk_cache.hash_objs(a) != disk_cache.hash_objs(a[:, None])
+
+        def make_func(x):
+            def func():
+                return x
+            return func
+
+        def make_func2(x):
+            def func():
+                return x + 1
+            return func
+
+        # enclosed objects are not hashed, only the code
+        assert disk_cache.hash_objs(make_func(1)) == disk_cache.hash_objs(make_func(2))
+        assert disk_cache.hash_objs(make_func) != disk_cache.hash_objs(make_func2)
+        with pytest.raises(Exception) as e_info:
+            disk_cache.hash_objs(object())
+
+    def test_get_set(self, tmp_path):
+        cache = disk_cache.DiskCache(str(tmp_path))
+        key = cache.make_key('a', np.arange(3))
+        assert cache.get(key) is None
+        assert key not in cache
+        assert cache.set(key, [np.arange(3), np.arange(6).reshape((2, 3))], meta=[1, 2])
+        assert key in cache
+        arrays, meta = cache.get(key)
+        np.testing.assert_array_equal(arrays[0], np.arange(3))
+        np.testing.assert_array_equal(arrays[1], np.arange(6).reshape((2, 3)))
+        assert isinstance(arrays[0], np.memmap)
+        assert meta == [1, 2]
+        cache.delete(key)
+        assert key not in cache
+
+    def test_evict(self, tmp_path):
+        cache = disk_cache.DiskCache(str(tmp_path))
+        cache.set('a', [np.zeros(1000)])
+        entry_size = cache.size()
+        cache = disk_cache.DiskCache(str(tmp_path), max_size=int(entry_size * 2.5))
+        os.utime(os.path.join(str(tmp_path), 'a'), (0, 0))
+        cache.set('b', [np.zeros(1000)])
+        cache.get('a')  # a is now most recently used
+        cache.set('c', [np.zeros(1000)])
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        cache.clear()
+        assert cache.size() == 0
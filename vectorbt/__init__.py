@@ -467,6 +467,8 @@ Note: you will need to run the notebook to play with widgets.
 - [Detecting and backtesting common candlestick patterns](https://github.com/polakowo/vectorbt/tree/master/apps/candlestick-patterns)
 """
 
+__version__ = '0.14.4'
+
 # Load all accessors
 import vectorbt.root_accessors
 import vectorbt.base.accessors
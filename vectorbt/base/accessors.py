@@ -37,22 +37,67 @@ class Base_Accessor(ArrayWrapper):
 
     Series is just a DataFrame with one column, hence to avoid defining methods exclusively for 1-dim data,
     we will convert any Series to a DataFrame and perform matrix computation on it. Afterwards,
-    by using `Base_Accessor.wrap`, we will convert the 2-dim output back to a Series."""
-
-    def __init__(self, obj, freq=None):
+    by using `Base_Accessor.wrap`, we will convert the 2-dim output back to a Series.
+
+    You can also call the accessor with `to_pd=False` to make every method that goes through
+    `Base_Accessor.wrap` or `Base_Accessor.wrap_reduced` return the raw NumPy array instead of
+    a pandas object. This avoids building a new index and columns on each call in performance-critical code.
+    The accessor itself is still a `vectorbt.base.array_wrapper.ArrayWrapper`, so the metadata
+    required to wrap the result later is always at hand.
+
+    Example:
+        ```python-repl
+        >>> import vectorbt as vbt
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({'a': [1, 2, 3], 'b': [3, 2, 1]})
+
+        >>> df.vbt(to_pd=False).rolling_mean(2)
+        array([[nan, nan],
+               [1.5, 2.5],
+               [2.5, 1.5]])
+        ```"""
+
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
         self._obj = obj
+        self._to_pd = to_pd
 
-        # Initialize array wrapper
-        wrapper = ArrayWrapper.from_obj(obj)
-        ArrayWrapper.__init__(self, index=wrapper.index, columns=wrapper.columns, ndim=wrapper.ndim, freq=freq)
+        # Initialize array wrapper (without building a temporary one)
+        ArrayWrapper.__init__(
+            self,
+            index=index_fns.get_index(obj, 0),
+            columns=index_fns.get_index(obj, 1),
+            ndim=obj.ndim,
+            freq=freq
+        )
 
     def __call__(self, *args, **kwargs):
         """Allows passing arguments to the initializer."""
 
         return self.__class__(self._obj, *args, **kwargs)
 
+    @property
+    def to_pd(self):
+        """Whether to convert outputs of `Base_Accessor.wrap` and `Base_Accessor.wrap_reduced` to pandas."""
+        return self._to_pd
+
+    def wrap(self, *args, to_pd=None, **kwargs):
+        """See `vectorbt.base.array_wrapper.ArrayWrapper.wrap`.
+
+        If `to_pd` is None, defaults to `Base_Accessor.to_pd`."""
+        if to_pd is None:
+            to_pd = self.to_pd
+        return ArrayWrapper.wrap(self, *args, to_pd=to_pd, **kwargs)
+
+    def wrap_reduced(self, *args, to_pd=None, **kwargs):
+        """See `vectorbt.base.array_wrapper.ArrayWrapper.wrap_reduced`.
+
+        If `to_pd` is None, defaults to `Base_Accessor.to_pd`."""
+        if to_pd is None:
+            to_pd = self.to_pd
+        return ArrayWrapper.wrap_reduced(self, *args, to_pd=to_pd, **kwargs)
+
     # ############# Creation ############# #
 
     @classmethod
@@ -413,7 +458,7 @@ class Base_Accessor(ArrayWrapper):
             new_obj_arr = np.asarray(new_obj)
             new_other_arr = np.asarray(new_other)
         result = combine_func(new_obj_arr, new_other_arr, *args, **kwargs)
-        return new_obj.vbt.wrap(result)
+        return new_obj.vbt.wrap(result, to_pd=self.to_pd)
 
     def combine_with_multiple(self, others, *args, combine_func=None, to_2d=False,
                               concat=False, broadcast_kwargs={}, keys=None, **kwargs):
@@ -486,7 +531,7 @@ class Base_Accessor(ArrayWrapper):
             else:
                 top_columns = pd.Index(np.arange(len(new_others)), name='combine_idx')
                 new_columns = index_fns.combine_indexes(top_columns, columns)
-            return new_obj.vbt.wrap(result, columns=new_columns)
+            return new_obj.vbt.wrap(result, columns=new_columns, to_pd=self.to_pd)
         else:
             # Combine arguments pairwise into one object
             if checks.is_numba_func(combine_func):
@@ -495,7 +540,7 @@ class Base_Accessor(ArrayWrapper):
                 result = combine_fns.combine_multiple_nb(bc_arrays, combine_func, *args, **kwargs)
             else:
                 result = combine_fns.combine_multiple(bc_arrays, combine_func, *args, **kwargs)
-            return new_obj.vbt.wrap(result)
+            return new_obj.vbt.wrap(result, to_pd=self.to_pd)
 
 
 class Base_SRAccessor(Base_Accessor):
@@ -503,12 +548,12 @@ class Base_SRAccessor(Base_Accessor):
 
     Accessible through `pd.Series.vbt` and all child accessors."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
         checks.assert_type(obj, pd.Series)
 
-        Base_Accessor.__init__(self, obj, freq=freq)
+        Base_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     @class_or_instancemethod
     def is_series(self_or_cls):
@@ -524,12 +569,12 @@ class Base_DFAccessor(Base_Accessor):
 
     Accessible through `pd.DataFrame.vbt` and all child accessors."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
         checks.assert_type(obj, pd.DataFrame)
 
-        Base_Accessor.__init__(self, obj, freq=freq)
+        Base_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     @class_or_instancemethod
     def is_series(self_or_cls):
@@ -7,11 +7,12 @@ import warnings
 from vectorbt import defaults
 from vectorbt.utils import checks
 from vectorbt.utils.config import Configured
+from vectorbt.utils.decorators import cached_method
 from vectorbt.utils.datetime import freq_delta, DatetimeTypes, to_time_units
 from vectorbt.utils.array import get_ranges_arr
 from vectorbt.base import index_fns, reshape_fns
 from vectorbt.base.indexing import IndexingError, PandasIndexer
-from vectorbt.base.column_grouper import ColumnGrouper
+from vectorbt.base.column_grouper import ColumnGrouper, get_groups_and_index
 
 
 def indexing_on_wrapper_meta(obj, pd_indexing_func, index=None, columns=None,
@@ -170,6 +171,16 @@ def indexing_on_wrapper_meta(obj, pd_indexing_func, index=None, columns=None,
     ), idx_idxs, col_idxs, col_idxs
 
 
+def _name_from_columns(columns):
+    """Get the name of a Series from its columns."""
+    if columns is not None and len(columns) == 1:
+        name = columns[0]
+        if name == 0:  # was a Series before
+            return None
+        return name
+    return None
+
+
 def _indexing_func(obj, pd_indexing_func, **kwargs):
     """Perform indexing on `ArrayWrapper`"""
     return indexing_on_wrapper_meta(obj, pd_indexing_func, **kwargs)[0]
@@ -332,25 +343,42 @@ class ArrayWrapper(Configured, PandasIndexer):
             raise ValueError("Couldn't parse the frequency of index. You must set `freq`.")
         return to_time_units(a, self.freq)
 
-    def wrap(self, a, index=None, columns=None, dtype=None, collapse=None, **kwargs):
-        """Wrap a NumPy array using the stored metadata."""
-        checks.assert_ndim(a, (1, 2))
+    @cached_method(typed=True)
+    def get_wrap_meta(self, **kwargs):
+        """Get grouped columns, the name of a Series, and whether to collapse a single group into a Series.
+
+        Resolved once per grouping and reused by `ArrayWrapper.wrap` and `ArrayWrapper.wrap_reduced`,
+        such that repeated wraps don't rebuild the columns.
+
+        Cached by type and value, since `group_by=False` (no grouping) and `group_by=0` (first level)
+        compare equal but mean different groupings."""
         group_by = self.grouper.resolve_group_by(**kwargs)
+        columns = get_groups_and_index(self.columns, group_by)[1]
+        collapse = group_by is not None and group_by is not False and self.grouped_ndim == 1
+        return columns, _name_from_columns(columns), collapse
+
+    def wrap(self, a, index=None, columns=None, dtype=None, collapse=None, to_pd=True, **kwargs):
+        """Wrap a NumPy array using the stored metadata.
+
+        Index and columns objects are reused (see `ArrayWrapper.get_wrap_meta`), and the array
+        is wrapped as a single block without copying, unless `dtype` requires a cast.
+
+        If `to_pd` is False, doesn't construct any pandas object and returns the NumPy array
+        with the same number of dimensions as the pandas object would have. This way, results
+        of multiple operations can be kept as arrays and wrapped once at the end."""
+        checks.assert_ndim(a, (1, 2))
+        _columns, name, _collapse = self.get_wrap_meta(**kwargs)
 
         a = np.asarray(a)
         a = reshape_fns.soft_to_ndim(a, self.ndim)
         if index is None:
             index = self.index
         if columns is None:
-            columns = self.grouper.get_columns(**kwargs)
-        if collapse is None:
-            collapse = group_by is not None and group_by is not False and self.grouped_ndim == 1
-        if columns is not None and len(columns) == 1:
-            name = columns[0]
-            if name == 0:  # was a Series before
-                name = None
+            columns = _columns
         else:
-            name = None
+            name = _name_from_columns(columns)
+        if collapse is None:
+            collapse = _collapse
 
         # Perform checks
         if index is not None:
@@ -358,31 +386,43 @@ class ArrayWrapper(Configured, PandasIndexer):
         if a.ndim == 2 and columns is not None:
             checks.assert_shape_equal(a, columns, axis=(1, 0))
 
-        if a.ndim == 1:
-            return pd.Series(a, index=index, name=name, dtype=dtype)
         if a.ndim == 2 and a.shape[1] == 1 and collapse:
-            return pd.Series(a[:, 0], index=index, name=name, dtype=dtype)
-        return pd.DataFrame(a, index=index, columns=columns, dtype=dtype)
+            a = a[:, 0]
+        if not to_pd:
+            if dtype is not None:
+                return a.astype(dtype, copy=False)
+            return a
+        if a.ndim == 1:
+            return pd.Series(a, index=index, name=name, dtype=dtype, copy=False)
+        return pd.DataFrame(a, index=index, columns=columns, dtype=dtype, copy=False)
 
-    def wrap_reduced(self, a, index=None, columns=None, time_units=False, collapse=None, **kwargs):
+    def wrap_reduced(self, a, index=None, columns=None, time_units=False, collapse=None, to_pd=True, **kwargs):
         """Wrap result of reduction.
 
         `index` can be set when reducing to an array of values (vs. one value) per column.
         `columns` can be set to override object's default columns.
 
-        If `time_units` is set, calls `to_time_units`."""
+        If `time_units` is set, calls `to_time_units`.
+
+        If `to_pd` is False, doesn't construct any pandas object and returns the NumPy array
+        (or scalar) with the same number of dimensions as the pandas object would have.
+        See `ArrayWrapper.wrap`."""
         checks.assert_not_none(self.ndim)
-        group_by = self.grouper.resolve_group_by(**kwargs)
+        _columns, name, _collapse = self.get_wrap_meta(**kwargs)
         if columns is None:
-            columns = self.grouper.get_columns(**kwargs)
+            columns = _columns
+        else:
+            name = _name_from_columns(columns)
         if collapse is None:
-            collapse = group_by is not None and group_by is not False and self.grouped_ndim == 1
+            collapse = _collapse
 
         a = np.asarray(a)
         if time_units:
             a = self.to_time_units(a)
         if a.ndim == 0:
             # Scalar per Series/DataFrame
+            if not to_pd:
+                return a
             if time_units:
                 return pd.to_timedelta(a.item())
             return a.item()
@@ -390,23 +430,25 @@ class ArrayWrapper(Configured, PandasIndexer):
             if self.ndim == 1 or (self.ndim == 2 and len(columns) == 1 and collapse):
                 if a.shape[0] == 1:
                     # Scalar per Series/DataFrame with one column
-                    if time_units:
+                    if time_units and to_pd:
                         return pd.to_timedelta(a[0])
                     return a[0]
                 # Array per Series
-                name = columns[0]
-                if name == 0:  # was a Series before
-                    name = None
-                return pd.Series(a, index=index, name=name)
+                if not to_pd:
+                    return a
+                return pd.Series(a, index=index, name=name, copy=False)
             # Scalar per column in a DataFrame
+            if not to_pd:
+                return a
             if index is None:
                 index = columns
-            return pd.Series(a, index=index)
+            return pd.Series(a, index=index, copy=False)
         if self.ndim == 1:
             # Array per Series
-            name = columns[0]
-            if name == 0:  # was a Series before
-                name = None
-            return pd.Series(a[:, 0], index=index, name=name)
+            if not to_pd:
+                return a[:, 0]
+            return pd.Series(a[:, 0], index=index, name=name, copy=False)
         # Array per column in a DataFrame
-        return pd.DataFrame(a, index=index, columns=columns)
+        if not to_pd:
+            return a
+        return pd.DataFrame(a, index=index, columns=columns, copy=False)
@@ -1,7 +1,7 @@
 """Functions for combining arrays."""
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.typed import List
 
 from vectorbt.base import reshape_fns
@@ -48,6 +48,29 @@ def apply_and_concat_one_nb(n, apply_func_nb, *args):  # numba doesn't accepts *
     return output
 
 
+@njit(parallel=True)
+def apply_and_concat_one_parallel_nb(n, apply_func_nb, *args):
+    """A parallel version of `apply_and_concat_one_nb`.
+
+    Applies `apply_func_nb` at 0 to allocate the output, and then distributes the remaining
+    applications across threads using `numba.prange`. Each thread writes directly into its
+    own block of the output.
+
+    !!! note
+        * `apply_func_nb` must be Numba-compiled and thread-safe
+        * Output of `apply_func_nb` must have the same shape at each `i`
+        * `*args` must be arrays or scalars, since tuples cannot be passed into the `prange` body
+        * No support for `**kwargs`
+    """
+    output_0 = to_2d_one_nb(apply_func_nb(0, *args))
+    n_cols = output_0.shape[1]
+    output = np.empty((output_0.shape[0], n * n_cols), dtype=output_0.dtype)
+    output[:, :n_cols] = output_0
+    for i in prange(1, n):
+        output[:, i * n_cols:(i + 1) * n_cols] = to_2d_one_nb(apply_func_nb(i, *args))
+    return output
+
+
 def apply_and_concat_multiple(n, apply_func, *args, **kwargs):
     """Identical to `apply_and_concat_one`, except that the result of `apply_func` must be 
     multiple 1-dim or 2-dim arrays. Each of these arrays at `i` will be concatenated with the
@@ -93,6 +116,34 @@ def apply_and_concat_multiple_nb(n, apply_func_nb, *args):
     return outputs
 
 
+@njit(parallel=True)
+def apply_and_concat_multiple_parallel_nb(n, apply_func_nb, *args):
+    """A parallel version of `apply_and_concat_multiple_nb`.
+
+    See `apply_and_concat_one_parallel_nb`.
+
+    !!! note
+        * Output of `apply_func_nb` must be strictly homogeneous
+        * `apply_func_nb` must be Numba-compiled and thread-safe
+        * Output of `apply_func_nb` must have the same shape at each `i`
+        * `*args` must be arrays or scalars, since tuples cannot be passed into the `prange` body
+        * No support for `**kwargs`
+    """
+    outputs = []
+    outputs_0 = to_2d_multiple_nb(apply_func_nb(0, *args))
+    for j in range(len(outputs_0)):
+        n_cols = outputs_0[j].shape[1]
+        output = np.empty((outputs_0[j].shape[0], n * n_cols), dtype=outputs_0[j].dtype)
+        output[:, :n_cols] = outputs_0[j]
+        outputs.append(output)
+    for i in prange(1, n):
+        outputs_i = to_2d_multiple_nb(apply_func_nb(i, *args))
+        for j in range(len(outputs_i)):
+            n_cols = outputs_i[j].shape[1]
+            outputs[j][:, i * n_cols:(i + 1) * n_cols] = outputs_i[j]
+    return outputs
+
+
 def select_and_combine(i, obj, others, combine_func, *args, **kwargs):
     """Combine `obj` and an element from `others` at `i` using `combine_func`."""
     return combine_func(obj, others[i], *args, **kwargs)
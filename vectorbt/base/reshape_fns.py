@@ -251,6 +251,9 @@ def broadcast(*args, to_shape=None, to_pd=None, to_frame=None, align_index=None,
         index_from (any): Broadcasting rule for index.
         columns_from (any): Broadcasting rule for columns.
         require_kwargs (dict or list of dict): Keyword arguments passed to `np.require`.
+
+            Memory-mapped arrays (see `vectorbt.utils.checks.is_memmap`) are never copied
+            to satisfy the `W` requirement, as this would load them into memory.
         keep_raw (bool, tuple or list): Whether to keep the unbroadcasted version of the array.
 
             Only makes sure that the array can be broadcast to the target shape.
@@ -466,7 +469,17 @@ def broadcast(*args, to_shape=None, to_pd=None, to_frame=None, align_index=None,
             _require_kwargs = require_kwargs[i]
         else:
             _require_kwargs = require_kwargs
-        new_args[i] = np.require(new_args[i], **_require_kwargs)
+        if checks.is_memmap(new_args[i]):
+            # Making a memory-mapped array writeable would load it into memory
+            requirements = _require_kwargs.get('requirements', None)
+            if requirements is not None:
+                if isinstance(requirements, str):
+                    requirements = [requirements]
+                requirements = [r for r in requirements if r.upper() not in ('W', 'WRITEABLE')]
+                _require_kwargs = {**_require_kwargs, 'requirements': requirements}
+            new_args[i] = np.asarray(np.require(new_args[i], **_require_kwargs))
+        else:
+            new_args[i] = np.require(new_args[i], **_require_kwargs)
 
     if is_pd:
         # Decide on index and columns
@@ -802,6 +815,23 @@ def flex_select_nb(i, col, a, flex_i, flex_col, flex_2d):
     return a[flex_i, flex_col]
 
 
+def flex_select_cols(a, from_col, to_col, flex_2d):
+    """Select columns from `from_col` to `to_col` of `a` as if it has been broadcast.
+
+    Returns a view that can be used with `flex_select_nb` on the selected range of columns.
+    Elements that are shared by all columns are returned as-is."""
+    a = np.asarray(a)
+    if a.ndim == 0:
+        return a
+    if a.ndim == 1:
+        if flex_2d and a.shape[0] > 1:
+            return a[from_col:to_col]
+        return a
+    if a.shape[1] > 1:
+        return a[:, from_col:to_col]
+    return a
+
+
 @njit(cache=True)
 def flex_select_auto_nb(i, col, a, flex_2d):
     """Combines `flex_choose_i_and_col_nb` and `flex_select_nb`.
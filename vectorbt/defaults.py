@@ -12,6 +12,8 @@ Changes take effect immediately."""
 
 import numpy as np
 import json
+import os
+import tempfile
 
 from vectorbt.utils.config import Config
 
@@ -137,6 +139,58 @@ caching = True
 
 Disable for performance tests."""
 
+# Generic
+generic = Config(
+    parallel=False
+)
+"""_"""
+
+__pdoc__['generic'] = f"""Parameters for generic functions.
+
+See `vectorbt.generic.accessors.Generic_Accessor`.
+
+```plaintext
+{json.dumps(generic, indent=2)}
+```
+"""
+
+# Indicators
+indicators = Config(
+    parallel=False,
+    disk_cache=False,
+    disk_cache_dir=os.path.join(tempfile.gettempdir(), 'vectorbt_cache'),
+    disk_cache_max_size=1024 ** 3,
+    disk_cache_mmap_mode='c',
+    float_dtype=None
+)
+"""_"""
+
+__pdoc__['indicators'] = f"""Parameters for indicators.
+
+See `vectorbt.indicators.factory.run_pipeline`.
+
+```plaintext
+{json.dumps(indicators, indent=2)}
+```
+"""
+
+# Records
+records = Config(
+    parallel=False,
+    compact=False,
+    compact_float_dtype=None
+)
+"""_"""
+
+__pdoc__['records'] = f"""Parameters for records and mapped arrays.
+
+See `vectorbt.records.base.MappedArray.reduce` and `vectorbt.records.base.compact_records_dtype`.
+
+```plaintext
+{json.dumps(records, indent=2)}
+```
+"""
+
 # Returns
 returns = Config(
     year_freq='365 days'
@@ -166,6 +220,10 @@ portfolio = Config(
     conflict_mode='Ignore',
     cash_sharing=False,
     row_wise=False,
+    parallel=False,
+    chunk_size=None,
+    max_memory=None,
+    sparse=False,
     seed=None,
     freq=None,
     incl_unrealized=False
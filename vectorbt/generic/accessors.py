@@ -38,6 +38,7 @@ import plotly.graph_objects as go
 from numba.typed import Dict
 import warnings
 
+from vectorbt import defaults
 from vectorbt.utils import checks
 from vectorbt.utils.config import merge_kwargs
 from vectorbt.base import index_fns, reshape_fns
@@ -79,40 +80,92 @@ except ImportError:
     nb.ffill_nb,
     nb.product_nb,
     nb.cumsum_nb,
-    nb.cumprod_nb,
-    nb.rolling_min_nb,
-    nb.rolling_max_nb,
-    nb.rolling_mean_nb,
-    nb.expanding_min_nb,
-    nb.expanding_max_nb,
-    nb.expanding_mean_nb
+    nb.cumprod_nb
 ], module_name='vectorbt.generic.nb')
 class Generic_Accessor(Base_Accessor):
     """Accessor on top of data of any type. For both, Series and DataFrames.
 
-    Accessible through `pd.Series.vbt` and `pd.DataFrame.vbt`."""
+    Accessible through `pd.Series.vbt` and `pd.DataFrame.vbt`.
 
-    def __init__(self, obj, freq=None):
+    Methods that process columns independently accept `parallel`. If True, uses the `_parallel_nb`
+    version of each function to distribute columns across threads. Any function passed by the user
+    must then be thread-safe. Defaults to `vectorbt.defaults.generic`."""
+
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Base_Accessor.__init__(self, obj, freq=freq)
-
-    def rolling_std(self, window, minp=1, ddof=1):  # pragma: no cover
+        Base_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+
+    def rolling_min(self, window, minp=None, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.rolling_min_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.rolling_min_parallel_nb if parallel else nb.rolling_min_nb
+        return self.wrap(func(self.to_2d_array(), window, minp=minp, out=out))
+
+    def rolling_max(self, window, minp=None, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.rolling_max_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.rolling_max_parallel_nb if parallel else nb.rolling_max_nb
+        return self.wrap(func(self.to_2d_array(), window, minp=minp, out=out))
+
+    def rolling_mean(self, window, minp=None, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.rolling_mean_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.rolling_mean_parallel_nb if parallel else nb.rolling_mean_nb
+        return self.wrap(func(self.to_2d_array(), window, minp=minp, out=out))
+
+    def rolling_std(self, window, minp=1, ddof=1, out=None, parallel=None):  # pragma: no cover
         """See `vectorbt.generic.nb.rolling_std_nb`."""
-        return self.wrap(nb.rolling_std_nb(self.to_2d_array(), window, minp=minp, ddof=ddof))
-
-    def expanding_std(self, minp=1, ddof=1):  # pragma: no cover
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.rolling_std_parallel_nb if parallel else nb.rolling_std_nb
+        return self.wrap(func(self.to_2d_array(), window, minp=minp, ddof=ddof, out=out))
+
+    def expanding_min(self, minp=1, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.expanding_min_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.expanding_min_parallel_nb if parallel else nb.expanding_min_nb
+        return self.wrap(func(self.to_2d_array(), minp=minp, out=out))
+
+    def expanding_max(self, minp=1, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.expanding_max_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.expanding_max_parallel_nb if parallel else nb.expanding_max_nb
+        return self.wrap(func(self.to_2d_array(), minp=minp, out=out))
+
+    def expanding_mean(self, minp=1, out=None, parallel=None):  # pragma: no cover
+        """See `vectorbt.generic.nb.expanding_mean_nb`."""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.expanding_mean_parallel_nb if parallel else nb.expanding_mean_nb
+        return self.wrap(func(self.to_2d_array(), minp=minp, out=out))
+
+    def expanding_std(self, minp=1, ddof=1, out=None, parallel=None):  # pragma: no cover
         """See `vectorbt.generic.nb.expanding_std_nb`."""
-        return self.wrap(nb.expanding_std_nb(self.to_2d_array(), minp=minp, ddof=ddof))
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.expanding_std_parallel_nb if parallel else nb.expanding_std_nb
+        return self.wrap(func(self.to_2d_array(), minp=minp, ddof=ddof, out=out))
 
-    def ewm_mean(self, span, minp=0, adjust=True):  # pragma: no cover
+    def ewm_mean(self, span, minp=0, adjust=True, out=None, parallel=None):  # pragma: no cover
         """See `vectorbt.generic.nb.ewm_mean_nb`."""
-        return self.wrap(nb.ewm_mean_nb(self.to_2d_array(), span, minp=minp, adjust=adjust))
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.ewm_mean_parallel_nb if parallel else nb.ewm_mean_nb
+        return self.wrap(func(self.to_2d_array(), span, minp=minp, adjust=adjust, out=out))
 
-    def ewm_std(self, span, minp=0, adjust=True, ddof=1):  # pragma: no cover
+    def ewm_std(self, span, minp=0, adjust=True, ddof=1, out=None, parallel=None):  # pragma: no cover
         """See `vectorbt.generic.nb.ewm_std_nb`."""
-        return self.wrap(nb.ewm_std_nb(self.to_2d_array(), span, minp=minp, adjust=adjust, ddof=ddof))
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        func = nb.ewm_std_parallel_nb if parallel else nb.ewm_std_nb
+        return self.wrap(func(self.to_2d_array(), span, minp=minp, adjust=adjust, ddof=ddof, out=out))
 
     def split_into_ranges(self, n=None, range_len=None, start_idxs=None, end_idxs=None):
         """Either split into `n` ranges each `range_len` long, or split into ranges between
@@ -202,10 +255,13 @@ class Generic_Accessor(Base_Accessor):
         new_columns = index_fns.combine_indexes(self.columns, range_columns)
         return pd.DataFrame(matrix, columns=new_columns)
 
-    def rolling_apply(self, window, apply_func_nb, *args, on_matrix=False):
+    def rolling_apply(self, window, apply_func_nb, *args, on_matrix=False, incremental=False, parallel=None):
         """See `vectorbt.generic.nb.rolling_apply_nb` and
         `vectorbt.generic.nb.rolling_apply_matrix_nb` for `on_matrix=True`.
 
+        If `incremental` is True, `apply_func_nb` must be a tuple of `init_func_nb`, `add_func_nb`,
+        `remove_func_nb` and `result_func_nb`. See `vectorbt.generic.nb.rolling_apply_incremental_nb`.
+
         Example:
             ```python-repl
             >>> mean_nb = njit(lambda col, i, a: np.nanmean(a))
@@ -224,19 +280,59 @@ class Generic_Accessor(Base_Accessor):
             2020-01-03  2.666667  2.666667  2.666667
             2020-01-04  2.777778  2.777778  2.777778
             2020-01-05  2.666667  2.666667  2.666667
+
+            >>> @njit
+            ... def add_nb(col, i, state, value):
+            ...     state[0] += value
+            ...     state[1] += 1
+            >>> @njit
+            ... def remove_nb(col, i, state, value):
+            ...     state[0] -= value
+            ...     state[1] -= 1
+            >>> mean_funcs = (
+            ...     njit(lambda col: np.zeros(2)),
+            ...     add_nb,
+            ...     remove_nb,
+            ...     njit(lambda col, i, state: state[0] / state[1])
+            ... )
+            >>> df.vbt.rolling_apply(3, mean_funcs, incremental=True)
+                          a    b         c
+            2020-01-01  1.0  5.0  1.000000
+            2020-01-02  1.5  4.5  1.500000
+            2020-01-03  2.0  4.0  2.000000
+            2020-01-04  3.0  3.0  2.333333
+            2020-01-05  4.0  2.0  2.000000
             ```"""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        if incremental:
+            if on_matrix:
+                raise ValueError("Incremental calculation cannot be performed on matrix")
+            init_func_nb, add_func_nb, remove_func_nb, result_func_nb = apply_func_nb
+            checks.assert_numba_func(init_func_nb)
+            checks.assert_numba_func(add_func_nb)
+            checks.assert_numba_func(remove_func_nb)
+            checks.assert_numba_func(result_func_nb)
+
+            func = nb.rolling_apply_incremental_parallel_nb if parallel else nb.rolling_apply_incremental_nb
+            out = func(self.to_2d_array(), window, init_func_nb, add_func_nb, remove_func_nb, result_func_nb, *args)
+            return self.wrap(out)
         checks.assert_numba_func(apply_func_nb)
 
         if on_matrix:
             out = nb.rolling_apply_matrix_nb(self.to_2d_array(), window, apply_func_nb, *args)
         else:
-            out = nb.rolling_apply_nb(self.to_2d_array(), window, apply_func_nb, *args)
+            func = nb.rolling_apply_parallel_nb if parallel else nb.rolling_apply_nb
+            out = func(self.to_2d_array(), window, apply_func_nb, *args)
         return self.wrap(out)
 
-    def expanding_apply(self, apply_func_nb, *args, on_matrix=False):
+    def expanding_apply(self, apply_func_nb, *args, on_matrix=False, incremental=False, parallel=None):
         """See `vectorbt.generic.nb.expanding_apply_nb` and
         `vectorbt.generic.nb.expanding_apply_matrix_nb` for `on_matrix=True`.
 
+        If `incremental` is True, see `Generic_Accessor.rolling_apply`. `remove_func_nb` is never
+        called and can be omitted. See `vectorbt.generic.nb.expanding_apply_incremental_nb`.
+
         Example:
             ```python-repl
             >>> mean_nb = njit(lambda col, i, a: np.nanmean(a))
@@ -256,15 +352,32 @@ class Generic_Accessor(Base_Accessor):
             2020-01-04  2.666667  2.666667  2.666667
             2020-01-05  2.600000  2.600000  2.600000
             ```"""
+        if parallel is None:
+            parallel = defaults.generic['parallel']
+        if incremental:
+            if on_matrix:
+                raise ValueError("Incremental calculation cannot be performed on matrix")
+            if len(apply_func_nb) == 4:
+                init_func_nb, add_func_nb, _, result_func_nb = apply_func_nb
+            else:
+                init_func_nb, add_func_nb, result_func_nb = apply_func_nb
+            checks.assert_numba_func(init_func_nb)
+            checks.assert_numba_func(add_func_nb)
+            checks.assert_numba_func(result_func_nb)
+
+            func = nb.expanding_apply_incremental_parallel_nb if parallel else nb.expanding_apply_incremental_nb
+            out = func(self.to_2d_array(), init_func_nb, add_func_nb, result_func_nb, *args)
+            return self.wrap(out)
         checks.assert_numba_func(apply_func_nb)
 
         if on_matrix:
             out = nb.expanding_apply_matrix_nb(self.to_2d_array(), apply_func_nb, *args)
         else:
-            out = nb.expanding_apply_nb(self.to_2d_array(), apply_func_nb, *args)
+            func = nb.expanding_apply_parallel_nb if parallel else nb.expanding_apply_nb
+            out = func(self.to_2d_array(), apply_func_nb, *args)
         return self.wrap(out)
 
-    def groupby_apply(self, by, apply_func_nb, *args, on_matrix=False, **kwargs):
+    def groupby_apply(self, by, apply_func_nb, *args, on_matrix=False, parallel=None, **kwargs):
         """See `vectorbt.generic.nb.groupby_apply_nb` and
         `vectorbt.generic.nb.groupby_apply_matrix_nb` for `on_matrix=True`.
 
@@ -286,6 +399,8 @@ class Generic_Accessor(Base_Accessor):
             3  2.333333  2.333333  2.333333
             ```"""
         checks.assert_numba_func(apply_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
         regrouped = self._obj.groupby(by, axis=0, **kwargs)
         groups = Dict()
@@ -294,10 +409,11 @@ class Generic_Accessor(Base_Accessor):
         if on_matrix:
             out = nb.groupby_apply_matrix_nb(self.to_2d_array(), groups, apply_func_nb, *args)
         else:
-            out = nb.groupby_apply_nb(self.to_2d_array(), groups, apply_func_nb, *args)
+            func = nb.groupby_apply_parallel_nb if parallel else nb.groupby_apply_nb
+            out = func(self.to_2d_array(), groups, apply_func_nb, *args)
         return self.wrap_reduced(out, index=list(regrouped.indices.keys()))
 
-    def resample_apply(self, freq, apply_func_nb, *args, on_matrix=False, **kwargs):
+    def resample_apply(self, freq, apply_func_nb, *args, on_matrix=False, parallel=None, **kwargs):
         """See `vectorbt.generic.nb.groupby_apply_nb` and
         `vectorbt.generic.nb.groupby_apply_matrix_nb` for `on_matrix=True`.
 
@@ -319,6 +435,8 @@ class Generic_Accessor(Base_Accessor):
             2020-01-05  2.333333  2.333333  2.333333
             ```"""
         checks.assert_numba_func(apply_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
         resampled = self._obj.resample(freq, axis=0, **kwargs)
         groups = Dict()
@@ -327,14 +445,21 @@ class Generic_Accessor(Base_Accessor):
         if on_matrix:
             out = nb.groupby_apply_matrix_nb(self.to_2d_array(), groups, apply_func_nb, *args)
         else:
-            out = nb.groupby_apply_nb(self.to_2d_array(), groups, apply_func_nb, *args)
-        out_obj = self.wrap(out, index=list(resampled.indices.keys()))
+            func = nb.groupby_apply_parallel_nb if parallel else nb.groupby_apply_nb
+            out = func(self.to_2d_array(), groups, apply_func_nb, *args)
+        out_obj = self.wrap(out, index=list(resampled.indices.keys()), to_pd=True)
         resampled_arr = np.full((resampled.ngroups, self.to_2d_array().shape[1]), np.nan)
-        resampled_obj = self.wrap(resampled_arr, index=pd.Index(list(resampled.groups.keys()), freq=freq))
+        resampled_obj = self.wrap(
+            resampled_arr,
+            index=pd.Index(list(resampled.groups.keys()), freq=freq),
+            to_pd=True
+        )
         resampled_obj.loc[out_obj.index] = out_obj.values
+        if not self.to_pd:
+            return resampled_obj.values
         return resampled_obj
 
-    def applymap(self, apply_func_nb, *args):
+    def applymap(self, apply_func_nb, *args, parallel=None):
         """See `vectorbt.generic.nb.applymap_nb`.
 
         Example:
@@ -349,11 +474,14 @@ class Generic_Accessor(Base_Accessor):
             2020-01-05  25.0   1.0  1.0
             ```"""
         checks.assert_numba_func(apply_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
-        out = nb.applymap_nb(self.to_2d_array(), apply_func_nb, *args)
+        func = nb.applymap_parallel_nb if parallel else nb.applymap_nb
+        out = func(self.to_2d_array(), apply_func_nb, *args)
         return self.wrap(out)
 
-    def filter(self, filter_func_nb, *args):
+    def filter(self, filter_func_nb, *args, parallel=None):
         """See `vectorbt.generic.nb.filter_nb`.
 
         Example:
@@ -368,11 +496,14 @@ class Generic_Accessor(Base_Accessor):
             2020-01-05  5.0  NaN  NaN
             ```"""
         checks.assert_numba_func(filter_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
-        out = nb.filter_nb(self.to_2d_array(), filter_func_nb, *args)
+        func = nb.filter_parallel_nb if parallel else nb.filter_nb
+        out = func(self.to_2d_array(), filter_func_nb, *args)
         return self.wrap(out)
 
-    def apply_and_reduce(self, apply_func_nb, reduce_func_nb, *args, **kwargs):
+    def apply_and_reduce(self, apply_func_nb, reduce_func_nb, *args, parallel=None, **kwargs):
         """See `vectorbt.generic.nb.apply_and_reduce_nb`.
 
         `**kwargs` will be passed to `vectorbt.base.array_wrapper.ArrayWrapper.wrap_reduced`.
@@ -389,11 +520,14 @@ class Generic_Accessor(Base_Accessor):
             ```"""
         checks.assert_numba_func(apply_func_nb)
         checks.assert_numba_func(reduce_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
-        out = nb.apply_and_reduce_nb(self.to_2d_array(), apply_func_nb, reduce_func_nb, *args)
+        func = nb.apply_and_reduce_parallel_nb if parallel else nb.apply_and_reduce_nb
+        out = func(self.to_2d_array(), apply_func_nb, reduce_func_nb, *args)
         return self.wrap_reduced(out, **kwargs)
 
-    def reduce(self, reduce_func_nb, *args, **kwargs):
+    def reduce(self, reduce_func_nb, *args, parallel=None, **kwargs):
         """See `vectorbt.generic.nb.reduce_nb`.
 
         `**kwargs` will be passed to `vectorbt.base.array_wrapper.ArrayWrapper.wrap_reduced`.
@@ -408,11 +542,14 @@ class Generic_Accessor(Base_Accessor):
             dtype: float64
             ```"""
         checks.assert_numba_func(reduce_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
-        out = nb.reduce_nb(self.to_2d_array(), reduce_func_nb, *args)
+        func = nb.reduce_parallel_nb if parallel else nb.reduce_nb
+        out = func(self.to_2d_array(), reduce_func_nb, *args)
         return self.wrap_reduced(out, **kwargs)
 
-    def reduce_to_array(self, reduce_func_nb, *args, **kwargs):
+    def reduce_to_array(self, reduce_func_nb, *args, parallel=None, **kwargs):
         """See `vectorbt.generic.nb.reduce_to_array_nb`.
 
         `**kwargs` will be passed to `vectorbt.base.array_wrapper.ArrayWrapper.wrap_reduced`.
@@ -426,8 +563,11 @@ class Generic_Accessor(Base_Accessor):
             max  5.0  5.0  3.0
             ```"""
         checks.assert_numba_func(reduce_func_nb)
+        if parallel is None:
+            parallel = defaults.generic['parallel']
 
-        out = nb.reduce_to_array_nb(self.to_2d_array(), reduce_func_nb, *args)
+        func = nb.reduce_to_array_parallel_nb if parallel else nb.reduce_to_array_nb
+        out = func(self.to_2d_array(), reduce_func_nb, *args)
         return self.wrap_reduced(out, **kwargs)
 
     def min(self, **kwargs):
@@ -610,12 +750,12 @@ class Generic_SRAccessor(Generic_Accessor, Base_SRAccessor):
 
     Accessible through `pd.Series.vbt`."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Base_SRAccessor.__init__(self, obj, freq=freq)
-        Generic_Accessor.__init__(self, obj, freq=freq)
+        Base_SRAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Generic_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     def plot(self, name=None, trace_kwargs={}, fig=None, **layout_kwargs):  # pragma: no cover
         """Plot Series as a line.
@@ -849,12 +989,12 @@ class Generic_DFAccessor(Generic_Accessor, Base_DFAccessor):
 
     Accessible through `pd.DataFrame.vbt`."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Base_DFAccessor.__init__(self, obj, freq=freq)
-        Generic_Accessor.__init__(self, obj, freq=freq)
+        Base_DFAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Generic_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     def plot(self, trace_kwargs={}, fig=None, **layout_kwargs):  # pragma: no cover
         """Plot each column in DataFrame as a line.
@@ -11,7 +11,7 @@
     
     All functions passed as argument should be Numba-compiled."""
 
-from numba import njit
+from numba import njit, prange
 import numpy as np
 
 
@@ -343,72 +343,126 @@ def concat_ranges_nb(a, start_idxs, end_idxs):
 def rolling_min_1d_nb(a, window, minp=None):
     """Return rolling min.
 
-    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).min()`."""
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).min()`.
+
+    Keeps a monotonic deque of indices whose values are increasing, such that the first index
+    always points to the min of the window. Runs in O(n) regardless of `window`."""
     if minp is None:
         minp = window
     if minp > window:
         raise ValueError("minp must be <= window")
     out = np.empty_like(a, dtype=np.float_)
+    deque = np.empty(a.shape[0], dtype=np.int_)
+    head = 0
+    tail = 0
+    nancnt = 0
     for i in range(a.shape[0]):
-        minv = a[i]
-        cnt = 0
-        for j in range(max(i - window + 1, 0), i + 1):
-            if np.isnan(a[j]):
-                continue
-            if np.isnan(minv) or a[j] < minv:
-                minv = a[j]
-            cnt += 1
-        if cnt < minp:
+        # Remove the index that leaves the window
+        if head < tail and deque[head] <= i - window:
+            head += 1
+        if i >= window and np.isnan(a[i - window]):
+            nancnt -= 1
+        # Add the new index
+        if np.isnan(a[i]):
+            nancnt += 1
+        else:
+            while head < tail and a[deque[tail - 1]] >= a[i]:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        if min(i + 1, window) - nancnt < minp or head == tail:
             out[i] = np.nan
         else:
-            out[i] = minv
+            out[i] = a[deque[head]]
     return out
 
 
 @njit(cache=True)
-def rolling_min_nb(a, window, minp=None):
-    """2-dim version of `rolling_min_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def rolling_min_nb(a, window, minp=None, out=None):
+    """2-dim version of `rolling_min_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = rolling_min_1d_nb(a[:, col], window, minp=minp)
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_min_parallel_nb(a, window, minp=None, out=None):
+    """A parallel version of `rolling_min_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_min_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
 def rolling_max_1d_nb(a, window, minp=None):
     """Return rolling max.
 
-    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).max()`."""
+    Numba equivalent to `pd.Series(a).rolling(window, min_periods=minp).max()`.
+
+    Keeps a monotonic deque of indices whose values are decreasing, such that the first index
+    always points to the max of the window. Runs in O(n) regardless of `window`."""
     if minp is None:
         minp = window
     if minp > window:
         raise ValueError("minp must be <= window")
     out = np.empty_like(a, dtype=np.float_)
+    deque = np.empty(a.shape[0], dtype=np.int_)
+    head = 0
+    tail = 0
+    nancnt = 0
     for i in range(a.shape[0]):
-        maxv = a[i]
-        cnt = 0
-        for j in range(max(i - window + 1, 0), i + 1):
-            if np.isnan(a[j]):
-                continue
-            if np.isnan(maxv) or a[j] > maxv:
-                maxv = a[j]
-            cnt += 1
-        if cnt < minp:
+        # Remove the index that leaves the window
+        if head < tail and deque[head] <= i - window:
+            head += 1
+        if i >= window and np.isnan(a[i - window]):
+            nancnt -= 1
+        # Add the new index
+        if np.isnan(a[i]):
+            nancnt += 1
+        else:
+            while head < tail and a[deque[tail - 1]] <= a[i]:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        if min(i + 1, window) - nancnt < minp or head == tail:
             out[i] = np.nan
         else:
-            out[i] = maxv
+            out[i] = a[deque[head]]
     return out
 
 
 @njit(cache=True)
-def rolling_max_nb(a, window, minp=None):
-    """2-dim version of `rolling_max_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def rolling_max_nb(a, window, minp=None, out=None):
+    """2-dim version of `rolling_max_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = rolling_max_1d_nb(a[:, col], window, minp=minp)
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_max_parallel_nb(a, window, minp=None, out=None):
+    """A parallel version of `rolling_max_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_max_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
 def rolling_mean_1d_nb(a, window, minp=None):
     """Return rolling mean.
@@ -444,14 +498,29 @@ def rolling_mean_1d_nb(a, window, minp=None):
 
 
 @njit(cache=True)
-def rolling_mean_nb(a, window, minp=None):
-    """2-dim version of `rolling_mean_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def rolling_mean_nb(a, window, minp=None, out=None):
+    """2-dim version of `rolling_mean_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = rolling_mean_1d_nb(a[:, col], window, minp=minp)
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_mean_parallel_nb(a, window, minp=None, out=None):
+    """A parallel version of `rolling_mean_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_mean_1d_nb(a[:, col], window, minp=minp)
+    return out
+
+
 @njit(cache=True)
 def rolling_std_1d_nb(a, window, minp=None, ddof=0):
     """Return rolling standard deviation.
@@ -496,14 +565,29 @@ def rolling_std_1d_nb(a, window, minp=None, ddof=0):
 
 
 @njit(cache=True)
-def rolling_std_nb(a, window, minp=None, ddof=0):
-    """2-dim version of `rolling_std_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def rolling_std_nb(a, window, minp=None, ddof=0, out=None):
+    """2-dim version of `rolling_std_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = rolling_std_1d_nb(a[:, col], window, minp=minp, ddof=ddof)
     return out
 
 
+@njit(cache=True, parallel=True)
+def rolling_std_parallel_nb(a, window, minp=None, ddof=0, out=None):
+    """A parallel version of `rolling_std_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = rolling_std_1d_nb(a[:, col], window, minp=minp, ddof=ddof)
+    return out
+
+
 @njit(cache=True)
 def ewm_mean_1d_nb(a, span, minp=None, adjust=False):
     """Return exponential weighted average.
@@ -550,14 +634,29 @@ def ewm_mean_1d_nb(a, span, minp=None, adjust=False):
 
 
 @njit(cache=True)
-def ewm_mean_nb(a, span, minp=None, adjust=False):
-    """2-dim version of `ewm_mean_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def ewm_mean_nb(a, span, minp=None, adjust=False, out=None):
+    """2-dim version of `ewm_mean_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = ewm_mean_1d_nb(a[:, col], span, minp=minp, adjust=adjust)
     return out
 
 
+@njit(cache=True, parallel=True)
+def ewm_mean_parallel_nb(a, span, minp=None, adjust=False, out=None):
+    """A parallel version of `ewm_mean_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = ewm_mean_1d_nb(a[:, col], span, minp=minp, adjust=adjust)
+    return out
+
+
 @njit(cache=True)
 def ewm_std_1d_nb(a, span, minp=None, adjust=False, ddof=0):
     """Return exponential weighted standard deviation.
@@ -640,14 +739,29 @@ def ewm_std_1d_nb(a, span, minp=None, adjust=False, ddof=0):
 
 
 @njit(cache=True)
-def ewm_std_nb(a, span, minp=None, adjust=False, ddof=0):
-    """2-dim version of `ewm_std_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def ewm_std_nb(a, span, minp=None, adjust=False, ddof=0, out=None):
+    """2-dim version of `ewm_std_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = ewm_std_1d_nb(a[:, col], span, minp=minp, adjust=adjust, ddof=ddof)
     return out
 
 
+@njit(cache=True, parallel=True)
+def ewm_std_parallel_nb(a, span, minp=None, adjust=False, ddof=0, out=None):
+    """A parallel version of `ewm_std_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = ewm_std_1d_nb(a[:, col], span, minp=minp, adjust=adjust, ddof=ddof)
+    return out
+
+
 # ############# Expanding functions ############# #
 
 
@@ -672,14 +786,29 @@ def expanding_min_1d_nb(a, minp=1):
 
 
 @njit(cache=True)
-def expanding_min_nb(a, minp=1):
-    """2-dim version of `expanding_min_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def expanding_min_nb(a, minp=1, out=None):
+    """2-dim version of `expanding_min_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = expanding_min_1d_nb(a[:, col], minp=minp)
     return out
 
 
+@njit(cache=True, parallel=True)
+def expanding_min_parallel_nb(a, minp=1, out=None):
+    """A parallel version of `expanding_min_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = expanding_min_1d_nb(a[:, col], minp=minp)
+    return out
+
+
 @njit(cache=True)
 def expanding_max_1d_nb(a, minp=1):
     """Return expanding max.
@@ -701,14 +830,29 @@ def expanding_max_1d_nb(a, minp=1):
 
 
 @njit(cache=True)
-def expanding_max_nb(a, minp=1):
-    """2-dim version of `expanding_max_1d_nb`."""
-    out = np.empty_like(a, dtype=np.float_)
+def expanding_max_nb(a, minp=1, out=None):
+    """2-dim version of `expanding_max_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
     for col in range(a.shape[1]):
         out[:, col] = expanding_max_1d_nb(a[:, col], minp=minp)
     return out
 
 
+@njit(cache=True, parallel=True)
+def expanding_max_parallel_nb(a, minp=1, out=None):
+    """A parallel version of `expanding_max_nb`.
+
+    Columns are distributed across threads using `prange`."""
+    if out is None:
+        out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        out[:, col] = expanding_max_1d_nb(a[:, col], minp=minp)
+    return out
+
+
 @njit(cache=True)
 def expanding_mean_1d_nb(a, minp=1):
     """Return expanding mean.
@@ -718,9 +862,17 @@ def expanding_mean_1d_nb(a, minp=1):
 
 
 @njit(cache=True)
-def expanding_mean_nb(a, minp=1):
-    """2-dim version of `expanding_mean_1d_nb`."""
-    return rolling_mean_nb(a, a.shape[0], minp=minp)
+def expanding_mean_nb(a, minp=1, out=None):
+    """2-dim version of `expanding_mean_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    return rolling_mean_nb(a, a.shape[0], minp=minp, out=out)
+
+
+@njit(cache=True)
+def expanding_mean_parallel_nb(a, minp=1, out=None):
+    """A parallel version of `expanding_mean_nb`."""
+    return rolling_mean_parallel_nb(a, a.shape[0], minp=minp, out=out)
 
 
 @njit(cache=True)
@@ -732,9 +884,17 @@ def expanding_std_1d_nb(a, minp=1, ddof=0):
 
 
 @njit(cache=True)
-def expanding_std_nb(a, minp=1, ddof=0):
-    """2-dim version of `expanding_std_1d_nb`."""
-    return rolling_std_nb(a, a.shape[0], minp=minp, ddof=ddof)
+def expanding_std_nb(a, minp=1, ddof=0, out=None):
+    """2-dim version of `expanding_std_1d_nb`.
+
+    Writes to `out` if provided, such as a memory-mapped array of the same shape as `a`."""
+    return rolling_std_nb(a, a.shape[0], minp=minp, ddof=ddof, out=out)
+
+
+@njit(cache=True)
+def expanding_std_parallel_nb(a, minp=1, ddof=0, out=None):
+    """A parallel version of `expanding_std_nb`."""
+    return rolling_std_parallel_nb(a, a.shape[0], minp=minp, ddof=ddof, out=out)
 
 
 # ############# Apply functions ############# #
@@ -754,6 +914,19 @@ def rolling_apply_nb(a, window, apply_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def rolling_apply_parallel_nb(a, window, apply_func_nb, *args):
+    """A parallel version of `rolling_apply_nb`.
+
+    Columns are distributed across threads using `prange`. `apply_func_nb` must be thread-safe."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        for i in range(a.shape[0]):
+            window_a = a[max(0, i + 1 - window):i + 1, col]
+            out[i, col] = apply_func_nb(col, i, window_a, *args)
+    return out
+
+
 @njit
 def rolling_apply_matrix_nb(a, window, apply_func_nb, *args):
     """`rolling_apply_nb` with `apply_func_nb` being applied on all columns at once.
@@ -767,18 +940,121 @@ def rolling_apply_matrix_nb(a, window, apply_func_nb, *args):
     return out
 
 
+@njit
+def rolling_apply_incremental_nb(a, window, init_func_nb, add_func_nb, remove_func_nb, result_func_nb, *args):
+    """Provide rolling window calculations by updating a state incrementally.
+
+    Instead of applying a function on each window, keeps a state per column and updates it
+    as values enter and leave the window, which takes O(n) instead of O(n * window) time.
+
+    * `init_func_nb` must accept index of the current column and `*args`.
+        Must return a state as a 1-dim array.
+    * `add_func_nb` must accept index of the current column, index of the current row,
+        the state, the value entering the window, and `*args`. Must update the state in place.
+    * `remove_func_nb` is same as `add_func_nb` but receives the value leaving the window.
+    * `result_func_nb` must accept index of the current column, index of the current row,
+        the state, and `*args`. Must return a single value.
+
+    Produces the same output as `rolling_apply_nb` with a function equivalent to the above.
+
+    Example:
+        ```python-repl
+        >>> from numba import njit
+        >>> import numpy as np
+        >>> from vectorbt.generic.nb import rolling_apply_incremental_nb
+
+        >>> init_nb = njit(lambda col: np.zeros(2))
+        >>> @njit
+        ... def add_nb(col, i, state, value):
+        ...     state[0] += value
+        ...     state[1] += 1
+        >>> @njit
+        ... def remove_nb(col, i, state, value):
+        ...     state[0] -= value
+        ...     state[1] -= 1
+        >>> result_nb = njit(lambda col, i, state: state[0] / state[1])
+
+        >>> a = np.asarray([1., 2., 3., 4., 5.])[:, None]
+        >>> rolling_apply_incremental_nb(a, 3, init_nb, add_nb, remove_nb, result_nb)
+        [[1. ]
+         [1.5]
+         [2. ]
+         [3. ]
+         [4. ]]
+        ```"""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        state = init_func_nb(col, *args)
+        for i in range(a.shape[0]):
+            if i >= window:
+                remove_func_nb(col, i, state, a[i - window, col], *args)
+            add_func_nb(col, i, state, a[i, col], *args)
+            out[i, col] = result_func_nb(col, i, state, *args)
+    return out
+
+
+@njit(parallel=True)
+def rolling_apply_incremental_parallel_nb(a, window, init_func_nb, add_func_nb,
+                                          remove_func_nb, result_func_nb, *args):
+    """A parallel version of `rolling_apply_incremental_nb`.
+
+    Columns are distributed across threads using `prange`. Each column has its own state,
+    but the functions must not write to any other array shared across columns."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        state = init_func_nb(col, *args)
+        for i in range(a.shape[0]):
+            if i >= window:
+                remove_func_nb(col, i, state, a[i - window, col], *args)
+            add_func_nb(col, i, state, a[i, col], *args)
+            out[i, col] = result_func_nb(col, i, state, *args)
+    return out
+
+
 @njit
 def expanding_apply_nb(a, apply_func_nb, *args):
     """Expanding version of `rolling_apply_nb`."""
     return rolling_apply_nb(a, a.shape[0], apply_func_nb, *args)
 
 
+@njit
+def expanding_apply_parallel_nb(a, apply_func_nb, *args):
+    """A parallel version of `expanding_apply_nb`."""
+    return rolling_apply_parallel_nb(a, a.shape[0], apply_func_nb, *args)
+
+
 @njit
 def expanding_apply_matrix_nb(a, apply_func_nb, *args):
     """Expanding version of `rolling_apply_matrix_nb`."""
     return rolling_apply_matrix_nb(a, a.shape[0], apply_func_nb, *args)
 
 
+@njit
+def expanding_apply_incremental_nb(a, init_func_nb, add_func_nb, result_func_nb, *args):
+    """Expanding version of `rolling_apply_incremental_nb`.
+
+    Values never leave the window, so no `remove_func_nb` is required."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        state = init_func_nb(col, *args)
+        for i in range(a.shape[0]):
+            add_func_nb(col, i, state, a[i, col], *args)
+            out[i, col] = result_func_nb(col, i, state, *args)
+    return out
+
+
+@njit(parallel=True)
+def expanding_apply_incremental_parallel_nb(a, init_func_nb, add_func_nb, result_func_nb, *args):
+    """A parallel version of `expanding_apply_incremental_nb`."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in prange(a.shape[1]):
+        state = init_func_nb(col, *args)
+        for i in range(a.shape[0]):
+            add_func_nb(col, i, state, a[i, col], *args)
+            out[i, col] = result_func_nb(col, i, state, *args)
+    return out
+
+
 @njit
 def groupby_apply_nb(a, groups, apply_func_nb, *args):
     """Provide group-by calculations.
@@ -796,6 +1072,38 @@ def groupby_apply_nb(a, groups, apply_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def groupby_apply_parallel_nb(a, groups, apply_func_nb, *args):
+    """A parallel version of `groupby_apply_nb`.
+
+    Flattens `groups` into arrays beforehand, such that threads don't share the dictionary.
+    Columns are distributed across threads using `prange`. `apply_func_nb` must be thread-safe."""
+    n_groups = len(groups)
+    group_keys = np.empty(n_groups, dtype=np.int_)
+    group_starts = np.empty(n_groups, dtype=np.int_)
+    group_ends = np.empty(n_groups, dtype=np.int_)
+    n_idxs = 0
+    for idxs in groups.values():
+        n_idxs += len(idxs)
+    all_idxs = np.empty(n_idxs, dtype=np.int_)
+    g = 0
+    k = 0
+    for i, idxs in groups.items():
+        group_keys[g] = i
+        group_starts[g] = k
+        all_idxs[k:k + len(idxs)] = idxs
+        k += len(idxs)
+        group_ends[g] = k
+        g += 1
+
+    out = np.empty((n_groups, a.shape[1]), dtype=np.float_)
+    for col in prange(a.shape[1]):
+        for g in range(n_groups):
+            idxs = all_idxs[group_starts[g]:group_ends[g]]
+            out[group_keys[g], col] = apply_func_nb(col, idxs, a[idxs, col], *args)
+    return out
+
+
 @njit
 def groupby_apply_matrix_nb(a, groups, apply_func_nb, *args):
     """`groupby_apply_nb` with `apply_func_nb` being applied on all columns at once.
@@ -826,6 +1134,20 @@ def applymap_nb(a, map_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def applymap_parallel_nb(a, map_func_nb, *args):
+    """A parallel version of `applymap_nb`.
+
+    Columns are distributed across threads using `prange`. `map_func_nb` must be thread-safe."""
+    out = np.full_like(a, np.nan, dtype=np.float_)
+
+    for col in prange(out.shape[1]):
+        idxs = np.flatnonzero(~np.isnan(a[:, col]))
+        for i in idxs:
+            out[i, col] = map_func_nb(col, i, a[i, col], *args)
+    return out
+
+
 @njit
 def filter_nb(a, filter_func_nb, *args):
     """Filter non-NA elements elementwise using `filter_func_nb`. 
@@ -843,6 +1165,21 @@ def filter_nb(a, filter_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def filter_parallel_nb(a, filter_func_nb, *args):
+    """A parallel version of `filter_nb`.
+
+    Columns are distributed across threads using `prange`. `filter_func_nb` must be thread-safe."""
+    out = a.astype(np.float_)
+
+    for col in prange(out.shape[1]):
+        idxs = np.flatnonzero(~np.isnan(a[:, col]))
+        for i in idxs:
+            if not filter_func_nb(col, i, a[i, col], *args):
+                out[i, col] = np.nan
+    return out
+
+
 @njit
 def apply_and_reduce_nb(a, apply_func_nb, reduce_func_nb, *args):
     """Apply `apply_func_nb` on each column and reduce into a single value using `reduce_func_nb`.
@@ -860,6 +1197,19 @@ def apply_and_reduce_nb(a, apply_func_nb, reduce_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def apply_and_reduce_parallel_nb(a, apply_func_nb, reduce_func_nb, *args):
+    """A parallel version of `apply_and_reduce_nb`.
+
+    Columns are distributed across threads using `prange`. Both functions must be thread-safe."""
+    out = np.full(a.shape[1], np.nan, dtype=np.float_)
+
+    for col in prange(a.shape[1]):
+        mapped = apply_func_nb(col, a[:, col], *args)
+        out[col] = reduce_func_nb(col, mapped, *args)
+    return out
+
+
 @njit
 def reduce_nb(a, reduce_func_nb, *args):
     """Reduce each column into a single value using `reduce_func_nb`.
@@ -873,6 +1223,18 @@ def reduce_nb(a, reduce_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def reduce_parallel_nb(a, reduce_func_nb, *args):
+    """A parallel version of `reduce_nb`.
+
+    Columns are distributed across threads using `prange`. `reduce_func_nb` must be thread-safe."""
+    out = np.full(a.shape[1], np.nan, dtype=np.float_)
+
+    for col in prange(a.shape[1]):
+        out[col] = reduce_func_nb(col, a[:, col], *args)
+    return out
+
+
 @njit
 def reduce_to_array_nb(a, reduce_func_nb, *args):
     """Reduce each column into an array of values using `reduce_func_nb`.
@@ -892,6 +1254,20 @@ def reduce_to_array_nb(a, reduce_func_nb, *args):
     return out
 
 
+@njit(parallel=True)
+def reduce_to_array_parallel_nb(a, reduce_func_nb, *args):
+    """A parallel version of `reduce_to_array_nb`.
+
+    Reduces the first column to get the shape of the output, and then distributes the remaining
+    columns across threads using `prange`. `reduce_func_nb` must be thread-safe."""
+    col_out = reduce_func_nb(0, a[:, 0], *args)
+    out = np.full((col_out.shape[0], a.shape[1]), np.nan, dtype=np.float_)
+    out[:, 0] = col_out
+    for col in prange(1, a.shape[1]):
+        out[:, col] = reduce_func_nb(col, a[:, col], *args)
+    return out
+
+
 @njit(cache=True)
 def nst_reduce_nb(col, a, n, *args):
     if n >= a.shape[0]:
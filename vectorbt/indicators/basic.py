@@ -26,15 +26,118 @@ Date
 ![](/vectorbt/docs/img/Indicators_price.png)"""
 
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 
 from vectorbt import defaults
+from vectorbt.utils import checks
 from vectorbt.utils.config import merge_kwargs
 from vectorbt.utils.docs import fix_class_for_docs
+from vectorbt.base.reshape_fns import to_2d
 from vectorbt.generic import nb as generic_nb
 from vectorbt.indicators.factory import IndicatorFactory
 from vectorbt.indicators import nb
 
+
+def copy_state(state):
+    """Copy (nested) tuple of arrays that represents the state of an incremental update."""
+    if isinstance(state, tuple):
+        return type(state)(*map(copy_state, state)) if hasattr(state, '_fields') \
+            else tuple(map(copy_state, state))
+    return state.copy()
+
+
+def prepare_update(ind, *new_inputs):
+    """Prepare new rows for the `update` method of indicator `ind`.
+
+    Each new input must be a pandas object and will broadcast to the number of input columns.
+    Returns the new index and raw new inputs, 2-dim and tiled to the number of output columns."""
+    new_index = None
+    for new_input in new_inputs:
+        checks.assert_type(new_input, (pd.Series, pd.DataFrame))
+        if new_index is None:
+            new_index = new_input.index
+        else:
+            checks.assert_index_equal(new_index, new_input.index)
+    if len(new_index) == 0:
+        raise ValueError("At least one new row is required")
+    input_mapper = ind._input_mapper
+    new_input_list = []
+    for input_name, new_input in zip(ind.input_names, new_inputs):
+        n_cols = to_2d(getattr(ind, '_' + input_name)).shape[1]
+        new_input = np.broadcast_to(to_2d(new_input, raw=True), (len(new_index), n_cols))
+        if input_mapper is not None:
+            new_input = new_input[:, input_mapper]
+        new_input_list.append(np.asarray(new_input, dtype=np.float_))
+    return new_index, new_input_list
+
+
+def get_old_inputs(ind):
+    """Get raw inputs of indicator `ind`, 2-dim and tiled to the number of output columns.
+
+    Only needed to build the state of the first update."""
+    input_mapper = ind._input_mapper
+    old_input_list = []
+    for input_name in ind.input_names:
+        old_input = to_2d(getattr(ind, '_' + input_name), raw=True)
+        if input_mapper is not None:
+            old_input = old_input[:, input_mapper]
+        old_input_list.append(np.asarray(old_input, dtype=np.float_))
+    return old_input_list
+
+
+def wrap_new_rows(ind, new_index, new_inputs, new_output_list, update_state):
+    """Return a new instance of indicator `ind` that holds only the new rows.
+
+    `new_inputs` are the pandas objects passed to the `update` method. `update_state` is
+    stored in the new instance and used by its next update."""
+    wrapper = ind.wrapper.copy(index=new_index)
+    input_list = []
+    for input_name, new_input in zip(ind.input_names, new_inputs):
+        old_input = getattr(ind, '_' + input_name)
+        new_input = np.broadcast_to(to_2d(new_input, raw=True), (len(new_index), to_2d(old_input).shape[1]))
+        if old_input.ndim == 1:
+            new_input = new_input[:, 0]
+        input_list.append(new_input)
+    obj = ind.__class__(
+        wrapper,
+        input_list,
+        ind._input_mapper,
+        new_output_list,
+        [getattr(ind, f'_{param_name}_array') for param_name in ind.param_names],
+        [getattr(ind, f'_{param_name}_mapper') for param_name in ind.param_names],
+        ind.short_name,
+        ind.level_names
+    )
+    obj._update_state = update_state
+    return obj
+
+
+def get_update_state(ind, init_func):
+    """Get a copy of the state stored by the last update of indicator `ind`.
+
+    If there is none, calls `init_func` to build the state from the whole history."""
+    update_state = getattr(ind, '_update_state', None)
+    if update_state is None:
+        return init_func()
+    return copy_state(update_state)
+
+
+def get_param_mapper(ind, param_name, dtype):
+    """Get parameter value per output column."""
+    return np.asarray(getattr(ind, f'_{param_name}_mapper'), dtype=dtype)
+
+
+update_docstring = """Compute the indicator for new rows `{}`.
+
+Only the new rows are computed, by resuming from the state of the rolling windows, exponential
+weights and running sums after the last row. The state is built from the whole history on the first
+update and then stored in the returned instance, such that each subsequent update takes time
+proportional to the number of new rows and columns.
+
+New inputs must be pandas objects. Returns a new instance that holds only the new rows
+and can be updated again."""
+
 # ############# MA ############# #
 
 
@@ -93,6 +196,22 @@ class MA(MA):
 
         return fig
 
+    def update(self, close):
+        windows = get_param_mapper(self, 'window', np.int_)
+        ewms = get_param_mapper(self, 'ewm', np.bool_)
+        new_index, (new_close,) = prepare_update(self, close)
+
+        def init_func():
+            state = nb.init_rolling_state_nb(np.max(windows), len(windows))
+            nb.rolling_update_nb(*get_old_inputs(self), windows, ewms, state)
+            return state
+
+        state = get_update_state(self, init_func)
+        ma, _ = nb.rolling_update_nb(new_close, windows, ewms, state)
+        return wrap_new_rows(self, new_index, (close,), [ma], state)
+
+    update.__doc__ = update_docstring.format('close')
+
 
 fix_class_for_docs(MA)
 
@@ -146,6 +265,22 @@ class MSTD(MSTD):
 
         return fig
 
+    def update(self, close):
+        windows = get_param_mapper(self, 'window', np.int_)
+        ewms = get_param_mapper(self, 'ewm', np.bool_)
+        new_index, (new_close,) = prepare_update(self, close)
+
+        def init_func():
+            state = nb.init_rolling_state_nb(np.max(windows), len(windows))
+            nb.rolling_update_nb(*get_old_inputs(self), windows, ewms, state)
+            return state
+
+        state = get_update_state(self, init_func)
+        _, mstd = nb.rolling_update_nb(new_close, windows, ewms, state)
+        return wrap_new_rows(self, new_index, (close,), [mstd], state)
+
+    update.__doc__ = update_docstring.format('close')
+
 
 fix_class_for_docs(MSTD)
 
@@ -243,6 +378,23 @@ class BBANDS(BBANDS):
 
         return fig
 
+    def update(self, close):
+        windows = get_param_mapper(self, 'window', np.int_)
+        ewms = get_param_mapper(self, 'ewm', np.bool_)
+        alphas = get_param_mapper(self, 'alpha', np.float_)
+        new_index, (new_close,) = prepare_update(self, close)
+
+        def init_func():
+            state = nb.init_rolling_state_nb(np.max(windows), len(windows))
+            nb.rolling_update_nb(*get_old_inputs(self), windows, ewms, state)
+            return state
+
+        state = get_update_state(self, init_func)
+        ma, mstd = nb.rolling_update_nb(new_close, windows, ewms, state)
+        return wrap_new_rows(self, new_index, (close,), [ma, ma + alphas * mstd, ma - alphas * mstd], state)
+
+    update.__doc__ = update_docstring.format('close')
+
 
 fix_class_for_docs(BBANDS)
 
@@ -319,6 +471,26 @@ class RSI(RSI):
 
         return fig
 
+    def update(self, close):
+        windows = get_param_mapper(self, 'window', np.int_)
+        ewms = get_param_mapper(self, 'ewm', np.bool_)
+        new_index, (new_close,) = prepare_update(self, close)
+
+        def init_func():
+            state = (
+                np.full(len(windows), np.nan),
+                nb.init_rolling_state_nb(np.max(windows), len(windows)),
+                nb.init_rolling_state_nb(np.max(windows), len(windows))
+            )
+            nb.rsi_update_nb(*get_old_inputs(self), windows, ewms, *state)
+            return state
+
+        state = get_update_state(self, init_func)
+        rsi = nb.rsi_update_nb(new_close, windows, ewms, *state)
+        return wrap_new_rows(self, new_index, (close,), [rsi], state)
+
+    update.__doc__ = update_docstring.format('close')
+
 
 fix_class_for_docs(RSI)
 
@@ -407,6 +579,27 @@ class STOCH(STOCH):
 
         return fig
 
+    def update(self, high, low, close):
+        k_windows = get_param_mapper(self, 'k_window', np.int_)
+        d_windows = get_param_mapper(self, 'd_window', np.int_)
+        d_ewms = get_param_mapper(self, 'd_ewm', np.bool_)
+        new_index, new_input_list = prepare_update(self, high, low, close)
+
+        def init_func():
+            state = (
+                nb.init_rolling_min_max_state_nb(np.max(k_windows), len(k_windows)),
+                nb.init_rolling_min_max_state_nb(np.max(k_windows), len(k_windows)),
+                nb.init_rolling_state_nb(np.max(d_windows), len(d_windows))
+            )
+            nb.stoch_update_nb(*get_old_inputs(self), k_windows, d_windows, d_ewms, *state)
+            return state
+
+        state = get_update_state(self, init_func)
+        percent_k, percent_d = nb.stoch_update_nb(*new_input_list, k_windows, d_windows, d_ewms, *state)
+        return wrap_new_rows(self, new_index, (high, low, close), [percent_k, percent_d], state)
+
+    update.__doc__ = update_docstring.format('high`, `low` and `close')
+
 
 fix_class_for_docs(STOCH)
 
@@ -499,6 +692,31 @@ class MACD(MACD):
 
         return fig
 
+    def update(self, close):
+        fast_windows = get_param_mapper(self, 'fast_window', np.int_)
+        slow_windows = get_param_mapper(self, 'slow_window', np.int_)
+        signal_windows = get_param_mapper(self, 'signal_window', np.int_)
+        macd_ewms = get_param_mapper(self, 'macd_ewm', np.bool_)
+        signal_ewms = get_param_mapper(self, 'signal_ewm', np.bool_)
+        new_index, (new_close,) = prepare_update(self, close)
+
+        def init_func():
+            state = (
+                nb.init_rolling_state_nb(np.max(fast_windows), len(fast_windows)),
+                nb.init_rolling_state_nb(np.max(slow_windows), len(slow_windows)),
+                nb.init_rolling_state_nb(np.max(signal_windows), len(signal_windows))
+            )
+            nb.macd_update_nb(
+                *get_old_inputs(self), fast_windows, slow_windows, signal_windows, macd_ewms, signal_ewms, *state)
+            return state
+
+        state = get_update_state(self, init_func)
+        macd, signal = nb.macd_update_nb(
+            new_close, fast_windows, slow_windows, signal_windows, macd_ewms, signal_ewms, *state)
+        return wrap_new_rows(self, new_index, (close,), [macd, signal], state)
+
+    update.__doc__ = update_docstring.format('close')
+
 
 fix_class_for_docs(MACD)
 
@@ -560,6 +778,25 @@ class ATR(ATR):
 
         return fig
 
+    def update(self, high, low, close):
+        windows = get_param_mapper(self, 'window', np.int_)
+        ewms = get_param_mapper(self, 'ewm', np.bool_)
+        new_index, new_input_list = prepare_update(self, high, low, close)
+
+        def init_func():
+            state = (
+                np.full(len(windows), np.nan),
+                nb.init_rolling_state_nb(np.max(windows), len(windows))
+            )
+            nb.atr_update_nb(*get_old_inputs(self), windows, ewms, *state)
+            return state
+
+        state = get_update_state(self, init_func)
+        tr, atr = nb.atr_update_nb(*new_input_list, windows, ewms, *state)
+        return wrap_new_rows(self, new_index, (high, low, close), [tr, atr], state)
+
+    update.__doc__ = update_docstring.format('high`, `low` and `close')
+
 
 fix_class_for_docs(ATR)
 
@@ -611,5 +848,20 @@ class OBV(OBV):
 
         return fig
 
+    def update(self, close, volume):
+        new_index, new_input_list = prepare_update(self, close, volume)
+        n_cols = new_input_list[0].shape[1]
+
+        def init_func():
+            state = (np.full(n_cols, np.nan), np.full(n_cols, 0.))
+            nb.obv_update_nb(*get_old_inputs(self), *state)
+            return state
+
+        state = get_update_state(self, init_func)
+        obv = nb.obv_update_nb(*new_input_list, *state)
+        return wrap_new_rows(self, new_index, (close, volume), [obv], state)
+
+    update.__doc__ = update_docstring.format('close` and `volume')
+
 
 fix_class_for_docs(OBV)
@@ -0,0 +1,66 @@
+"""Named tuples and enumerated types."""
+
+from collections import namedtuple
+
+__pdoc__ = {}
+
+# We use namedtuple for enums and classes to be able to use them in Numba
+
+# ############# RollingState ############# #
+
+RollingState = namedtuple('RollingState', [
+    'n',
+    'buffer',
+    'nancnt',
+    'sum',
+    'sum_sq',
+    'ewm_mean',
+    'ewm_cov',
+    'sum_wt',
+    'sum_wt2',
+    'old_wt',
+    'nobs'
+])
+__pdoc__['RollingState'] = """A named tuple representing the state of a simple or exponential moving
+mean and standard deviation after the last row.
+
+Each field is an array with one element per column, except `buffer`. Updated in place by
+`vectorbt.indicators.nb.rolling_update_nb`."""
+__pdoc__['RollingState.n'] = "Number of rows processed so far."
+__pdoc__['RollingState.buffer'] = """Ring buffer of the last values in the window.
+
+Has shape `(max_window, columns)`. The value at row `i` is stored at `i % window`."""
+__pdoc__['RollingState.nancnt'] = "Number of NaN values in the window."
+__pdoc__['RollingState.sum'] = "Sum of the values in the window."
+__pdoc__['RollingState.sum_sq'] = "Sum of the squared values in the window."
+__pdoc__['RollingState.ewm_mean'] = "Exponential weighted mean."
+__pdoc__['RollingState.ewm_cov'] = "Exponential weighted variance (biased)."
+__pdoc__['RollingState.sum_wt'] = "Sum of weights."
+__pdoc__['RollingState.sum_wt2'] = "Sum of squared weights."
+__pdoc__['RollingState.old_wt'] = "Weight of the previous mean."
+__pdoc__['RollingState.nobs'] = "Number of observations (non-NaN values) so far."
+
+# ############# RollingMinMaxState ############# #
+
+RollingMinMaxState = namedtuple('RollingMinMaxState', [
+    'n',
+    'buffer',
+    'nancnt',
+    'deque',
+    'deque_start',
+    'deque_len'
+])
+__pdoc__['RollingMinMaxState'] = """A named tuple representing the state of a rolling min or max
+after the last row.
+
+Each field is an array with one element per column, except `buffer` and `deque`. Updated in place by
+`vectorbt.indicators.nb.rolling_min_max_update_nb`."""
+__pdoc__['RollingMinMaxState.n'] = "Number of rows processed so far."
+__pdoc__['RollingMinMaxState.buffer'] = "See `RollingState.buffer`."
+__pdoc__['RollingMinMaxState.nancnt'] = "Number of NaN values in the window."
+__pdoc__['RollingMinMaxState.deque'] = """Monotonic deque of row indices stored as a ring buffer.
+
+Has shape `(max_window, columns)`. Values at these rows are increasing for min and decreasing
+for max, such that the first row always holds the extreme value of the window."""
+__pdoc__['RollingMinMaxState.deque_start'] = "Position of the first element in `deque`."
+__pdoc__['RollingMinMaxState.deque_len'] = "Number of elements in `deque`."
@@ -281,10 +281,12 @@ import itertools
 import inspect
 from collections import OrderedDict
 
+from vectorbt import defaults, __version__ as vbt_version
 from vectorbt.utils import checks
 from vectorbt.utils.decorators import classproperty, cached_property
 from vectorbt.utils.config import merge_kwargs, Configured
 from vectorbt.utils.random import set_seed
+from vectorbt.utils.disk_cache import DiskCache
 from vectorbt.base import index_fns, reshape_fns, combine_fns
 from vectorbt.base.indexing import PandasIndexer, ParamIndexerFactory
 from vectorbt.base.array_wrapper import ArrayWrapper, indexing_on_wrapper_meta
@@ -441,6 +443,46 @@ def build_column_hierarchy(param_list, level_names, input_columns, hide_levels=[
     return input_columns
 
 
+def get_enclosed_funcs(func, _seen=None):
+    """Get functions enclosed by `func`, recursively.
+
+    For example, `apply_func` and `cache_func` of the function built by `IndicatorFactory.from_apply_func`."""
+    if _seen is None:
+        _seen = set()
+    out = []
+    func = getattr(func, 'py_func', func)  # Numba-compiled functions
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            obj = cell.cell_contents
+        except ValueError:
+            continue  # empty cell
+        if callable(obj) and not isinstance(obj, type) and id(obj) not in _seen:
+            _seen.add(id(obj))
+            out.append(obj)
+            out.extend(get_enclosed_funcs(obj, _seen=_seen))
+    return out
+
+
+def get_disk_cache(disk_cache=None):
+    """Resolve `disk_cache` passed to `run_pipeline` into an instance of
+    `vectorbt.utils.disk_cache.DiskCache`, or None if disabled."""
+    if disk_cache is None:
+        disk_cache = defaults.indicators['disk_cache']
+    if disk_cache is None or disk_cache is False:
+        return None
+    if isinstance(disk_cache, DiskCache):
+        return disk_cache
+    if disk_cache is True:
+        cache_dir = defaults.indicators['disk_cache_dir']
+    else:
+        cache_dir = disk_cache
+    return DiskCache(
+        cache_dir,
+        max_size=defaults.indicators['disk_cache_max_size'],
+        mmap_mode=defaults.indicators['disk_cache_mmap_mode']
+    )
+
+
 def run_pipeline(
         num_ret_outputs,
         custom_func,
@@ -465,6 +507,9 @@ def run_pipeline(
         use_raw=None,
         wrapper_kwargs=None,
         seed=None,
+        disk_cache=None,
+        disk_cache_id=None,
+        float_dtype=None,
         **kwargs):
     """A pipeline for calculating an indicator, used by `IndicatorFactory`.
 
@@ -523,6 +568,30 @@ def run_pipeline(
         use_raw (bool): Takes the raw results and uses them instead of running `custom_func`.
         wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
         seed (int): Set seed to make output deterministic.
+        disk_cache (bool, str or DiskCache): Whether to cache raw outputs on disk.
+
+            Outputs are stored under a hash of the version of vectorbt, `disk_cache_id`, `custom_func`
+            along with the functions it encloses (see `get_enclosed_funcs`), broadcast inputs,
+            parameters, and other arguments, and are loaded as memory maps when the same calculation
+            is requested again, even from another process. On a hit, cached in-place outputs are copied
+            into the prepared in-place output arrays. Pass a path to use a specific directory,
+            or an instance of `vectorbt.utils.disk_cache.DiskCache`. If None, see `vectorbt.defaults.indicators`.
+
+            Requires `disk_cache_id`. Arguments that cannot be hashed by content raise an error.
+
+            !!! note
+                Functions are identified by their bytecode, but not by the global functions they call.
+                Change `disk_cache_id` or clear the cache after changing such functions.
+        disk_cache_id (any): Identity of the indicator used as part of the cache key.
+
+            Must be unique for each calculation performed by `custom_func`, for example, each `apply_func`
+            passed to `IndicatorFactory.from_apply_func`. If None, doesn't cache on disk unless
+            `disk_cache` was passed explicitly, in which case raises an error.
+            Indicators of vectorbt and TA-Lib are identified by their module and class/function name.
+        float_dtype (any): Data type to cast floating outputs returned by `custom_func` to,
+            such as `np.float32` to halve their memory footprint. In-place outputs are kept as-is.
+
+            If None, see `vectorbt.defaults.indicators`. Set to False to keep outputs as returned.
         **kwargs: Keyword arguments passed to the `custom_func`.
 
             Some common arguments include `return_cache` to return cache and `use_cache` to use cache.
@@ -651,6 +720,10 @@ def run_pipeline(
             forward_input_shape = True
         else:
             forward_input_shape = False
+    if float_dtype is None:
+        float_dtype = defaults.indicators['float_dtype']
+    if float_dtype is False:
+        float_dtype = None
 
     in_output_idxs = [i for i, x in enumerate(in_output_list) if x is not None]
     if len(in_output_idxs) > 0:
@@ -746,55 +819,99 @@ def run_pipeline(
             func_kwargs['flex_2d'] = len(input_shape) == 2
         func_kwargs = merge_kwargs(func_kwargs, kwargs)
 
-        # Set seed
-        if seed is not None:
-            set_seed(seed)
-
-        # Run the function
-        if pass_lists:
-            if checks.is_numba_func(custom_func):
-                output = custom_func(
-                    tuple(input_list_passed),
-                    tuple(in_output_list_passed),
-                    tuple(param_list),
-                    *args, **func_kwargs
-                )
+        # Try to load raw outputs from disk
+        cache = None
+        cached = None
+        if not kwargs.get('return_cache', False):
+            if disk_cache_id is None:
+                if disk_cache is not None and disk_cache is not False:
+                    raise ValueError("disk_cache_id is required to cache on disk")
+            else:
+                cache = get_disk_cache(disk_cache)
+        if cache is not None:
+            cache_key = cache.make_key(
+                vbt_version,
+                disk_cache_id,
+                custom_func,
+                get_enclosed_funcs(custom_func),
+                num_ret_outputs,
+                input_list_passed,
+                bc_in_output_list,
+                param_list,
+                args,
+                {k: v for k, v in func_kwargs.items() if k not in ('use_cache', 'parallel')},  # don't change outputs
+                pass_lists,
+                seed,
+                float_dtype
+            )
+            cached = cache.get(cache_key)
+        if cached is not None:
+            output_list, other_list = cached
+            # Fill in-place outputs as if custom_func had been run
+            output_list = output_list[:num_ret_outputs]
+            for in_output, cached_in_output in zip(in_output_list, cached[0][num_ret_outputs:]):
+                np.copyto(in_output, cached_in_output)
+                output_list.append(in_output)
+        else:
+            # Set seed
+            if seed is not None:
+                set_seed(seed)
+
+            # Run the function
+            if pass_lists:
+                if checks.is_numba_func(custom_func):
+                    output = custom_func(
+                        tuple(input_list_passed),
+                        tuple(in_output_list_passed),
+                        tuple(param_list),
+                        *args, **func_kwargs
+                    )
+                else:
+                    output = custom_func(
+                        input_list_passed,
+                        in_output_list_passed,
+                        param_list,
+                        *args, **func_kwargs
+                    )
             else:
                 output = custom_func(
-                    input_list_passed,
-                    in_output_list_passed,
-                    param_list,
+                    *input_list_passed,
+                    *in_output_list_passed,
+                    *param_list, 
                     *args, **func_kwargs
                 )
-        else:
-            output = custom_func(
-                *input_list_passed,
-                *in_output_list_passed,
-                *param_list, 
-                *args, **func_kwargs
-            )
 
-        # Return cache
-        if kwargs.get('return_cache', False):
-            return output
+            # Return cache
+            if kwargs.get('return_cache', False):
+                return output
 
-        # Post-process results
-        if isinstance(output, (tuple, list, List)):
-            output_list = list(output)
-        else:
-            output_list = [output]
-        # Other outputs should be returned without post-processing (for example cache_dict)
-        if len(output_list) > num_ret_outputs:
-            other_list = output_list[num_ret_outputs:]
-        else:
-            other_list = []
-        # Process only the num_ret_outputs outputs
-        output_list = output_list[:num_ret_outputs]
-        if len(output_list) != num_ret_outputs:
-            raise ValueError("Number of returned outputs other than expected")
-        output_list = list(map(reshape_fns.to_2d, output_list))
-        # In-place outputs are treated as outputs from here
-        output_list += in_output_list
+            # Post-process results
+            if isinstance(output, (tuple, list, List)):
+                output_list = list(output)
+            else:
+                output_list = [output]
+            # Other outputs should be returned without post-processing (for example cache_dict)
+            if len(output_list) > num_ret_outputs:
+                other_list = output_list[num_ret_outputs:]
+            else:
+                other_list = []
+            # Process only the num_ret_outputs outputs
+            output_list = output_list[:num_ret_outputs]
+            if len(output_list) != num_ret_outputs:
+                raise ValueError("Number of returned outputs other than expected")
+            output_list = list(map(reshape_fns.to_2d, output_list))
+            if float_dtype is not None:
+                output_list = [
+                    output.astype(float_dtype, copy=False)
+                    if np.issubdtype(output.dtype, np.floating) else output
+                    for output in output_list
+                ]
+            # In-place outputs are treated as outputs from here
+            output_list += in_output_list
+
+            # Store raw outputs on disk
+            if cache is not None:
+                cache.set(cache_key, output_list, other_list)
 
         # Return raw results if needed
         param_map = list(zip(*param_list))
@@ -1411,6 +1528,10 @@ class IndicatorFactory:
             level_names = list(level_names)
             param_list = [params.value if isinstance(params, Default) else params for params in param_list]
 
+            # Built-in indicators of vectorbt are identified by their class when caching on disk
+            if cls.__module__.startswith('vectorbt.') and cls.__module__ != __name__:
+                kwargs.setdefault('disk_cache_id', (cls.__module__, cls.__name__))
+
             # Run the pipeline
             results = run_pipeline(
                 len(output_names) - len(in_output_names),  # number of returned outputs
@@ -1649,6 +1770,15 @@ class IndicatorFactory:
             * You cannot pass keyword arguments
             * Your outputs must be arrays of the same shape, data type and data order
 
+        Built-in keyword arguments of the `run` method include `return_cache` and `use_cache`
+        (see `vectorbt.indicators.factory.run_pipeline`), and `parallel` to distribute parameter
+        combinations across threads using `vectorbt.base.combine_fns.apply_and_concat_one_parallel_nb`.
+        If None, see `vectorbt.defaults.indicators`. Only applicable if `apply_func` is Numba-compiled
+        and returns outputs of the same shape for each parameter combination. Since tuples cannot be
+        passed into the `prange` body, parameters are stacked into arrays and in-place outputs are
+        written back after the run. Falls back to the sequential run if any parameter is not numeric
+        or any of the passed arguments is a tuple.
+
         Args:
             apply_func (callable): A function that takes broadcast time series arrays corresponding
                 to `input_names`, single parameter selection corresponding to `param_names`, and other
@@ -1669,6 +1799,7 @@ class IndicatorFactory:
                 * `flex_2d`: See `vectorbt.base.reshape_fns.flex_choose_i_and_col_nb`.
                     Default is provided by the pipeline if `forward_flex_2d` is True.
             **kwargs: Keyword arguments passed to `IndicatorFactory.from_custom_func`.
+
         Returns:
             CustomIndicator
         Example:
@@ -1714,26 +1845,56 @@ class IndicatorFactory:
         if checks.is_numba_func(apply_func):
             if num_ret_outputs > 1:
                 apply_and_concat_func = combine_fns.apply_and_concat_multiple_nb
+                apply_and_concat_parallel_func = combine_fns.apply_and_concat_multiple_parallel_nb
             else:
                 apply_and_concat_func = combine_fns.apply_and_concat_one_nb
+                apply_and_concat_parallel_func = combine_fns.apply_and_concat_one_parallel_nb
 
             @njit
             def select_params(i, args_before, input_list, in_output_tuples, param_tuples, *args):
                 # Select the next tuple of parameters
                 return apply_func(*args_before, *input_list, *in_output_tuples[i], *param_tuples[i], *args)
 
+            select_params_parallel_funcs = {}
+
+            def get_select_params_parallel(n_shape, n_inputs, n_in_outputs, n_params):
+                # Tuples cannot be passed into the prange body, thus compile a function that
+                # takes each argument separately and selects parameters from stacked arrays
+                key = (n_shape, n_inputs, n_in_outputs, n_params)
+                if key not in select_params_parallel_funcs:
+                    shape_names = ['s%d' % j for j in range(n_shape)]
+                    input_names_ = ['x%d' % j for j in range(n_inputs)]
+                    in_output_names_ = ['io%d' % j for j in range(n_in_outputs)]
+                    param_names_ = ['p%d' % j for j in range(n_params)]
+                    first_arg = shape_names + input_names_ + in_output_names_ + param_names_
+                    first_arg = ', '.join(first_arg) + ', ' if len(first_arg) > 0 else ''
+                    second_arg = ['(' + ', '.join(shape_names) + ',)'] if n_shape > 0 else []
+                    second_arg += input_names_
+                    second_arg += [k + '[i]' for k in in_output_names_ + param_names_]
+                    second_arg = ', '.join(second_arg) + ', ' if len(second_arg) > 0 else ''
+                    func_str = "def select_params_parallel(i, {0}*args):\n" \
+                        "    return apply_func({1}*args)".format(first_arg, second_arg)
+                    scope = {'apply_func': apply_func}
+                    filename = inspect.getfile(lambda: None)
+                    code = compile(func_str, filename, 'exec')
+                    exec(code, scope)
+                    select_params_parallel_funcs[key] = njit(scope['select_params_parallel'])
+                return select_params_parallel_funcs[key]
+
         else:
             if num_ret_outputs > 1:
                 apply_and_concat_func = combine_fns.apply_and_concat_multiple
             else:
                 apply_and_concat_func = combine_fns.apply_and_concat_one
+            apply_and_concat_parallel_func = None  # GIL prevents parallelism
+            get_select_params_parallel = None
 
             def select_params(i, args_before, input_list, in_output_tuples, param_tuples, *args, **_kwargs):
                 # Select the next tuple of parameters
                 return apply_func(*args_before, *input_list, *in_output_tuples[i], *param_tuples[i], *args, **_kwargs)
 
         def custom_func(input_list, in_output_list, param_list, *args, input_shape=None,
-                        return_cache=False, use_cache=None, **_kwargs):
+                        return_cache=False, use_cache=None, parallel=None, **_kwargs):
 
             n_params = len(param_list[0]) if len(param_list) > 0 else 1
             input_list = tuple(input_list)
@@ -1775,6 +1936,36 @@ class IndicatorFactory:
             if not isinstance(cache, (tuple, list, List)):
                 cache = (cache,)
 
+            if parallel is None:
+                parallel = defaults.indicators['parallel']
+            if parallel and n_params > 1 and apply_and_concat_parallel_func is not None:
+                # Stack each parameter and in-place output along the first axis
+                param_arrs = tuple(map(np.asarray, param_list))
+                in_output_arrs = tuple(map(np.stack, in_output_list))
+                pass_args = (*args, *more_args, *cache)
+                if all(a.dtype.kind in 'biufc' for a in param_arrs) \
+                        and not any(isinstance(a, tuple) for a in pass_args):
+                    select_params_parallel = get_select_params_parallel(
+                        len(input_shape) if input_shape is not None else 0,
+                        len(input_list),
+                        len(in_output_arrs),
+                        len(param_arrs)
+                    )
+                    output = apply_and_concat_parallel_func(
+                        n_params,
+                        select_params_parallel,
+                        *(input_shape if input_shape is not None else ()),
+                        *input_list,
+                        *in_output_arrs,
+                        *param_arrs,
+                        *pass_args
+                    )
+                    # Write in-place outputs back
+                    for in_output_tuple, in_output_arr in zip(in_output_list, in_output_arrs):
+                        for i in range(n_params):
+                            in_output_tuple[i][:] = in_output_arr[i]
+                    return output
+
             return apply_and_concat_func(
                 n_params,
                 select_params,
@@ -1871,6 +2062,6 @@ class IndicatorFactory:
         ).from_custom_func(
             custom_func,
             **info['parameters'],
-            **kwargs
+            **merge_kwargs(dict(disk_cache_id=('talib', info['name'])), kwargs)
         )
         return TALibIndicator
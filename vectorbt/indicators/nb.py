@@ -11,6 +11,7 @@ import numpy as np
 from numba import njit
 
 from vectorbt.generic import nb as generic_nb
+from vectorbt.indicators.enums import RollingState, RollingMinMaxState
 
 
 @njit(cache=True)
@@ -29,14 +30,90 @@ def mstd_nb(a, window, ewm):
     return generic_nb.rolling_std_nb(a, window, minp=window, ddof=0)
 
 
+@njit(cache=True)
+def prefix_sums_nb(a):
+    """Compute cumulative sum, cumulative sum of squares and cumulative NaN count of `a` along axis 0.
+
+    NaN values are skipped in both sums. Each output has one more row than `a` with zeros in the
+    first row, such that the sum of rows `i - window + 1` to `i` is `out[i + 1] - out[max(i + 1 - window, 0)]`."""
+    cumsum = np.zeros((a.shape[0] + 1, a.shape[1]), dtype=np.float_)
+    cumsum_sq = np.zeros((a.shape[0] + 1, a.shape[1]), dtype=np.float_)
+    nancnt = np.zeros((a.shape[0] + 1, a.shape[1]), dtype=np.int_)
+    for col in range(a.shape[1]):
+        for i in range(a.shape[0]):
+            if np.isnan(a[i, col]):
+                cumsum[i + 1, col] = cumsum[i, col]
+                cumsum_sq[i + 1, col] = cumsum_sq[i, col]
+                nancnt[i + 1, col] = nancnt[i, col] + 1
+            else:
+                cumsum[i + 1, col] = cumsum[i, col] + a[i, col]
+                cumsum_sq[i + 1, col] = cumsum_sq[i, col] + a[i, col] ** 2
+                nancnt[i + 1, col] = nancnt[i, col]
+    return cumsum, cumsum_sq, nancnt
+
+
+@njit(cache=True)
+def rolling_mean_from_sums_nb(cumsum, nancnt, window, minp=None):
+    """Compute rolling mean from the output of `prefix_sums_nb`.
+
+    Equivalent to `vectorbt.generic.nb.rolling_mean_nb`, but takes a single pass over
+    precomputed sums, which can be shared among windows."""
+    if minp is None:
+        minp = window
+    if minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty((cumsum.shape[0] - 1, cumsum.shape[1]), dtype=np.float_)
+    for col in range(out.shape[1]):
+        for i in range(out.shape[0]):
+            j = max(i + 1 - window, 0)
+            window_len = i + 1 - j - (nancnt[i + 1, col] - nancnt[j, col])
+            if window_len < minp:
+                out[i, col] = np.nan
+            else:
+                out[i, col] = (cumsum[i + 1, col] - cumsum[j, col]) / window_len
+    return out
+
+
+@njit(cache=True)
+def rolling_std_from_sums_nb(cumsum, cumsum_sq, nancnt, window, minp=None, ddof=0):
+    """Compute rolling standard deviation from the output of `prefix_sums_nb`.
+
+    Equivalent to `vectorbt.generic.nb.rolling_std_nb`. See `rolling_mean_from_sums_nb`."""
+    if minp is None:
+        minp = window
+    if minp > window:
+        raise ValueError("minp must be <= window")
+    out = np.empty((cumsum.shape[0] - 1, cumsum.shape[1]), dtype=np.float_)
+    for col in range(out.shape[1]):
+        for i in range(out.shape[0]):
+            j = max(i + 1 - window, 0)
+            window_len = i + 1 - j - (nancnt[i + 1, col] - nancnt[j, col])
+            if window_len < minp or window_len == ddof:
+                out[i, col] = np.nan
+            else:
+                window_cumsum = cumsum[i + 1, col] - cumsum[j, col]
+                window_cumsum_sq = cumsum_sq[i + 1, col] - cumsum_sq[j, col]
+                mean = window_cumsum / window_len
+                out[i, col] = np.sqrt(np.abs(window_cumsum_sq - 2 * window_cumsum *
+                                             mean + window_len * mean ** 2) / (window_len - ddof))
+    return out
+
+
 @njit(cache=True)
 def ma_cache_nb(ts, windows, ewms):
-    """Caching function for `vectorbt.indicators.basic.MA`."""
+    """Caching function for `vectorbt.indicators.basic.MA`.
+
+    Simple moving averages of all windows are derived from sums computed once by `prefix_sums_nb`."""
+    cumsum, _, nancnt = prefix_sums_nb(ts)
     cache_dict = dict()
     for i in range(len(windows)):
         h = hash((windows[i], ewms[i]))
         if h not in cache_dict:
-            cache_dict[h] = ma_nb(ts, windows[i], ewms[i])
+            if ewms[i]:
+                # Match the layout of arrays derived from sums
+                cache_dict[h] = np.ascontiguousarray(ma_nb(ts, windows[i], ewms[i]))
+            else:
+                cache_dict[h] = rolling_mean_from_sums_nb(cumsum, nancnt, windows[i])
     return cache_dict
 
 
@@ -49,12 +126,18 @@ def ma_apply_nb(ts, window, ewm, cache_dict):
 
 @njit(cache=True)
 def mstd_cache_nb(ts, windows, ewms):
-    """Caching function for `vectorbt.indicators.basic.MSTD`."""
+    """Caching function for `vectorbt.indicators.basic.MSTD`.
+
+    Simple moving STDs of all windows are derived from sums computed once by `prefix_sums_nb`."""
+    cumsum, cumsum_sq, nancnt = prefix_sums_nb(ts)
     cache_dict = dict()
     for i in range(len(windows)):
         h = hash((windows[i], ewms[i]))
         if h not in cache_dict:
-            cache_dict[h] = mstd_nb(ts, windows[i], ewms[i])
+            if ewms[i]:
+                cache_dict[h] = np.ascontiguousarray(mstd_nb(ts, windows[i], ewms[i]))
+            else:
+                cache_dict[h] = rolling_std_from_sums_nb(cumsum, cumsum_sq, nancnt, windows[i])
     return cache_dict
 
 
@@ -68,8 +151,18 @@ def mstd_apply_nb(ts, window, ewm, cache_dict):
 @njit(cache=True)
 def bb_cache_nb(ts, windows, ewms, alphas):
     """Caching function for `vectorbt.indicators.basic.BBANDS`."""
-    ma_cache_dict = ma_cache_nb(ts, windows, ewms)
-    mstd_cache_dict = mstd_cache_nb(ts, windows, ewms)
+    cumsum, cumsum_sq, nancnt = prefix_sums_nb(ts)
+    ma_cache_dict = dict()
+    mstd_cache_dict = dict()
+    for i in range(len(windows)):
+        h = hash((windows[i], ewms[i]))
+        if h not in ma_cache_dict:
+            if ewms[i]:
+                ma_cache_dict[h] = np.ascontiguousarray(ma_nb(ts, windows[i], ewms[i]))
+                mstd_cache_dict[h] = np.ascontiguousarray(mstd_nb(ts, windows[i], ewms[i]))
+            else:
+                ma_cache_dict[h] = rolling_mean_from_sums_nb(cumsum, nancnt, windows[i])
+                mstd_cache_dict[h] = rolling_std_from_sums_nb(cumsum, cumsum_sq, nancnt, windows[i])
     return ma_cache_dict, mstd_cache_dict
 
 
@@ -92,13 +185,11 @@ def rsi_cache_nb(ts, windows, ewms):
     up = generic_nb.set_by_mask_nb(up, up < 0, 0)
     down = np.abs(generic_nb.set_by_mask_nb(down, down > 0, 0))
     # Cache
+    up_cache_dict = ma_cache_nb(up, windows, ewms)
+    down_cache_dict = ma_cache_nb(down, windows, ewms)
     cache_dict = dict()
-    for i in range(len(windows)):
-        h = hash((windows[i], ewms[i]))
-        if h not in cache_dict:
-            roll_up = ma_nb(up, windows[i], ewms[i])
-            roll_down = ma_nb(down, windows[i], ewms[i])
-            cache_dict[h] = roll_up, roll_down
+    for h in up_cache_dict:
+        cache_dict[h] = up_cache_dict[h], down_cache_dict[h]
     return cache_dict
 
 
@@ -178,13 +269,7 @@ def atr_cache_nb(high_ts, low_ts, close_ts, windows, ewms):
     """Caching function for `vectorbt.indicators.basic.ATR`."""
     # Calculate TR here instead of re-calculating it for each param in atr_apply_nb
     tr = true_range(high_ts, low_ts, close_ts)
-
-    cache_dict = dict()
-    for i in range(len(windows)):
-        h = hash((windows[i], ewms[i]))
-        if h not in cache_dict:
-            cache_dict[h] = ma_nb(tr, windows[i], ewms[i])
-    return tr, cache_dict
+    return tr, ma_cache_nb(tr, windows, ewms)
 
 
 @njit(cache=True)
@@ -200,3 +285,246 @@ def obv_custom_nb(close_ts, volume_ts):
     obv = generic_nb.set_by_mask_mult_nb(volume_ts, close_ts < generic_nb.fshift_nb(close_ts, 1), -volume_ts)
     obv = generic_nb.cumsum_nb(obv)
     return obv
+
+
+# ############# Incremental updates ############# #
+
+
+@njit(cache=True)
+def init_rolling_state_nb(max_window, n_cols):
+    """Create an empty `vectorbt.indicators.enums.RollingState`."""
+    return RollingState(
+        np.full(n_cols, 0, dtype=np.int_),
+        np.full((max_window, n_cols), np.nan, dtype=np.float_),
+        np.full(n_cols, 0, dtype=np.int_),
+        np.full(n_cols, 0., dtype=np.float_),
+        np.full(n_cols, 0., dtype=np.float_),
+        np.full(n_cols, np.nan, dtype=np.float_),
+        np.full(n_cols, 0., dtype=np.float_),
+        np.full(n_cols, 1., dtype=np.float_),
+        np.full(n_cols, 1., dtype=np.float_),
+        np.full(n_cols, 1., dtype=np.float_),
+        np.full(n_cols, 0, dtype=np.int_)
+    )
+
+
+@njit(cache=True)
+def rolling_update_nb(a, windows, ewms, state):
+    """Compute moving average and STD of new rows `a` by resuming from `state`.
+
+    Equivalent to `ma_nb` and `mstd_nb` over the whole series, but processes each new row
+    in constant time using running sums (`ewm=False`) or exponential weights (`ewm=True`).
+    `windows` and `ewms` have one element per column. `state` is updated in place.
+
+    Returns moving average and STD."""
+    ma_out = np.empty_like(a, dtype=np.float_)
+    mstd_out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        window = windows[col]
+        com = (window - 1) / 2.0
+        alpha = 1. / (1. + com)
+        old_wt_factor = 1. - alpha
+        new_wt = alpha
+        for i in range(a.shape[0]):
+            cur = a[i, col]
+            t = state.n[col]
+            if ewms[col]:
+                is_observation = (cur == cur)
+                state.nobs[col] += is_observation
+                mean = state.ewm_mean[col]
+                if mean == mean:
+                    state.sum_wt[col] *= old_wt_factor
+                    state.sum_wt2[col] *= (old_wt_factor * old_wt_factor)
+                    state.old_wt[col] *= old_wt_factor
+                    if is_observation:
+                        old_wt = state.old_wt[col]
+                        old_mean = mean
+                        # avoid numerical errors on constant series
+                        if mean != cur:
+                            mean = ((old_wt * old_mean) + (new_wt * cur)) / (old_wt + new_wt)
+                        state.ewm_cov[col] = ((old_wt * (state.ewm_cov[col] + ((old_mean - mean) *
+                                                                               (old_mean - mean)))) +
+                                              (new_wt * ((cur - mean) * (cur - mean)))) / (old_wt + new_wt)
+                        state.sum_wt[col] += new_wt
+                        state.sum_wt2[col] += (new_wt * new_wt)
+                        old_wt += new_wt
+                        state.sum_wt[col] /= old_wt
+                        state.sum_wt2[col] /= (old_wt * old_wt)
+                        state.old_wt[col] = 1.
+                elif is_observation:
+                    mean = cur
+                state.ewm_mean[col] = mean
+                if state.nobs[col] >= window:
+                    ma_out[i, col] = mean
+                    numerator = state.sum_wt[col] * state.sum_wt[col]
+                    denominator = numerator - state.sum_wt2[col]
+                    if denominator > 0.:
+                        mstd_out[i, col] = np.sqrt((numerator / denominator) * state.ewm_cov[col])
+                    else:
+                        mstd_out[i, col] = np.nan
+                else:
+                    ma_out[i, col] = np.nan
+                    mstd_out[i, col] = np.nan
+            else:
+                if t >= window:
+                    old = state.buffer[t % window, col]
+                    if np.isnan(old):
+                        state.nancnt[col] -= 1
+                    else:
+                        state.sum[col] -= old
+                        state.sum_sq[col] -= old ** 2
+                state.buffer[t % window, col] = cur
+                if np.isnan(cur):
+                    state.nancnt[col] += 1
+                else:
+                    state.sum[col] += cur
+                    state.sum_sq[col] += cur ** 2
+                window_len = min(t + 1, window) - state.nancnt[col]
+                if window_len < window or window_len == 0:
+                    ma_out[i, col] = np.nan
+                    mstd_out[i, col] = np.nan
+                else:
+                    mean = state.sum[col] / window_len
+                    ma_out[i, col] = mean
+                    mstd_out[i, col] = np.sqrt(np.abs(state.sum_sq[col] - 2 * state.sum[col] *
+                                                      mean + window_len * mean ** 2) / window_len)
+            state.n[col] += 1
+    return ma_out, mstd_out
+
+
+@njit(cache=True)
+def init_rolling_min_max_state_nb(max_window, n_cols):
+    """Create an empty `vectorbt.indicators.enums.RollingMinMaxState`."""
+    return RollingMinMaxState(
+        np.full(n_cols, 0, dtype=np.int_),
+        np.full((max_window, n_cols), np.nan, dtype=np.float_),
+        np.full(n_cols, 0, dtype=np.int_),
+        np.full((max_window, n_cols), 0, dtype=np.int_),
+        np.full(n_cols, 0, dtype=np.int_),
+        np.full(n_cols, 0, dtype=np.int_)
+    )
+
+
+@njit(cache=True)
+def rolling_min_max_update_nb(a, windows, state, is_max):
+    """Compute rolling min (or max if `is_max` is True) of new rows `a` by resuming from `state`.
+
+    Equivalent to `vectorbt.generic.nb.rolling_min_nb` and `vectorbt.generic.nb.rolling_max_nb`
+    with `minp=window`, but processes each new row in amortized constant time using a monotonic deque.
+    `windows` has one element per column. `state` is updated in place."""
+    out = np.empty_like(a, dtype=np.float_)
+    for col in range(a.shape[1]):
+        window = windows[col]
+        for i in range(a.shape[0]):
+            cur = a[i, col]
+            t = state.n[col]
+            # Remove the row that leaves the window
+            while state.deque_len[col] > 0 and state.deque[state.deque_start[col], col] <= t - window:
+                state.deque_start[col] = (state.deque_start[col] + 1) % window
+                state.deque_len[col] -= 1
+            if t >= window and np.isnan(state.buffer[t % window, col]):
+                state.nancnt[col] -= 1
+            # Add the new row
+            if np.isnan(cur):
+                state.nancnt[col] += 1
+            else:
+                while state.deque_len[col] > 0:
+                    last = state.deque[(state.deque_start[col] + state.deque_len[col] - 1) % window, col]
+                    last_val = state.buffer[last % window, col]
+                    if (is_max and last_val > cur) or (not is_max and last_val < cur):
+                        break
+                    state.deque_len[col] -= 1
+                state.deque[(state.deque_start[col] + state.deque_len[col]) % window, col] = t
+                state.deque_len[col] += 1
+            state.buffer[t % window, col] = cur
+            if min(t + 1, window) - state.nancnt[col] < window:
+                out[i, col] = np.nan
+            else:
+                out[i, col] = state.buffer[state.deque[state.deque_start[col], col] % window, col]
+            state.n[col] += 1
+    return out
+
+
+@njit(cache=True)
+def rsi_update_nb(close_ts, windows, ewms, prev_close, up_state, down_state):
+    """Update function for `vectorbt.indicators.basic.RSI`.
+
+    `prev_close` holds the last close per column and is updated in place."""
+    delta = np.empty_like(close_ts, dtype=np.float_)
+    delta[0, :] = close_ts[0, :] - prev_close
+    delta[1:, :] = close_ts[1:, :] - close_ts[:-1, :]
+    prev_close[:] = close_ts[-1, :]
+    up, down = delta.copy(), delta.copy()
+    up = generic_nb.set_by_mask_nb(up, up < 0, 0)
+    down = np.abs(generic_nb.set_by_mask_nb(down, down > 0, 0))
+    roll_up = rolling_update_nb(up, windows, ewms, up_state)[0]
+    roll_down = rolling_update_nb(down, windows, ewms, down_state)[0]
+    rs = roll_up / roll_down
+    return 100 - 100 / (1 + rs)
+
+
+@njit(cache=True)
+def stoch_update_nb(high_ts, low_ts, close_ts, k_windows, d_windows, d_ewms, min_state, max_state, d_state):
+    """Update function for `vectorbt.indicators.basic.STOCH`."""
+    roll_min = rolling_min_max_update_nb(low_ts, k_windows, min_state, False)
+    roll_max = rolling_min_max_update_nb(high_ts, k_windows, max_state, True)
+    percent_k = 100 * (close_ts - roll_min) / (roll_max - roll_min)
+    percent_d = rolling_update_nb(percent_k, d_windows, d_ewms, d_state)[0]
+    return percent_k, percent_d
+
+
+@njit(cache=True)
+def macd_update_nb(close_ts, fast_windows, slow_windows, signal_windows, macd_ewms, signal_ewms,
+                   fast_state, slow_state, signal_state):
+    """Update function for `vectorbt.indicators.basic.MACD`."""
+    fast_ma = rolling_update_nb(close_ts, fast_windows, macd_ewms, fast_state)[0]
+    slow_ma = rolling_update_nb(close_ts, slow_windows, macd_ewms, slow_state)[0]
+    macd_ts = fast_ma - slow_ma
+    signal_ts = rolling_update_nb(macd_ts, signal_windows, signal_ewms, signal_state)[0]
+    return macd_ts, signal_ts
+
+
+@njit(cache=True)
+def atr_update_nb(high_ts, low_ts, close_ts, windows, ewms, prev_close, state):
+    """Update function for `vectorbt.indicators.basic.ATR`.
+
+    `prev_close` holds the last close per column and is updated in place."""
+    tr = np.empty_like(close_ts, dtype=np.float_)
+    for col in range(close_ts.shape[1]):
+        for i in range(close_ts.shape[0]):
+            if i == 0:
+                _prev_close = prev_close[col]
+            else:
+                _prev_close = close_ts[i - 1, col]
+            tr[i, col] = np.nan
+            for v in (
+                high_ts[i, col] - low_ts[i, col],
+                abs(high_ts[i, col] - _prev_close),
+                abs(low_ts[i, col] - _prev_close)
+            ):
+                if not np.isnan(v) and (np.isnan(tr[i, col]) or v > tr[i, col]):
+                    tr[i, col] = v
+    prev_close[:] = close_ts[-1, :]
+    atr = rolling_update_nb(tr, windows, ewms, state)[0]
+    return tr, atr
+
+
+@njit(cache=True)
+def obv_update_nb(close_ts, volume_ts, prev_close, prev_obv):
+    """Update function for `vectorbt.indicators.basic.OBV`.
+
+    `prev_close` holds the last close and `prev_obv` the running sum per column. Both are updated in place."""
+    obv = np.empty_like(volume_ts, dtype=np.float_)
+    for col in range(close_ts.shape[1]):
+        for i in range(close_ts.shape[0]):
+            if close_ts[i, col] < prev_close[col]:
+                volume = -volume_ts[i, col]
+            else:
+                volume = volume_ts[i, col]
+            if np.isnan(volume):
+                obv[i, col] = np.nan
+            else:
+                prev_obv[col] += volume
+                obv[i, col] = prev_obv[col]
+            prev_close[col] = close_ts[i, col]
+    return obv
@@ -204,14 +204,18 @@ There is currently no way to disable caching for an entire class.
 
 import numpy as np
 import pandas as pd
+from copy import deepcopy
 from inspect import signature
+from numba.typed import List, Dict
 
 from vectorbt import defaults
 from vectorbt.utils import checks
 from vectorbt.utils.decorators import cached_method
 from vectorbt.utils.config import Configured, merge_kwargs
 from vectorbt.utils.random import set_seed
-from vectorbt.base.reshape_fns import to_1d, to_2d, broadcast
+from vectorbt.utils.datetime import freq_delta
+from vectorbt.base.reshape_fns import to_1d, to_2d, broadcast, wrap_broadcasted, flex_select_cols
+from vectorbt.base import index_fns
 from vectorbt.base.indexing import PandasIndexer
 from vectorbt.base.array_wrapper import ArrayWrapper
 from vectorbt.generic import nb as generic_nb
@@ -223,8 +227,11 @@ from vectorbt.portfolio.enums import (
     CallSeqType,
     InitCashMode
 )
-from vectorbt.records import Orders, Trades, Positions, Drawdowns
+from vectorbt.records import Orders, Trades, Positions, Drawdowns, order_dt
+from vectorbt.records import nb as records_nb
 from vectorbt.records.orders import indexing_on_orders_meta
+from vectorbt.signals.packed import PackedSignals
+from vectorbt.signals.nb import to_sparse_nb, packed_to_sparse_nb
 
 
 def _indexing_func(obj, pd_indexing_func):
@@ -234,15 +241,31 @@ def _indexing_func(obj, pd_indexing_func):
         new_init_cash = obj._init_cash
     else:
         new_init_cash = to_1d(obj._init_cash, raw=True)[group_idxs if obj.cash_sharing else col_idxs]
-    new_call_seq = obj.call_seq.values[:, col_idxs]
+    new_call_seq = to_2d(obj._call_seq, raw=True)[:, col_idxs]
 
     return obj.copy(
         orders=new_orders,
         init_cash=new_init_cash,
-        call_seq=new_call_seq
+        call_seq=new_call_seq,
+        sim_state=None
     )
 
 
+def _copy_prep_out(prep_out):
+    """Copy the output of `prep_func_nb` such that in-place changes don't leak into the original."""
+    if isinstance(prep_out, tuple):
+        return tuple(map(_copy_prep_out, prep_out))
+    if isinstance(prep_out, (np.ndarray, List, Dict)):
+        return prep_out.copy()
+    return deepcopy(prep_out)
+
+
+def _is_sparse_signals(obj):
+    """Whether `obj` is a tuple of row indices and column index of sparse signals."""
+    return isinstance(obj, tuple) and len(obj) == 2 \
+        and all(isinstance(a, np.ndarray) for a in obj) and obj[1].ndim == 2
+
+
 def add_returns_methods(func_names):
     """Class decorator to add `vectorbt.returns.accessors.Returns_Accessor` methods to `Portfolio`."""
 
@@ -325,7 +348,12 @@ class Portfolio(Configured, PandasIndexer):
         init_cash (InitCashMode, float or array_like of float): Initial capital.
         cash_sharing (bool): Whether to share cash within the same group.
         call_seq (array_like of int): Sequence of calls per row and group.
+
+            Can be of shape `(1, columns)` if the sequence is the same for each row.
         incl_unrealized (bool): Whether to include unrealized P&L in statistics.
+        sim_state (SimulationState): State of the simulation after the last row.
+
+            Set by `Portfolio.from_order_func` if `row_wise` is True. Required by `Portfolio.update`.
 
     !!! note
         Use class methods with `from_` prefix to build a portfolio.
@@ -334,14 +362,15 @@ class Portfolio(Configured, PandasIndexer):
     !!! note
         This class is meant to be immutable. To change any attribute, use `Portfolio.copy`."""
 
-    def __init__(self, orders, init_cash, cash_sharing, call_seq, incl_unrealized=None):
+    def __init__(self, orders, init_cash, cash_sharing, call_seq, incl_unrealized=None, sim_state=None):
         Configured.__init__(
             self,
             orders=orders,
             init_cash=init_cash,
             cash_sharing=cash_sharing,
             call_seq=call_seq,
-            incl_unrealized=incl_unrealized
+            incl_unrealized=incl_unrealized,
+            sim_state=sim_state
         )
         # Get defaults
         if incl_unrealized is None:
@@ -357,6 +386,7 @@ class Portfolio(Configured, PandasIndexer):
         self._cash_sharing = cash_sharing
         self._call_seq = call_seq
         self._incl_unrealized = incl_unrealized
+        self._sim_state = sim_state
 
         # Supercharge
         PandasIndexer.__init__(self, _indexing_func)
@@ -368,7 +398,8 @@ class Portfolio(Configured, PandasIndexer):
                      fees=None, fixed_fees=None, slippage=None, reject_prob=None, min_size=None,
                      init_cash=None, cash_sharing=None, call_seq=None, accumulate=None,
                      accumulate_exit_mode=None, conflict_mode=None, seed=None, freq=None, group_by=None,
-                     broadcast_kwargs=None, wrapper_kwargs=None, **kwargs):
+                     broadcast_kwargs=None, wrapper_kwargs=None, parallel=None, chunk_size=None,
+                     max_memory=None, sparse=None, reduce_only=False, year_freq=None, **kwargs):
         """Simulate portfolio from entry and exit signals.
 
         Starting with initial cash `init_cash`, for each signal in `entries`, enters a position
@@ -384,7 +415,17 @@ class Portfolio(Configured, PandasIndexer):
 
                 Will be used for calculating unrealized P&L and portfolio value.
             entries (array_like of bool): Boolean array of entry signals. Will broadcast.
+
+                Can also be `vectorbt.signals.packed.PackedSignals`, whose bits are read by the simulation
+                without unpacking. They won't broadcast, instead other inputs are broadcast to their shape.
+
+                Can also be sparse signals, that is, a tuple of row indices and column index as returned
+                by `vectorbt.signals.nb.to_sparse_nb`. They are passed to the simulation as they are,
+                such that the work scales with the number of signals. They won't broadcast and must
+                have one column index entry per column. Enables `sparse`.
             exits (array_like of bool): Boolean array of exit signals. Will broadcast.
+
+                Can also be `vectorbt.signals.packed.PackedSignals` or sparse signals. See `entries`.
             size (float or array_like): Size to order. Will broadcast.
 
                 * Set to positive/negative to buy/sell.
@@ -441,6 +482,37 @@ class Portfolio(Configured, PandasIndexer):
             group_by (any): Group columns. See `vectorbt.base.column_grouper.ColumnGrouper`.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
+            parallel (bool): Whether to simulate groups in parallel using Numba.
+
+                Groups (columns if cash sharing is disabled) are independent from each other and
+                thus can be distributed across threads. The order records are the same as in
+                the sequential mode.
+
+                !!! note
+                    Rejection of orders with `reject_prob` isn't reproducible with `seed` in parallel mode.
+            chunk_size (int): Maximum number of columns to simulate at once.
+
+                If set, simulates the columns chunk by chunk and concatenates their order records.
+                Chunks never split a group with cash sharing. Inputs are never broadcast to the full
+                shape, and `close` is stored as a read-only broadcast view.
+            max_memory (int): Maximum number of bytes to allocate for order records per chunk.
+
+                Used to derive `chunk_size`. If both are set, takes the smaller chunk.
+            sparse (bool): Whether to convert signals into sparse signals and simulate using
+                `vectorbt.portfolio.nb.simulate_from_signals_sparse_nb`.
+
+                Visits only the rows with signals and allocates order records only for signals,
+                which is much faster for strategies with few signals. Cannot be combined with
+                `parallel` and `reduce_only`. Defaults to True if any signals are sparse.
+            reduce_only (bool): Whether to reduce each column/group to metrics during simulation.
+
+                Instead of a portfolio, returns a DataFrame with one row per column/group and
+                the fields of `vectorbt.portfolio.enums.metrics_dt` as columns. Neither order records
+                nor any time series are kept, which makes it suitable for large parameter sweeps.
+                Sharpe ratio is calculated with zero risk-free rate.
+            year_freq (any): Year frequency for annualization of metrics if `reduce_only` is True.
+
+                Defaults to `vectorbt.defaults.returns['year_freq']`.
             **kwargs: Keyword arguments passed to the `__init__` method.
 
         All time series will be broadcast together using `vectorbt.base.reshape_fns.broadcast`.
@@ -575,6 +647,21 @@ class Portfolio(Configured, PandasIndexer):
             if isinstance(conflict_mode, str):
                 conflict_mode = getattr(ConflictMode, conflict_mode)
         checks.assert_in(conflict_mode, ConflictMode)
+        if parallel is None:
+            parallel = defaults.portfolio['parallel']
+        if chunk_size is None:
+            chunk_size = defaults.portfolio['chunk_size']
+        if max_memory is None:
+            max_memory = defaults.portfolio['max_memory']
+        chunked = chunk_size is not None or max_memory is not None
+        sparse_entries = _is_sparse_signals(entries)
+        sparse_exits = _is_sparse_signals(exits)
+        if sparse is None:
+            sparse = sparse_entries or sparse_exits or defaults.portfolio['sparse']
+        elif not sparse and (sparse_entries or sparse_exits):
+            raise ValueError("Sparse signals require sparse=True")
+        if sparse and (parallel or reduce_only):
+            raise ValueError("sparse cannot be combined with parallel or reduce_only")
         if seed is None:
             seed = defaults.portfolio['seed']
         if seed is not None:
@@ -588,10 +675,29 @@ class Portfolio(Configured, PandasIndexer):
         if not wrapper_kwargs.get('group_select', True) and cash_sharing:
             raise ValueError("group_select cannot be disabled if cash_sharing=True")
 
+        # Packed signals are passed to the simulation as they are -> keep their wrapper for the shape and labels
+        packed_wrapper = None
+        packed_entries = None
+        packed_exits = None
+        if isinstance(exits, PackedSignals):
+            packed_wrapper = exits.wrapper
+            packed_exits = exits.packed
+            exits = False
+        if isinstance(entries, PackedSignals):
+            packed_wrapper = entries.wrapper
+            packed_entries = entries.packed
+            entries = False
+        if sparse_entries:
+            entries = tuple(np.asarray(a, dtype=np.int_) for a in entries)
+        if sparse_exits:
+            exits = tuple(np.asarray(a, dtype=np.int_) for a in exits)
+
         # Perform checks
         checks.assert_subdtype(close, np.floating)
-        checks.assert_dtype(entries, np.bool)
-        checks.assert_dtype(exits, np.bool)
+        if not sparse_entries:
+            checks.assert_dtype(entries, np.bool)
+        if not sparse_exits:
+            checks.assert_dtype(exits, np.bool)
         checks.assert_subdtype(size, np.floating)
         checks.assert_subdtype(entry_price, np.floating)
         checks.assert_subdtype(exit_price, np.floating)
@@ -604,15 +710,48 @@ class Portfolio(Configured, PandasIndexer):
         checks.assert_subdtype(call_seq, np.integer)
 
         # Broadcast inputs
-        # Only close is broadcast, others can remain unchanged thanks to flexible indexing
-        keep_raw = (False, True, True, True, True, True, True, True, True, True, True)
+        # Inputs can remain unchanged thanks to flexible indexing
+        # Close is not needed for simulation and becomes a read-only broadcast view
+        keep_raw = True
         broadcast_kwargs = merge_kwargs(dict(require_kwargs=dict(requirements='W')), broadcast_kwargs)
-        close, entries, exits, size, entry_price, exit_price, fees, fixed_fees, slippage, reject_prob = \
-            broadcast(close, entries, exits, size, entry_price, exit_price, fees, fixed_fees,
-                slippage, reject_prob, **broadcast_kwargs, keep_raw=keep_raw)
+        if packed_wrapper is not None:
+            broadcast_kwargs = merge_kwargs(dict(to_shape=packed_wrapper.shape), broadcast_kwargs)
+        orig_close = close
+        orig_entries = entries
+        orig_exits = exits
+        if sparse_entries:
+            entries = False  # sparse signals don't broadcast
+        if sparse_exits:
+            exits = False
+        (raw_close, entries, exits, size, entry_price, exit_price, fees, fixed_fees, slippage, reject_prob), \
+            to_shape, new_index, new_columns = broadcast(
+                close, entries, exits, size, entry_price, exit_price, fees, fixed_fees,
+                slippage, reject_prob, **broadcast_kwargs, keep_raw=keep_raw, return_meta=True)
+        if packed_wrapper is not None:
+            if new_index is None:
+                new_index = packed_wrapper.index
+            if new_columns is None:
+                new_columns = packed_wrapper.columns
+        close = wrap_broadcasted(
+            orig_close,
+            np.broadcast_to(raw_close, to_shape),
+            is_pd=checks.is_pandas(orig_close) or new_index is not None,
+            new_index=new_index,
+            new_columns=new_columns
+        )
         if not checks.is_pandas(close):
             close = pd.Series(close) if close.ndim == 1 else pd.DataFrame(close)
         target_shape_2d = (close.shape[0], close.shape[1] if close.ndim > 1 else 1)
+        if sparse_entries:
+            entries = orig_entries
+        if sparse_exits:
+            exits = orig_exits
+        for a in (entries, exits):
+            if isinstance(a, tuple) and a[1].shape != (target_shape_2d[1], 2):
+                raise ValueError("Column index of sparse signals must have one entry per column")
+        for a in (packed_entries, packed_exits):
+            if a is not None and a.shape != ((target_shape_2d[0] + 7) // 8, target_shape_2d[1]):
+                raise ValueError("Shape of packed signals doesn't match the shape of other inputs")
         min_size = np.require(np.broadcast_to(min_size, (target_shape_2d[1],)), requirements='W')
         wrapper = ArrayWrapper.from_obj(close, freq=freq, group_by=group_by, **wrapper_kwargs)
         cs_group_counts = wrapper.grouper.get_group_counts(group_by=cash_sharing)
@@ -621,29 +760,126 @@ class Portfolio(Configured, PandasIndexer):
         if checks.is_array(call_seq):
             call_seq = nb.require_call_seq(broadcast(call_seq, to_shape=target_shape_2d, to_pd=False))
         else:
-            call_seq = nb.build_call_seq(target_shape_2d, group_counts, call_seq_type=call_seq)
+            call_seq = nb.build_call_seq(target_shape_2d, group_counts, call_seq_type=call_seq, keep_raw=True)
 
         # Perform calculation
-        order_records = nb.simulate_from_signals_nb(
-            target_shape_2d,
-            cs_group_counts,  # group only if cash sharing is enabled to speed up
-            init_cash,
-            call_seq,
-            entries,
-            exits,
-            size,
-            entry_price,
-            exit_price,
-            fees,
-            fixed_fees,
-            slippage,
-            reject_prob,
-            min_size,
-            accumulate,
-            accumulate_exit_mode,
-            conflict_mode,
-            close.ndim == 2
-        )
+        flex_2d = close.ndim == 2
+        if reduce_only:
+            if init_cash_mode is not None:
+                raise ValueError("InitCashMode is not supported if reduce_only=True")
+            if year_freq is None:
+                year_freq = defaults.returns['year_freq']
+            if wrapper.freq is None:
+                raise ValueError("Couldn't parse the frequency of index. You must set `freq`.")
+            ann_factor = freq_delta(year_freq) / wrapper.freq
+            if parallel:
+                simulate_func_nb = nb.simulate_from_signals_metrics_parallel_nb
+            else:
+                simulate_func_nb = nb.simulate_from_signals_metrics_nb
+            sim_group_counts = group_counts  # metrics are reduced per group
+        else:
+            if sparse:
+                simulate_func_nb = nb.simulate_from_signals_sparse_nb
+            elif parallel:
+                simulate_func_nb = nb.simulate_from_signals_parallel_nb
+            else:
+                simulate_func_nb = nb.simulate_from_signals_nb
+            sim_group_counts = cs_group_counts  # group only if cash sharing is enabled to speed up
+        if chunked:
+            # Simulate chunks of groups one by one to limit the size of the record buffer
+            if max_memory is not None:
+                col_memory = target_shape_2d[0] * (order_dt.itemsize + 1)  # records and their mask
+                max_chunk_size = max(max_memory // col_memory, 1)
+                if chunk_size is None or max_chunk_size < chunk_size:
+                    chunk_size = max_chunk_size
+        else:
+            chunk_size = target_shape_2d[1]
+        group_end = np.cumsum(sim_group_counts)
+        results = []
+        from_group = 0
+        while from_group < len(sim_group_counts):
+            from_col = group_end[from_group] - sim_group_counts[from_group]
+            to_group = np.searchsorted(group_end, from_col + chunk_size, side='right')
+            to_group = max(to_group, from_group + 1)
+            to_col = group_end[to_group - 1]
+            chunk_shape = (target_shape_2d[0], to_col - from_col)
+            chunk_group_counts = sim_group_counts[from_group:to_group]
+            if cash_sharing:
+                chunk_init_cash = init_cash[from_group:to_group]
+            else:
+                chunk_init_cash = init_cash[from_col:to_col]
+            chunk_inputs = [a if isinstance(a, tuple) else flex_select_cols(a, from_col, to_col, flex_2d) for a in (
+                entries,
+                exits,
+                size,
+                entry_price,
+                exit_price,
+                fees,
+                fixed_fees,
+                slippage,
+                reject_prob
+            )]
+            chunk_packed = [None if a is None else a[:, from_col:to_col] for a in (packed_entries, packed_exits)]
+            if reduce_only:
+                chunk_result = simulate_func_nb(
+                    chunk_shape,
+                    flex_select_cols(raw_close, from_col, to_col, flex_2d),
+                    chunk_group_counts,
+                    chunk_init_cash,
+                    cash_sharing,
+                    call_seq[:, from_col:to_col],
+                    *chunk_inputs,
+                    min_size[from_col:to_col],
+                    accumulate,
+                    accumulate_exit_mode,
+                    conflict_mode,
+                    flex_2d,
+                    ann_factor,
+                    *chunk_packed
+                )
+            else:
+                if sparse:
+                    # Replace entries and exits by the positions of their signals
+                    sparse_inputs = []
+                    for a, packed_a in zip(chunk_inputs[:2], chunk_packed):
+                        if packed_a is not None:
+                            # Packed -> scan the bytes for signals
+                            sparse_inputs.extend(packed_to_sparse_nb(packed_a))
+                            continue
+                        if isinstance(a, tuple):
+                            # Already sparse -> select the columns of the chunk from the column index
+                            sparse_inputs.extend((a[0], a[1][from_col:to_col]))
+                            continue
+                        if not flex_2d:
+                            a = to_2d(a, raw=True)  # 1-dim array corresponds to rows
+                        sparse_inputs.extend(to_sparse_nb(np.broadcast_to(a, chunk_shape)))
+                    chunk_inputs = sparse_inputs + chunk_inputs[2:]
+                    chunk_packed = []  # already sparse
+                chunk_result = simulate_func_nb(
+                    chunk_shape,
+                    chunk_group_counts,
+                    chunk_init_cash,
+                    call_seq[:, from_col:to_col],
+                    *chunk_inputs,
+                    min_size[from_col:to_col],
+                    accumulate,
+                    accumulate_exit_mode,
+                    conflict_mode,
+                    flex_2d,
+                    *chunk_packed
+                )
+                if from_col > 0:
+                    chunk_result['col'] += from_col
+            results.append(chunk_result)
+            from_group = to_group
+        if len(results) == 1:
+            results = results[0]
+        else:
+            results = np.concatenate(results)
+
+        if reduce_only:
+            return pd.DataFrame.from_records(results, index=wrapper.grouper.get_columns(group_by=group_by))
+        order_records = results
 
         # Create an instance
         orders = Orders(wrapper, order_records, close)
@@ -659,7 +895,7 @@ class Portfolio(Configured, PandasIndexer):
     def from_orders(cls, close, order_size, size_type=None, order_price=None, fees=None, fixed_fees=None,
                     slippage=None, reject_prob=None, min_size=None, init_cash=None, cash_sharing=None,
                     call_seq=None, val_price=None, freq=None, seed=None, group_by=None, broadcast_kwargs=None,
-                    wrapper_kwargs=None, **kwargs):
+                    wrapper_kwargs=None, parallel=None, **kwargs):
         """Simulate portfolio from orders.
 
         Starting with initial cash `init_cash`, orders the number of shares specified in `order_size`
@@ -751,6 +987,14 @@ class Portfolio(Configured, PandasIndexer):
             group_by (any): Group columns. See `vectorbt.base.column_grouper.ColumnGrouper`.
             broadcast_kwargs (dict): Keyword arguments passed to `vectorbt.base.reshape_fns.broadcast`.
             wrapper_kwargs (dict): Keyword arguments passed to `vectorbt.base.array_wrapper.ArrayWrapper`.
+            parallel (bool): Whether to simulate groups in parallel using Numba.
+
+                Groups (columns if cash sharing is disabled) are independent from each other and
+                thus can be distributed across threads. The order records are the same as in
+                the sequential mode.
+
+                !!! note
+                    Rejection of orders with `reject_prob` isn't reproducible with `seed` in parallel mode.
 
         All time series will be broadcast together using `vectorbt.base.reshape_fns.broadcast`.
         At the end, they will have the same metadata.
@@ -850,6 +1094,8 @@ class Portfolio(Configured, PandasIndexer):
             else:
                 val_price = np.roll(np.asarray(close), 1, axis=0)
                 val_price[0] = np.nan
+        if parallel is None:
+            parallel = defaults.portfolio['parallel']
         if seed is None:
             seed = defaults.portfolio['seed']
         if seed is not None:
@@ -878,12 +1124,22 @@ class Portfolio(Configured, PandasIndexer):
         checks.assert_subdtype(val_price, np.floating)
 
         # Broadcast inputs
-        # Only close is broadcast, others can remain unchanged thanks to flexible indexing
-        keep_raw = (False, True, True, True, True, True, True, True, True, True)
+        # Inputs can remain unchanged thanks to flexible indexing
+        # Close is not needed for simulation and becomes a read-only broadcast view
+        keep_raw = True
         broadcast_kwargs = merge_kwargs(dict(require_kwargs=dict(requirements='W')), broadcast_kwargs)
-        close, order_size, size_type, order_price, fees, fixed_fees, slippage, reject_prob, val_price = \
-            broadcast(close, order_size, size_type, order_price, fees, fixed_fees, slippage,
-                      reject_prob, val_price, **broadcast_kwargs, keep_raw=keep_raw)
+        orig_close = close
+        (close, order_size, size_type, order_price, fees, fixed_fees, slippage, reject_prob, val_price), \
+            to_shape, new_index, new_columns = broadcast(
+                close, order_size, size_type, order_price, fees, fixed_fees, slippage,
+                reject_prob, val_price, **broadcast_kwargs, keep_raw=keep_raw, return_meta=True)
+        close = wrap_broadcasted(
+            orig_close,
+            np.broadcast_to(close, to_shape),
+            is_pd=checks.is_pandas(orig_close) or new_index is not None,
+            new_index=new_index,
+            new_columns=new_columns
+        )
         if not checks.is_pandas(close):
             close = pd.Series(close) if close.ndim == 1 else pd.DataFrame(close)
         target_shape_2d = (close.shape[0], close.shape[1] if close.ndim > 1 else 1)
@@ -895,10 +1151,16 @@ class Portfolio(Configured, PandasIndexer):
         if checks.is_array(call_seq):
             call_seq = nb.require_call_seq(broadcast(call_seq, to_shape=target_shape_2d, to_pd=False))
         else:
-            call_seq = nb.build_call_seq(target_shape_2d, group_counts, call_seq_type=call_seq)
+            # Automatic call sequence is modified in place and thus must be fully built
+            call_seq = nb.build_call_seq(target_shape_2d, group_counts, call_seq_type=call_seq,
+                                         keep_raw=not auto_call_seq)
 
         # Perform calculation
-        order_records = nb.simulate_from_orders_nb(
+        if parallel:
+            simulate_func_nb = nb.simulate_from_orders_parallel_nb
+        else:
+            simulate_func_nb = nb.simulate_from_orders_nb
+        order_records = simulate_func_nb(
             target_shape_2d,
             cs_group_counts,  # group only if cash sharing is enabled to speed up
             init_cash,
@@ -1061,7 +1323,6 @@ class Portfolio(Configured, PandasIndexer):
         if broadcast_kwargs is None:
             broadcast_kwargs = {}
         require_kwargs = dict(require_kwargs=dict(requirements='W'))
-        broadcast_kwargs = merge_kwargs(require_kwargs, broadcast_kwargs)
         if wrapper_kwargs is None:
             wrapper_kwargs = {}
         if not wrapper_kwargs.get('group_select', True) and cash_sharing:
@@ -1081,7 +1342,17 @@ class Portfolio(Configured, PandasIndexer):
                 if keys is None:
                     keys = pd.Index(np.arange(target_shape_2d[1]), name='iteration_idx')
                 tile_times = target_shape_2d[1] // len(close.vbt.columns)
-                close = close.vbt.tile(tile_times, keys=keys)
+                if len(close.vbt.columns) == 1:
+                    # Tiling one column is the same as broadcasting it -> create a read-only view
+                    new_columns = index_fns.combine_indexes(keys, close.vbt.columns)
+                    close = pd.DataFrame(
+                        np.broadcast_to(to_2d(close, raw=True), target_shape_2d),
+                        index=close.index,
+                        columns=new_columns
+                    )
+                else:
+                    close = close.vbt.tile(tile_times, keys=keys)
+        # Close is only read, thus it can remain a read-only broadcast view
         close = broadcast(close, to_shape=target_shape, **broadcast_kwargs)
         min_size = np.require(np.broadcast_to(min_size, (target_shape_2d[1],)), requirements='W')
         wrapper = ArrayWrapper.from_obj(close, freq=freq, group_by=group_by, **wrapper_kwargs)
@@ -1124,8 +1395,9 @@ class Portfolio(Configured, PandasIndexer):
         order_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in order_args])
 
         # Perform calculation
+        sim_state = None
         if row_wise:
-            order_records = nb.simulate_row_wise_nb(
+            order_records, sim_state = nb.simulate_row_wise_resumable_nb(
                 target_shape_2d,
                 to_2d(close, raw=True),
                 group_counts,
@@ -1170,9 +1442,133 @@ class Portfolio(Configured, PandasIndexer):
             init_cash if init_cash_mode is None else init_cash_mode,
             cash_sharing,
             call_seq,
+            sim_state=sim_state,
             **kwargs
         )
 
+    def update(self, close, order_func_nb, *order_args, call_seq=None, active_mask=None, min_size=None,
+               row_prep_func_nb=None, row_prep_args=None, segment_prep_func_nb=None, segment_prep_args=None):
+        """Extend the portfolio with new rows by resuming its simulation.
+
+        Only the new rows are simulated, starting from a copy of `Portfolio.sim_state`. New order
+        records are merged into the existing ones column by column. Requires the portfolio to be
+        built with `Portfolio.from_order_func` and `row_wise=True`.
+
+        For details, see `vectorbt.portfolio.nb.resume_row_wise_nb`.
+
+        Args:
+            close (pd.Series or pd.DataFrame): Reference price of the new rows.
+
+                Will broadcast to the number of columns. Its index is appended to the existing index.
+            order_func_nb (callable): Order generation function.
+            *order_args: Arguments passed to `order_func_nb`.
+
+                Since row indices are relative to the first new row, arrays should cover only the new rows.
+            call_seq (CallSeqType or array_like of int): Default sequence of calls per row and group
+                for the new rows.
+            active_mask (bool or array_like): Mask of whether a particular segment should be executed
+                for the new rows.
+            min_size (float or array_like): Minimum size for an order to be accepted.
+            row_prep_func_nb (callable): Row preparation function.
+            row_prep_args (tuple): Packed arguments passed to `row_prep_func_nb`.
+            segment_prep_func_nb (callable): Segment preparation function.
+            segment_prep_args (tuple): Packed arguments passed to `segment_prep_func_nb`.
+
+        Returns a new instance of `Portfolio`. The preparation function isn't called again.
+
+        !!! note
+            Callbacks and their arguments are not stored in the portfolio and must be passed again."""
+        if self.sim_state is None:
+            raise ValueError("Portfolio must be built using from_order_func with row_wise=True")
+        if isinstance(self._init_cash, int):
+            raise ValueError("Portfolio with InitCashMode cannot be updated")
+        checks.assert_type(close, (pd.Series, pd.DataFrame))
+
+        # Get defaults
+        if call_seq is None:
+            call_seq = defaults.portfolio['call_seq']
+            if isinstance(call_seq, str):
+                call_seq = getattr(CallSeqType, call_seq)
+        if isinstance(call_seq, int):
+            checks.assert_in(call_seq, CallSeqType)
+            if call_seq == CallSeqType.Auto:
+                raise ValueError("CallSeqType.Auto should be implemented manually."
+                                 "Use auto_call_seq_ctx_nb in segment_prep_func_nb.")
+        if active_mask is None:
+            active_mask = True
+        if min_size is None:
+            min_size = defaults.portfolio['min_size']
+        if row_prep_func_nb is None:
+            row_prep_func_nb = nb.empty_prep_nb
+        if row_prep_args is None:
+            row_prep_args = ()
+        if segment_prep_func_nb is None:
+            segment_prep_func_nb = nb.empty_prep_nb
+        if segment_prep_args is None:
+            segment_prep_args = ()
+
+        # Perform checks
+        checks.assert_subdtype(close, np.floating)
+        checks.assert_subdtype(call_seq, np.integer)
+
+        # Prepare the new rows
+        target_shape_2d = (close.shape[0], self.wrapper.shape_2d[1])
+        new_close = np.broadcast_to(to_2d(close, raw=True), target_shape_2d)
+        group_counts = self.wrapper.grouper.get_group_counts()
+        min_size = np.require(np.broadcast_to(min_size, (target_shape_2d[1],)), requirements='W')
+        if checks.is_array(call_seq):
+            new_call_seq = nb.require_call_seq(broadcast(call_seq, to_shape=target_shape_2d, to_pd=False))
+        else:
+            new_call_seq = nb.build_call_seq(target_shape_2d, group_counts, call_seq_type=call_seq)
+        active_mask = broadcast(active_mask, to_shape=(target_shape_2d[0], len(group_counts)), to_pd=False)
+        sim_state = self.sim_state._replace(prep_out=_copy_prep_out(self.sim_state.prep_out))
+
+        row_prep_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in row_prep_args])
+        segment_prep_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in segment_prep_args])
+        order_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in order_args])
+
+        # Perform calculation
+        new_order_records, sim_state = nb.resume_row_wise_nb(
+            sim_state,
+            target_shape_2d,
+            new_close,
+            group_counts,
+            to_1d(self._init_cash, raw=True),
+            self.cash_sharing,
+            new_call_seq,
+            active_mask,
+            min_size,
+            row_prep_func_nb,
+            row_prep_args,
+            segment_prep_func_nb,
+            segment_prep_args,
+            order_func_nb,
+            order_args
+        )
+
+        # Merge both record arrays column by column (records of each column stay sorted by index)
+        old_orders = self._orders
+        new_order_records = new_order_records.astype(old_orders.records_arr.dtype, copy=False)  # may be compact
+        order_records, col_index = records_nb.merge_records_nb(
+            old_orders.records_arr,
+            old_orders.col_index,
+            new_order_records,
+            records_nb.record_col_index_nb(new_order_records, target_shape_2d[1])
+        )
+
+        # Append new rows
+        wrapper = self.wrapper.copy(index=self.wrapper.index.append(close.index))
+        close = wrapper.wrap(np.concatenate((to_2d(self.close, raw=True), new_close)), group_by=False)
+        call_seq = np.concatenate((to_2d(self.call_seq, raw=True), new_call_seq))
+
+        # Create an instance
+        orders = Orders(wrapper, order_records, close, col_index=col_index)
+        return self.copy(
+            orders=orders,
+            call_seq=call_seq,
+            sim_state=sim_state
+        )
+
     # ############# Properties ############# #
 
     @property
@@ -1193,13 +1589,22 @@ class Portfolio(Configured, PandasIndexer):
     @property
     def call_seq(self):
         """Sequence of calls per row and group."""
-        return self.wrapper.wrap(self._call_seq, group_by=False)
+        # Call sequence can be stored in a compact form, such as one row for all rows
+        call_seq = np.broadcast_to(to_2d(self._call_seq, raw=True), self.wrapper.shape_2d)
+        return self.wrapper.wrap(call_seq, group_by=False)
 
     @property
     def incl_unrealized(self):
         """Whether to include unrealized trade P&L in statistics."""
         return self._incl_unrealized
 
+    @property
+    def sim_state(self):
+        """State of the simulation after the last row.
+
+        See `vectorbt.portfolio.enums.SimulationState`."""
+        return self._sim_state
+
     # ############# Regrouping ############# #
 
     def regroup(self, group_by):
@@ -1489,7 +1894,9 @@ class Portfolio(Configured, PandasIndexer):
               in_sim_order=False, agg_func=lambda x: x.mean(axis=0), **kwargs):
         """Compute various statistics on this portfolio.
 
-        `kwargs` will be passed to each `vectorbt.returns.accessors.Returns_Accessor` method.
+        Drawdown, trade and return metrics are computed in a single pass using `vectorbt.portfolio.nb.stats_nb`.
+        Supported `kwargs` are `year_freq`, `risk_free` (Sharpe ratio) and `required_return` (Sortino ratio),
+        see `vectorbt.returns.accessors.Returns_Accessor`. Raises `TypeError` for any other keyword argument.
 
         Can either return aggregated statistics by reducing metrics of all columns with
         `agg_func` (mean by default) or return statistics for a single column if `column`
@@ -1499,15 +1906,36 @@ class Portfolio(Configured, PandasIndexer):
         !!! note
             Use `column` only if caching is enabled, otherwise it may re-compute the same
             objects multiple times."""
+        unknown_kwargs = set(kwargs.keys()) - {'year_freq', 'risk_free', 'required_return'}
+        if len(unknown_kwargs) > 0:
+            raise TypeError(f"Unexpected keyword arguments: {sorted(unknown_kwargs)}")
+
         # Pre-calculate
         trades = self.trades(group_by=group_by, incl_unrealized=incl_unrealized)
-        drawdowns = self.drawdowns(group_by=group_by)
+        value = self.value(group_by=group_by)
         if active_returns:
             returns = self.active_returns(group_by=group_by)
         else:
             returns = self.returns(group_by=group_by, in_sim_order=in_sim_order)
+        returns_acc = returns.vbt.returns(freq=self.wrapper.freq, year_freq=kwargs.get('year_freq', None))
+        n_cols = to_2d(value, raw=True).shape[1]
+        risk_free = np.broadcast_to(kwargs.get('risk_free', 0.), (n_cols,)).astype(np.float_)
+        required_return = np.broadcast_to(kwargs.get('required_return', 0.), (n_cols,)).astype(np.float_)
+
+        # Run stats in one pass over value, returns and trade records
+        stats = nb.stats_nb(
+            to_2d(value, raw=True),
+            to_2d(returns, raw=True),
+            trades.records_arr,
+            trades.get_col_index(),
+            returns_acc.ann_factor,
+            risk_free,
+            required_return
+        )
+
+        def wrap_stats(field, **_kwargs):
+            return self.wrapper.wrap_reduced(stats[field], group_by=group_by, **_kwargs)
 
-        # Run stats
         stats_df = pd.DataFrame({
             'Start': self.wrapper.index[0],
             'End': self.wrapper.index[-1],
@@ -1516,22 +1944,22 @@ class Portfolio(Configured, PandasIndexer):
             'Total Profit': self.total_profit(group_by=group_by),
             'Total Return [%]': self.total_return(group_by=group_by) * 100,
             'Buy & Hold Return [%]': self.buy_and_hold_return(group_by=group_by) * 100,
-            'Max. Drawdown [%]': -drawdowns.max_drawdown() * 100,
-            'Avg. Drawdown [%]': -drawdowns.avg_drawdown() * 100,
-            'Max. Drawdown Duration': drawdowns.max_duration(),
-            'Avg. Drawdown Duration': drawdowns.avg_duration(),
-            'Num. Trades': trades.count(),
-            'Win Rate [%]': trades.win_rate() * 100,
-            'Best Trade [%]': trades.returns.max() * 100,
-            'Worst Trade [%]': trades.returns.min() * 100,
-            'Avg. Trade [%]': trades.returns.mean() * 100,
-            'Max. Trade Duration': trades.duration.max(time_units=True),
-            'Avg. Trade Duration': trades.duration.mean(time_units=True),
-            'Expectancy': trades.expectancy(),
-            'SQN': trades.sqn(),
-            'Sharpe Ratio': self.sharpe_ratio(reuse_returns=returns, **kwargs),
-            'Sortino Ratio': self.sortino_ratio(reuse_returns=returns, **kwargs),
-            'Calmar Ratio': self.calmar_ratio(reuse_returns=returns, **kwargs)
+            'Max. Drawdown [%]': -wrap_stats('max_drawdown') * 100,
+            'Avg. Drawdown [%]': -wrap_stats('avg_drawdown') * 100,
+            'Max. Drawdown Duration': wrap_stats('max_drawdown_duration', time_units=True),
+            'Avg. Drawdown Duration': wrap_stats('avg_drawdown_duration', time_units=True),
+            'Num. Trades': wrap_stats('num_trades'),
+            'Win Rate [%]': wrap_stats('win_rate') * 100,
+            'Best Trade [%]': wrap_stats('best_trade') * 100,
+            'Worst Trade [%]': wrap_stats('worst_trade') * 100,
+            'Avg. Trade [%]': wrap_stats('avg_trade') * 100,
+            'Max. Trade Duration': wrap_stats('max_trade_duration', time_units=True),
+            'Avg. Trade Duration': wrap_stats('avg_trade_duration', time_units=True),
+            'Expectancy': wrap_stats('expectancy'),
+            'SQN': wrap_stats('sqn'),
+            'Sharpe Ratio': wrap_stats('sharpe_ratio'),
+            'Sortino Ratio': wrap_stats('sortino_ratio'),
+            'Calmar Ratio': wrap_stats('calmar_ratio')
         }, index=self.wrapper.grouper.get_columns(group_by=group_by))
 
         # Select columns or reduce
@@ -210,6 +210,42 @@ Scalar value. Per group if cash sharing is enabled, otherwise per column.
 Current value is calculated using `last_val_price`.
 """
 
+# ############# SimulationState ############# #
+
+SimulationState = namedtuple('SimulationState', [
+    'next_row',
+    'record_count',
+    'last_cash',
+    'last_shares',
+    'last_val_price',
+    'last_close',
+    'prep_out'
+])
+__pdoc__['SimulationState'] = """A named tuple representing the state of a simulation after its last row.
+
+Can be passed to `vectorbt.portfolio.nb.resume_row_wise_nb` to continue the simulation
+with new rows without running it over the previous rows again."""
+__pdoc__['SimulationState.next_row'] = """Row to resume the simulation from.
+
+Equals to the number of rows simulated so far.
+"""
+__pdoc__['SimulationState.record_count'] = """Number of order records filled so far.
+
+Used as `j` in the contexts of the resumed simulation.
+"""
+__pdoc__['SimulationState.last_cash'] = "See `SimulationContext.last_cash`."
+__pdoc__['SimulationState.last_shares'] = "See `SimulationContext.last_shares`."
+__pdoc__['SimulationState.last_val_price'] = "See `SimulationContext.last_val_price`."
+__pdoc__['SimulationState.last_close'] = """Close of the last simulated row.
+
+Becomes the valuation price of the first resumed row.
+"""
+__pdoc__['SimulationState.prep_out'] = """Tuple returned by `prep_func_nb`.
+
+Passed to `row_prep_func_nb` of the resumed simulation, so any state accumulated by
+the user in these arrays is carried over.
+"""
+
 # ############# InitCashMode ############# #
 
 InitCashMode = namedtuple('InitCashMode', [
@@ -382,3 +418,57 @@ __pdoc__['OrderResult.side'] = "See `vectorbt.records.enums.OrderSide`."
 __pdoc__['OrderResult.status'] = "See `OrderStatus`."
 
 RejectedOrder = OrderResult(np.nan, np.nan, np.nan, -1, OrderStatus.Rejected)
+
+# ############# Metrics ############# #
+
+metrics_dt = np.dtype([
+    ('total_return', np.float64),
+    ('max_drawdown', np.float64),
+    ('sharpe_ratio', np.float64),
+    ('num_trades', np.int64)
+], align=True)
+"""_"""
+
+__pdoc__['metrics_dt'] = f"""`np.dtype` of metrics produced by reduce-only simulation.
+
+```plaintext
+{json.dumps(dict(zip(
+    dict(metrics_dt.fields).keys(),
+    list(map(lambda x: str(x[0]), dict(metrics_dt.fields).values()))
+)), indent=2)}
+```
+"""
+
+# ############# Stats ############# #
+
+stats_dt = np.dtype([
+    ('max_drawdown', np.float64),
+    ('avg_drawdown', np.float64),
+    ('max_drawdown_duration', np.float64),
+    ('avg_drawdown_duration', np.float64),
+    ('num_trades', np.int64),
+    ('win_rate', np.float64),
+    ('best_trade', np.float64),
+    ('worst_trade', np.float64),
+    ('avg_trade', np.float64),
+    ('max_trade_duration', np.float64),
+    ('avg_trade_duration', np.float64),
+    ('expectancy', np.float64),
+    ('sqn', np.float64),
+    ('sharpe_ratio', np.float64),
+    ('sortino_ratio', np.float64),
+    ('calmar_ratio', np.float64)
+], align=True)
+"""_"""
+
+__pdoc__['stats_dt'] = f"""`np.dtype` of statistics produced by `vectorbt.portfolio.nb.stats_nb`.
+
+Durations are in raw format (number of rows).
+
+```plaintext
+{json.dumps(dict(zip(
+    dict(stats_dt.fields).keys(),
+    list(map(lambda x: str(x[0]), dict(stats_dt.fields).values()))
+)), indent=2)}
+```
+"""
@@ -39,7 +39,7 @@
 """
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from vectorbt.utils.math import is_close_or_less_nb
 from vectorbt.utils.array import insert_argsort_nb
@@ -51,6 +51,7 @@ from vectorbt.portfolio.enums import (
     RowContext,
     SegmentContext,
     OrderContext,
+    SimulationState,
     CallSeqType,
     SizeType,
     AccumulateExitMode,
@@ -59,7 +60,9 @@ from vectorbt.portfolio.enums import (
     NoOrder,
     OrderStatus,
     OrderResult,
-    RejectedOrder
+    RejectedOrder,
+    metrics_dt,
+    stats_dt
 )
 from vectorbt.records.enums import (
     OrderSide,
@@ -233,6 +236,14 @@ def check_group_init_cash(group_counts, n_cols, init_cash, cash_sharing):
             raise ValueError("If cash sharing is disabled, init_cash must match the number of columns")
 
 
+@njit(cache=True)
+def check_auto_call_seq(target_shape, call_seq, cash_sharing, auto_call_seq):
+    """Check that `call_seq` can be modified in place if `auto_call_seq` is enabled."""
+    if cash_sharing and auto_call_seq:
+        if call_seq.shape[0] != target_shape[0] or call_seq.shape[1] != target_shape[1]:
+            raise ValueError("call_seq must have shape target_shape if auto_call_seq is enabled")
+
+
 @njit(cache=True)
 def get_record_idx_nb(target_shape, col, i):
     """Get record index by position of order in the matrix."""
@@ -279,8 +290,12 @@ def require_call_seq(call_seq):
     return np.require(call_seq, dtype=np.int_, requirements=['A', 'O', 'W', 'F'])
 
 
-def build_call_seq(target_shape, group_counts, call_seq_type=CallSeqType.Default):
-    """Not compiled but faster version of `build_call_seq_nb`."""
+def build_call_seq(target_shape, group_counts, call_seq_type=CallSeqType.Default, keep_raw=False):
+    """Not compiled but faster version of `build_call_seq_nb`.
+
+    If `keep_raw` is True, returns an array of shape `(1, target_shape[1])` for sequences
+    that are the same for each row (all except `CallSeqType.Random`). Such an array can be
+    used by simulators that utilize flexible indexing for `call_seq`."""
     call_seq = np.full(target_shape[1], 1, dtype=np.int_)
     if call_seq_type == CallSeqType.Reversed:
         call_seq[np.cumsum(group_counts)[1:] - group_counts[1:] - 1] -= group_counts[1:]
@@ -288,6 +303,8 @@ def build_call_seq(target_shape, group_counts, call_seq_type=CallSeqType.Default
     else:
         call_seq[np.cumsum(group_counts[:-1])] -= group_counts[:-1]
         call_seq = np.cumsum(call_seq) - 1
+    if keep_raw and call_seq_type != CallSeqType.Random:
+        return require_call_seq(call_seq[None, :])
     call_seq = np.broadcast_to(call_seq, target_shape)
     if call_seq_type == CallSeqType.Random:
         call_seq = require_call_seq(call_seq)
@@ -406,8 +423,13 @@ def simulate_nb(target_shape, close, group_counts, init_cash, cash_sharing, call
 
             A tuple with exactly two elements: the number of steps and columns.
         close (np.ndarray): Reference price, such as close.
-        
-            Should have shape `target_shape`.
+
+            Should be 2-dim and broadcastable to `target_shape`. Utilizes flexible indexing,
+            thus a price of shape `(target_shape[0], 1)` is shared by all columns without being tiled.
+
+            !!! note
+                Contexts contain `close` as it was passed. If `close` isn't of shape `target_shape`,
+                use `vectorbt.base.reshape_fns.flex_select_auto_nb` to access its elements.
         group_counts (np.ndarray): Column count per group.
 
             Even if columns are not grouped, `group_counts` should contain ones - one column per group.
@@ -426,7 +448,8 @@ def simulate_nb(target_shape, close, group_counts, init_cash, cash_sharing, call
 
             A segment is simply a sequence of `order_func_nb` calls under the same group and row.
 
-            Should have shape `(target_shape[0], group_counts.shape[0])`.
+            Should be 2-dim and broadcastable to `(target_shape[0], group_counts.shape[0])`.
+            Utilizes flexible indexing.
         min_size (np.ndarray): Minimum size for an order to be accepted.
 
             Should have shape `(target_shape[1],)`.
@@ -647,12 +670,22 @@ def simulate_nb(target_shape, close, group_counts, init_cash, cash_sharing, call
     )
     prep_out = prep_func_nb(simc, *prep_args)
 
+    # Close and active mask can be compact -> use flexible indexing
+    flex_i1, flex_col1 = flex_choose_i_and_col_nb(close, True)
+    flex_i2, flex_col2 = flex_choose_i_and_col_nb(active_mask, True)
+
     from_col = 0
     for group in range(len(group_counts)):
+        to_col = from_col + group_counts[group]
+        group_len = to_col - from_col
+
         # Is this group active?
-        if np.any(active_mask[:, group]):
-            to_col = from_col + group_counts[group]
-            group_len = to_col - from_col
+        group_active = False
+        for i in range(target_shape[0]):
+            if flex_select_nb(i, group, active_mask, flex_i2, flex_col2, True):
+                group_active = True
+                break
+        if group_active:
 
             # Run a function to preprocess this entire group
             gc = GroupContext(
@@ -679,11 +712,11 @@ def simulate_nb(target_shape, close, group_counts, init_cash, cash_sharing, call
 
             for i in range(target_shape[0]):
                 # Is this row segment active?
-                if active_mask[i, group]:
+                if flex_select_nb(i, group, active_mask, flex_i2, flex_col2, True):
                     # Update valuation price
                     if i > 0:
                         for col in range(from_col, to_col):
-                            last_val_price[col] = close[i - 1, col]
+                            last_val_price[col] = flex_select_nb(i - 1, col, close, flex_i1, flex_col1, True)
 
                     # Run a function to preprocess this group within this row
                     call_seq_now = call_seq[i, from_col:to_col]
@@ -812,93 +845,43 @@ def simulate_nb(target_shape, close, group_counts, init_cash, cash_sharing, call
                             last_cash[col] = cash_now
                         last_shares[col] = shares_now
 
-            from_col = to_col
+        from_col = to_col
 
     # Order records are not sorted yet
     return order_records[record_mask]
 
 
 @njit
-def simulate_row_wise_nb(target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
-                         active_mask, min_size, prep_func_nb, prep_args, row_prep_func_nb, row_prep_args,
-                         segment_prep_func_nb, segment_prep_args, order_func_nb, order_args):
-    """Same as `simulate_nb`, but iterates using row-major order, with the rows
-    changing fastest, and the columns/groups changing slowest.
-
-    The main difference is that instead of `group_prep_func_nb` it now exposes `row_prep_func_nb`,
-    which is executed per entire row. It should accept `vectorbt.portfolio.enums.RowContext`.
-
-    !!! note
-        Function `row_prep_func_nb` is only called if there is at least on active segment in
-        the row. Functions `segment_prep_func_nb` and `order_func_nb` are only called if their
-        segment is active. If the main task of `row_prep_func_nb` is to activate/deactivate segments,
-        all segments should be activated by default to allow `row_prep_func_nb` to be called.
-
-    !!! warning
-        You can only safely access data points that are to the left of the current group and
-        rows that are to the top of the current row.
-
-    Example:
-        Running the same example as in `simulate_nb` but replacing `group_prep_func_nb` for
-        `row_prep_func_nb` gives the same results but now the following call hierarchy:
-        ```plaintext
-        preparing simulation
-            preparing row 0
-                preparing segment 0 (group)
-                    running order 0 at column 0
-                    running order 1 at column 1
-                    running order 2 at column 2
-            preparing row 2
-                preparing segment 0 (group)
-                    running order 0 at column 1
-                    running order 1 at column 2
-                    running order 2 at column 0
-            preparing row 4
-                preparing segment 0 (group)
-                    running order 0 at column 0
-                    running order 1 at column 2
-                    running order 2 at column 1
-        ```
-
-        Note, however, that we cannot create NumPy arrays per group anymore as there is no
-        `group_prep_func_nb`, so you would need to move this part to `prep_func_nb`,
-        make arrays wider, and use only the part of the array that corresponds to the current group.
-    """
-    check_group_counts(group_counts, target_shape[1])
-    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
-
-    order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
-    record_mask = np.full(target_shape[0] * target_shape[1], False)
-    j = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
-    last_val_price = np.full_like(last_shares, np.nan, dtype=np.float_)
-
-    # Run a function to prepare the simulation
-    simc = SimulationContext(
-        target_shape,
-        close,
-        group_counts,
-        init_cash,
-        cash_sharing,
-        call_seq,
-        active_mask,
-        min_size,
-        order_records,
-        record_mask,
-        last_cash,
-        last_shares,
-        last_val_price
-    )
-    prep_out = prep_func_nb(simc, *prep_args)
+def simulate_rows_nb(row_offset, target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
+                     active_mask, min_size, order_records, record_mask, last_cash, last_shares,
+                     last_val_price, last_close, j, prep_out, row_prep_func_nb, row_prep_args,
+                     segment_prep_func_nb, segment_prep_args, order_func_nb, order_args):
+    """Simulate all rows of `target_shape` in row-major order.
+
+    Shared by `simulate_row_wise_nb` and `resume_row_wise_nb`. All arrays cover only the rows
+    being simulated, while `row_offset` is the number of rows simulated before and is added to
+    the index of each order record. Updates `last_cash`, `last_shares`, `last_val_price` and
+    `last_close` in-place.
+
+    Returns the number of order records filled so far."""
+    # Close and active mask can be compact -> use flexible indexing
+    flex_i1, flex_col1 = flex_choose_i_and_col_nb(close, True)
+    flex_i2, flex_col2 = flex_choose_i_and_col_nb(active_mask, True)
 
     for i in range(target_shape[0]):
         # Is this row active?
-        if np.any(active_mask[i, :]):
+        row_active = False
+        for group in range(len(group_counts)):
+            if flex_select_nb(i, group, active_mask, flex_i2, flex_col2, True):
+                row_active = True
+                break
+        if row_active:
             # Update valuation price
             if i > 0:
                 for col in range(target_shape[1]):
-                    last_val_price[col] = close[i - 1, col]
+                    last_val_price[col] = flex_select_nb(i - 1, col, close, flex_i1, flex_col1, True)
+            elif row_offset > 0:
+                last_val_price[:] = last_close
 
             # Run a function to preprocess this entire row
             rc = RowContext(
@@ -922,10 +905,11 @@ def simulate_row_wise_nb(target_shape, close, group_counts, init_cash, cash_shar
 
             from_col = 0
             for group in range(len(group_counts)):
+                to_col = from_col + group_counts[group]
+                group_len = to_col - from_col
+
                 # Is this group segment active?
-                if active_mask[i, group]:
-                    to_col = from_col + group_counts[group]
-                    group_len = to_col - from_col
+                if flex_select_nb(i, group, active_mask, flex_i2, flex_col2, True):
 
                     # Run a function to preprocess this row within this group
                     call_seq_now = call_seq[i, from_col:to_col]
@@ -1039,7 +1023,7 @@ def simulate_row_wise_nb(target_shape, close, group_counts, init_cash, cash_shar
                             # Add a new record
                             r = get_record_idx_nb(target_shape, col, i)
                             order_records[r]['col'] = col
-                            order_records[r]['idx'] = i
+                            order_records[r]['idx'] = row_offset + i
                             order_records[r]['size'] = order_result.size
                             order_records[r]['price'] = order_result.price
                             order_records[r]['fees'] = order_result.fees
@@ -1054,19 +1038,325 @@ def simulate_row_wise_nb(target_shape, close, group_counts, init_cash, cash_shar
                             last_cash[col] = cash_now
                         last_shares[col] = shares_now
 
-                    from_col = to_col
+                from_col = to_col
+
+    if target_shape[0] > 0:
+        for col in range(target_shape[1]):
+            last_close[col] = flex_select_nb(target_shape[0] - 1, col, close, flex_i1, flex_col1, True)
+    return j
+
+
+@njit
+def simulate_row_wise_nb(target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
+                         active_mask, min_size, prep_func_nb, prep_args, row_prep_func_nb, row_prep_args,
+                         segment_prep_func_nb, segment_prep_args, order_func_nb, order_args):
+    """Same as `simulate_nb`, but iterates using row-major order, with the rows
+    changing fastest, and the columns/groups changing slowest.
+
+    The main difference is that instead of `group_prep_func_nb` it now exposes `row_prep_func_nb`,
+    which is executed per entire row. It should accept `vectorbt.portfolio.enums.RowContext`.
+
+    !!! note
+        Function `row_prep_func_nb` is only called if there is at least on active segment in
+        the row. Functions `segment_prep_func_nb` and `order_func_nb` are only called if their
+        segment is active. If the main task of `row_prep_func_nb` is to activate/deactivate segments,
+        all segments should be activated by default to allow `row_prep_func_nb` to be called.
+
+    !!! warning
+        You can only safely access data points that are to the left of the current group and
+        rows that are to the top of the current row.
+
+    Example:
+        Running the same example as in `simulate_nb` but replacing `group_prep_func_nb` for
+        `row_prep_func_nb` gives the same results but now the following call hierarchy:
+        ```plaintext
+        preparing simulation
+            preparing row 0
+                preparing segment 0 (group)
+                    running order 0 at column 0
+                    running order 1 at column 1
+                    running order 2 at column 2
+            preparing row 2
+                preparing segment 0 (group)
+                    running order 0 at column 1
+                    running order 1 at column 2
+                    running order 2 at column 0
+            preparing row 4
+                preparing segment 0 (group)
+                    running order 0 at column 0
+                    running order 1 at column 2
+                    running order 2 at column 1
+        ```
+
+        Note, however, that we cannot create NumPy arrays per group anymore as there is no
+        `group_prep_func_nb`, so you would need to move this part to `prep_func_nb`,
+        make arrays wider, and use only the part of the array that corresponds to the current group.
+    """
+    order_records, _ = simulate_row_wise_resumable_nb(
+        target_shape,
+        close,
+        group_counts,
+        init_cash,
+        cash_sharing,
+        call_seq,
+        active_mask,
+        min_size,
+        prep_func_nb,
+        prep_args,
+        row_prep_func_nb,
+        row_prep_args,
+        segment_prep_func_nb,
+        segment_prep_args,
+        order_func_nb,
+        order_args
+    )
+    return order_records
+
+
+@njit
+def simulate_row_wise_resumable_nb(target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
+                                   active_mask, min_size, prep_func_nb, prep_args, row_prep_func_nb,
+                                   row_prep_args, segment_prep_func_nb, segment_prep_args, order_func_nb,
+                                   order_args):
+    """Same as `simulate_row_wise_nb`, but also returns the state of the simulation
+    of type `vectorbt.portfolio.enums.SimulationState`.
+
+    The state can be passed to `resume_row_wise_nb` to append new rows to the simulation."""
+    check_group_counts(group_counts, target_shape[1])
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+
+    order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
+    record_mask = np.full(target_shape[0] * target_shape[1], False)
+    j = 0
+    last_cash = init_cash.astype(np.float_)
+    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
+    last_val_price = np.full_like(last_shares, np.nan, dtype=np.float_)
+    last_close = np.full_like(last_shares, np.nan, dtype=np.float_)
+
+    # Run a function to prepare the simulation
+    simc = SimulationContext(
+        target_shape,
+        close,
+        group_counts,
+        init_cash,
+        cash_sharing,
+        call_seq,
+        active_mask,
+        min_size,
+        order_records,
+        record_mask,
+        last_cash,
+        last_shares,
+        last_val_price
+    )
+    prep_out = prep_func_nb(simc, *prep_args)
+
+    j = simulate_rows_nb(
+        0,
+        target_shape,
+        close,
+        group_counts,
+        init_cash,
+        cash_sharing,
+        call_seq,
+        active_mask,
+        min_size,
+        order_records,
+        record_mask,
+        last_cash,
+        last_shares,
+        last_val_price,
+        last_close,
+        j,
+        prep_out,
+        row_prep_func_nb,
+        row_prep_args,
+        segment_prep_func_nb,
+        segment_prep_args,
+        order_func_nb,
+        order_args
+    )
+    state = SimulationState(target_shape[0], j, last_cash, last_shares, last_val_price, last_close, prep_out)
+
+    # Order records are not sorted yet
+    return order_records[record_mask], state
+
+
+@njit
+def resume_row_wise_nb(state, target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
+                       active_mask, min_size, row_prep_func_nb, row_prep_args, segment_prep_func_nb,
+                       segment_prep_args, order_func_nb, order_args):
+    """Resume a simulation of `simulate_row_wise_resumable_nb` from `state`.
+
+    Simulates `target_shape[0]` new rows and returns their order records along with the new state.
+    The previous state is not modified, except for `state.prep_out`.
+
+    All arguments should describe only the new rows, such that the simulation takes time
+    proportional to the number of new rows. The indices passed to the callbacks are relative
+    to the first new row, while the index of each order record is absolute, that is,
+    offset by `state.next_row`. The preparation function isn't called again, instead
+    `state.prep_out` is passed to `row_prep_func_nb`.
+
+    !!! warning
+        `state.prep_out` isn't copied. Arrays modified in-place by the callbacks will
+        also be modified in the previous state. Copy them beforehand to keep the previous state."""
+    check_group_counts(group_counts, target_shape[1])
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+    if state.last_cash.shape[0] != init_cash.shape[0] or state.last_shares.shape[0] != target_shape[1]:
+        raise ValueError("State doesn't match the shape of the simulation")
+
+    order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
+    record_mask = np.full(target_shape[0] * target_shape[1], False)
+    last_cash = state.last_cash.copy()
+    last_shares = state.last_shares.copy()
+    last_val_price = state.last_val_price.copy()
+    last_close = state.last_close.copy()
+
+    j = simulate_rows_nb(
+        state.next_row,
+        target_shape,
+        close,
+        group_counts,
+        init_cash,
+        cash_sharing,
+        call_seq,
+        active_mask,
+        min_size,
+        order_records,
+        record_mask,
+        last_cash,
+        last_shares,
+        last_val_price,
+        last_close,
+        state.record_count,
+        state.prep_out,
+        row_prep_func_nb,
+        row_prep_args,
+        segment_prep_func_nb,
+        segment_prep_args,
+        order_func_nb,
+        order_args
+    )
+    new_state = SimulationState(
+        state.next_row + target_shape[0],
+        j,
+        last_cash,
+        last_shares,
+        last_val_price,
+        last_close,
+        state.prep_out
+    )
 
     # Order records are not sorted yet
-    return order_records[record_mask]
+    return order_records[record_mask], new_state
+
+
+@njit(cache=True)
+def packed_select_nb(i, col, packed):
+    """Select the signal at row `i` and column `col` of signals packed with `vectorbt.signals.nb.pack_nb`.
+
+    Reads the bit directly instead of unpacking the whole column."""
+    return ((packed[i // 8, col] >> (i % 8)) & 1) == 1
+
+
+@njit(cache=True)
+def simulate_from_signals_group_nb(from_col, to_col, cash_now, order_records, record_mask, target_shape,
+                                   cash_sharing, call_seq, entries, exits, size, entry_price, exit_price,
+                                   fees, fixed_fees, slippage, reject_prob, min_size, accumulate,
+                                   accumulate_exit_mode, conflict_mode, flex_2d, packed_entries=None,
+                                   packed_exits=None):
+    """Simulate a single group of `simulate_from_signals_nb`.
+
+    Writes filled orders to `order_records` at their position in the matrix and marks them in `record_mask`.
+    Since groups do not depend upon each other, they can be processed in any order."""
+    group_len = to_col - from_col
+    last_cash = np.full(group_len, cash_now, dtype=np.float_)
+    last_shares = np.full(group_len, 0., dtype=np.float_)
+
+    # Inputs were not broadcast -> use flexible indexing
+    flex_i1, flex_col1 = flex_choose_i_and_col_nb(entries, flex_2d)
+    flex_i2, flex_col2 = flex_choose_i_and_col_nb(exits, flex_2d)
+    flex_i3, flex_col3 = flex_choose_i_and_col_nb(size, flex_2d)
+    flex_i4, flex_col4 = flex_choose_i_and_col_nb(entry_price, flex_2d)
+    flex_i5, flex_col5 = flex_choose_i_and_col_nb(exit_price, flex_2d)
+    flex_i6, flex_col6 = flex_choose_i_and_col_nb(fees, flex_2d)
+    flex_i7, flex_col7 = flex_choose_i_and_col_nb(fixed_fees, flex_2d)
+    flex_i8, flex_col8 = flex_choose_i_and_col_nb(slippage, flex_2d)
+    flex_i9, flex_col9 = flex_choose_i_and_col_nb(reject_prob, flex_2d)
+    flex_i10, flex_col10 = flex_choose_i_and_col_nb(call_seq, True)
+
+    for i in range(target_shape[0]):
+        for k in range(group_len):
+            col = from_col + k
+            if cash_sharing:
+                col_i = flex_select_nb(i, col, call_seq, flex_i10, flex_col10, True)
+                if col_i >= group_len:
+                    raise ValueError("Call index exceeds bounds of the group")
+                col = from_col + col_i
+
+            # Get running values per column
+            if not cash_sharing:
+                cash_now = last_cash[col - from_col]
+            shares_now = last_shares[col - from_col]
+
+            if packed_entries is not None:
+                is_entry = packed_select_nb(i, col, packed_entries)
+            else:
+                is_entry = flex_select_nb(i, col, entries, flex_i1, flex_col1, flex_2d)
+            if packed_exits is not None:
+                is_exit = packed_select_nb(i, col, packed_exits)
+            else:
+                is_exit = flex_select_nb(i, col, exits, flex_i2, flex_col2, flex_2d)
+            if is_entry or is_exit:
+                # Generate the next order
+                order = signals_order_func_nb(
+                    shares_now,
+                    is_entry,
+                    is_exit,
+                    flex_select_nb(i, col, size, flex_i3, flex_col3, flex_2d),
+                    flex_select_nb(i, col, entry_price, flex_i4, flex_col4, flex_2d),
+                    flex_select_nb(i, col, exit_price, flex_i5, flex_col5, flex_2d),
+                    flex_select_nb(i, col, fees, flex_i6, flex_col6, flex_2d),
+                    flex_select_nb(i, col, fixed_fees, flex_i7, flex_col7, flex_2d),
+                    flex_select_nb(i, col, slippage, flex_i8, flex_col8, flex_2d),
+                    flex_select_nb(i, col, reject_prob, flex_i9, flex_col9, flex_2d),
+                    accumulate,
+                    accumulate_exit_mode,
+                    conflict_mode
+                )
+
+                # Process the order
+                cash_now, shares_now, order_result = process_order_nb(
+                    cash_now, shares_now, order, min_size[col])
+
+                if order_result.status == OrderStatus.Filled:
+                    # Add a new record
+                    r = get_record_idx_nb(target_shape, col, i)
+                    order_records[r]['col'] = col
+                    order_records[r]['idx'] = i
+                    order_records[r]['size'] = order_result.size
+                    order_records[r]['price'] = order_result.price
+                    order_records[r]['fees'] = order_result.fees
+                    order_records[r]['side'] = order_result.side
+                    record_mask[r] = True
+
+            # Now becomes last
+            if not cash_sharing:
+                last_cash[col - from_col] = cash_now
+            last_shares[col - from_col] = shares_now
 
 
 @njit(cache=True)
 def simulate_from_signals_nb(target_shape, group_counts, init_cash, call_seq, entries, exits, size,
                              entry_price, exit_price, fees, fixed_fees, slippage, reject_prob, min_size,
-                             accumulate, accumulate_exit_mode, conflict_mode, flex_2d):
+                             accumulate, accumulate_exit_mode, conflict_mode, flex_2d, packed_entries=None,
+                             packed_exits=None):
     """Adaptation of `simulate_nb` for simulation based on entry and exit signals.
 
-    Utilizes flexible broadcasting.
+    Utilizes flexible broadcasting, also for `call_seq`.
+
+    If `packed_entries` or `packed_exits` is not None, signals are read from their bits as returned by
+    `vectorbt.signals.nb.pack_nb` instead of `entries` or `exits` respectively.
 
     !!! note
         Should be only grouped if cash sharing is enabled."""
@@ -1076,13 +1366,104 @@ def simulate_from_signals_nb(target_shape, group_counts, init_cash, call_seq, en
 
     order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
     record_mask = np.full(target_shape[0] * target_shape[1], False)
-    j = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
+
+    from_col = 0
+    for group in range(len(group_counts)):
+        to_col = from_col + group_counts[group]
+        if cash_sharing:
+            cash_now = float(init_cash[group])
+        else:
+            cash_now = float(init_cash[from_col])
+        simulate_from_signals_group_nb(
+            from_col, to_col, cash_now, order_records, record_mask, target_shape,
+            cash_sharing, call_seq, entries, exits, size, entry_price, exit_price,
+            fees, fixed_fees, slippage, reject_prob, min_size, accumulate,
+            accumulate_exit_mode, conflict_mode, flex_2d, packed_entries, packed_exits
+        )
+        from_col = to_col
+
+    # Order records are sorted by column and index
+    return order_records[record_mask]
+
+
+@njit(cache=True, parallel=True)
+def simulate_from_signals_parallel_nb(target_shape, group_counts, init_cash, call_seq, entries, exits, size,
+                                      entry_price, exit_price, fees, fixed_fees, slippage, reject_prob, min_size,
+                                      accumulate, accumulate_exit_mode, conflict_mode, flex_2d,
+                                      packed_entries=None, packed_exits=None):
+    """Parallel version of `simulate_from_signals_nb`.
+
+    Groups are distributed across threads using `numba.prange`. Since each order is written
+    to its own position in the record buffer, the resulting records are identical to those of
+    `simulate_from_signals_nb`.
+
+    !!! note
+        Rejection of orders with `reject_prob` relies on per-thread random states and
+        thus isn't reproducible with a seed."""
+    check_group_counts(group_counts, target_shape[1])
+    cash_sharing = is_grouped_nb(group_counts)
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+
+    order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
+    record_mask = np.full(target_shape[0] * target_shape[1], False)
+    group_end = np.cumsum(group_counts)
+
+    # Parallel loops cannot pass 0-dim arrays -> make them 1-dim (flexible indexing stays the same)
+    _entries = np.atleast_1d(entries)
+    _exits = np.atleast_1d(exits)
+    _size = np.atleast_1d(size)
+    _entry_price = np.atleast_1d(entry_price)
+    _exit_price = np.atleast_1d(exit_price)
+    _fees = np.atleast_1d(fees)
+    _fixed_fees = np.atleast_1d(fixed_fees)
+    _slippage = np.atleast_1d(slippage)
+    _reject_prob = np.atleast_1d(reject_prob)
+
+    for group in prange(len(group_counts)):
+        from_col = group_end[group] - group_counts[group]
+        to_col = group_end[group]
+        if cash_sharing:
+            cash_now = float(init_cash[group])
+        else:
+            cash_now = float(init_cash[from_col])
+        simulate_from_signals_group_nb(
+            from_col, to_col, cash_now, order_records, record_mask, target_shape,
+            cash_sharing, call_seq, _entries, _exits, _size, _entry_price, _exit_price,
+            _fees, _fixed_fees, _slippage, _reject_prob, min_size, accumulate,
+            accumulate_exit_mode, conflict_mode, flex_2d, packed_entries, packed_exits
+        )
+
+    # Order records are sorted by column and index
+    return order_records[record_mask]
+
+
+@njit(cache=True)
+def simulate_from_signals_sparse_nb(target_shape, group_counts, init_cash, call_seq, entry_idxs, entry_col_index,
+                                    exit_idxs, exit_col_index, size, entry_price, exit_price, fees, fixed_fees,
+                                    slippage, reject_prob, min_size, accumulate, accumulate_exit_mode,
+                                    conflict_mode, flex_2d):
+    """Adaptation of `simulate_from_signals_nb` for sparse entry and exit signals.
+
+    Signals are given as row indices and column index as returned by `vectorbt.signals.nb.to_sparse_nb`.
+    The column index may point into a larger array of row indices, such that a chunk of columns can be
+    simulated by slicing the column index only. Since orders can only be issued at signals, visits only
+    the rows with at least one signal in the group, and allocates the record buffer for the number of
+    signals rather than the number of elements. Produces the same records as `simulate_from_signals_nb`.
+
+    !!! note
+        Should be only grouped if cash sharing is enabled."""
+    check_group_counts(group_counts, target_shape[1])
+    cash_sharing = is_grouped_nb(group_counts)
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+
+    n_signals = 0
+    for col in range(target_shape[1]):
+        n_signals += entry_col_index[col, 1] - entry_col_index[col, 0]
+        n_signals += exit_col_index[col, 1] - exit_col_index[col, 0]
+    order_records = np.empty(n_signals, dtype=order_dt)
+    r = 0
 
     # Inputs were not broadcast -> use flexible indexing
-    flex_i1, flex_col1 = flex_choose_i_and_col_nb(entries, flex_2d)
-    flex_i2, flex_col2 = flex_choose_i_and_col_nb(exits, flex_2d)
     flex_i3, flex_col3 = flex_choose_i_and_col_nb(size, flex_2d)
     flex_i4, flex_col4 = flex_choose_i_and_col_nb(entry_price, flex_2d)
     flex_i5, flex_col5 = flex_choose_i_and_col_nb(exit_price, flex_2d)
@@ -1090,33 +1471,51 @@ def simulate_from_signals_nb(target_shape, group_counts, init_cash, call_seq, en
     flex_i7, flex_col7 = flex_choose_i_and_col_nb(fixed_fees, flex_2d)
     flex_i8, flex_col8 = flex_choose_i_and_col_nb(slippage, flex_2d)
     flex_i9, flex_col9 = flex_choose_i_and_col_nb(reject_prob, flex_2d)
+    flex_i10, flex_col10 = flex_choose_i_and_col_nb(call_seq, True)
 
     from_col = 0
     for group in range(len(group_counts)):
         to_col = from_col + group_counts[group]
         group_len = to_col - from_col
-
-        # Get running values per group
         if cash_sharing:
-            cash_now = last_cash[group]
+            cash_now = float(init_cash[group])
+        else:
+            cash_now = float(init_cash[from_col])
+        last_shares = np.full(group_len, 0., dtype=np.float_)
+        entry_k = entry_col_index[from_col:to_col, 0].copy()
+        exit_k = exit_col_index[from_col:to_col, 0].copy()
+
+        while True:
+            # Find the next row with any signal in the group
+            i = target_shape[0]
+            for k in range(group_len):
+                col = from_col + k
+                if entry_k[k] < entry_col_index[col, 1] and entry_idxs[entry_k[k]] < i:
+                    i = entry_idxs[entry_k[k]]
+                if exit_k[k] < exit_col_index[col, 1] and exit_idxs[exit_k[k]] < i:
+                    i = exit_idxs[exit_k[k]]
+            if i == target_shape[0]:
+                break
 
-        for i in range(target_shape[0]):
             for k in range(group_len):
                 col = from_col + k
                 if cash_sharing:
-                    col_i = call_seq[i, col]
+                    col_i = flex_select_nb(i, col, call_seq, flex_i10, flex_col10, True)
                     if col_i >= group_len:
                         raise ValueError("Call index exceeds bounds of the group")
                     col = from_col + col_i
 
-                # Get running values per column
-                if not cash_sharing:
-                    cash_now = last_cash[col]
-                shares_now = last_shares[col]
-
-                is_entry = flex_select_nb(i, col, entries, flex_i1, flex_col1, flex_2d)
-                is_exit = flex_select_nb(i, col, exits, flex_i2, flex_col2, flex_2d)
+                is_entry = entry_k[col - from_col] < entry_col_index[col, 1] \
+                    and entry_idxs[entry_k[col - from_col]] == i
+                is_exit = exit_k[col - from_col] < exit_col_index[col, 1] \
+                    and exit_idxs[exit_k[col - from_col]] == i
+                if is_entry:
+                    entry_k[col - from_col] += 1
+                if is_exit:
+                    exit_k[col - from_col] += 1
                 if is_entry or is_exit:
+                    shares_now = last_shares[col - from_col]
+
                     # Generate the next order
                     order = signals_order_func_nb(
                         shares_now,
@@ -1140,33 +1539,235 @@ def simulate_from_signals_nb(target_shape, group_counts, init_cash, call_seq, en
 
                     if order_result.status == OrderStatus.Filled:
                         # Add a new record
-                        if cash_sharing:
-                            r = get_record_idx_nb(target_shape, col, i)
-                        else:
-                            r = j
                         order_records[r]['col'] = col
                         order_records[r]['idx'] = i
                         order_records[r]['size'] = order_result.size
                         order_records[r]['price'] = order_result.price
                         order_records[r]['fees'] = order_result.fees
                         order_records[r]['side'] = order_result.side
-                        if cash_sharing:
-                            record_mask[r] = True
-                        j += 1
+                        r += 1
 
-                # Now becomes last
-                if cash_sharing:
-                    last_cash[group] = cash_now
-                else:
-                    last_cash[col] = cash_now
-                last_shares[col] = shares_now
+                    # Now becomes last
+                    last_shares[col - from_col] = shares_now
 
         from_col = to_col
 
-    # Order records are not sorted yet
     if cash_sharing:
-        return order_records[record_mask]
-    return order_records[:j]
+        # Records of a group were created row by row -> sort them by column, keeping the order of rows
+        sort_idxs = np.argsort(order_records['col'][:r], kind='mergesort')
+    else:
+        sort_idxs = np.arange(r)
+    return order_records[:r][sort_idxs]
+
+
+@njit(cache=True)
+def simulate_from_signals_metrics_group_nb(group, from_col, to_col, metrics, target_shape, close, init_cash,
+                                           cash_sharing, call_seq, entries, exits, size, entry_price,
+                                           exit_price, fees, fixed_fees, slippage, reject_prob, min_size,
+                                           accumulate, accumulate_exit_mode, conflict_mode, flex_2d,
+                                           ann_factor, packed_entries=None, packed_exits=None):
+    """Simulate a single group of `simulate_from_signals_metrics_nb`.
+
+    Same as `simulate_from_signals_group_nb` but instead of writing order records, updates
+    the value of the group after each row and reduces it to metrics on the fly.
+    Writes the metrics to `metrics` at position `group`."""
+    group_len = to_col - from_col
+    last_cash = np.empty(group_len, dtype=np.float_)
+    last_shares = np.full(group_len, 0., dtype=np.float_)
+    if cash_sharing:
+        cash_now = float(init_cash[group])
+        init_value = cash_now
+    else:
+        for k in range(group_len):
+            last_cash[k] = init_cash[from_col + k]
+        cash_now = 0.
+        init_value = np.sum(last_cash)
+
+    # Inputs were not broadcast -> use flexible indexing
+    flex_i0, flex_col0 = flex_choose_i_and_col_nb(close, flex_2d)
+    flex_i1, flex_col1 = flex_choose_i_and_col_nb(entries, flex_2d)
+    flex_i2, flex_col2 = flex_choose_i_and_col_nb(exits, flex_2d)
+    flex_i3, flex_col3 = flex_choose_i_and_col_nb(size, flex_2d)
+    flex_i4, flex_col4 = flex_choose_i_and_col_nb(entry_price, flex_2d)
+    flex_i5, flex_col5 = flex_choose_i_and_col_nb(exit_price, flex_2d)
+    flex_i6, flex_col6 = flex_choose_i_and_col_nb(fees, flex_2d)
+    flex_i7, flex_col7 = flex_choose_i_and_col_nb(fixed_fees, flex_2d)
+    flex_i8, flex_col8 = flex_choose_i_and_col_nb(slippage, flex_2d)
+    flex_i9, flex_col9 = flex_choose_i_and_col_nb(reject_prob, flex_2d)
+    flex_i10, flex_col10 = flex_choose_i_and_col_nb(call_seq, True)
+
+    # Running metrics
+    num_trades = 0
+    prev_value = init_value
+    value_now = init_value
+    cum_return = 1.
+    max_cum_return = 1.
+    max_drawdown = 0.
+    ret_count = 0
+    ret_mean = 0.
+    ret_m2 = 0.
+
+    for i in range(target_shape[0]):
+        for k in range(group_len):
+            col = from_col + k
+            if cash_sharing:
+                col_i = flex_select_nb(i, col, call_seq, flex_i10, flex_col10, True)
+                if col_i >= group_len:
+                    raise ValueError("Call index exceeds bounds of the group")
+                col = from_col + col_i
+
+            # Get running values per column
+            if not cash_sharing:
+                cash_now = last_cash[col - from_col]
+            shares_now = last_shares[col - from_col]
+
+            if packed_entries is not None:
+                is_entry = packed_select_nb(i, col, packed_entries)
+            else:
+                is_entry = flex_select_nb(i, col, entries, flex_i1, flex_col1, flex_2d)
+            if packed_exits is not None:
+                is_exit = packed_select_nb(i, col, packed_exits)
+            else:
+                is_exit = flex_select_nb(i, col, exits, flex_i2, flex_col2, flex_2d)
+            if is_entry or is_exit:
+                # Generate the next order
+                order = signals_order_func_nb(
+                    shares_now,
+                    is_entry,
+                    is_exit,
+                    flex_select_nb(i, col, size, flex_i3, flex_col3, flex_2d),
+                    flex_select_nb(i, col, entry_price, flex_i4, flex_col4, flex_2d),
+                    flex_select_nb(i, col, exit_price, flex_i5, flex_col5, flex_2d),
+                    flex_select_nb(i, col, fees, flex_i6, flex_col6, flex_2d),
+                    flex_select_nb(i, col, fixed_fees, flex_i7, flex_col7, flex_2d),
+                    flex_select_nb(i, col, slippage, flex_i8, flex_col8, flex_2d),
+                    flex_select_nb(i, col, reject_prob, flex_i9, flex_col9, flex_2d),
+                    accumulate,
+                    accumulate_exit_mode,
+                    conflict_mode
+                )
+
+                # Process the order
+                cash_now, shares_now, order_result = process_order_nb(
+                    cash_now, shares_now, order, min_size[col])
+
+                if order_result.status == OrderStatus.Filled and order_result.side == OrderSide.Sell:
+                    num_trades += 1
+
+            # Now becomes last
+            if not cash_sharing:
+                last_cash[col - from_col] = cash_now
+            last_shares[col - from_col] = shares_now
+
+        # Update value of the group
+        if cash_sharing:
+            value_now = cash_now
+        else:
+            value_now = np.sum(last_cash)
+        for k in range(group_len):
+            close_now = flex_select_nb(i, from_col + k, close, flex_i0, flex_col0, flex_2d)
+            value_now += last_shares[k] * close_now
+
+        # Update metrics based on the return of this row
+        ret = (value_now - prev_value) / prev_value
+        if not np.isnan(ret):
+            ret_count += 1
+            delta = ret - ret_mean
+            ret_mean += delta / ret_count
+            ret_m2 += delta * (ret - ret_mean)
+            cum_return *= 1. + ret
+        if i == 0 or cum_return > max_cum_return:
+            max_cum_return = cum_return
+        drawdown = cum_return / max_cum_return - 1
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+        prev_value = value_now
+
+    metrics[group]['total_return'] = (value_now - init_value) / init_value
+    metrics[group]['max_drawdown'] = max_drawdown
+    if target_shape[0] < 2 or ret_count < 2:
+        metrics[group]['sharpe_ratio'] = np.nan
+    else:
+        ret_std = np.sqrt(ret_m2 / (ret_count - 1))
+        if ret_std == 0.:
+            metrics[group]['sharpe_ratio'] = np.inf
+        else:
+            metrics[group]['sharpe_ratio'] = ret_mean / ret_std * np.sqrt(ann_factor)
+    metrics[group]['num_trades'] = num_trades
+
+
+@njit(cache=True)
+def simulate_from_signals_metrics_nb(target_shape, close, group_counts, init_cash, cash_sharing, call_seq,
+                                     entries, exits, size, entry_price, exit_price, fees, fixed_fees,
+                                     slippage, reject_prob, min_size, accumulate, accumulate_exit_mode,
+                                     conflict_mode, flex_2d, ann_factor, packed_entries=None, packed_exits=None):
+    """Reduce-only version of `simulate_from_signals_nb`.
+
+    Instead of order records, returns an array of type `vectorbt.portfolio.enums.metrics_dt`
+    with one element per group. Memory usage doesn't depend upon the number of rows.
+
+    Unlike `simulate_from_signals_nb`, groups can be defined independently of cash sharing.
+    If cash sharing is enabled, `init_cash` should be per group, otherwise per column.
+
+    Metrics are computed the same way as `vectorbt.portfolio.base.Portfolio.total_return`,
+    `vectorbt.portfolio.base.Portfolio.max_drawdown` and `vectorbt.portfolio.base.Portfolio.sharpe_ratio`
+    (with zero risk-free rate). The number of trades is the number of closed trades, which is
+    the same as the number of filled sell orders."""
+    check_group_counts(group_counts, target_shape[1])
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+
+    metrics = np.empty(len(group_counts), dtype=metrics_dt)
+
+    from_col = 0
+    for group in range(len(group_counts)):
+        to_col = from_col + group_counts[group]
+        simulate_from_signals_metrics_group_nb(
+            group, from_col, to_col, metrics, target_shape, close, init_cash,
+            cash_sharing, call_seq, entries, exits, size, entry_price, exit_price,
+            fees, fixed_fees, slippage, reject_prob, min_size, accumulate,
+            accumulate_exit_mode, conflict_mode, flex_2d, ann_factor, packed_entries, packed_exits
+        )
+        from_col = to_col
+
+    return metrics
+
+
+@njit(cache=True, parallel=True)
+def simulate_from_signals_metrics_parallel_nb(target_shape, close, group_counts, init_cash, cash_sharing,
+                                              call_seq, entries, exits, size, entry_price, exit_price, fees,
+                                              fixed_fees, slippage, reject_prob, min_size, accumulate,
+                                              accumulate_exit_mode, conflict_mode, flex_2d, ann_factor,
+                                              packed_entries=None, packed_exits=None):
+    """Parallel version of `simulate_from_signals_metrics_nb`."""
+    check_group_counts(group_counts, target_shape[1])
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+
+    metrics = np.empty(len(group_counts), dtype=metrics_dt)
+    group_end = np.cumsum(group_counts)
+
+    # Parallel loops cannot pass 0-dim arrays -> make them 1-dim (flexible indexing stays the same)
+    _close = np.atleast_1d(close)
+    _entries = np.atleast_1d(entries)
+    _exits = np.atleast_1d(exits)
+    _size = np.atleast_1d(size)
+    _entry_price = np.atleast_1d(entry_price)
+    _exit_price = np.atleast_1d(exit_price)
+    _fees = np.atleast_1d(fees)
+    _fixed_fees = np.atleast_1d(fixed_fees)
+    _slippage = np.atleast_1d(slippage)
+    _reject_prob = np.atleast_1d(reject_prob)
+
+    for group in prange(len(group_counts)):
+        from_col = group_end[group] - group_counts[group]
+        to_col = group_end[group]
+        simulate_from_signals_metrics_group_nb(
+            group, from_col, to_col, metrics, target_shape, _close, init_cash,
+            cash_sharing, call_seq, _entries, _exits, _size, _entry_price, _exit_price,
+            _fees, _fixed_fees, _slippage, _reject_prob, min_size, accumulate,
+            accumulate_exit_mode, conflict_mode, flex_2d, ann_factor, packed_entries, packed_exits
+        )
+
+    return metrics
 
 
 @njit(cache=True)
@@ -1232,162 +1833,212 @@ def signals_order_func_nb(shares_now, is_entry, is_exit, size, entry_price, exit
     )
 
 
+@njit(cache=True)
+def simulate_from_orders_group_nb(from_col, to_col, cash_now, order_records, record_mask, target_shape,
+                                  cash_sharing, call_seq, size, size_type, price, fees, fixed_fees, slippage,
+                                  reject_prob, min_size, val_price, auto_call_seq, flex_2d):
+    """Simulate a single group of `simulate_from_orders_nb`.
+
+    Writes filled orders to `order_records` at their position in the matrix and marks them in `record_mask`.
+    Since groups do not depend upon each other, they can be processed in any order."""
+    group_len = to_col - from_col
+    last_cash = np.full(group_len, cash_now, dtype=np.float_)
+    last_shares = np.full(group_len, 0., dtype=np.float_)
+    temp_order_value = np.empty(group_len, dtype=np.float_)
+
+    # Inputs were not broadcast -> use flexible indexing
+    flex_i1, flex_col1 = flex_choose_i_and_col_nb(size, flex_2d)
+    flex_i2, flex_col2 = flex_choose_i_and_col_nb(size_type, flex_2d)
+    flex_i3, flex_col3 = flex_choose_i_and_col_nb(price, flex_2d)
+    flex_i4, flex_col4 = flex_choose_i_and_col_nb(fees, flex_2d)
+    flex_i5, flex_col5 = flex_choose_i_and_col_nb(fixed_fees, flex_2d)
+    flex_i6, flex_col6 = flex_choose_i_and_col_nb(slippage, flex_2d)
+    flex_i7, flex_col7 = flex_choose_i_and_col_nb(reject_prob, flex_2d)
+    flex_i8, flex_col8 = flex_choose_i_and_col_nb(val_price, flex_2d)
+    flex_i9, flex_col9 = flex_choose_i_and_col_nb(call_seq, True)
+
+    for i in range(target_shape[0]):
+        # Calculate group value and rearrange if cash sharing is enabled
+        if cash_sharing:
+            # Same as get_group_value_ctx_nb but with flexible indexing
+            value_now = cash_now
+            for k in range(group_len):
+                col = from_col + k
+                if last_shares[k] > 0.:
+                    _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
+                    holding_value = last_shares[k] * _val_price
+                    value_now += holding_value
+
+            # Dynamically sort by order value -> selling comes first to release funds early
+            if auto_call_seq:
+                # Same as sort_by_order_value_ctx_nb but with flexible indexing
+                for k in range(group_len):
+                    col = from_col + k
+                    _size = flex_select_nb(i, col, size, flex_i1, flex_col1, flex_2d)
+                    _size_type = flex_select_nb(i, col, size_type, flex_i2, flex_col2, flex_2d)
+                    _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
+                    holding_value_now = last_shares[k] * _val_price
+
+                    if _size_type == SizeType.Shares:
+                        temp_order_value[k] = _size * _val_price
+                    if _size_type == SizeType.TargetShares:
+                        temp_order_value[k] = _size * _val_price - holding_value_now
+                    if _size_type == SizeType.TargetValue:
+                        temp_order_value[k] = _size - holding_value_now
+                    if _size_type == SizeType.TargetPercent:
+                        temp_order_value[k] = _size * value_now - holding_value_now
+
+                # Sort by order value
+                insert_argsort_nb(temp_order_value, call_seq[i, from_col:to_col])
+
+        for k in range(group_len):
+            if cash_sharing:
+                col_i = flex_select_nb(i, from_col + k, call_seq, flex_i9, flex_col9, True)
+                if col_i >= group_len:
+                    raise ValueError("Call index exceeds bounds of the group")
+                col = from_col + col_i
+            else:
+                col = from_col + k
+
+            # Get running values per column
+            shares_now = last_shares[col - from_col]
+            _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
+            if not cash_sharing:
+                cash_now = last_cash[col - from_col]
+                value_now = cash_now
+                if shares_now > 0.:
+                    value_now += shares_now * _val_price
+
+            # Convert target value or percent into target shares
+            _size = flex_select_nb(i, col, size, flex_i1, flex_col1, flex_2d)
+            _size_type = flex_select_nb(i, col, size_type, flex_i2, flex_col2, flex_2d)
+            if _size_type == SizeType.TargetPercent:
+                if not np.isnan(_size):
+                    if np.isnan(_val_price):
+                        raise ValueError("Valuation price is NaN")
+                    if np.isnan(value_now):
+                        raise ValueError("Value of the group is NaN")
+                _size = _size * value_now / _val_price
+                _size_type = SizeType.TargetShares
+            elif _size_type == SizeType.TargetValue:
+                if not np.isnan(_size):
+                    if np.isnan(_val_price):
+                        raise ValueError("Valuation price is NaN")
+                _size = _size / _val_price
+                _size_type = SizeType.TargetShares
+
+            # Generate the next order
+            order = Order(
+                _size,
+                _size_type,
+                flex_select_nb(i, col, price, flex_i3, flex_col3, flex_2d),
+                flex_select_nb(i, col, fees, flex_i4, flex_col4, flex_2d),
+                flex_select_nb(i, col, fixed_fees, flex_i5, flex_col5, flex_2d),
+                flex_select_nb(i, col, slippage, flex_i6, flex_col6, flex_2d),
+                flex_select_nb(i, col, reject_prob, flex_i7, flex_col7, flex_2d)
+            )
+
+            # Process the order
+            cash_now, shares_now, order_result = process_order_nb(
+                cash_now, shares_now, order, min_size[col])
+
+            if order_result.status == OrderStatus.Filled:
+                # Add a new record
+                r = get_record_idx_nb(target_shape, col, i)
+                order_records[r]['col'] = col
+                order_records[r]['idx'] = i
+                order_records[r]['size'] = order_result.size
+                order_records[r]['price'] = order_result.price
+                order_records[r]['fees'] = order_result.fees
+                order_records[r]['side'] = order_result.side
+                record_mask[r] = True
+
+            # Now becomes last
+            if not cash_sharing:
+                last_cash[col - from_col] = cash_now
+            last_shares[col - from_col] = shares_now
+
+
 @njit(cache=True)
 def simulate_from_orders_nb(target_shape, group_counts, init_cash, call_seq, size, size_type,
                             price, fees, fixed_fees, slippage, reject_prob, min_size, val_price,
                             auto_call_seq, flex_2d):
     """Adaptation of `simulate_nb` for simulation based on orders.
 
-    Utilizes flexible broadcasting.
+    Utilizes flexible broadcasting, also for `call_seq`.
 
     !!! note
         Should be only grouped if cash sharing is enabled.
 
-        If `auto_call_seq` is True, make sure that `call_seq` follows `CallSeqType.Default`."""
+        If `auto_call_seq` is True, make sure that `call_seq` follows `CallSeqType.Default`
+        and has shape `target_shape`, since it's modified in place."""
     check_group_counts(group_counts, target_shape[1])
     cash_sharing = is_grouped_nb(group_counts)
     check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+    check_auto_call_seq(target_shape, call_seq, cash_sharing, auto_call_seq)
 
     order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
     record_mask = np.full(target_shape[0] * target_shape[1], False)
-    j = 0
-    last_cash = init_cash.astype(np.float_)
-    last_shares = np.full(target_shape[1], 0., dtype=np.float_)
-    temp_order_value = np.empty(target_shape[1], dtype=np.float_)
-
-    # Inputs were not broadcast -> use flexible indexing
-    flex_i1, flex_col1 = flex_choose_i_and_col_nb(size, flex_2d)
-    flex_i2, flex_col2 = flex_choose_i_and_col_nb(size_type, flex_2d)
-    flex_i3, flex_col3 = flex_choose_i_and_col_nb(price, flex_2d)
-    flex_i4, flex_col4 = flex_choose_i_and_col_nb(fees, flex_2d)
-    flex_i5, flex_col5 = flex_choose_i_and_col_nb(fixed_fees, flex_2d)
-    flex_i6, flex_col6 = flex_choose_i_and_col_nb(slippage, flex_2d)
-    flex_i7, flex_col7 = flex_choose_i_and_col_nb(reject_prob, flex_2d)
-    flex_i8, flex_col8 = flex_choose_i_and_col_nb(val_price, flex_2d)
 
     from_col = 0
     for group in range(len(group_counts)):
         to_col = from_col + group_counts[group]
-        group_len = to_col - from_col
-
-        # Get running values per group
         if cash_sharing:
-            cash_now = last_cash[group]
-
-        for i in range(target_shape[0]):
-            # Calculate group value and rearrange if cash sharing is enabled
-            if cash_sharing:
-                # Same as get_group_value_ctx_nb but with flexible indexing
-                value_now = cash_now
-                for k in range(group_len):
-                    col = from_col + k
-                    if last_shares[col] > 0.:
-                        _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
-                        holding_value = last_shares[col] * _val_price
-                        value_now += holding_value
-
-                # Dynamically sort by order value -> selling comes first to release funds early
-                if auto_call_seq:
-                    # Same as sort_by_order_value_ctx_nb but with flexible indexing
-                    for k in range(group_len):
-                        col = from_col + k
-                        _size = flex_select_nb(i, col, size, flex_i1, flex_col1, flex_2d)
-                        _size_type = flex_select_nb(i, col, size_type, flex_i2, flex_col2, flex_2d)
-                        _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
-                        holding_value_now = last_shares[col] * _val_price
-
-                        if _size_type == SizeType.Shares:
-                            temp_order_value[k] = _size * _val_price
-                        if _size_type == SizeType.TargetShares:
-                            temp_order_value[k] = _size * _val_price - holding_value_now
-                        if _size_type == SizeType.TargetValue:
-                            temp_order_value[k] = _size - holding_value_now
-                        if _size_type == SizeType.TargetPercent:
-                            temp_order_value[k] = _size * value_now - holding_value_now
-
-                    # Sort by order value
-                    insert_argsort_nb(temp_order_value[:group_len], call_seq[i, from_col:to_col])
-
-            for k in range(group_len):
-                if cash_sharing:
-                    col_i = call_seq[i, from_col + k]
-                    if col_i >= group_len:
-                        raise ValueError("Call index exceeds bounds of the group")
-                    col = from_col + col_i
-                else:
-                    col = from_col + k
+            cash_now = float(init_cash[group])
+        else:
+            cash_now = float(init_cash[from_col])
+        simulate_from_orders_group_nb(
+            from_col, to_col, cash_now, order_records, record_mask, target_shape,
+            cash_sharing, call_seq, size, size_type, price, fees, fixed_fees, slippage,
+            reject_prob, min_size, val_price, auto_call_seq, flex_2d
+        )
+        from_col = to_col
 
-                # Get running values per column
-                shares_now = last_shares[col]
-                _val_price = flex_select_nb(i, col, val_price, flex_i8, flex_col8, flex_2d)
-                if not cash_sharing:
-                    cash_now = last_cash[col]
-                    value_now = cash_now
-                    if shares_now > 0.:
-                        value_now += shares_now * _val_price
-
-                # Convert target value or percent into target shares
-                _size = flex_select_nb(i, col, size, flex_i1, flex_col1, flex_2d)
-                _size_type = flex_select_nb(i, col, size_type, flex_i2, flex_col2, flex_2d)
-                if _size_type == SizeType.TargetPercent:
-                    if not np.isnan(_size):
-                        if np.isnan(_val_price):
-                            raise ValueError("Valuation price is NaN")
-                        if np.isnan(value_now):
-                            raise ValueError("Value of the group is NaN")
-                    _size = _size * value_now / _val_price
-                    _size_type = SizeType.TargetShares
-                elif _size_type == SizeType.TargetValue:
-                    if not np.isnan(_size):
-                        if np.isnan(_val_price):
-                            raise ValueError("Valuation price is NaN")
-                    _size = _size / _val_price
-                    _size_type = SizeType.TargetShares
+    # Order records are sorted by column and index
+    return order_records[record_mask]
 
-                # Generate the next order
-                order = Order(
-                    _size,
-                    _size_type,
-                    flex_select_nb(i, col, price, flex_i3, flex_col3, flex_2d),
-                    flex_select_nb(i, col, fees, flex_i4, flex_col4, flex_2d),
-                    flex_select_nb(i, col, fixed_fees, flex_i5, flex_col5, flex_2d),
-                    flex_select_nb(i, col, slippage, flex_i6, flex_col6, flex_2d),
-                    flex_select_nb(i, col, reject_prob, flex_i7, flex_col7, flex_2d)
-                )
 
-                # Process the order
-                cash_now, shares_now, order_result = process_order_nb(
-                    cash_now, shares_now, order, min_size[col])
+@njit(cache=True, parallel=True)
+def simulate_from_orders_parallel_nb(target_shape, group_counts, init_cash, call_seq, size, size_type,
+                                     price, fees, fixed_fees, slippage, reject_prob, min_size, val_price,
+                                     auto_call_seq, flex_2d):
+    """Parallel version of `simulate_from_orders_nb`.
 
-                if order_result.status == OrderStatus.Filled:
-                    # Add a new record
-                    if cash_sharing:
-                        r = get_record_idx_nb(target_shape, col, i)
-                    else:
-                        r = j
-                    order_records[r]['col'] = col
-                    order_records[r]['idx'] = i
-                    order_records[r]['size'] = order_result.size
-                    order_records[r]['price'] = order_result.price
-                    order_records[r]['fees'] = order_result.fees
-                    order_records[r]['side'] = order_result.side
-                    if cash_sharing:
-                        record_mask[r] = True
-                    j += 1
-
-                # Now becomes last
-                if cash_sharing:
-                    last_cash[group] = cash_now
-                else:
-                    last_cash[col] = cash_now
-                last_shares[col] = shares_now
+    See `simulate_from_signals_parallel_nb`."""
+    check_group_counts(group_counts, target_shape[1])
+    cash_sharing = is_grouped_nb(group_counts)
+    check_group_init_cash(group_counts, target_shape[1], init_cash, cash_sharing)
+    check_auto_call_seq(target_shape, call_seq, cash_sharing, auto_call_seq)
 
-        from_col = to_col
+    order_records = np.empty(target_shape[0] * target_shape[1], dtype=order_dt)
+    record_mask = np.full(target_shape[0] * target_shape[1], False)
+    group_end = np.cumsum(group_counts)
+
+    # Parallel loops cannot pass 0-dim arrays -> make them 1-dim (flexible indexing stays the same)
+    _size = np.atleast_1d(size)
+    _size_type = np.atleast_1d(size_type)
+    _price = np.atleast_1d(price)
+    _fees = np.atleast_1d(fees)
+    _fixed_fees = np.atleast_1d(fixed_fees)
+    _slippage = np.atleast_1d(slippage)
+    _reject_prob = np.atleast_1d(reject_prob)
+    _val_price = np.atleast_1d(val_price)
+
+    for group in prange(len(group_counts)):
+        from_col = group_end[group] - group_counts[group]
+        to_col = group_end[group]
+        if cash_sharing:
+            cash_now = float(init_cash[group])
+        else:
+            cash_now = float(init_cash[from_col])
+        simulate_from_orders_group_nb(
+            from_col, to_col, cash_now, order_records, record_mask, target_shape,
+            cash_sharing, call_seq, _size, _size_type, _price, _fees, _fixed_fees, _slippage,
+            _reject_prob, min_size, _val_price, auto_call_seq, flex_2d
+        )
 
-    # Order records are not sorted yet
-    if cash_sharing:
-        return order_records[record_mask]
-    return order_records[:j]
+    # Order records are sorted by column and index
+    return order_records[record_mask]
 
 
 # ############# Shares ############# #
@@ -1745,3 +2396,229 @@ def buy_and_hold_return_grouped_nb(close, group_counts):
         out[group] = np.sum(total_return[from_col:to_col]) / group_len
         from_col = to_col
     return out
+
+
+# ############# Stats ############# #
+
+@njit(cache=True)
+def stats_col_nb(col, stats, value, returns, trade_records, trade_col_index, ann_factor,
+                 risk_free, required_return):
+    """Compute statistics of a single column/group of `stats_nb`.
+
+    Writes the statistics to `stats` at position `col`."""
+    # Walk value and returns once
+    n_drawdowns = 0
+    dd_cnt = 0
+    dd_sum = 0.
+    dd_min = np.nan
+    dd_duration_sum = 0
+    dd_duration_max = 0
+    drawdown_started = False
+    peak_idx = -1
+    peak_val = value[0, col]
+    valley_val = value[0, col]
+
+    ret_cnt = 0
+    ret_mean = 0.
+    ret_m2 = 0.
+    adj_ret_sum = 0.
+    down_sq_sum = 0.
+    end_value = np.nan
+    cum_return = 1.
+    max_cum_return = 1.
+    ret_max_drawdown = 0.
+
+    for i in range(value.shape[0]):
+        # Drawdowns (same as vectorbt.records.nb.drawdown_records_nb)
+        cur_val = value[i, col]
+        if not np.isnan(cur_val):
+            store_drawdown = False
+            if np.isnan(peak_val) or cur_val >= peak_val:
+                if not drawdown_started:
+                    peak_val = cur_val
+                    peak_idx = i
+                elif cur_val >= peak_val:
+                    drawdown_started = False
+                    store_drawdown = True
+            else:
+                if not drawdown_started:
+                    drawdown_started = True
+                    valley_val = cur_val
+                elif cur_val < valley_val:
+                    valley_val = cur_val
+            if i == value.shape[0] - 1 and drawdown_started:
+                drawdown_started = False
+                store_drawdown = True
+            if store_drawdown:
+                n_drawdowns += 1
+                drawdown = (valley_val - peak_val) / peak_val
+                if not np.isnan(drawdown):
+                    dd_cnt += 1
+                    dd_sum += drawdown
+                    if np.isnan(dd_min) or drawdown < dd_min:
+                        dd_min = drawdown
+                duration = i - peak_idx
+                dd_duration_sum += duration
+                if duration > dd_duration_max:
+                    dd_duration_max = duration
+                peak_idx = i
+                peak_val = cur_val
+                valley_val = cur_val
+
+        # Returns
+        ret = returns[i, col]
+        if not np.isnan(ret):
+            ret_cnt += 1
+            delta = ret - ret_mean
+            ret_mean += delta / ret_cnt
+            ret_m2 += delta * (ret - ret_mean)
+            adj_ret = ret - required_return
+            adj_ret_sum += adj_ret
+            if adj_ret < 0:
+                down_sq_sum += adj_ret ** 2
+            cum_return *= 1. + ret
+            if np.isnan(end_value):
+                end_value = 1. + ret
+            else:
+                end_value *= 1. + ret
+        if i == 0 or cum_return > max_cum_return:
+            max_cum_return = cum_return
+        ret_drawdown = cum_return / max_cum_return - 1
+        if ret_drawdown < ret_max_drawdown:
+            ret_max_drawdown = ret_drawdown
+
+    if n_drawdowns == 0:
+        stats[col]['max_drawdown'] = 0.
+        stats[col]['avg_drawdown'] = 0.
+        stats[col]['max_drawdown_duration'] = np.nan
+        stats[col]['avg_drawdown_duration'] = np.nan
+    else:
+        stats[col]['max_drawdown'] = dd_min
+        stats[col]['avg_drawdown'] = dd_sum / dd_cnt if dd_cnt > 0 else np.nan
+        stats[col]['max_drawdown_duration'] = dd_duration_max
+        stats[col]['avg_drawdown_duration'] = dd_duration_sum / n_drawdowns
+
+    # Same as vectorbt.returns.nb.sharpe_ratio_1d_nb, sortino_ratio_1d_nb and calmar_ratio_1d_nb
+    if returns.shape[0] < 2 or ret_cnt == 0:
+        stats[col]['sharpe_ratio'] = np.nan
+        stats[col]['sortino_ratio'] = np.nan
+    else:
+        if ret_cnt < 2:
+            stats[col]['sharpe_ratio'] = np.nan
+        else:
+            ret_std = np.sqrt(ret_m2 / (ret_cnt - 1))
+            if ret_std == 0.:
+                stats[col]['sharpe_ratio'] = np.inf
+            else:
+                stats[col]['sharpe_ratio'] = (ret_mean - risk_free) / ret_std * np.sqrt(ann_factor)
+        downside_risk = np.sqrt(down_sq_sum / ret_cnt) * np.sqrt(ann_factor)
+        if downside_risk == 0.:
+            stats[col]['sortino_ratio'] = np.inf
+        else:
+            stats[col]['sortino_ratio'] = adj_ret_sum / ret_cnt * ann_factor / downside_risk
+    if ret_max_drawdown == 0.:
+        stats[col]['calmar_ratio'] = np.nan
+    else:
+        annualized_return = end_value ** (ann_factor / returns.shape[0]) - 1
+        stats[col]['calmar_ratio'] = annualized_return / np.abs(ret_max_drawdown)
+
+    # Walk trade records once
+    from_r = trade_col_index[col, 0]
+    to_r = trade_col_index[col, 1]
+    num_trades = 0
+    win_cnt = 0
+    win_pnl_sum = 0.
+    loss_cnt = 0
+    loss_pnl_sum = 0.
+    pnl_cnt = 0
+    pnl_mean = 0.
+    pnl_m2 = 0.
+    return_cnt = 0
+    return_sum = 0.
+    return_max = np.nan
+    return_min = np.nan
+    duration_sum = 0
+    duration_max = 0
+    if from_r != -1 and to_r != -1:
+        for r in range(from_r, to_r):
+            record = trade_records[r]
+            num_trades += 1
+            pnl = record['pnl']
+            if pnl > 0:
+                win_cnt += 1
+                win_pnl_sum += pnl
+            elif pnl < 0:
+                loss_cnt += 1
+                loss_pnl_sum += pnl
+            if not np.isnan(pnl):
+                pnl_cnt += 1
+                delta = pnl - pnl_mean
+                pnl_mean += delta / pnl_cnt
+                pnl_m2 += delta * (pnl - pnl_mean)
+            trade_return = record['return']
+            if not np.isnan(trade_return):
+                return_cnt += 1
+                return_sum += trade_return
+                if np.isnan(return_max) or trade_return > return_max:
+                    return_max = trade_return
+                if np.isnan(return_min) or trade_return < return_min:
+                    return_min = trade_return
+            duration = record['exit_idx'] - record['entry_idx']
+            duration_sum += duration
+            if duration > duration_max:
+                duration_max = duration
+
+    stats[col]['num_trades'] = num_trades
+    stats[col]['best_trade'] = return_max
+    stats[col]['worst_trade'] = return_min
+    stats[col]['avg_trade'] = return_sum / return_cnt if return_cnt > 0 else np.nan
+    if num_trades == 0:
+        stats[col]['win_rate'] = np.nan
+        stats[col]['max_trade_duration'] = np.nan
+        stats[col]['avg_trade_duration'] = np.nan
+        stats[col]['expectancy'] = np.nan
+    else:
+        win_rate = win_cnt / num_trades
+        avg_win = win_pnl_sum / win_cnt if win_cnt > 0 else 0.
+        avg_loss = loss_pnl_sum / loss_cnt if loss_cnt > 0 else 0.
+        stats[col]['win_rate'] = win_rate
+        stats[col]['max_trade_duration'] = duration_max
+        stats[col]['avg_trade_duration'] = duration_sum / num_trades
+        stats[col]['expectancy'] = win_rate * avg_win - (1 - win_rate) * np.abs(avg_loss)
+
+    # Same as vectorbt.records.events.BaseEventsByResult.sqn
+    if pnl_cnt < 2:
+        stats[col]['sqn'] = np.nan
+    else:
+        pnl_std = np.sqrt(pnl_m2 / (pnl_cnt - 1))
+        if pnl_std == 0.:
+            if pnl_mean == 0.:
+                stats[col]['sqn'] = np.nan
+            else:
+                stats[col]['sqn'] = np.sign(pnl_mean) * np.inf
+        else:
+            stats[col]['sqn'] = np.sqrt(num_trades) * pnl_mean / pnl_std
+
+
+@njit(cache=True)
+def stats_nb(value, returns, trade_records, trade_col_index, ann_factor, risk_free, required_return):
+    """Compute the default statistics of `vectorbt.portfolio.base.Portfolio.stats` in one go.
+
+    Instead of building drawdown records and reducing each mapped array separately, walks
+    `value` and `returns` once and the trade records once per column/group, and returns an array
+    of type `vectorbt.portfolio.enums.stats_dt` with one element per column/group.
+
+    `value` and `returns` must have the same shape, with one column per column/group.
+    `trade_col_index` is the column index of `trade_records` of the same length
+    (see `vectorbt.records.nb.record_col_index_nb`). `risk_free` and `required_return`
+    should be arrays of shape `value.shape[1]`.
+
+    Metrics are computed the same way as `vectorbt.records.drawdowns.Drawdowns`,
+    `vectorbt.records.events.Trades` and `vectorbt.returns.accessors.Returns_Accessor`."""
+    stats = np.empty(value.shape[1], dtype=stats_dt)
+    for col in range(value.shape[1]):
+        stats_col_nb(
+            col, stats, value, returns, trade_records, trade_col_index,
+            ann_factor, risk_free[col], required_return[col]
+        )
+    return stats
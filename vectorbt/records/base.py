@@ -341,9 +341,11 @@ There is currently no way to disable caching for an entire class.
 import numpy as np
 import pandas as pd
 
+from vectorbt import defaults
 from vectorbt.utils import checks
 from vectorbt.utils.decorators import cached_property, cached_method
 from vectorbt.utils.config import Configured
+from vectorbt.utils.array import is_sorted_nb
 from vectorbt.base.indexing import PandasIndexer
 from vectorbt.base import reshape_fns
 from vectorbt.base.common import (
@@ -361,7 +363,7 @@ def indexing_on_mapped_array_meta(obj, pd_indexing_func):
     """Perform indexing on `MappedArray` and return metadata."""
     new_wrapper, _, group_idxs, col_idxs = \
         indexing_on_wrapper_meta(obj.wrapper, pd_indexing_func, column_only_select=True)
-    new_indices, new_col_arr = nb.select_mapped_cols_nb(
+    new_indices, new_col_arr, new_col_index = nb.select_mapped_cols_with_index_nb(
         obj.col_arr,
         obj.col_index,
         reshape_fns.to_1d(col_idxs)
@@ -371,18 +373,19 @@ def indexing_on_mapped_array_meta(obj, pd_indexing_func):
         new_idx_arr = obj.idx_arr[new_indices]
     else:
         new_idx_arr = None
-    return new_wrapper, new_mapped_arr, new_col_arr, new_idx_arr, group_idxs, col_idxs
+    return new_wrapper, new_mapped_arr, new_col_arr, new_idx_arr, new_col_index, group_idxs, col_idxs
 
 
 def _mapped_array_indexing_func(obj, pd_indexing_func):
     """Perform indexing on `MappedArray`."""
-    new_wrapper, new_mapped_arr, new_col_arr, new_idx_arr, _, _ = \
+    new_wrapper, new_mapped_arr, new_col_arr, new_idx_arr, new_col_index, _, _ = \
         indexing_on_mapped_array_meta(obj, pd_indexing_func)
     return obj.copy(
         wrapper=new_wrapper,
         mapped_arr=new_mapped_arr,
         col_arr=new_col_arr,
-        idx_arr=new_idx_arr
+        idx_arr=new_idx_arr,
+        col_index=new_col_index
     )
 
 
@@ -404,7 +407,8 @@ def _mapped_binary_translate_func(self, other, np_func):
         self.wrapper,
         np_func(self.mapped_arr, other),
         self.col_arr,
-        idx_arr=self.idx_arr
+        idx_arr=self.idx_arr,
+        col_index=self.col_index
     )
 
 
@@ -418,7 +422,8 @@ def _mapped_binary_translate_func(self, other, np_func):
         self.wrapper,
         np_func(self.mapped_arr),
         self.col_arr,
-        idx_arr=self.idx_arr
+        idx_arr=self.idx_arr,
+        col_index=self.col_index
     )
 )
 class MappedArray(Configured, PandasIndexer):
@@ -435,18 +440,17 @@ class MappedArray(Configured, PandasIndexer):
         idx_arr (array_like): A one-dimensional index array. Optional.
 
             Must be of the same size as `mapped_arr`.
+        col_index (array_like): Column index. Optional.
+
+            See `MappedArray.col_index`. Built on first access if not provided.
+
+    If `col_arr` is not sorted, all arrays are sorted by column once using a stable sort,
+    such that the elements of each column remain in their original order.
 
     !!! note
         This class is meant to be immutable. To change any attribute, use `MappedArray.copy`."""
 
-    def __init__(self, wrapper, mapped_arr, col_arr, idx_arr=None):
-        Configured.__init__(
-            self,
-            wrapper=wrapper,
-            mapped_arr=mapped_arr,
-            col_arr=col_arr,
-            idx_arr=idx_arr
-        )
+    def __init__(self, wrapper, mapped_arr, col_arr, idx_arr=None, col_index=None):
         checks.assert_type(wrapper, ArrayWrapper)
         if not isinstance(mapped_arr, np.ndarray):
             mapped_arr = np.asarray(mapped_arr)
@@ -457,11 +461,26 @@ class MappedArray(Configured, PandasIndexer):
             if not isinstance(idx_arr, np.ndarray):
                 idx_arr = np.asarray(idx_arr)
             checks.assert_shape_equal(mapped_arr, idx_arr, axis=0)
+        if col_index is None and not is_sorted_nb(col_arr):
+            indices = np.argsort(col_arr, kind='stable')
+            mapped_arr = mapped_arr[indices]
+            col_arr = col_arr[indices]
+            if idx_arr is not None:
+                idx_arr = idx_arr[indices]
+        Configured.__init__(
+            self,
+            wrapper=wrapper,
+            mapped_arr=mapped_arr,
+            col_arr=col_arr,
+            idx_arr=idx_arr,
+            col_index=col_index
+        )
 
         self._wrapper = wrapper
         self._mapped_arr = mapped_arr
         self._col_arr = col_arr
         self._idx_arr = idx_arr
+        self._col_index = col_index
 
         PandasIndexer.__init__(self, _mapped_array_indexing_func)
 
@@ -470,6 +489,17 @@ class MappedArray(Configured, PandasIndexer):
         """Array wrapper."""
         return self._wrapper
 
+    def copy(self, **new_config):
+        """See `vectorbt.utils.config.Configured.copy`.
+
+        Drops `MappedArray.col_index` if the column array or the number of columns is replaced
+        and no new column index is passed."""
+        if 'col_index' not in new_config:
+            if 'col_arr' in new_config or ('wrapper' in new_config and
+                                           len(new_config['wrapper'].columns) != len(self.wrapper.columns)):
+                new_config['col_index'] = None
+        return Configured.copy(self, **new_config)
+
     def regroup(self, group_by):
         """Regroup this object."""
         if self.wrapper.grouper.is_grouping_changed(group_by=group_by):
@@ -494,9 +524,23 @@ class MappedArray(Configured, PandasIndexer):
 
     @cached_property
     def col_index(self):
-        """Column index for `MappedArray.mapped_arr`."""
+        """Column index for `MappedArray.mapped_arr`.
+
+        A 2-dim array with start (inclusive) and end (exclusive) position of the elements
+        of each column, or -1 if the column has no elements. See `vectorbt.records.nb.mapped_col_index_nb`.
+
+        Built once and passed over to instances derived by indexing, filtering and mapping."""
+        if self._col_index is not None:
+            return self._col_index
         return nb.mapped_col_index_nb(self.mapped_arr, self.col_arr, len(self.wrapper.columns))
 
+    def get_col_index(self, group_by=None):
+        """Column index of columns or groups (if grouped)."""
+        if self.wrapper.grouper.is_grouped(group_by=group_by):
+            group_counts = self.wrapper.grouper.get_group_counts(group_by=group_by)
+            return nb.group_col_index_nb(self.col_index, group_counts)
+        return self.col_index
+
     def filter_by_mask(self, mask, idx_arr=None, group_by=None, **kwargs):
         """Return a new class instance, filtered by mask."""
         if idx_arr is None:
@@ -512,13 +556,14 @@ class MappedArray(Configured, PandasIndexer):
             mapped_arr=self.mapped_arr[mask],
             col_arr=self.col_arr[mask],
             idx_arr=idx_arr,
+            col_index=nb.filter_col_index_nb(self.col_index, mask),
             **kwargs
         )
 
     def to_matrix(self, idx_arr=None, default_val=np.nan):
         """Convert mapped array to the matrix form.
 
-        See `vectorbt.records.nb.mapped_to_matrix_nb`.
+        See `vectorbt.records.nb.mapped_to_matrix_indexed_nb`.
 
         !!! warning
             Mapped arrays represent information in the most memory-friendly format.
@@ -528,23 +573,26 @@ class MappedArray(Configured, PandasIndexer):
                 raise ValueError("Must pass idx_arr")
             idx_arr = self.idx_arr
         target_shape = (len(self.wrapper.index), len(self.wrapper.columns))
-        result = nb.mapped_to_matrix_nb(self.mapped_arr, self.col_arr, idx_arr, target_shape, default_val)
+        result = nb.mapped_to_matrix_indexed_nb(self.mapped_arr, self.col_index, idx_arr, target_shape, default_val)
         return self.wrapper.wrap(result, group_by=False)
 
     def reduce(self, reduce_func_nb, *args, idx_arr=None, to_array=False, n_rows=None, to_idx=False,
-               idx_labeled=True, default_val=np.nan, cast=None, group_by=None, **kwargs):
+               idx_labeled=True, default_val=np.nan, cast=None, parallel=None, group_by=None, **kwargs):
         """Reduce mapped array by column.
 
-        If `to_array` is False and `to_idx` is False, see `vectorbt.records.nb.reduce_mapped_nb`.
-        If `to_array` is False and `to_idx` is True, see `vectorbt.records.nb.reduce_mapped_to_idx_nb`.
-        If `to_array` is True and `to_idx` is False, see `vectorbt.records.nb.reduce_mapped_to_array_nb`.
-        If `to_array` is True and `to_idx` is True, see `vectorbt.records.nb.reduce_mapped_to_idx_array_nb`.
+        If `to_array` is False and `to_idx` is False, see `vectorbt.records.nb.reduce_mapped_indexed_nb`.
+        If `to_array` is False and `to_idx` is True, see `vectorbt.records.nb.reduce_mapped_to_idx_indexed_nb`.
+        If `to_array` is True and `to_idx` is False, see `vectorbt.records.nb.reduce_mapped_to_array_indexed_nb`.
+        If `to_array` is True and `to_idx` is True, see `vectorbt.records.nb.reduce_mapped_to_idx_array_indexed_nb`.
 
         If `to_array` is True, must pass `n_rows` indicating the number of elements in the array.
         If `to_idx` is True, must pass `idx_arr`. Set `idx_labeled` to False to return raw positions
         instead of labels. Use `default_val` to set the default value and `cast` to perform casting
         on the resulting pandas object. Set `group_by` to False to disable grouping.
 
+        Set `parallel` to True to reduce columns in parallel using the `_parallel_nb` version of each
+        function. `reduce_func_nb` must then be thread-safe. Defaults to `vectorbt.defaults.records`.
+
         `**kwargs` will be passed to `vectorbt.base.array_wrapper.ArrayWrapper.wrap_reduced`."""
         # Perform checks
         checks.assert_numba_func(reduce_func_nb)
@@ -553,29 +601,28 @@ class MappedArray(Configured, PandasIndexer):
                 if to_idx:
                     raise ValueError("Must pass idx_arr")
             idx_arr = self.idx_arr
+        if parallel is None:
+            parallel = defaults.records['parallel']
 
         # Perform main computation
-        group_arr, columns = self.wrapper.grouper.get_groups_and_columns(group_by=group_by)
-        if group_arr is not None:
-            col_arr = group_arr[self.col_arr]
-        else:
-            col_arr = self.col_arr
+        col_index = self.get_col_index(group_by=group_by)
         if not to_array:
             if not to_idx:
-                result = nb.reduce_mapped_nb(
+                func = nb.reduce_mapped_indexed_parallel_nb if parallel else nb.reduce_mapped_indexed_nb
+                result = func(
                     self.mapped_arr,
-                    col_arr,
-                    len(columns),
+                    col_index,
                     default_val,
                     reduce_func_nb,
                     *args
                 )
             else:
-                result = nb.reduce_mapped_to_idx_nb(
+                func = nb.reduce_mapped_to_idx_indexed_parallel_nb if parallel \
+                    else nb.reduce_mapped_to_idx_indexed_nb
+                result = func(
                     self.mapped_arr,
-                    col_arr,
+                    col_index,
                     idx_arr,
-                    len(columns),
                     default_val,
                     reduce_func_nb,
                     *args
@@ -583,21 +630,23 @@ class MappedArray(Configured, PandasIndexer):
         else:
             checks.assert_not_none(n_rows)
             if not to_idx:
-                result = nb.reduce_mapped_to_array_nb(
+                func = nb.reduce_mapped_to_array_indexed_parallel_nb if parallel \
+                    else nb.reduce_mapped_to_array_indexed_nb
+                result = func(
                     self.mapped_arr,
-                    col_arr,
-                    len(columns),
+                    col_index,
                     n_rows,
                     default_val,
                     reduce_func_nb,
                     *args
                 )
             else:
-                result = nb.reduce_mapped_to_idx_array_nb(
+                func = nb.reduce_mapped_to_idx_array_indexed_parallel_nb if parallel \
+                    else nb.reduce_mapped_to_idx_array_indexed_nb
+                result = func(
                     self.mapped_arr,
-                    col_arr,
+                    col_index,
                     idx_arr,
-                    len(columns),
                     n_rows,
                     default_val,
                     reduce_func_nb,
@@ -755,24 +804,45 @@ class MappedArray(Configured, PandasIndexer):
         return self.plot_by_func(lambda x: x.vbt.box(**kwargs), group_by=group_by)
 
 
+def compact_records_dtype(dtype, float_dtype=None):
+    """Get the compact version of the record data type `dtype`.
+
+    64-bit integer fields, such as `col` and `idx`, become 32-bit. If `float_dtype` is not None,
+    64-bit floating fields, such as `size`, `price` and `fees`, are cast to it. Other fields are kept.
+    Fields are packed without alignment padding.
+
+    Without `float_dtype`, `order_dt` shrinks from 48 to 36 bytes (25%) and `trade_dt` from 96
+    to 76 bytes (21%). With `float_dtype=np.float32`, both are halved (24 and 48 bytes)."""
+    fields = []
+    for name in dtype.names:
+        field_dtype = dtype.fields[name][0]
+        if field_dtype == np.int64:
+            field_dtype = np.dtype(np.int32)
+        elif float_dtype is not None and field_dtype == np.float64:
+            field_dtype = np.dtype(float_dtype)
+        fields.append((name, field_dtype))
+    return np.dtype(fields, align=False)
+
+
 def indexing_on_records_meta(obj, pd_indexing_func):
     """Perform indexing on `Records` and return metadata."""
     new_wrapper, _, group_idxs, col_idxs = \
         indexing_on_wrapper_meta(obj.wrapper, pd_indexing_func, column_only_select=True)
-    new_records_arr = nb.select_record_cols_nb(
+    new_records_arr, new_col_index = nb.select_record_cols_with_index_nb(
         obj.records_arr,
         obj.col_index,
         reshape_fns.to_1d(col_idxs)
     )
-    return new_wrapper, new_records_arr, group_idxs, col_idxs
+    return new_wrapper, new_records_arr, new_col_index, group_idxs, col_idxs
 
 
 def _records_indexing_func(obj, pd_indexing_func):
     """Perform indexing on `Records`."""
-    new_wrapper, new_records_arr, _, _ = indexing_on_records_meta(obj, pd_indexing_func)
+    new_wrapper, new_records_arr, new_col_index, _, _ = indexing_on_records_meta(obj, pd_indexing_func)
     return obj.copy(
         wrapper=new_wrapper,
-        records_arr=new_records_arr
+        records_arr=new_records_arr,
+        col_index=new_col_index
     )
 
 
@@ -789,22 +859,50 @@ class Records(Configured, PandasIndexer):
         idx_field (str): The name of the field corresponding to the index. Optional.
 
             Will be derived automatically if records contain field `'idx'`.
+        col_index (array_like): Column index. Optional.
+
+            See `Records.col_index`. Built on first access if not provided.
+
+    If records are not sorted by column, they are sorted once using a stable sort,
+    such that the records of each column remain in their original order.
+
+    If `compact` in `vectorbt.defaults.records` is True, records are stored using
+    `compact_records_dtype` with `compact_float_dtype` as `float_dtype`, unless the shape of
+    `wrapper` exceeds the range of a 32-bit integer. Records are sorted and cast in a single copy.
 
     !!! note
         This class is meant to be immutable. To change any attribute, use `Records.copy`."""
 
-    def __init__(self, wrapper, records_arr, idx_field=None):
-        Configured.__init__(
-            self,
-            wrapper=wrapper,
-            records_arr=records_arr,
-            idx_field=idx_field
-        )
+    def __init__(self, wrapper, records_arr, idx_field=None, col_index=None):
         checks.assert_type(wrapper, ArrayWrapper)
         if not isinstance(records_arr, np.ndarray):
             records_arr = np.asarray(records_arr)
         checks.assert_not_none(records_arr.dtype.fields)
         checks.assert_in('col', records_arr.dtype.names)
+        sort_idxs = None
+        if col_index is None and not is_sorted_nb(records_arr['col']):
+            sort_idxs = np.argsort(records_arr['col'], kind='stable')
+        if defaults.records['compact'] and max(wrapper.shape_2d) <= np.iinfo(np.int32).max:
+            compact_dt = compact_records_dtype(records_arr.dtype, float_dtype=defaults.records['compact_float_dtype'])
+            if records_arr.dtype != compact_dt:
+                # Cast field by field, sorting along the way, such that only one new array is created
+                new_records_arr = np.empty(records_arr.shape[0], dtype=compact_dt)
+                for name in compact_dt.names:
+                    if sort_idxs is None:
+                        new_records_arr[name] = records_arr[name]
+                    else:
+                        new_records_arr[name] = records_arr[name][sort_idxs]
+                records_arr = new_records_arr
+                sort_idxs = None
+        if sort_idxs is not None:
+            records_arr = records_arr[sort_idxs]
+        Configured.__init__(
+            self,
+            wrapper=wrapper,
+            records_arr=records_arr,
+            idx_field=idx_field,
+            col_index=col_index
+        )
         if idx_field is not None:
             checks.assert_in(idx_field, records_arr.dtype.names)
         else:
@@ -814,6 +912,7 @@ class Records(Configured, PandasIndexer):
         self._wrapper = wrapper
         self._records_arr = records_arr
         self._idx_field = idx_field
+        self._col_index = col_index
 
         PandasIndexer.__init__(self, _records_indexing_func)
 
@@ -822,6 +921,17 @@ class Records(Configured, PandasIndexer):
         """Array wrapper."""
         return self._wrapper
 
+    def copy(self, **new_config):
+        """See `vectorbt.utils.config.Configured.copy`.
+
+        Drops `Records.col_index` if the records array or the number of columns is replaced
+        and no new column index is passed."""
+        if 'col_index' not in new_config:
+            if 'records_arr' in new_config or ('wrapper' in new_config and
+                                               len(new_config['wrapper'].columns) != len(self.wrapper.columns)):
+                new_config['col_index'] = None
+        return Configured.copy(self, **new_config)
+
     def regroup(self, group_by):
         """Regroup this object."""
         if self.wrapper.grouper.is_grouping_changed(group_by=group_by):
@@ -850,9 +960,20 @@ class Records(Configured, PandasIndexer):
 
     @cached_property
     def col_index(self):
-        """Column index for `Records.records`."""
+        """Column index for `Records.records`.
+
+        See `MappedArray.col_index` and `vectorbt.records.nb.record_col_index_nb`."""
+        if self._col_index is not None:
+            return self._col_index
         return nb.record_col_index_nb(self.records_arr, len(self.wrapper.columns))
 
+    def get_col_index(self, group_by=None):
+        """Column index of columns or groups (if grouped)."""
+        if self.wrapper.grouper.is_grouped(group_by=group_by):
+            group_counts = self.wrapper.grouper.get_group_counts(group_by=group_by)
+            return nb.group_col_index_nb(self.col_index, group_counts)
+        return self.col_index
+
     def filter_by_mask(self, mask, group_by=None, **kwargs):
         """Return a new class instance, filtered by mask."""
         if self.wrapper.grouper.is_grouping_changed(group_by=group_by):
@@ -863,6 +984,7 @@ class Records(Configured, PandasIndexer):
         return self.copy(
             wrapper=wrapper,
             records_arr=self.records_arr[mask],
+            col_index=nb.filter_col_index_nb(self.col_index, mask),
             **kwargs
         )
 
@@ -888,6 +1010,7 @@ class Records(Configured, PandasIndexer):
             mapped_arr,
             self.records_arr['col'],
             idx_arr=idx_arr,
+            col_index=self.col_index,
             **kwargs
         )
 
@@ -908,6 +1031,7 @@ class Records(Configured, PandasIndexer):
             self.records_arr[field],
             self.records_arr['col'],
             idx_arr=idx_arr,
+            col_index=self.col_index,
             **kwargs
         )
 
@@ -934,6 +1058,7 @@ class Records(Configured, PandasIndexer):
             a,
             self.records_arr['col'],
             idx_arr=idx_arr,
+            col_index=self.col_index,
             **kwargs
         )
 
@@ -20,11 +20,13 @@ from vectorbt.records import nb
 
 def _indexing_func(obj, pd_indexing_func):
     """Perform indexing on `BaseDrawdowns`."""
-    new_wrapper, new_records_arr, _, col_idxs = indexing_on_records_meta(obj, pd_indexing_func)
+    new_wrapper, new_records_arr, new_col_index, _, col_idxs = \
+        indexing_on_records_meta(obj, pd_indexing_func)
     new_ts = new_wrapper.wrap(obj.ts.values[:, col_idxs], group_by=False)
     return obj.copy(
         wrapper=new_wrapper,
         records_arr=new_records_arr,
+        col_index=new_col_index,
         ts=new_ts
     )
 
@@ -34,19 +36,21 @@ class BaseDrawdowns(Records):
 
     Requires `records_arr` to have all fields defined in `vectorbt.records.enums.drawdown_dt`."""
 
-    def __init__(self, wrapper, records_arr, ts, idx_field='end_idx'):
+    def __init__(self, wrapper, records_arr, ts, idx_field='end_idx', col_index=None):
         Records.__init__(
             self,
             wrapper,
             records_arr,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         Configured.__init__(
             self,
             wrapper=wrapper,
-            records_arr=records_arr,
+            records_arr=self.records_arr,
             ts=ts,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         self._ts = ts
 
@@ -30,11 +30,13 @@ from vectorbt.records.enums import (
 
 def indexing_on_events_meta(obj, pd_indexing_func):
     """Perform indexing on `BaseEvents` and also return metadata."""
-    new_wrapper, new_records_arr, group_idxs, col_idxs = indexing_on_records_meta(obj, pd_indexing_func)
+    new_wrapper, new_records_arr, new_col_index, group_idxs, col_idxs = \
+        indexing_on_records_meta(obj, pd_indexing_func)
     new_ref_price = new_wrapper.wrap(obj.close.values[:, col_idxs], group_by=False)
     return obj.copy(
         wrapper=new_wrapper,
         records_arr=new_records_arr,
+        col_index=new_col_index,
         close=new_ref_price
     ), group_idxs, col_idxs
 
@@ -50,19 +52,21 @@ def _indexing_func(obj, pd_indexing_func):
 class BaseEvents(Records):
     """Extends `Records` for working with event records."""
 
-    def __init__(self, wrapper, records_arr, close, idx_field='exit_idx'):
+    def __init__(self, wrapper, records_arr, close, idx_field='exit_idx', col_index=None):
         Records.__init__(
             self,
             wrapper,
             records_arr,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         Configured.__init__(
             self,
             wrapper=wrapper,
-            records_arr=records_arr,
+            records_arr=self.records_arr,
             close=close,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         self.close = close
 
@@ -358,20 +362,20 @@ class BaseEventsByResult(BaseEvents):
         )
 
     @cached_method
-    def win_rate(self, group_by=None, **kwargs):
+    def win_rate(self, group_by=None, parallel=None, **kwargs):
         """Rate of profitable events."""
-        win_count = to_1d(self.winning.count(group_by=group_by), raw=True)
-        total_count = to_1d(self.count(group_by=group_by), raw=True)
+        win_count = to_1d(self.winning.count(group_by=group_by, parallel=parallel), raw=True)
+        total_count = to_1d(self.count(group_by=group_by, parallel=parallel), raw=True)
         return self.wrapper.wrap_reduced(win_count / total_count, group_by=group_by, **kwargs)
 
     @cached_method
-    def profit_factor(self, group_by=None, **kwargs):
+    def profit_factor(self, group_by=None, parallel=None, **kwargs):
         """Profit factor."""
-        total_win = to_1d(self.winning.pnl.sum(group_by=group_by), raw=True)
-        total_loss = to_1d(self.losing.pnl.sum(group_by=group_by), raw=True)
+        total_win = to_1d(self.winning.pnl.sum(group_by=group_by, parallel=parallel), raw=True)
+        total_loss = to_1d(self.losing.pnl.sum(group_by=group_by, parallel=parallel), raw=True)
 
         # Otherwise columns with only wins or losses will become NaNs
-        has_values = to_1d(self.count(group_by=group_by), raw=True) > 0
+        has_values = to_1d(self.count(group_by=group_by, parallel=parallel), raw=True) > 0
         total_win[np.isnan(total_win) & has_values] = 0.
         total_loss[np.isnan(total_loss) & has_values] = 0.
 
@@ -379,14 +383,14 @@ class BaseEventsByResult(BaseEvents):
         return self.wrapper.wrap_reduced(profit_factor, group_by=group_by, **kwargs)
 
     @cached_method
-    def expectancy(self, group_by=None, **kwargs):
+    def expectancy(self, group_by=None, parallel=None, **kwargs):
         """Average profitability."""
-        win_rate = to_1d(self.win_rate(group_by=group_by), raw=True)
-        avg_win = to_1d(self.winning.pnl.mean(group_by=group_by), raw=True)
-        avg_loss = to_1d(self.losing.pnl.mean(group_by=group_by), raw=True)
+        win_rate = to_1d(self.win_rate(group_by=group_by, parallel=parallel), raw=True)
+        avg_win = to_1d(self.winning.pnl.mean(group_by=group_by, parallel=parallel), raw=True)
+        avg_loss = to_1d(self.losing.pnl.mean(group_by=group_by, parallel=parallel), raw=True)
 
         # Otherwise columns with only wins or losses will become NaNs
-        has_values = to_1d(self.count(group_by=group_by), raw=True) > 0
+        has_values = to_1d(self.count(group_by=group_by, parallel=parallel), raw=True) > 0
         avg_win[np.isnan(avg_win) & has_values] = 0.
         avg_loss[np.isnan(avg_loss) & has_values] = 0.
 
@@ -394,11 +398,11 @@ class BaseEventsByResult(BaseEvents):
         return self.wrapper.wrap_reduced(expectancy, group_by=group_by, **kwargs)
 
     @cached_method
-    def sqn(self, group_by=None, **kwargs):
+    def sqn(self, group_by=None, parallel=None, **kwargs):
         """System Quality Number (SQN)."""
-        count = to_1d(self.count(group_by=group_by), raw=True)
-        pnl_mean = to_1d(self.pnl.mean(group_by=group_by), raw=True)
-        pnl_std = to_1d(self.pnl.std(group_by=group_by), raw=True)
+        count = to_1d(self.count(group_by=group_by, parallel=parallel), raw=True)
+        pnl_mean = to_1d(self.pnl.mean(group_by=group_by, parallel=parallel), raw=True)
+        pnl_std = to_1d(self.pnl.std(group_by=group_by, parallel=parallel), raw=True)
         sqn = np.sqrt(count) * pnl_mean / pnl_std
         return self.wrapper.wrap_reduced(sqn, group_by=group_by, **kwargs)
 
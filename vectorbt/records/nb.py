@@ -10,7 +10,7 @@
     Records should remain the order they were created in."""
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from vectorbt.utils.math import is_close_nb
 from vectorbt.records.enums import (
@@ -54,10 +54,17 @@ def record_col_index_nb(records, n_cols):
 
 
 @njit(cache=True)
-def select_record_cols_nb(records, col_index, new_cols):
-    """Select columns of `records` given column indices `col_index`."""
+def select_record_cols_with_index_nb(records, col_index, new_cols):
+    """Select columns of `records` given column indices `col_index`.
+
+    Returns new records and their column index. Takes time proportional to the number of
+    selected records and columns."""
     col_index = col_index[new_cols]
-    new_n = np.sum(col_index[:, 1] - col_index[:, 0])
+    new_col_index = np.full((new_cols.shape[0], 2), -1, dtype=np.int_)
+    new_n = 0
+    for c in range(new_cols.shape[0]):
+        if col_index[c, 0] != -1:
+            new_n += col_index[c, 1] - col_index[c, 0]
     out = np.empty(new_n, dtype=records.dtype)
     j = 0
     for c in range(new_cols.shape[0]):
@@ -68,8 +75,45 @@ def select_record_cols_nb(records, col_index, new_cols):
         col_records = np.copy(records[from_i:to_i])
         col_records['col'][:] = c  # don't forget to assign new column indices
         out[j:j + col_records.shape[0]] = col_records
+        new_col_index[c, 0] = j
+        new_col_index[c, 1] = j + col_records.shape[0]
         j += col_records.shape[0]
-    return out
+    return out, new_col_index
+
+
+@njit(cache=True)
+def select_record_cols_nb(records, col_index, new_cols):
+    """Select columns of `records` given column indices `col_index`.
+
+    See `select_record_cols_with_index_nb`."""
+    return select_record_cols_with_index_nb(records, col_index, new_cols)[0]
+
+
+@njit(cache=True)
+def merge_records_nb(records1, col_index1, records2, col_index2):
+    """Merge two record arrays sorted by column given their column indices.
+
+    Within each column, records of `records2` are placed after records of `records1`.
+    Both arrays must be of the same data type.
+
+    Returns new records and their column index. Takes time proportional to the number of records."""
+    out = np.empty(records1.shape[0] + records2.shape[0], dtype=records1.dtype)
+    new_col_index = np.full(col_index1.shape, -1, dtype=np.int_)
+    r = 0
+    for col in range(col_index1.shape[0]):
+        from_r = r
+        if col_index1[col, 0] != -1:
+            n = col_index1[col, 1] - col_index1[col, 0]
+            out[r:r + n] = records1[col_index1[col, 0]:col_index1[col, 1]]
+            r += n
+        if col_index2[col, 0] != -1:
+            n = col_index2[col, 1] - col_index2[col, 0]
+            out[r:r + n] = records2[col_index2[col, 0]:col_index2[col, 1]]
+            r += n
+        if r > from_r:
+            new_col_index[col, 0] = from_r
+            new_col_index[col, 1] = r
+    return out, new_col_index
 
 
 # ############# Indexing (mapped arrays) ############# #
@@ -95,12 +139,17 @@ def mapped_col_index_nb(mapped_arr, col_arr, n_cols):
 
 
 @njit(cache=True)
-def select_mapped_cols_nb(col_arr, col_index, new_cols):
+def select_mapped_cols_with_index_nb(col_arr, col_index, new_cols):
     """Return indices of elements corresponding to columns in `new_cols`.
 
-    In contrast to `select_record_cols_nb`, returns new indices and new column array."""
+    In contrast to `select_record_cols_with_index_nb`, returns new indices, new column array,
+    and new column index."""
     col_index = col_index[new_cols]
-    new_n = np.sum(col_index[:, 1] - col_index[:, 0])
+    new_col_index = np.full((new_cols.shape[0], 2), -1, dtype=np.int_)
+    new_n = 0
+    for c in range(new_cols.shape[0]):
+        if col_index[c, 0] != -1:
+            new_n += col_index[c, 1] - col_index[c, 0]
     mapped_arr_result = np.empty(new_n, dtype=np.int_)
     col_arr_result = np.empty(new_n, dtype=np.int_)
     j = 0
@@ -112,10 +161,65 @@ def select_mapped_cols_nb(col_arr, col_index, new_cols):
         rang = np.arange(from_i, to_i)
         mapped_arr_result[j:j + rang.shape[0]] = rang
         col_arr_result[j:j + rang.shape[0]] = c
+        new_col_index[c, 0] = j
+        new_col_index[c, 1] = j + rang.shape[0]
         j += rang.shape[0]
+    return mapped_arr_result, col_arr_result, new_col_index
+
+
+@njit(cache=True)
+def select_mapped_cols_nb(col_arr, col_index, new_cols):
+    """Return indices of elements corresponding to columns in `new_cols`.
+
+    In contrast to `select_record_cols_nb`, returns new indices and new column array.
+    See `select_mapped_cols_with_index_nb`."""
+    mapped_arr_result, col_arr_result, _ = select_mapped_cols_with_index_nb(col_arr, col_index, new_cols)
     return mapped_arr_result, col_arr_result
 
 
+# ############# Column index ############# #
+
+
+@njit(cache=True)
+def filter_col_index_nb(col_index, mask):
+    """Column index of elements that are left after applying `mask`.
+
+    Elements must be sorted by column."""
+    cumsum = np.empty(mask.shape[0] + 1, dtype=np.int_)
+    cumsum[0] = 0
+    for r in range(mask.shape[0]):
+        cumsum[r + 1] = cumsum[r] + mask[r]
+    new_col_index = np.full(col_index.shape, -1, dtype=np.int_)
+    for col in range(col_index.shape[0]):
+        if col_index[col, 0] == -1:
+            continue
+        from_i = cumsum[col_index[col, 0]]
+        to_i = cumsum[col_index[col, 1]]
+        if to_i > from_i:
+            new_col_index[col, 0] = from_i
+            new_col_index[col, 1] = to_i
+    return new_col_index
+
+
+@njit(cache=True)
+def group_col_index_nb(col_index, group_counts):
+    """Column index of groups.
+
+    Since groups are coherent and sorted, elements of each group are contiguous."""
+    group_col_index = np.full((group_counts.shape[0], 2), -1, dtype=np.int_)
+    from_col = 0
+    for group in range(group_counts.shape[0]):
+        to_col = from_col + group_counts[group]
+        for col in range(from_col, to_col):
+            if col_index[col, 0] == -1:
+                continue
+            if group_col_index[group, 0] == -1:
+                group_col_index[group, 0] = col_index[col, 0]
+            group_col_index[group, 1] = col_index[col, 1]
+        from_col = to_col
+    return group_col_index
+
+
 # ############# Mapping (records) ############# #
 
 
@@ -137,25 +241,34 @@ def map_records_nb(records, map_func_nb, *args):
 def mapped_to_matrix_nb(mapped_arr, col_arr, idx_arr, target_shape, default_val):
     """Convert mapped array to the matrix form.
 
+    Builds the column index using `mapped_col_index_nb` and calls `mapped_to_matrix_indexed_nb`.
+
     !!! note
         Will raise an error if there are multiple values pointing to the same matrix element."""
+    col_index = mapped_col_index_nb(mapped_arr, col_arr, target_shape[1])
+    return mapped_to_matrix_indexed_nb(mapped_arr, col_index, idx_arr, target_shape, default_val)
+
+
+@njit(cache=True)
+def mapped_to_matrix_indexed_nb(mapped_arr, col_index, idx_arr, target_shape, default_val):
+    """Same as `mapped_to_matrix_nb` but takes the column index `col_index` of `mapped_arr`
+    (see `mapped_col_index_nb`) instead of `col_arr`."""
 
     out = np.full(target_shape, default_val, dtype=np.float_)
-    last_idx = -1
-    last_col = -1
-    for r in range(mapped_arr.shape[0]):
-        cur_idx = idx_arr[r]
-        cur_col = col_arr[r]
-        if cur_col == last_col:
+    for col in range(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        last_idx = -1
+        for r in range(from_r, to_r):
+            cur_idx = idx_arr[r]
             if cur_idx == last_idx:
                 raise ValueError("Multiple values are pointing to the same matrix element")
             if cur_idx < last_idx:
-                raise ValueError("col_arr and idx_arr must be sorted")
-        if cur_col < last_col:
-            raise ValueError("col_arr and idx_arr must be sorted")
-        out[cur_idx, cur_col] = mapped_arr[r]
-        last_idx = cur_idx
-        last_col = cur_col
+                raise ValueError("idx_arr must be sorted within each column")
+            out[cur_idx, col] = mapped_arr[r]
+            last_idx = cur_idx
     return out
 
 
@@ -168,24 +281,41 @@ def reduce_mapped_nb(mapped_arr, col_arr, n_cols, default_val, reduce_func_nb, *
     Faster than `mapped_to_matrix_nb` and `vbt.*` used together, and also
     requires less memory. But does not take advantage of caching.
 
+    Builds the column index using `mapped_col_index_nb` and calls `reduce_mapped_indexed_nb`.
+
     `reduce_func_nb` must accept index of the current column, mapped array and `*args`,
     and return a scalar value."""
-    out = np.full(n_cols, default_val, dtype=np.float_)
-    from_r = 0
-    prev_col = -1
-    
-    for r in range(mapped_arr.shape[0]):
-        col = col_arr[r]
-        if col < prev_col:
-            raise ValueError("col_arr must be sorted")
-        if col != prev_col:
-            if prev_col != -1:
-                # At the beginning of second column do reduce on the first
-                out[prev_col] = reduce_func_nb(prev_col, mapped_arr[from_r:r], *args)
-            from_r = r
-            prev_col = col
-        if r == len(mapped_arr) - 1:
-            out[col] = reduce_func_nb(col, mapped_arr[from_r:r + 1], *args)
+    col_index = mapped_col_index_nb(mapped_arr, col_arr, n_cols)
+    return reduce_mapped_indexed_nb(mapped_arr, col_index, default_val, reduce_func_nb, *args)
+
+
+@njit
+def reduce_mapped_indexed_nb(mapped_arr, col_index, default_val, reduce_func_nb, *args):
+    """Same as `reduce_mapped_nb` but takes the column index `col_index` of `mapped_arr`
+    (see `mapped_col_index_nb`) instead of `col_arr` and `n_cols`.
+
+    Columns without elements get `default_val`."""
+    out = np.full(col_index.shape[0], default_val, dtype=np.float_)
+    for col in range(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        out[col] = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_indexed_parallel_nb(mapped_arr, col_index, default_val, reduce_func_nb, *args):
+    """A parallel version of `reduce_mapped_indexed_nb`.
+
+    Columns are distributed across threads using `prange`. `reduce_func_nb` must be thread-safe."""
+    out = np.full(col_index.shape[0], default_val, dtype=np.float_)
+    for col in prange(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r != -1 and to_r != -1:
+            out[col] = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
     return out
 
 
@@ -197,24 +327,36 @@ def reduce_mapped_to_idx_nb(mapped_arr, col_arr, idx_arr, n_cols, default_val, r
 
     !!! note
         Must return integers or raise an exception."""
-    out = np.full(n_cols, default_val, dtype=np.float_)
-    from_r = 0
-    prev_col = -1
+    col_index = mapped_col_index_nb(mapped_arr, col_arr, n_cols)
+    return reduce_mapped_to_idx_indexed_nb(mapped_arr, col_index, idx_arr, default_val, reduce_func_nb, *args)
 
-    for r in range(mapped_arr.shape[0]):
-        col = col_arr[r]
-        if col < prev_col:
-            raise ValueError("col_arr must be sorted")
-        if col != prev_col:
-            if prev_col != -1:
-                # At the beginning of second column do reduce on the first
-                col_result = reduce_func_nb(prev_col, mapped_arr[from_r:r], *args)
-                out[prev_col] = idx_arr[from_r:r][col_result]
-            from_r = r
-            prev_col = col
-        if r == len(mapped_arr) - 1:
-            col_result = reduce_func_nb(col, mapped_arr[from_r:r + 1], *args)
-            out[col] = idx_arr[from_r:r + 1][col_result]
+
+@njit
+def reduce_mapped_to_idx_indexed_nb(mapped_arr, col_index, idx_arr, default_val, reduce_func_nb, *args):
+    """Same as `reduce_mapped_to_idx_nb` but takes the column index `col_index`.
+
+    See `reduce_mapped_indexed_nb`."""
+    out = np.full(col_index.shape[0], default_val, dtype=np.float_)
+    for col in range(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        col_result = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+        out[col] = idx_arr[from_r:to_r][col_result]
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_idx_indexed_parallel_nb(mapped_arr, col_index, idx_arr, default_val, reduce_func_nb, *args):
+    """A parallel version of `reduce_mapped_to_idx_indexed_nb`."""
+    out = np.full(col_index.shape[0], default_val, dtype=np.float_)
+    for col in prange(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r != -1 and to_r != -1:
+            col_result = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+            out[col] = idx_arr[from_r:to_r][col_result]
     return out
 
 
@@ -223,22 +365,34 @@ def reduce_mapped_to_array_nb(mapped_arr, col_arr, n_cols, n_rows, default_val,
     """Reduce mapped array by column to an array.
 
     `reduce_func_nb` same as for `reduce_mapped_nb` but must return an array."""
-    out = np.full((n_rows, n_cols), default_val, dtype=np.float_)
-    from_r = 0
-    prev_col = -1
-    
-    for r in range(mapped_arr.shape[0]):
-        col = col_arr[r]
-        if col < prev_col:
-            raise ValueError("col_arr must be sorted")
-        if col != prev_col:
-            if prev_col != -1:
-                # At the beginning of second column do reduce on the first
-                out[:, prev_col] = reduce_func_nb(prev_col, mapped_arr[from_r:r], *args)
-            from_r = r
-            prev_col = col
-        if r == len(mapped_arr) - 1:
-            out[:, col] = reduce_func_nb(col, mapped_arr[from_r:r + 1], *args)
+    col_index = mapped_col_index_nb(mapped_arr, col_arr, n_cols)
+    return reduce_mapped_to_array_indexed_nb(mapped_arr, col_index, n_rows, default_val, reduce_func_nb, *args)
+
+
+@njit
+def reduce_mapped_to_array_indexed_nb(mapped_arr, col_index, n_rows, default_val, reduce_func_nb, *args):
+    """Same as `reduce_mapped_to_array_nb` but takes the column index `col_index`.
+
+    See `reduce_mapped_indexed_nb`."""
+    out = np.full((n_rows, col_index.shape[0]), default_val, dtype=np.float_)
+    for col in range(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        out[:, col] = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_array_indexed_parallel_nb(mapped_arr, col_index, n_rows, default_val, reduce_func_nb, *args):
+    """A parallel version of `reduce_mapped_to_array_indexed_nb`."""
+    out = np.full((n_rows, col_index.shape[0]), default_val, dtype=np.float_)
+    for col in prange(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r != -1 and to_r != -1:
+            out[:, col] = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
     return out
 
 
@@ -250,24 +404,39 @@ def reduce_mapped_to_idx_array_nb(mapped_arr, col_arr, idx_arr, n_cols, n_rows,
 
     !!! note
         Must return integers or raise an exception."""
-    out = np.full((n_rows, n_cols), default_val, dtype=np.float_)
-    from_r = 0
-    prev_col = -1
+    col_index = mapped_col_index_nb(mapped_arr, col_arr, n_cols)
+    return reduce_mapped_to_idx_array_indexed_nb(
+        mapped_arr, col_index, idx_arr, n_rows, default_val, reduce_func_nb, *args)
 
-    for r in range(mapped_arr.shape[0]):
-        col = col_arr[r]
-        if col < prev_col:
-            raise ValueError("col_arr must be sorted")
-        if col != prev_col:
-            if prev_col != -1:
-                # At the beginning of second column do reduce on the first
-                col_result = reduce_func_nb(prev_col, mapped_arr[from_r:r], *args)
-                out[:, prev_col] = idx_arr[from_r:r][col_result]
-            from_r = r
-            prev_col = col
-        if r == len(mapped_arr) - 1:
-            col_result = reduce_func_nb(col, mapped_arr[from_r:r + 1], *args)
-            out[:, col] = idx_arr[from_r:r + 1][col_result]
+
+@njit
+def reduce_mapped_to_idx_array_indexed_nb(mapped_arr, col_index, idx_arr, n_rows, default_val,
+                                          reduce_func_nb, *args):
+    """Same as `reduce_mapped_to_idx_array_nb` but takes the column index `col_index`.
+
+    See `reduce_mapped_indexed_nb`."""
+    out = np.full((n_rows, col_index.shape[0]), default_val, dtype=np.float_)
+    for col in range(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r == -1 or to_r == -1:
+            continue
+        col_result = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+        out[:, col] = idx_arr[from_r:to_r][col_result]
+    return out
+
+
+@njit(parallel=True)
+def reduce_mapped_to_idx_array_indexed_parallel_nb(mapped_arr, col_index, idx_arr, n_rows, default_val,
+                                                   reduce_func_nb, *args):
+    """A parallel version of `reduce_mapped_to_idx_array_indexed_nb`."""
+    out = np.full((n_rows, col_index.shape[0]), default_val, dtype=np.float_)
+    for col in prange(col_index.shape[0]):
+        from_r = col_index[col, 0]
+        to_r = col_index[col, 1]
+        if from_r != -1 and to_r != -1:
+            col_result = reduce_func_nb(col, mapped_arr[from_r:to_r], *args)
+            out[:, col] = idx_arr[from_r:to_r][col_result]
     return out
 
 
@@ -15,11 +15,13 @@ from vectorbt.records.enums import OrderSide, order_dt
 
 def indexing_on_orders_meta(obj, pd_indexing_func):
     """Perform indexing on `BaseOrders`."""
-    new_wrapper, new_records_arr, group_idxs, col_idxs = indexing_on_records_meta(obj, pd_indexing_func)
+    new_wrapper, new_records_arr, new_col_index, group_idxs, col_idxs = \
+        indexing_on_records_meta(obj, pd_indexing_func)
     new_ref_price = new_wrapper.wrap(obj.close.values[:, col_idxs], group_by=False)
     return obj.copy(
         wrapper=new_wrapper,
         records_arr=new_records_arr,
+        col_index=new_col_index,
         close=new_ref_price
     ), group_idxs, col_idxs
 
@@ -50,19 +52,21 @@ class BaseOrders(Records):
         1
         ```"""
 
-    def __init__(self, wrapper, records_arr, close, idx_field='idx'):
+    def __init__(self, wrapper, records_arr, close, idx_field='idx', col_index=None):
         Records.__init__(
             self,
             wrapper,
             records_arr,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         Configured.__init__(
             self,
             wrapper=wrapper,
-            records_arr=records_arr,
+            records_arr=self.records_arr,
             close=close,
-            idx_field=idx_field
+            idx_field=idx_field,
+            col_index=col_index
         )
         self.close = close
 
@@ -28,6 +28,10 @@ The accessors extend `vectorbt.generic.accessors`.
 0.2
 ```
 
+## Enums
+
+`vectorbt.returns.enums` defines schemas for working with returns.
+
 ## Numba-compiled functions
 
 `vectorbt.returns.nb` provides an arsenal of Numba-compiled functions that are used by accessors
@@ -39,3 +43,4 @@ and for measuring portfolio performance. These only accept NumPy arrays and othe
 array([0.2, 0.32, 0.32, 0.188, -0.0496])
 ```"""
 
+from vectorbt.returns.enums import ReturnsMetric
@@ -21,6 +21,7 @@ from vectorbt.generic.accessors import (
 )
 from vectorbt.utils.datetime import freq_delta, DatetimeTypes
 from vectorbt.returns import nb, metrics
+from vectorbt.returns.enums import ReturnsMetric
 
 
 class Returns_Accessor(Generic_Accessor):
@@ -28,11 +29,11 @@ class Returns_Accessor(Generic_Accessor):
 
     Accessible through `pd.Series.vbt.returns` and `pd.DataFrame.vbt.returns`."""
 
-    def __init__(self, obj, freq=None, year_freq=None):
+    def __init__(self, obj, freq=None, year_freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Generic_Accessor.__init__(self, obj, freq=freq)
+        Generic_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
         # Set year frequency
         self._year_freq = year_freq
@@ -257,11 +258,158 @@ class Returns_Accessor(Generic_Accessor):
         """Total maximum drawdown (MDD)."""
         return self.wrap_reduced(nb.max_drawdown_nb(self.to_2d_array()))
 
+    metric_names = {
+        'total': ReturnsMetric.Total,
+        'annualized': ReturnsMetric.Annualized,
+        'annualized_volatility': ReturnsMetric.AnnualizedVolatility,
+        'calmar_ratio': ReturnsMetric.CalmarRatio,
+        'omega_ratio': ReturnsMetric.OmegaRatio,
+        'sharpe_ratio': ReturnsMetric.SharpeRatio,
+        'downside_risk': ReturnsMetric.DownsideRisk,
+        'sortino_ratio': ReturnsMetric.SortinoRatio,
+        'tail_ratio': ReturnsMetric.TailRatio,
+        'value_at_risk': ReturnsMetric.ValueAtRisk,
+        'conditional_value_at_risk': ReturnsMetric.ConditionalValueAtRisk,
+        'max_drawdown': ReturnsMetric.MaxDrawdown
+    }
+    """Names accepted by `Returns_Accessor.metrics` mapped to `vectorbt.returns.enums.ReturnsMetric`."""
+
+    def metrics(self, names=None, risk_free=0., required_return=0., levy_alpha=2.0, cutoff=0.05):
+        """Compute multiple metrics at once.
+
+        Args:
+            names (list of str): Names of the metrics to compute.
+
+                Each name should be a key in `Returns_Accessor.metric_names` and corresponds to the
+                method of the same name. If None, computes all of them.
+            risk_free (float or array_like): See `Returns_Accessor.sharpe_ratio`.
+            required_return (float or array_like): See `Returns_Accessor.sortino_ratio`.
+            levy_alpha (float or array_like): See `Returns_Accessor.annualized_volatility`.
+            cutoff (float or array_like): See `Returns_Accessor.value_at_risk`.
+
+        Much faster than calling each method separately since all metrics are computed
+        in a single pass over each column. See `vectorbt.returns.nb.metrics_nb`.
+
+        Returns a Series with one value per metric, or a DataFrame with one row per metric and
+        one column per column.
+
+        ## Example
+
+        ```python-repl
+        >>> import pandas as pd
+        >>> import vectorbt as vbt
+
+        >>> returns = pd.Series([0.2, 0.1, 0, -0.1, -0.2], index=pd.date_range('2020', periods=5))
+        >>> returns.vbt.returns.metrics(['total', 'max_drawdown'])
+        total          -0.0496
+        max_drawdown   -0.2800
+        dtype: float64
+        ```"""
+        if names is None:
+            names = list(self.metric_names.keys())
+        for name in names:
+            checks.assert_in(name, self.metric_names)
+        metric_ids = np.asarray([self.metric_names[name] for name in names], dtype=np.int_)
+        risk_free = np.broadcast_to(risk_free, (len(self.columns),))
+        required_return = np.broadcast_to(required_return, (len(self.columns),))
+        levy_alpha = np.broadcast_to(levy_alpha, (len(self.columns),))
+        cutoff = np.broadcast_to(cutoff, (len(self.columns),))
+        out = nb.metrics_nb(
+            self.to_2d_array(),
+            self.ann_factor,
+            metric_ids,
+            risk_free,
+            required_return,
+            levy_alpha,
+            cutoff
+        )
+        return self.wrap_reduced(out, index=pd.Index(names))
+
+    # ############# Rolling and expanding metrics ############# #
+
+    def rolling_annualized(self, window, minp=None):
+        """Rolling version of `Returns_Accessor.annualized`.
+
+        See `vectorbt.returns.nb.rolling_annualized_return_nb`."""
+        return self.wrap(nb.rolling_annualized_return_nb(self.to_2d_array(), window, self.ann_factor, minp=minp))
+
+    def expanding_annualized(self, minp=1):
+        """Expanding version of `Returns_Accessor.annualized`."""
+        return self.wrap(nb.expanding_annualized_return_nb(self.to_2d_array(), self.ann_factor, minp=minp))
+
+    def rolling_annualized_volatility(self, window, minp=None, levy_alpha=2.0):
+        """Rolling version of `Returns_Accessor.annualized_volatility`."""
+        levy_alpha = np.broadcast_to(levy_alpha, (len(self.columns),))
+        return self.wrap(nb.rolling_annualized_volatility_nb(
+            self.to_2d_array(), window, self.ann_factor, minp, levy_alpha))
+
+    def expanding_annualized_volatility(self, minp=1, levy_alpha=2.0):
+        """Expanding version of `Returns_Accessor.annualized_volatility`."""
+        levy_alpha = np.broadcast_to(levy_alpha, (len(self.columns),))
+        return self.wrap(nb.expanding_annualized_volatility_nb(
+            self.to_2d_array(), self.ann_factor, minp, levy_alpha))
+
+    def rolling_calmar_ratio(self, window, minp=None):
+        """Rolling version of `Returns_Accessor.calmar_ratio`."""
+        return self.wrap(nb.rolling_calmar_ratio_nb(self.to_2d_array(), window, self.ann_factor, minp=minp))
+
+    def expanding_calmar_ratio(self, minp=1):
+        """Expanding version of `Returns_Accessor.calmar_ratio`."""
+        return self.wrap(nb.expanding_calmar_ratio_nb(self.to_2d_array(), self.ann_factor, minp=minp))
+
+    def rolling_sharpe_ratio(self, window, minp=None, risk_free=0.):
+        """Rolling version of `Returns_Accessor.sharpe_ratio`."""
+        risk_free = np.broadcast_to(risk_free, (len(self.columns),))
+        return self.wrap(nb.rolling_sharpe_ratio_nb(
+            self.to_2d_array(), window, self.ann_factor, minp, risk_free))
+
+    def expanding_sharpe_ratio(self, minp=1, risk_free=0.):
+        """Expanding version of `Returns_Accessor.sharpe_ratio`."""
+        risk_free = np.broadcast_to(risk_free, (len(self.columns),))
+        return self.wrap(nb.expanding_sharpe_ratio_nb(
+            self.to_2d_array(), self.ann_factor, minp, risk_free))
+
+    def rolling_downside_risk(self, window, minp=None, required_return=0.):
+        """Rolling version of `Returns_Accessor.downside_risk`."""
+        required_return = np.broadcast_to(required_return, (len(self.columns),))
+        return self.wrap(nb.rolling_downside_risk_nb(
+            self.to_2d_array(), window, self.ann_factor, minp, required_return))
+
+    def expanding_downside_risk(self, minp=1, required_return=0.):
+        """Expanding version of `Returns_Accessor.downside_risk`."""
+        required_return = np.broadcast_to(required_return, (len(self.columns),))
+        return self.wrap(nb.expanding_downside_risk_nb(
+            self.to_2d_array(), self.ann_factor, minp, required_return))
+
+    def rolling_sortino_ratio(self, window, minp=None, required_return=0.):
+        """Rolling version of `Returns_Accessor.sortino_ratio`."""
+        required_return = np.broadcast_to(required_return, (len(self.columns),))
+        return self.wrap(nb.rolling_sortino_ratio_nb(
+            self.to_2d_array(), window, self.ann_factor, minp, required_return))
+
+    def expanding_sortino_ratio(self, minp=1, required_return=0.):
+        """Expanding version of `Returns_Accessor.sortino_ratio`."""
+        required_return = np.broadcast_to(required_return, (len(self.columns),))
+        return self.wrap(nb.expanding_sortino_ratio_nb(
+            self.to_2d_array(), self.ann_factor, minp, required_return))
+
+    def rolling_max_drawdown(self, window, minp=None):
+        """Rolling version of `Returns_Accessor.max_drawdown`.
+
+        See `vectorbt.returns.nb.rolling_max_drawdown_nb`."""
+        return self.wrap(nb.rolling_max_drawdown_nb(self.to_2d_array(), window, minp=minp))
+
+    def expanding_max_drawdown(self, minp=1):
+        """Expanding version of `Returns_Accessor.max_drawdown`."""
+        return self.wrap(nb.expanding_max_drawdown_nb(self.to_2d_array(), minp=minp))
+
     def drawdowns(self, **kwargs):
         """Generate drawdown records of cumulative returns.
 
         See `vectorbt.records.drawdowns.Drawdowns`."""
-        return self.cumulative(start_value=1.).vbt(freq=self.freq).drawdowns(**kwargs)
+        start_value = np.broadcast_to(1., (len(self.columns),))
+        cum_returns = self.wrap(nb.cum_returns_nb(self.to_2d_array(), start_value), to_pd=True)
+        return cum_returns.vbt(freq=self.freq).drawdowns(**kwargs)
 
 
 @register_series_accessor('returns')
@@ -270,12 +418,12 @@ class Returns_SRAccessor(Returns_Accessor, Generic_SRAccessor):
 
     Accessible through `pd.Series.vbt.returns`."""
 
-    def __init__(self, obj, freq=None, year_freq=None):
+    def __init__(self, obj, freq=None, year_freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Generic_SRAccessor.__init__(self, obj, freq=freq)
-        Returns_Accessor.__init__(self, obj, freq=freq, year_freq=year_freq)
+        Generic_SRAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Returns_Accessor.__init__(self, obj, freq=freq, year_freq=year_freq, to_pd=to_pd)
 
 
 @register_dataframe_accessor('returns')
@@ -284,9 +432,9 @@ class Returns_DFAccessor(Returns_Accessor, Generic_DFAccessor):
 
     Accessible through `pd.DataFrame.vbt.returns`."""
 
-    def __init__(self, obj, freq=None, year_freq=None):
+    def __init__(self, obj, freq=None, year_freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Generic_DFAccessor.__init__(self, obj, freq=freq)
-        Returns_Accessor.__init__(self, obj, freq=freq, year_freq=year_freq)
+        Generic_DFAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Returns_Accessor.__init__(self, obj, freq=freq, year_freq=year_freq, to_pd=to_pd)
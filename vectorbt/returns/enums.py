@@ -0,0 +1,33 @@
+"""Named tuples and enumerated types."""
+
+from collections import namedtuple
+import json
+
+__pdoc__ = {}
+
+# We use namedtuple for enums and classes to be able to use them in Numba
+
+# ############# ReturnsMetric ############# #
+
+ReturnsMetric = namedtuple('ReturnsMetric', [
+    'Total',
+    'Annualized',
+    'AnnualizedVolatility',
+    'CalmarRatio',
+    'OmegaRatio',
+    'SharpeRatio',
+    'DownsideRisk',
+    'SortinoRatio',
+    'TailRatio',
+    'ValueAtRisk',
+    'ConditionalValueAtRisk',
+    'MaxDrawdown'
+])(*range(12))
+"""_"""
+
+__pdoc__['ReturnsMetric'] = f"""Metric that can be computed by `vectorbt.returns.nb.metrics_nb`.
+
+```plaintext
+{json.dumps(dict(zip(ReturnsMetric._fields, ReturnsMetric)), indent=2)}
+```
+"""
@@ -11,7 +11,9 @@ import numpy as np
 from numba import njit
 
 from vectorbt.base.reshape_fns import flex_select_auto_nb
+from vectorbt.utils.array import select_ranks_nb
 from vectorbt.generic import nb as generic_nb
+from vectorbt.returns.enums import ReturnsMetric
 
 # ############# Financial risk and performance metrics ############# #
 
@@ -343,17 +345,73 @@ def alpha_nb(returns, factor_returns, ann_factor, risk_free):
     return out
 
 
+@njit(cache=True)
+def tail_metrics_1d_nb(returns, cutoff=0.05, calc_tail_ratio=True, calc_var=True, calc_cvar=True):
+    """Compute the tail ratio, the value at risk and the conditional value at risk at once.
+
+    Instead of sorting, copies the non-NaN returns once and partitions them in place around
+    the few ranks required by the selected metrics (see `vectorbt.utils.array.select_ranks_nb`),
+    which takes linear time on average. Metrics that are not selected are set to NaN.
+
+    Returns a tuple of results of `tail_ratio_1d_nb`, `value_at_risk_1d_nb` and
+    `conditional_value_at_risk_1d_nb`."""
+    n = returns.shape[0]
+    a = returns[~np.isnan(returns)]
+    m = a.shape[0]
+    tail_ratio = np.nan
+    var = np.nan
+    cvar = np.nan
+    if m < 1:
+        return tail_ratio, var, cvar
+
+    # Percentiles are interpolated linearly between two neighboring ranks
+    perc_q = np.array([95., 5., 100 * cutoff])
+    perc_lower = np.empty(3, dtype=np.int_)
+    perc_upper = np.empty(3, dtype=np.int_)
+    perc_frac = np.empty(3, dtype=np.float_)
+    for p in range(3):
+        rank = 1 + (m - 1) * perc_q[p] / 100
+        perc_lower[p] = int(np.floor(rank)) - 1
+        perc_upper[p] = min(perc_lower[p] + 1, m - 1)
+        perc_frac[p] = rank - np.floor(rank)
+    cvar_k = int((n - 1) * cutoff)
+    if cvar_k >= m:
+        # Mean would include NaN
+        calc_cvar = False
+
+    ranks = np.empty(7, dtype=np.int_)
+    ranks_n = 0
+    for p in range(3):
+        if (p < 2 and calc_tail_ratio) or (p == 2 and calc_var):
+            ranks[ranks_n] = perc_lower[p]
+            ranks[ranks_n + 1] = perc_upper[p]
+            ranks_n += 2
+    if calc_cvar:
+        ranks[ranks_n] = cvar_k
+        ranks_n += 1
+    select_ranks_nb(a, np.sort(ranks[:ranks_n]))
+
+    perc = np.empty(3, dtype=np.float_)
+    for p in range(3):
+        perc[p] = a[perc_lower[p]] * (1 - perc_frac[p]) + a[perc_upper[p]] * perc_frac[p]
+    if calc_tail_ratio:
+        if np.abs(perc[1]) == 0.:
+            tail_ratio = np.inf
+        else:
+            tail_ratio = np.abs(perc[0]) / np.abs(perc[1])
+    if calc_var:
+        var = perc[2]
+    if calc_cvar:
+        cvar = np.mean(a[:cvar_k + 1])
+    return tail_ratio, var, cvar
+
+
 @njit(cache=True)
 def tail_ratio_1d_nb(returns):
-    """See `empyrical.tail_ratio`."""
-    returns = returns[~np.isnan(returns)]
-    if len(returns) < 1:
-        return np.nan
-    perc_95 = np.abs(np.percentile(returns, 95))
-    perc_5 = np.abs(np.percentile(returns, 5))
-    if perc_5 == 0.:
-        return np.inf
-    return perc_95 / perc_5
+    """See `empyrical.tail_ratio`.
+
+    Uses `tail_metrics_1d_nb`."""
+    return tail_metrics_1d_nb(returns, calc_var=False, calc_cvar=False)[0]
 
 
 @njit(cache=True)
@@ -367,11 +425,10 @@ def tail_ratio_nb(returns):
 
 @njit(cache=True)
 def value_at_risk_1d_nb(returns, cutoff=0.05):
-    """See `empyrical.value_at_risk`."""
-    returns = returns[~np.isnan(returns)]
-    if len(returns) < 1:
-        return np.nan
-    return np.percentile(returns, 100 * cutoff)
+    """See `empyrical.value_at_risk`.
+
+    Uses `tail_metrics_1d_nb`."""
+    return tail_metrics_1d_nb(returns, cutoff=cutoff, calc_tail_ratio=False, calc_cvar=False)[1]
 
 
 @njit(cache=True)
@@ -389,9 +446,10 @@ def value_at_risk_nb(returns, cutoff):
 
 @njit(cache=True)
 def conditional_value_at_risk_1d_nb(returns, cutoff=0.05):
-    """See `empyrical.conditional_value_at_risk`."""
-    cutoff_index = int((len(returns) - 1) * cutoff)
-    return np.mean(np.partition(returns, cutoff_index)[:cutoff_index + 1])
+    """See `empyrical.conditional_value_at_risk`.
+
+    Uses `tail_metrics_1d_nb`."""
+    return tail_metrics_1d_nb(returns, cutoff=cutoff, calc_tail_ratio=False, calc_var=False)[2]
 
 
 @njit(cache=True)
@@ -407,6 +465,21 @@ def conditional_value_at_risk_nb(returns, cutoff):
     return out
 
 
+@njit(cache=True)
+def tail_metrics_nb(returns, cutoff):
+    """2-dim version of `tail_metrics_1d_nb`.
+
+    `cutoff_arr` should be an array of shape `returns.shape[1]`.
+
+    Returns an array of shape `(3, returns.shape[1])`."""
+    cutoff_arr = np.asarray(cutoff)
+    out = np.empty((3, returns.shape[1]), dtype=np.float_)
+    for col in range(returns.shape[1]):
+        _cutoff = flex_select_auto_nb(0, col, cutoff_arr, True)
+        out[0, col], out[1, col], out[2, col] = tail_metrics_1d_nb(returns[:, col], cutoff=_cutoff)
+    return out
+
+
 @njit(cache=True)
 def capture_1d_nb(returns, factor_returns, ann_factor):
     """See `empyrical.capture`."""
@@ -470,3 +543,565 @@ def down_capture_nb(returns, factor_returns, ann_factor):
     for col in range(returns.shape[1]):
         out[col] = down_capture_1d_nb(returns[:, col], factor_returns[:, col], ann_factor)
     return out
+
+
+# ############# Rolling and expanding metrics ############# #
+
+# Each rolling function returns the same value at row `i` as the respective full-period function
+# applied on the window `returns[max(0, i + 1 - window):i + 1]`, or NaN if the window has fewer
+# than `minp` non-NaN returns. All functions run in O(n) irrespective of `window`.
+
+
+@njit(cache=True)
+def rolling_annualized_return_1d_nb(returns, window, ann_factor, minp=None):
+    """Rolling version of `annualized_return_1d_nb`.
+
+    Keeps running sums of log absolute growth factors along with the number of negative
+    and zero factors, such that each window product is derived in constant time."""
+    if minp is None:
+        minp = window
+    if minp > window:
+        raise ValueError("minp must be <= window")
+    n = returns.shape[0]
+    out = np.empty(n, dtype=np.float_)
+    log_sum_arr = np.zeros(n + 1, dtype=np.float_)
+    neg_cnt_arr = np.zeros(n + 1, dtype=np.int_)
+    zero_cnt_arr = np.zeros(n + 1, dtype=np.int_)
+    cnt_arr = np.zeros(n + 1, dtype=np.int_)
+    for i in range(n):
+        log_sum_arr[i + 1] = log_sum_arr[i]
+        neg_cnt_arr[i + 1] = neg_cnt_arr[i]
+        zero_cnt_arr[i + 1] = zero_cnt_arr[i]
+        cnt_arr[i + 1] = cnt_arr[i]
+        if not np.isnan(returns[i]):
+            factor = 1. + returns[i]
+            cnt_arr[i + 1] += 1
+            if factor == 0.:
+                zero_cnt_arr[i + 1] += 1
+            else:
+                if factor < 0.:
+                    neg_cnt_arr[i + 1] += 1
+                log_sum_arr[i + 1] += np.log(np.abs(factor))
+        from_i = max(0, i + 1 - window)
+        cnt = cnt_arr[i + 1] - cnt_arr[from_i]
+        if cnt < minp or cnt == 0:
+            out[i] = np.nan
+            continue
+        if zero_cnt_arr[i + 1] - zero_cnt_arr[from_i] > 0:
+            end_value = 0.
+        else:
+            end_value = np.exp(log_sum_arr[i + 1] - log_sum_arr[from_i])
+            if (neg_cnt_arr[i + 1] - neg_cnt_arr[from_i]) % 2 == 1:
+                end_value = -end_value
+        out[i] = end_value ** (ann_factor / (i + 1 - from_i)) - 1
+    return out
+
+
+@njit(cache=True)
+def rolling_annualized_return_nb(returns, window, ann_factor, minp=None):
+    """2-dim version of `rolling_annualized_return_1d_nb`."""
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        out[:, col] = rolling_annualized_return_1d_nb(returns[:, col], window, ann_factor, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_annualized_volatility_1d_nb(returns, window, ann_factor, minp=None, levy_alpha=2.0):
+    """Rolling version of `annualized_volatility_1d_nb`."""
+    if minp is None:
+        minp = window
+    std = generic_nb.rolling_std_1d_nb(returns, window, minp=minp, ddof=1)
+    out = np.empty_like(std, dtype=np.float_)
+    for i in range(returns.shape[0]):
+        if min(i + 1, window) < 2:
+            out[i] = np.nan
+        else:
+            out[i] = std[i] * ann_factor ** (1.0 / levy_alpha)
+    return out
+
+
+@njit(cache=True)
+def rolling_annualized_volatility_nb(returns, window, ann_factor, minp, levy_alpha):
+    """2-dim version of `rolling_annualized_volatility_1d_nb`.
+
+    `levy_alpha` can be a scalar or an array of shape `returns.shape[1]`."""
+    levy_alpha_arr = np.asarray(levy_alpha)
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        _levy_alpha = flex_select_auto_nb(0, col, levy_alpha_arr, True)
+        out[:, col] = rolling_annualized_volatility_1d_nb(
+            returns[:, col], window, ann_factor, minp=minp, levy_alpha=_levy_alpha)
+    return out
+
+
+@njit(cache=True)
+def rolling_max_drawdown_1d_nb(returns, window, minp=None):
+    """Rolling version of `max_drawdown_1d_nb`.
+
+    Works on log cumulative returns: the maximum drawdown of a window is the lowest difference
+    between a value and any preceding value in the same window. Such differences can be merged
+    across adjacent segments, so the window is maintained as a queue made of two stacks with
+    aggregated maximum, minimum and lowest difference, which makes each step amortized O(1).
+
+    Growth factors of zero or below have no log: they are left out of the queue, and windows that
+    contain any of them are computed directly using `max_drawdown_1d_nb`."""
+    if minp is None:
+        minp = window
+    if minp > window:
+        raise ValueError("minp must be <= window")
+    n = returns.shape[0]
+    out = np.empty(n, dtype=np.float_)
+    cnt_arr = np.zeros(n + 1, dtype=np.int_)
+    non_pos_cnt_arr = np.zeros(n + 1, dtype=np.int_)
+
+    # Front stack holds the older elements, each along with the aggregate up to the newest front element
+    front_max = np.empty(window + 1, dtype=np.float_)
+    front_min = np.empty(window + 1, dtype=np.float_)
+    front_best = np.empty(window + 1, dtype=np.float_)
+    front_len = 0
+    # Back stack holds the newer elements in order of arrival, aggregated as a whole
+    back_vals = np.empty(window + 1, dtype=np.float_)
+    back_len = 0
+    back_max = -np.inf
+    back_min = np.inf
+    back_best = 0.
+
+    log_cum = 0.
+    for i in range(n):
+        cnt_arr[i + 1] = cnt_arr[i]
+        non_pos_cnt_arr[i + 1] = non_pos_cnt_arr[i]
+        if not np.isnan(returns[i]):
+            cnt_arr[i + 1] += 1
+            if returns[i] <= -1.:
+                non_pos_cnt_arr[i + 1] += 1
+            else:
+                log_cum += np.log1p(returns[i])
+
+        # Push the new value to the back stack
+        back_vals[back_len] = log_cum
+        back_len += 1
+        back_best = min(back_best, log_cum - back_max)
+        back_max = max(back_max, log_cum)
+        back_min = min(back_min, log_cum)
+
+        # Pop the oldest value if the window is full
+        if i >= window:
+            if front_len == 0:
+                # Move the back stack to the front stack, newest first
+                agg_max = -np.inf
+                agg_min = np.inf
+                agg_best = 0.
+                for k in range(back_len - 1, -1, -1):
+                    val = back_vals[k]
+                    agg_best = min(agg_best, agg_min - val)
+                    agg_max = max(agg_max, val)
+                    agg_min = min(agg_min, val)
+                    front_max[front_len] = agg_max
+                    front_min[front_len] = agg_min
+                    front_best[front_len] = agg_best
+                    front_len += 1
+                back_len = 0
+                back_max = -np.inf
+                back_min = np.inf
+                back_best = 0.
+            front_len -= 1
+
+        from_i = max(0, i + 1 - window)
+        if cnt_arr[i + 1] - cnt_arr[from_i] < minp:
+            out[i] = np.nan
+            continue
+        if non_pos_cnt_arr[i + 1] - non_pos_cnt_arr[from_i] > 0:
+            out[i] = max_drawdown_1d_nb(returns[from_i:i + 1])
+            continue
+        if front_len > 0:
+            best = min(front_best[front_len - 1], back_best, back_min - front_max[front_len - 1])
+        else:
+            best = back_best
+        out[i] = np.exp(best) - 1
+    return out
+
+
+@njit(cache=True)
+def rolling_max_drawdown_nb(returns, window, minp=None):
+    """2-dim version of `rolling_max_drawdown_1d_nb`."""
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        out[:, col] = rolling_max_drawdown_1d_nb(returns[:, col], window, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_calmar_ratio_1d_nb(returns, window, ann_factor, minp=None):
+    """Rolling version of `calmar_ratio_1d_nb`."""
+    max_drawdown = rolling_max_drawdown_1d_nb(returns, window, minp=minp)
+    annualized_return = rolling_annualized_return_1d_nb(returns, window, ann_factor, minp=minp)
+    out = np.empty_like(max_drawdown, dtype=np.float_)
+    for i in range(returns.shape[0]):
+        if max_drawdown[i] == 0.:
+            out[i] = np.nan
+        else:
+            out[i] = annualized_return[i] / np.abs(max_drawdown[i])
+    return out
+
+
+@njit(cache=True)
+def rolling_calmar_ratio_nb(returns, window, ann_factor, minp=None):
+    """2-dim version of `rolling_calmar_ratio_1d_nb`."""
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        out[:, col] = rolling_calmar_ratio_1d_nb(returns[:, col], window, ann_factor, minp=minp)
+    return out
+
+
+@njit(cache=True)
+def rolling_sharpe_ratio_1d_nb(returns, window, ann_factor, minp=None, risk_free=0.):
+    """Rolling version of `sharpe_ratio_1d_nb`."""
+    if minp is None:
+        minp = window
+    returns_risk_adj = returns - risk_free
+    mean = generic_nb.rolling_mean_1d_nb(returns_risk_adj, window, minp=minp)
+    std = generic_nb.rolling_std_1d_nb(returns_risk_adj, window, minp=minp, ddof=1)
+    out = np.empty_like(mean, dtype=np.float_)
+    for i in range(returns.shape[0]):
+        if min(i + 1, window) < 2:
+            out[i] = np.nan
+        elif std[i] == 0.:
+            out[i] = np.inf
+        else:
+            out[i] = mean[i] / std[i] * np.sqrt(ann_factor)
+    return out
+
+
+@njit(cache=True)
+def rolling_sharpe_ratio_nb(returns, window, ann_factor, minp, risk_free):
+    """2-dim version of `rolling_sharpe_ratio_1d_nb`.
+
+    `risk_free` can be a scalar or an array of shape `returns.shape[1]`."""
+    risk_free_arr = np.asarray(risk_free)
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        _risk_free = flex_select_auto_nb(0, col, risk_free_arr, True)
+        out[:, col] = rolling_sharpe_ratio_1d_nb(
+            returns[:, col], window, ann_factor, minp=minp, risk_free=_risk_free)
+    return out
+
+
+@njit(cache=True)
+def rolling_downside_risk_1d_nb(returns, window, ann_factor, minp=None, required_return=0.):
+    """Rolling version of `downside_risk_1d_nb`."""
+    if minp is None:
+        minp = window
+    adj_returns = returns - required_return
+    adj_returns[adj_returns > 0] = 0
+    mean_sq = generic_nb.rolling_mean_1d_nb(adj_returns ** 2, window, minp=minp)
+    return np.sqrt(mean_sq) * np.sqrt(ann_factor)
+
+
+@njit(cache=True)
+def rolling_downside_risk_nb(returns, window, ann_factor, minp, required_return):
+    """2-dim version of `rolling_downside_risk_1d_nb`.
+
+    `required_return` can be a scalar or an array of shape `returns.shape[1]`."""
+    required_return_arr = np.asarray(required_return)
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        _required_return = flex_select_auto_nb(0, col, required_return_arr, True)
+        out[:, col] = rolling_downside_risk_1d_nb(
+            returns[:, col], window, ann_factor, minp=minp, required_return=_required_return)
+    return out
+
+
+@njit(cache=True)
+def rolling_sortino_ratio_1d_nb(returns, window, ann_factor, minp=None, required_return=0.):
+    """Rolling version of `sortino_ratio_1d_nb`."""
+    if minp is None:
+        minp = window
+    adj_returns = returns - required_return
+    mean = generic_nb.rolling_mean_1d_nb(adj_returns, window, minp=minp)
+    downside_risk = rolling_downside_risk_1d_nb(
+        returns, window, ann_factor, minp=minp, required_return=required_return)
+    out = np.empty_like(mean, dtype=np.float_)
+    for i in range(returns.shape[0]):
+        if min(i + 1, window) < 2:
+            out[i] = np.nan
+        elif downside_risk[i] == 0.:
+            out[i] = np.inf
+        else:
+            out[i] = mean[i] * ann_factor / downside_risk[i]
+    return out
+
+
+@njit(cache=True)
+def rolling_sortino_ratio_nb(returns, window, ann_factor, minp, required_return):
+    """2-dim version of `rolling_sortino_ratio_1d_nb`.
+
+    `required_return` can be a scalar or an array of shape `returns.shape[1]`."""
+    required_return_arr = np.asarray(required_return)
+    out = np.empty_like(returns, dtype=np.float_)
+    for col in range(returns.shape[1]):
+        _required_return = flex_select_auto_nb(0, col, required_return_arr, True)
+        out[:, col] = rolling_sortino_ratio_1d_nb(
+            returns[:, col], window, ann_factor, minp=minp, required_return=_required_return)
+    return out
+
+
+@njit(cache=True)
+def expanding_annualized_return_1d_nb(returns, ann_factor, minp=1):
+    """Expanding version of `annualized_return_1d_nb`."""
+    return rolling_annualized_return_1d_nb(returns, returns.shape[0], ann_factor, minp=minp)
+
+
+@njit(cache=True)
+def expanding_annualized_return_nb(returns, ann_factor, minp=1):
+    """2-dim version of `expanding_annualized_return_1d_nb`."""
+    return rolling_annualized_return_nb(returns, returns.shape[0], ann_factor, minp=minp)
+
+
+@njit(cache=True)
+def expanding_annualized_volatility_1d_nb(returns, ann_factor, minp=1, levy_alpha=2.0):
+    """Expanding version of `annualized_volatility_1d_nb`."""
+    return rolling_annualized_volatility_1d_nb(
+        returns, returns.shape[0], ann_factor, minp=minp, levy_alpha=levy_alpha)
+
+
+@njit(cache=True)
+def expanding_annualized_volatility_nb(returns, ann_factor, minp, levy_alpha):
+    """2-dim version of `expanding_annualized_volatility_1d_nb`."""
+    return rolling_annualized_volatility_nb(returns, returns.shape[0], ann_factor, minp, levy_alpha)
+
+
+@njit(cache=True)
+def expanding_max_drawdown_1d_nb(returns, minp=1):
+    """Expanding version of `max_drawdown_1d_nb`."""
+    return rolling_max_drawdown_1d_nb(returns, returns.shape[0], minp=minp)
+
+
+@njit(cache=True)
+def expanding_max_drawdown_nb(returns, minp=1):
+    """2-dim version of `expanding_max_drawdown_1d_nb`."""
+    return rolling_max_drawdown_nb(returns, returns.shape[0], minp=minp)
+
+
+@njit(cache=True)
+def expanding_calmar_ratio_1d_nb(returns, ann_factor, minp=1):
+    """Expanding version of `calmar_ratio_1d_nb`."""
+    return rolling_calmar_ratio_1d_nb(returns, returns.shape[0], ann_factor, minp=minp)
+
+
+@njit(cache=True)
+def expanding_calmar_ratio_nb(returns, ann_factor, minp=1):
+    """2-dim version of `expanding_calmar_ratio_1d_nb`."""
+    return rolling_calmar_ratio_nb(returns, returns.shape[0], ann_factor, minp=minp)
+
+
+@njit(cache=True)
+def expanding_sharpe_ratio_1d_nb(returns, ann_factor, minp=1, risk_free=0.):
+    """Expanding version of `sharpe_ratio_1d_nb`."""
+    return rolling_sharpe_ratio_1d_nb(returns, returns.shape[0], ann_factor, minp=minp, risk_free=risk_free)
+
+
+@njit(cache=True)
+def expanding_sharpe_ratio_nb(returns, ann_factor, minp, risk_free):
+    """2-dim version of `expanding_sharpe_ratio_1d_nb`."""
+    return rolling_sharpe_ratio_nb(returns, returns.shape[0], ann_factor, minp, risk_free)
+
+
+@njit(cache=True)
+def expanding_downside_risk_1d_nb(returns, ann_factor, minp=1, required_return=0.):
+    """Expanding version of `downside_risk_1d_nb`."""
+    return rolling_downside_risk_1d_nb(
+        returns, returns.shape[0], ann_factor, minp=minp, required_return=required_return)
+
+
+@njit(cache=True)
+def expanding_downside_risk_nb(returns, ann_factor, minp, required_return):
+    """2-dim version of `expanding_downside_risk_1d_nb`."""
+    return rolling_downside_risk_nb(returns, returns.shape[0], ann_factor, minp, required_return)
+
+
+@njit(cache=True)
+def expanding_sortino_ratio_1d_nb(returns, ann_factor, minp=1, required_return=0.):
+    """Expanding version of `sortino_ratio_1d_nb`."""
+    return rolling_sortino_ratio_1d_nb(
+        returns, returns.shape[0], ann_factor, minp=minp, required_return=required_return)
+
+
+@njit(cache=True)
+def expanding_sortino_ratio_nb(returns, ann_factor, minp, required_return):
+    """2-dim version of `expanding_sortino_ratio_1d_nb`."""
+    return rolling_sortino_ratio_nb(returns, returns.shape[0], ann_factor, minp, required_return)
+
+
+# ############# Batched metrics ############# #
+
+
+@njit(cache=True)
+def metrics_1d_nb(returns, ann_factor, metric_ids, risk_free=0., required_return=0., levy_alpha=2.0, cutoff=0.05):
+    """Compute multiple metrics of type `vectorbt.returns.enums.ReturnsMetric` at once.
+
+    Instead of calling each metric function separately, walks over `returns` a single time to
+    gather the product of returns, the running peak of cumulative returns, the running mean and
+    variance (Welford's algorithm), and the threshold sums of the omega ratio and the downside risk.
+    Tail metrics share a single partition of returns (see `tail_metrics_1d_nb`), done only if requested.
+
+    Each metric yields the same result as its stand-alone function, such as `sharpe_ratio_1d_nb`.
+
+    Returns an array with one value per element in `metric_ids`."""
+    n = returns.shape[0]
+    if ann_factor == 1:
+        omega_thresh = required_return
+    elif ann_factor <= -1:
+        omega_thresh = np.nan
+    else:
+        omega_thresh = (1 + required_return) ** (1. / ann_factor) - 1
+
+    cnt = 0
+    prod = np.nan
+    cum = 100.
+    peak = 100.
+    max_dd = 0.
+    mean = 0.
+    m2 = 0.
+    omega_numer = 0.
+    omega_denom = 0.
+    downside_sum_sq = 0.
+    for i in range(n):
+        r = returns[i]
+        if np.isnan(r):
+            cum_r = 0.
+        else:
+            cum_r = r
+            cnt += 1
+            if np.isnan(prod):
+                prod = r + 1.
+            else:
+                prod *= r + 1.
+            delta = r - mean
+            mean += delta / cnt
+            m2 += delta * (r - mean)
+            omega_r = r - risk_free - omega_thresh
+            if omega_r > 0:
+                omega_numer += omega_r
+            elif omega_r < 0:
+                omega_denom -= omega_r
+            adj_r = r - required_return
+            if adj_r < 0:
+                downside_sum_sq += adj_r ** 2
+        cum *= cum_r + 1.
+        if i == 0 or cum > peak:
+            peak = cum
+        dd = cum / peak - 1
+        if i == 0 or dd < max_dd:
+            max_dd = dd
+
+    if cnt > 0:
+        total = prod - 1.
+        std = np.sqrt(m2 / (cnt - 1)) if cnt > 1 else np.nan
+        downside_risk = np.sqrt(downside_sum_sq / cnt) * np.sqrt(ann_factor)
+    else:
+        mean = np.nan
+        total = np.nan
+        std = np.nan
+        downside_risk = np.nan
+    annualized = (total + 1.) ** (ann_factor / n) - 1
+
+    calc_tail_ratio = False
+    calc_var = False
+    calc_cvar = False
+    for k in range(metric_ids.shape[0]):
+        if metric_ids[k] == ReturnsMetric.TailRatio:
+            calc_tail_ratio = True
+        elif metric_ids[k] == ReturnsMetric.ValueAtRisk:
+            calc_var = True
+        elif metric_ids[k] == ReturnsMetric.ConditionalValueAtRisk:
+            calc_cvar = True
+    tail_ratio = np.nan
+    var = np.nan
+    cvar = np.nan
+    if calc_tail_ratio or calc_var or calc_cvar:
+        tail_ratio, var, cvar = tail_metrics_1d_nb(
+            returns,
+            cutoff=cutoff,
+            calc_tail_ratio=calc_tail_ratio,
+            calc_var=calc_var,
+            calc_cvar=calc_cvar
+        )
+
+    out = np.empty(metric_ids.shape[0], dtype=np.float_)
+    for k in range(metric_ids.shape[0]):
+        metric_id = metric_ids[k]
+        if metric_id == ReturnsMetric.Total:
+            out[k] = total
+        elif metric_id == ReturnsMetric.Annualized:
+            out[k] = annualized
+        elif metric_id == ReturnsMetric.AnnualizedVolatility:
+            if n < 2:
+                out[k] = np.nan
+            else:
+                out[k] = std * ann_factor ** (1.0 / levy_alpha)
+        elif metric_id == ReturnsMetric.CalmarRatio:
+            if max_dd == 0.:
+                out[k] = np.nan
+            else:
+                out[k] = annualized / np.abs(max_dd)
+        elif metric_id == ReturnsMetric.OmegaRatio:
+            if np.isnan(omega_thresh):
+                out[k] = np.nan
+            elif omega_denom == 0.:
+                out[k] = np.inf
+            else:
+                out[k] = omega_numer / omega_denom
+        elif metric_id == ReturnsMetric.SharpeRatio:
+            if n < 2:
+                out[k] = np.nan
+            elif std == 0.:
+                out[k] = np.inf
+            else:
+                out[k] = (mean - risk_free) / std * np.sqrt(ann_factor)
+        elif metric_id == ReturnsMetric.DownsideRisk:
+            out[k] = downside_risk
+        elif metric_id == ReturnsMetric.SortinoRatio:
+            if n < 2:
+                out[k] = np.nan
+            elif downside_risk == 0.:
+                out[k] = np.inf
+            else:
+                out[k] = (mean - required_return) * ann_factor / downside_risk
+        elif metric_id == ReturnsMetric.TailRatio:
+            out[k] = tail_ratio
+        elif metric_id == ReturnsMetric.ValueAtRisk:
+            out[k] = var
+        elif metric_id == ReturnsMetric.ConditionalValueAtRisk:
+            out[k] = cvar
+        elif metric_id == ReturnsMetric.MaxDrawdown:
+            out[k] = max_dd
+        else:
+            raise ValueError("Unknown metric")
+    return out
+
+
+@njit(cache=True)
+def metrics_nb(returns, ann_factor, metric_ids, risk_free, required_return, levy_alpha, cutoff):
+    """2-dim version of `metrics_1d_nb`.
+
+    `risk_free`, `required_return`, `levy_alpha` and `cutoff` can be scalars or arrays
+    of shape `returns.shape[1]`.
+
+    Returns an array of shape `(len(metric_ids), returns.shape[1])`."""
+    risk_free_arr = np.asarray(risk_free)
+    required_return_arr = np.asarray(required_return)
+    levy_alpha_arr = np.asarray(levy_alpha)
+    cutoff_arr = np.asarray(cutoff)
+    out = np.empty((metric_ids.shape[0], returns.shape[1]), dtype=np.float_)
+    for col in range(returns.shape[1]):
+        out[:, col] = metrics_1d_nb(
+            returns[:, col],
+            ann_factor,
+            metric_ids,
+            risk_free=flex_select_auto_nb(0, col, risk_free_arr, True),
+            required_return=flex_select_auto_nb(0, col, required_return_arr, True),
+            levy_alpha=flex_select_auto_nb(0, col, levy_alpha_arr, True),
+            cutoff=flex_select_auto_nb(0, col, cutoff_arr, True)
+        )
+    return out
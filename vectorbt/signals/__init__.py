@@ -40,6 +40,11 @@ These only accept NumPy arrays and other Numba-compatible types.
 array([0, 1, 2, 3, 0])
 ```
 
+## Packed signals
+
+`vectorbt.signals.packed.PackedSignals` stores signals using one bit per element and supports
+counting, ranking, mapping and reducing, and logical operations without unpacking the whole array.
+
 ## Signal factory
 
 The signal factory class `vectorbt.signals.factory.SignalFactory` extends
@@ -55,6 +60,7 @@ random signal generator, all built with `vectorbt.signals.factory.SignalFactory`
 """
 
 from vectorbt.signals.enums import StopType
+from vectorbt.signals.packed import PackedSignals
 from vectorbt.signals.factory import SignalFactory
 from vectorbt.signals.basic import (
     RAND,
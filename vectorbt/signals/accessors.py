@@ -48,6 +48,7 @@ from vectorbt.base import reshape_fns
 from vectorbt.base.common import add_nb_methods
 from vectorbt.generic.accessors import Generic_Accessor, Generic_SRAccessor, Generic_DFAccessor
 from vectorbt.signals import nb
+from vectorbt.signals.packed import PackedSignals
 
 
 @add_nb_methods([
@@ -59,13 +60,13 @@ class Signals_Accessor(Generic_Accessor):
 
     Accessible through `pd.Series.vbt.signals` and `pd.DataFrame.vbt.signals`."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
         checks.assert_dtype(obj, np.bool)
 
-        Generic_Accessor.__init__(self, obj, freq=freq)
+        Generic_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     @classmethod
     def empty(cls, *args, fill_value=False, **kwargs):
@@ -416,7 +417,7 @@ class Signals_Accessor(Generic_Accessor):
         if prob is not None:
             obj, prob = reshape_fns.broadcast(self._obj, prob, keep_raw=[False, True])
             return obj.vbt.wrap(nb.generate_rand_ex_by_prob_nb(
-                obj.vbt.to_2d_array(), prob, wait, obj.ndim == 2, seed=seed))
+                obj.vbt.to_2d_array(), prob, wait, obj.ndim == 2, seed=seed), to_pd=self.to_pd)
         return self.wrap(nb.generate_rand_ex_nb(self.to_2d_array(), wait, seed=seed))
 
     def generate_stop_exits(self, ts, stop, trailing=False, entry_wait=1, exit_wait=1,
@@ -464,11 +465,11 @@ class Signals_Accessor(Generic_Accessor):
         if iteratively:
             new_entries, exits = nb.generate_stop_ex_iter_nb(
                 entries.vbt.to_2d_array(), ts, stop, trailing, entry_wait, exit_wait, entries.ndim == 2)
-            return entries.vbt.wrap(new_entries), entries.vbt.wrap(exits)
+            return entries.vbt.wrap(new_entries, to_pd=self.to_pd), entries.vbt.wrap(exits, to_pd=self.to_pd)
         else:
             exits = nb.generate_stop_ex_nb(
                 entries.vbt.to_2d_array(), ts, stop, trailing, exit_wait, first, entries.ndim == 2)
-            return entries.vbt.wrap(exits)
+            return entries.vbt.wrap(exits, to_pd=self.to_pd)
 
     def generate_adv_stop_exits(self, open, high=None, low=None, close=None, is_open_safe=True,
                                 out_dict=None, sl_stop=0., ts_stop=0., tp_stop=0., entry_wait=1,
@@ -574,17 +575,17 @@ class Signals_Accessor(Generic_Accessor):
                 entries.vbt.to_2d_array(), open, high, low, close, hit_price_out,
                 stop_type_out, sl_stop, ts_stop, tp_stop, is_open_safe, entry_wait,
                 exit_wait, first, entries.ndim == 2)
-            out_dict['hit_price'] = entries.vbt.wrap(hit_price_out)
-            out_dict['stop_type'] = entries.vbt.wrap(stop_type_out)
-            return entries.vbt.wrap(new_entries), entries.vbt.wrap(exits)
+            out_dict['hit_price'] = entries.vbt.wrap(hit_price_out, to_pd=self.to_pd)
+            out_dict['stop_type'] = entries.vbt.wrap(stop_type_out, to_pd=self.to_pd)
+            return entries.vbt.wrap(new_entries, to_pd=self.to_pd), entries.vbt.wrap(exits, to_pd=self.to_pd)
         else:
             exits = nb.generate_adv_stop_ex_nb(
                 entries.vbt.to_2d_array(), open, high, low, close, hit_price_out,
                 stop_type_out, sl_stop, ts_stop, tp_stop, is_open_safe, exit_wait,
                 first, entries.ndim == 2)
-            out_dict['hit_price'] = entries.vbt.wrap(hit_price_out)
-            out_dict['stop_type'] = entries.vbt.wrap(stop_type_out)
-            return entries.vbt.wrap(exits)
+            out_dict['hit_price'] = entries.vbt.wrap(hit_price_out, to_pd=self.to_pd)
+            out_dict['stop_type'] = entries.vbt.wrap(stop_type_out, to_pd=self.to_pd)
+            return entries.vbt.wrap(exits, to_pd=self.to_pd)
 
     # ############# Map and reduce ############# #
 
@@ -645,7 +646,7 @@ class Signals_Accessor(Generic_Accessor):
                 map_func_nb, map_args,
                 reduce_func_nb, reduce_args
             )
-            return obj.vbt.wrap_reduced(result)
+            return obj.vbt.wrap_reduced(result, to_pd=self.to_pd)
 
     def map_reduce_partitions(self, map_func_nb=None, map_args=None,
                               reduce_func_nb=None, reduce_args=None):
@@ -687,6 +688,12 @@ class Signals_Accessor(Generic_Accessor):
         """Sum up True values."""
         return self.sum()
 
+    def pack(self, **kwargs):
+        """Pack signals into one bit per element.
+
+        See `vectorbt.signals.packed.PackedSignals.from_signals`."""
+        return PackedSignals.from_signals(self._obj, freq=self.freq, **kwargs)
+
     def avg_distance(self, to=None, **kwargs):
         """Calculate the average distance between True values in `self` and optionally `to`.
 
@@ -747,7 +754,7 @@ class Signals_Accessor(Generic_Accessor):
             reset_by=reset_by,
             after_false=after_false,
             allow_gaps=allow_gaps)
-        return obj.vbt.wrap(ranked)
+        return obj.vbt.wrap(ranked, to_pd=self.to_pd)
 
     def rank_partitions(self, reset_by=None, after_false=False, broadcast_kwargs=None):
         """See `vectorbt.signals.nb.rank_partitions_nb`.
@@ -788,19 +795,19 @@ class Signals_Accessor(Generic_Accessor):
             obj.vbt.to_2d_array(),
             reset_by=reset_by,
             after_false=after_false)
-        return obj.vbt.wrap(ranked)
+        return obj.vbt.wrap(ranked, to_pd=self.to_pd)
 
     def first(self, **kwargs):
         """`vectorbt.signals.nb.rank_nb` == 1."""
-        return self.wrap(self.rank(**kwargs).values == 1)
+        return self.wrap(np.asarray(self.rank(**kwargs)) == 1)
 
     def nst(self, n, **kwargs):
         """`vectorbt.signals.nb.rank_nb` == n."""
-        return self.wrap(self.rank(**kwargs).values == n)
+        return self.wrap(np.asarray(self.rank(**kwargs)) == n)
 
     def from_nst(self, n, **kwargs):
         """`vectorbt.signals.nb.rank_nb` >= n."""
-        return self.wrap(self.rank(**kwargs).values >= n)
+        return self.wrap(np.asarray(self.rank(**kwargs)) >= n)
 
     # ############# Logical operations ############# #
 
@@ -845,12 +852,12 @@ class Signals_SRAccessor(Signals_Accessor, Generic_SRAccessor):
 
     Accessible through `pd.Series.vbt.signals`."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Generic_SRAccessor.__init__(self, obj, freq=freq)
-        Signals_Accessor.__init__(self, obj, freq=freq)
+        Generic_SRAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Signals_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     def plot(self, name=None, trace_kwargs=None, fig=None, **layout_kwargs):  # pragma: no cover
         """Plot Series as a line.
@@ -993,12 +1000,12 @@ class Signals_DFAccessor(Signals_Accessor, Generic_DFAccessor):
 
     Accessible through `pd.DataFrame.vbt.signals`."""
 
-    def __init__(self, obj, freq=None):
+    def __init__(self, obj, freq=None, to_pd=True):
         if not checks.is_pandas(obj):  # parent accessor
             obj = obj._obj
 
-        Generic_DFAccessor.__init__(self, obj, freq=freq)
-        Signals_Accessor.__init__(self, obj, freq=freq)
+        Generic_DFAccessor.__init__(self, obj, freq=freq, to_pd=to_pd)
+        Signals_Accessor.__init__(self, obj, freq=freq, to_pd=to_pd)
 
     def plot(self, trace_kwargs=None, fig=None, **layout_kwargs):  # pragma: no cover
         """Plot each column in DataFrame as a line.
@@ -12,7 +12,9 @@ from vectorbt.signals.nb import (
     rand_enex_apply_nb,
     rand_by_prob_choice_nb,
     stop_choice_nb,
-    adv_stop_choice_nb
+    generate_stop_ex_grid_nb,
+    adv_stop_choice_nb,
+    generate_adv_stop_ex_grid_nb
 )
 
 flex_elem_param_config = Config(
@@ -324,6 +326,12 @@ stex_func_config = Config(
             pass_params=['stop', 'trailing'],
             pass_kwargs=['wait', 'first', 'temp_idx_arr', 'flex_2d']
         ),
+        exit_grid_func=generate_stop_ex_grid_nb,
+        exit_grid_settings=dict(
+            pass_inputs=['ts'],
+            pass_params=['stop', 'trailing'],
+            pass_kwargs=['wait', 'first', 'flex_2d']
+        ),
         forward_flex_2d=True,
         param_settings=dict(
             stop=flex_elem_param_config,
@@ -348,7 +356,10 @@ class STEX(STEX):
 
     !!! hint
         All parameters can be either a single value (per frame) or a NumPy array (per row, column,
-        or element). To generate multiple combinations, pass them as lists."""
+        or element). To generate multiple combinations, pass them as lists.
+
+        If each combination has a single value per parameter, generates exits of all combinations
+        in one pass using `vectorbt.signals.nb.generate_stop_ex_grid_nb`."""
     pass
 
 
@@ -410,6 +421,13 @@ advstex_func_config = Config(
             pass_params=['sl_stop', 'ts_stop', 'tp_stop'],
             pass_kwargs=[('is_open_safe', True), 'wait', 'first', 'temp_idx_arr', 'flex_2d'],
         ),
+        exit_grid_func=generate_adv_stop_ex_grid_nb,
+        exit_grid_settings=dict(
+            pass_inputs=['open', 'high', 'low', 'close'],
+            pass_in_outputs=['hit_price', 'stop_type'],
+            pass_params=['sl_stop', 'ts_stop', 'tp_stop'],
+            pass_kwargs=[('is_open_safe', True), 'wait', 'first', 'flex_2d'],
+        ),
         forward_flex_2d=True,
         in_output_settings=dict(
             hit_price=dict(
@@ -518,6 +536,9 @@ class ADVSTEX(ADVSTEX):
         All parameters can be either a single value (per frame) or a NumPy array (per row, column,
         or element). To generate multiple combinations, pass them as lists.
 
+        If each combination has a single value per parameter, generates exits of all combinations
+        in one pass using `vectorbt.signals.nb.generate_adv_stop_ex_grid_nb`.
+
     Example:
         Test each stop type individually:
         ```python-repl
@@ -3,12 +3,21 @@
 import numpy as np
 from numba import njit
 from numba.typed import List
+import inspect
 
+from vectorbt import defaults
 from vectorbt.utils import checks
 from vectorbt.utils.config import merge_kwargs
 from vectorbt.base import combine_fns
 from vectorbt.indicators.factory import IndicatorFactory
-from vectorbt.signals.nb import generate_ex_nb, generate_enex_nb, first_choice_nb
+from vectorbt.signals.nb import (
+    generate_ex_nb,
+    generate_ex_col_nb,
+    generate_enex_nb,
+    generate_enex_col_nb,
+    apply_cols_parallel_nb,
+    first_choice_nb
+)
 
 
 class SignalFactory(IndicatorFactory):
@@ -130,9 +139,11 @@ class SignalFactory(IndicatorFactory):
             entry_choice_func=None,
             exit_choice_func=None,
             cache_func=None,
+            exit_grid_func=None,
             entry_settings=None,
             exit_settings=None,
             cache_settings=None,
+            exit_grid_settings=None,
             **kwargs):
         """Build signal generator class around entry and exit choice functions.
 
@@ -153,9 +164,20 @@ class SignalFactory(IndicatorFactory):
             cache_func (callable): A caching function to preprocess data beforehand.
 
                 All returned objects will be passed as last arguments to choice functions.
+            exit_grid_func (callable): A function that generates exits for all parameter
+                combinations at once.
+
+                Only used if `exit_only` is True and `iteratively` is False. Takes `entries` as first
+                argument, and then inputs, in-place outputs, parameters, `*args` and keyword arguments
+                as specified in `exit_grid_settings`. Each in-place output is passed as a 2-dim array
+                with columns of all parameter combinations stacked one after another, and each
+                parameter is passed as a 1-dim array with one value per combination. Must return
+                exits of the same layout. Called instead of `exit_choice_func` only if each value
+                of each passed parameter is a single value, otherwise falls back to `exit_choice_func`.
             entry_settings (dict): Settings dict for `entry_choice_func`.
             exit_settings (dict): Settings dict for `exit_choice_func`.
             cache_settings (dict): Settings dict for `cache_func`.
+            exit_grid_settings (dict): Settings dict for `exit_grid_func`.
             **kwargs: Keyword arguments passed to `IndicatorFactory.from_custom_func`.
 
         !!! note
@@ -217,6 +239,21 @@ class SignalFactory(IndicatorFactory):
                 passed as positional if in `pass_kwargs`.
             return_cache (bool): Whether to return only cache.
             use_cache (any): Cache to use.
+            use_grid (bool): Whether to use `exit_grid_func` if possible. Defaults to True.
+            parallel (bool): Whether to distribute columns of all parameter combinations across
+                threads using `vectorbt.signals.nb.apply_cols_parallel_nb`.
+
+                Before each column, the random number generator is seeded with a seed derived from
+                the global random state, such that `seed` makes the output reproducible. Arrays passed
+                as `temp_idx_arr` default to None, in which case the built-in choice functions allocate
+                their own. Custom choice functions must be thread-safe.
+
+                Since tuples cannot be passed into the `prange` body, parameters are stacked into arrays
+                and in-place outputs are written back after the run. Falls back to the sequential run
+                if any parameter is not numeric or has values of different shapes, or any of the passed
+                arguments is a tuple.
+
+                If None, see `vectorbt.defaults.indicators`.
             **kwargs: Should be used instead of `exit_kwargs` when `exit_only` is True.
 
         For more arguments, see `vectorbt.indicators.factory.run_pipeline`.
@@ -392,6 +429,10 @@ class SignalFactory(IndicatorFactory):
             exit_settings = {}
         if cache_settings is None:
             cache_settings = {}
+        if exit_grid_settings is None:
+            exit_grid_settings = {}
+        if not exit_only or iteratively:
+            exit_grid_func = None
 
         def _check_settings(func_settings):
             for k in func_settings:
@@ -407,6 +448,9 @@ class SignalFactory(IndicatorFactory):
         _check_settings(entry_settings)
         _check_settings(exit_settings)
         _check_settings(cache_settings)
+        _check_settings(exit_grid_settings)
+        if exit_grid_settings.get('pass_cache', False):
+            raise ValueError("exit_grid_func doesn't support pass_cache")
 
         # Get input names for each function
         def _get_func_names(func_settings, setting, all_names):
@@ -421,14 +465,17 @@ class SignalFactory(IndicatorFactory):
         entry_input_names = _get_func_names(entry_settings, 'pass_inputs', input_names)
         exit_input_names = _get_func_names(exit_settings, 'pass_inputs', input_names)
         cache_input_names = _get_func_names(cache_settings, 'pass_inputs', input_names)
+        exit_grid_input_names = _get_func_names(exit_grid_settings, 'pass_inputs', input_names)
 
         entry_in_output_names = _get_func_names(entry_settings, 'pass_in_outputs', in_output_names)
         exit_in_output_names = _get_func_names(exit_settings, 'pass_in_outputs', in_output_names)
         cache_in_output_names = _get_func_names(cache_settings, 'pass_in_outputs', in_output_names)
+        exit_grid_in_output_names = _get_func_names(exit_grid_settings, 'pass_in_outputs', in_output_names)
 
         entry_param_names = _get_func_names(entry_settings, 'pass_params', param_names)
         exit_param_names = _get_func_names(exit_settings, 'pass_params', param_names)
         cache_param_names = _get_func_names(cache_settings, 'pass_params', param_names)
+        exit_grid_param_names = _get_func_names(exit_grid_settings, 'pass_params', param_names)
 
         if exit_only and not iteratively:
             @njit
@@ -465,9 +512,62 @@ class SignalFactory(IndicatorFactory):
                     )
                 )
 
+        col_funcs = {}
+
+        def get_col_func(entry_counts, exit_counts):
+            # Tuples cannot be passed into the prange body, thus compile a function that takes
+            # each argument separately and selects parameters from stacked arrays
+            key = (entry_counts, exit_counts)
+            if key not in col_funcs:
+                def _arg_names(prefix, n_inputs, n_in_outputs, n_params, n_args):
+                    names = []
+                    selected = []
+                    for name, n in zip(('x', 'io', 'p', 'a'), (n_inputs, n_in_outputs, n_params, n_args)):
+                        for k in range(n):
+                            names.append(prefix + name + str(k))
+                            selected.append(names[-1] + '[i]' if name in ('io', 'p') else names[-1])
+                    return names, selected
+
+                if exit_only and not iteratively:
+                    exit_names, exit_selected = _arg_names('exit_', *exit_counts, 0)
+                    func_str = "def col_func_nb(j, n_cols, entries, exit_wait, exits, {0}*args):\n" \
+                        "    i = j // n_cols\n" \
+                        "    col = j % n_cols\n" \
+                        "    generate_ex_col_nb(col, entries, exit_wait, exits[:, j], " \
+                        "exit_choice_func, {1}*args)".format(
+                            ''.join(k + ', ' for k in exit_names),
+                            ''.join(k + ', ' for k in exit_selected)
+                        )
+                else:
+                    entry_names, entry_selected = _arg_names('entry_', *entry_counts)
+                    exit_names, exit_selected = _arg_names('exit_', *exit_counts, 0)
+                    func_str = "def col_func_nb(j, n_cols, n_rows, entry_wait, exit_wait, " \
+                        "entries, exits, {0}*args):\n" \
+                        "    i = j // n_cols\n" \
+                        "    col = j % n_cols\n" \
+                        "    generate_enex_col_nb(col, n_rows, entry_wait, exit_wait, entries[:, j], " \
+                        "exits[:, j], entry_choice_func, ({1}), exit_choice_func, ({2}*args,))".format(
+                            ''.join(k + ', ' for k in entry_names + exit_names),
+                            ''.join(k + ', ' for k in entry_selected),
+                            ''.join(k + ', ' for k in exit_selected)
+                        )
+                scope = dict(
+                    generate_ex_col_nb=generate_ex_col_nb,
+                    generate_enex_col_nb=generate_enex_col_nb,
+                    entry_choice_func=entry_choice_func,
+                    exit_choice_func=exit_choice_func
+                )
+                filename = inspect.getfile(lambda: None)
+                code = compile(func_str, filename, 'exec')
+                exec(code, scope)
+                col_funcs[key] = njit(scope['col_func_nb'])
+            return col_funcs[key]
+
+
         def custom_func(input_list, in_output_list, param_list, *args, input_shape=None, flex_2d=None,
                         entry_args=None, exit_args=None, cache_args=None, entry_kwargs=None,
-                        exit_kwargs=None, cache_kwargs=None, return_cache=False, use_cache=None, **_kwargs):
+                        exit_kwargs=None, cache_kwargs=None, return_cache=False, use_cache=None,
+                        use_grid=True, parallel=None, **_kwargs):
             # Get arguments
             if len(input_list) == 0:
                 if input_shape is None:
@@ -514,6 +614,8 @@ class SignalFactory(IndicatorFactory):
             cache_kwargs = merge_kwargs(kwargs_defaults, cache_kwargs)
             entry_wait = entry_kwargs['wait']
             exit_wait = exit_kwargs['wait']
+            if parallel is None:
+                parallel = defaults.indicators['parallel']
 
             # Distribute arguments across functions
             entry_input_list = ()
@@ -568,7 +670,8 @@ class SignalFactory(IndicatorFactory):
                     if isinstance(key, tuple):
                         key, value = key
                     else:
-                        if key.startswith('temp_idx_arr'):
+                        if key.startswith('temp_idx_arr') and not parallel:
+                            # Shared buffers aren't thread-safe -> let each call allocate its own
                             value = np.empty((input_shape[0],), dtype=np.int_)
                     value = func_kwargs.get(key, value)
                     more_args += (value,)
@@ -602,7 +705,121 @@ class SignalFactory(IndicatorFactory):
             if exit_settings.get('pass_cache', False):
                 exit_cache = cache
 
+            # Generate exits for all parameter combinations at once
+            if exit_grid_func is not None and use_grid and not parallel:
+                exit_grid_param_list = ()
+                for param_name in exit_grid_param_names:
+                    values = param_list[param_names.index(param_name)]
+                    if any([np.ndim(value) > 0 for value in values]):
+                        break
+                    exit_grid_param_list += (np.asarray(values),)
+                else:
+                    exit_grid_input_list = ()
+                    for input_name in exit_grid_input_names:
+                        exit_grid_input_list += (input_list[input_names.index(input_name)],)
+                    exit_grid_in_output_list = ()
+                    for in_output_name in exit_grid_in_output_names:
+                        in_output_tuple = in_output_list[in_output_names.index(in_output_name)]
+                        exit_grid_in_output_list += (np.column_stack(in_output_tuple),)
+                    exit_grid_more_args = _build_more_args(exit_grid_settings, exit_kwargs)
+
+                    exits = exit_grid_func(
+                        input_list[0],
+                        *exit_grid_input_list,
+                        *exit_grid_in_output_list,
+                        *exit_grid_param_list,
+                        *exit_args,
+                        *exit_grid_more_args
+                    )
+
+                    # Write in-place outputs back to the arrays of each parameter combination
+                    for k, in_output_name in enumerate(exit_grid_in_output_names):
+                        in_output_tuple = in_output_list[in_output_names.index(in_output_name)]
+                        for i in range(n_params):
+                            in_output_tuple[i][:] = exit_grid_in_output_list[k][
+                                :, i * input_shape[1]:(i + 1) * input_shape[1]]
+                    return exits
+
             # Apply and concatenate
+            if parallel:
+                def _stack(in_output_list, param_list):
+                    # Stack in-place outputs and parameters of all combinations along the first axis
+                    stacked = tuple(map(np.stack, in_output_list))
+                    for values in param_list:
+                        if len(set(map(np.shape, values))) > 1:
+                            return None
+                        values = np.asarray(values)
+                        if values.dtype.kind not in 'biufc':
+                            return None
+                        stacked += (values,)
+                    return stacked
+
+                entry_stacked = _stack(entry_in_output_list, entry_param_list)
+                exit_stacked = _stack(exit_in_output_list, exit_param_list)
+                entry_args = entry_args + entry_more_args + entry_cache
+                exit_args = exit_args + exit_more_args + exit_cache
+                if entry_stacked is not None and exit_stacked is not None \
+                        and not any(isinstance(arg, tuple) for arg in entry_args + exit_args):
+                    # Derive the seed of each column from the global random state to stay reproducible
+                    n_cols = input_shape[1]
+                    seed = np.random.randint(np.iinfo(np.int32).max - n_params * n_cols)
+                    exit_counts = (len(exit_input_list), len(exit_in_output_list), len(exit_param_list))
+                    if exit_only and not iteratively:
+                        col_func_nb = get_col_func(None, exit_counts)
+                        exits = np.full((input_shape[0], n_params * n_cols), False)
+                        apply_cols_parallel_nb(
+                            n_params * n_cols,
+                            seed,
+                            col_func_nb,
+                            n_cols,
+                            input_list[0],
+                            exit_wait,
+                            exits,
+                            *exit_input_list,
+                            *exit_stacked,
+                            *exit_args
+                        )
+                        out_in_outputs = zip(exit_in_output_list, exit_stacked)
+                        outputs = exits
+                    else:
+                        if entry_wait == 0 and exit_wait == 0:
+                            raise ValueError("entry_wait and exit_wait cannot be both 0")
+                        entry_counts = (
+                            len(entry_input_list),
+                            len(entry_in_output_list),
+                            len(entry_param_list),
+                            len(entry_args)
+                        )
+                        col_func_nb = get_col_func(entry_counts, exit_counts)
+                        entries = np.full((input_shape[0], n_params * n_cols), False)
+                        exits = np.full((input_shape[0], n_params * n_cols), False)
+                        apply_cols_parallel_nb(
+                            n_params * n_cols,
+                            seed,
+                            col_func_nb,
+                            n_cols,
+                            input_shape[0],
+                            entry_wait,
+                            exit_wait,
+                            entries,
+                            exits,
+                            *entry_input_list,
+                            *entry_stacked,
+                            *entry_args,
+                            *exit_input_list,
+                            *exit_stacked,
+                            *exit_args
+                        )
+                        out_in_outputs = list(zip(entry_in_output_list, entry_stacked))
+                        out_in_outputs += list(zip(exit_in_output_list, exit_stacked))
+                        outputs = entries, exits
+
+                    # Write in-place outputs back to the arrays of each parameter combination
+                    for in_output_tuple, in_output_arr in out_in_outputs:
+                        for i in range(n_params):
+                            in_output_tuple[i][:] = in_output_arr[i]
+                    return outputs
+
             if exit_only and not iteratively:
                 return combine_fns.apply_and_concat_one_nb(
                     n_params,
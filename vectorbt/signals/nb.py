@@ -9,7 +9,7 @@
 
     Returned indices should be absolute."""
 
-from numba import njit
+from numba import njit, prange
 import numpy as np
 
 from vectorbt.base.reshape_fns import flex_select_auto_nb
@@ -53,6 +53,29 @@ def generate_nb(shape, choice_func_nb, *args):
     return out
 
 
+@njit
+def generate_ex_col_nb(col, entries, wait, exits_out, exit_choice_func_nb, *args):
+    """Pick exit signals using `exit_choice_func_nb` after each signal in the column `col` of `entries`
+    and write them to the 1-dim array `exits_out`.
+
+    Columns are independent from each other and can be processed in any order.
+    See `generate_ex_nb`."""
+    entry_idxs = np.flatnonzero(entries[:, col])
+    for i in range(entry_idxs.shape[0]):
+        # Calculate the range to choose from
+        from_i = entry_idxs[i] + wait
+        if i < entry_idxs.shape[0] - 1:
+            to_i = entry_idxs[i + 1]
+        else:
+            to_i = entries.shape[0]
+        if to_i > from_i:
+            # Run the UDF
+            idxs = exit_choice_func_nb(col, from_i, to_i, *args)
+            if np.any(idxs < from_i) or np.any(idxs >= to_i):
+                raise ValueError("Returned indices are out of bounds")
+            exits_out[idxs] = True
+
+
 @njit
 def generate_ex_nb(entries, wait, exit_choice_func_nb, *args):
     """Pick exit signals using `exit_choice_func_nb` after each signal in `entries`.
@@ -66,23 +89,52 @@ def generate_ex_nb(entries, wait, exit_choice_func_nb, *args):
     exits = np.full_like(entries, False)
 
     for col in range(entries.shape[1]):
-        entry_idxs = np.flatnonzero(entries[:, col])
-        for i in range(entry_idxs.shape[0]):
-            # Calculate the range to choose from
-            from_i = entry_idxs[i] + wait
-            if i < entry_idxs.shape[0] - 1:
-                to_i = entry_idxs[i + 1]
-            else:
-                to_i = entries.shape[0]
-            if to_i > from_i:
-                # Run the UDF
-                idxs = exit_choice_func_nb(col, from_i, to_i, *args)
-                if np.any(idxs < from_i) or np.any(idxs >= to_i):
-                    raise ValueError("Returned indices are out of bounds")
-                exits[idxs, col] = True
+        generate_ex_col_nb(col, entries, wait, exits[:, col], exit_choice_func_nb, *args)
     return exits
 
 
+@njit
+def generate_enex_col_nb(col, n_rows, entry_wait, exit_wait, entries_out, exits_out,
+                         entry_choice_func_nb, entry_args, exit_choice_func_nb, exit_args):
+    """Pick entry and exit signals of the column `col` iteratively and write them to the
+    1-dim arrays `entries_out` and `exits_out`.
+
+    Columns are independent from each other and can be processed in any order.
+    See `generate_enex_nb`."""
+    prev_prev_i = -2
+    prev_i = -1
+    i = 0
+    while True:
+        to_i = n_rows
+        # Cannot assign two functions to a var in numba
+        if i % 2 == 0:
+            if i == 0:
+                from_i = 0
+            else:
+                from_i = prev_i + entry_wait
+            if from_i >= to_i:
+                break
+            idxs = entry_choice_func_nb(col, from_i, to_i, *entry_args)
+            a = entries_out
+        else:
+            from_i = prev_i + exit_wait
+            if from_i >= to_i:
+                break
+            idxs = exit_choice_func_nb(col, from_i, to_i, *exit_args)
+            a = exits_out
+        if len(idxs) == 0:
+            break
+        found_i = idxs[0]
+        if found_i == prev_i == prev_prev_i:
+            raise ValueError("Infinite loop detected")
+        if found_i < from_i or found_i >= to_i:
+            raise ValueError("Returned index is out of bounds")
+        a[found_i] = True
+        prev_prev_i = prev_i
+        prev_i = found_i
+        i += 1
+
+
 @njit
 def generate_enex_nb(shape, entry_wait, exit_wait, entry_choice_func_nb,
                      entry_args, exit_choice_func_nb, exit_args):
@@ -105,41 +157,33 @@ def generate_enex_nb(shape, entry_wait, exit_wait, entry_choice_func_nb,
         raise ValueError("entry_wait and exit_wait cannot be both 0")
 
     for col in range(shape[1]):
-        prev_prev_i = -2
-        prev_i = -1
-        i = 0
-        while True:
-            to_i = shape[0]
-            # Cannot assign two functions to a var in numba
-            if i % 2 == 0:
-                if i == 0:
-                    from_i = 0
-                else:
-                    from_i = prev_i + entry_wait
-                if from_i >= to_i:
-                    break
-                idxs = entry_choice_func_nb(col, from_i, to_i, *entry_args)
-                a = entries
-            else:
-                from_i = prev_i + exit_wait
-                if from_i >= to_i:
-                    break
-                idxs = exit_choice_func_nb(col, from_i, to_i, *exit_args)
-                a = exits
-            if len(idxs) == 0:
-                break
-            found_i = idxs[0]
-            if found_i == prev_i == prev_prev_i:
-                raise ValueError("Infinite loop detected")
-            if found_i < from_i or found_i >= to_i:
-                raise ValueError("Returned index is out of bounds")
-            a[found_i, col] = True
-            prev_prev_i = prev_i
-            prev_i = found_i
-            i += 1
+        generate_enex_col_nb(
+            col, shape[0], entry_wait, exit_wait, entries[:, col], exits[:, col],
+            entry_choice_func_nb, entry_args, exit_choice_func_nb, exit_args
+        )
     return entries, exits
 
 
+@njit(parallel=True)
+def apply_cols_parallel_nb(n_cols, seed, col_func_nb, *args):
+    """Apply `col_func_nb` to each column index from 0 to `n_cols` in parallel.
+
+    `col_func_nb` should accept the index of the current column and `*args`, and usually
+    calls `generate_ex_col_nb` or `generate_enex_col_nb`. Columns are distributed across threads
+    using `numba.prange`. Before each column, the random number generator is seeded with
+    `seed + col`, such that the output doesn't depend upon how columns are distributed across threads.
+
+    !!! note
+        * `col_func_nb` must be thread-safe: it must not write to arrays shared across columns,
+            such as `temp_idx_arr`. Built-in choice functions allocate a local array if
+            `temp_idx_arr` is None.
+        * `*args` must be arrays or scalars, since tuples cannot be passed into the `prange` body"""
+    for k in prange(n_cols):
+        col = np.int64(k)  # prange index is unsigned
+        np.random.seed(seed + col)
+        col_func_nb(col, *args)
+
+
 # ############# Random ############# #
 
 
@@ -190,8 +234,10 @@ def generate_rand_nb(shape, n, seed=None):
 def rand_by_prob_choice_nb(col, from_i, to_i, prob, first, temp_idx_arr, flex_2d):
     """`choice_func_nb` to randomly pick values from range `[from_i, to_i)` with probability `prob`.
 
-    `prob` uses flexible indexing."""
+    `prob` uses flexible indexing. If `temp_idx_arr` is None, allocates a new array."""
     probs = np.asarray(prob)
+    if temp_idx_arr is None:
+        temp_idx_arr = np.empty(to_i - from_i, dtype=np.int_)
     j = 0
     for i in range(from_i, to_i):
         if np.random.uniform(0, 1) < flex_select_auto_nb(i, col, probs, flex_2d):  # [0, 1)
@@ -391,10 +437,14 @@ def stop_choice_nb(col, from_i, to_i, ts, stop, trailing, wait, first, temp_idx_
 
             Setting False or 0 may result in two signals at one tick.
         first (bool): Whether to stop as soon as the first exit signal is found.
-        temp_idx_arr (int): Empty integer array used to temporarily store indices.
+        temp_idx_arr (array_like of int): Empty integer array used to temporarily store indices.
+
+            If None, allocates a new array, which makes the function thread-safe.
         flex_2d (bool): See `vectorbt.base.reshape_fns.flex_choose_i_and_col_nb`."""
     stops = np.asarray(stop)
     trailings = np.asarray(trailing)
+    if temp_idx_arr is None:
+        temp_idx_arr = np.empty(to_i - from_i, dtype=np.int_)
 
     j = 0
     min_i = max_i = init_i = from_i - wait
@@ -485,6 +535,95 @@ def generate_stop_ex_iter_nb(entries, ts, stop, trailing, entry_wait, exit_wait,
     )
 
 
+@njit(cache=True)
+def generate_stop_ex_grid_nb(entries, ts, stops, trailings, wait, first, flex_2d):
+    """Generate using `stop_choice_nb` for a grid of stop values at once.
+
+    `stops` and `trailings` must be 1-dim arrays with one value per parameter combination.
+    Returns exits of shape `(entries.shape[0], len(stops) * entries.shape[1])`, with columns
+    of each combination stacked one after another, same as running `generate_stop_ex_nb`
+    for each combination and concatenating the results.
+
+    Instead of scanning the time series once per combination, walks the range after each entry
+    once, keeps track of the lowest low and highest high since entry, and checks all combinations
+    that haven't exited yet at each tick.
+
+    Example:
+        ```python-repl
+        >>> import numpy as np
+        >>> from vectorbt.signals.nb import generate_stop_ex_grid_nb
+
+        >>> entries = np.asarray([False, True, False, False, False])[:, None]
+        >>> ts = np.asarray([1, 2, 3, 2, 1])[:, None]
+
+        >>> generate_stop_ex_grid_nb(
+        ...     entries, ts, np.asarray([-0.1, 0.1]), np.asarray([True, False]), 1, True, True)
+        array([[False, False],
+               [False, False],
+               [False,  True],
+               [ True, False],
+               [False, False]])
+        ```"""
+    n_params = stops.shape[0]
+    n_cols = entries.shape[1]
+    exits = np.full((entries.shape[0], n_params * n_cols), False, dtype=np.bool_)
+    active = np.empty(n_params, dtype=np.bool_)
+
+    for col in range(n_cols):
+        entry_idxs = np.flatnonzero(entries[:, col])
+        for e in range(entry_idxs.shape[0]):
+            # Calculate the range to choose from
+            from_i = entry_idxs[e] + wait
+            if e < entry_idxs.shape[0] - 1:
+                to_i = entry_idxs[e + 1]
+            else:
+                to_i = entries.shape[0]
+            if to_i <= from_i:
+                continue
+
+            init_ts = flex_select_auto_nb(from_i - wait, col, ts, flex_2d)
+            max_high = min_low = init_ts
+            n_active = 0
+            for k in range(n_params):
+                active[k] = stops[k] != 0
+                if active[k]:
+                    n_active += 1
+
+            for i in range(from_i, to_i):
+                if n_active == 0:
+                    break
+                curr_ts = flex_select_auto_nb(i, col, ts, flex_2d)
+                for k in range(n_params):
+                    if not active[k]:
+                        continue
+                    # Calculate stop price
+                    if trailings[k]:
+                        if stops[k] > 0:
+                            curr_stop_price = min_low * (1 + abs(stops[k]))
+                        else:
+                            curr_stop_price = max_high * (1 - abs(stops[k]))
+                    else:
+                        curr_stop_price = init_ts * (1 + stops[k])
+
+                    # Check if stop price is within bar
+                    if stops[k] > 0:
+                        exit_signal = curr_ts >= curr_stop_price
+                    else:
+                        exit_signal = curr_ts <= curr_stop_price
+                    if exit_signal:
+                        exits[i, k * n_cols + col] = True
+                        if first:
+                            active[k] = False
+                            n_active -= 1
+
+                # Keep track of lowest low and highest high (same for all combinations)
+                if curr_ts < min_low:
+                    min_low = curr_ts
+                elif curr_ts > max_high:
+                    max_high = curr_ts
+    return exits
+
+
 @njit(cache=True)
 def adv_stop_choice_nb(col, from_i, to_i, open, high, low, close, hit_price_out, stop_type_out,
                        sl_stop, ts_stop, tp_stop, is_open_safe, wait, first, temp_idx_arr, flex_2d):
@@ -528,11 +667,15 @@ def adv_stop_choice_nb(col, from_i, to_i, open, high, low, close, hit_price_out,
             Setting False or 0 may result in two signals at one tick.
         first (bool): Whether to stop as soon as the first exit signal is found.
         temp_idx_arr (array_like of int): Empty integer array used to temporarily store indices.
+
+            If None, allocates a new array, which makes the function thread-safe.
         flex_2d (bool): See `vectorbt.base.reshape_fns.flex_choose_i_and_col_nb`.
     """
     sl_stops = np.asarray(sl_stop)
     ts_stops = np.asarray(ts_stop)
     tp_stops = np.asarray(tp_stop)
+    if temp_idx_arr is None:
+        temp_idx_arr = np.empty(to_i - from_i, dtype=np.int_)
 
     init_i = from_i - wait
     init_open = flex_select_auto_nb(init_i, col, open, flex_2d)
@@ -671,6 +814,126 @@ def generate_adv_stop_ex_iter_nb(entries, open, high, low, close, hit_price_out,
     )
 
 
+@njit(cache=True)
+def generate_adv_stop_ex_grid_nb(entries, open, high, low, close, hit_price_out, stop_type_out,
+                                 sl_stops, ts_stops, tp_stops, is_open_safe, wait, first, flex_2d):
+    """Generate using `adv_stop_choice_nb` for a grid of stop values at once.
+
+    `sl_stops`, `ts_stops` and `tp_stops` must be 1-dim arrays with one value per parameter
+    combination. `hit_price_out` and `stop_type_out` must have the shape of the returned exits,
+    which is `(entries.shape[0], len(sl_stops) * entries.shape[1])`, with columns of each
+    combination stacked one after another, same as running `generate_adv_stop_ex_nb`
+    for each combination and concatenating the results.
+
+    Instead of scanning the price once per combination, walks the range after each entry
+    once, keeps track of the highest high since entry, and checks all combinations that
+    haven't exited yet at each tick. The price inputs are never tiled.
+
+    Example:
+        ```python-repl
+        >>> import numpy as np
+        >>> from vectorbt.signals.nb import generate_adv_stop_ex_grid_nb
+
+        >>> entries = np.asarray([True, False, False, False, False])[:, None]
+        >>> open_p = np.asarray([10, 11, 12, 11, 10])[:, None]
+        >>> high_p = open_p + 1
+        >>> low_p = open_p - 1
+        >>> close_p = open_p
+        >>> hit_p_out = np.full((5, 3), np.nan)
+        >>> stop_type_out = np.full((5, 3), -1)
+
+        >>> generate_adv_stop_ex_grid_nb(
+        ...     entries, open_p, high_p, low_p, close_p, hit_p_out, stop_type_out,
+        ...     np.asarray([0.1, 0., 0.]), np.asarray([0., 0.1, 0.]), np.asarray([0., 0., 0.1]),
+        ...     True, 1, True, True
+        ... )
+        array([[False, False, False],
+               [False, False,  True],
+               [False, False, False],
+               [False,  True, False],
+               [ True, False, False]])
+        >>> hit_p_out
+        array([[ nan,  nan,  nan],
+               [ nan,  nan, 11. ],
+               [ nan,  nan,  nan],
+               [ nan, 11.7,  nan],
+               [ 9. ,  nan,  nan]])
+        ```"""
+    n_params = sl_stops.shape[0]
+    n_cols = entries.shape[1]
+    exits = np.full((entries.shape[0], n_params * n_cols), False, dtype=np.bool_)
+    active = np.empty(n_params, dtype=np.bool_)
+
+    for col in range(n_cols):
+        entry_idxs = np.flatnonzero(entries[:, col])
+        for e in range(entry_idxs.shape[0]):
+            # Calculate the range to choose from
+            from_i = entry_idxs[e] + wait
+            if e < entry_idxs.shape[0] - 1:
+                to_i = entry_idxs[e + 1]
+            else:
+                to_i = entries.shape[0]
+            if to_i <= from_i:
+                continue
+
+            init_i = from_i - wait
+            init_open = flex_select_auto_nb(init_i, col, open, flex_2d)
+            max_p = init_open
+            n_active = 0
+            for k in range(n_params):
+                active[k] = sl_stops[k] != 0 or ts_stops[k] != 0 or tp_stops[k] != 0
+                if active[k]:
+                    n_active += 1
+
+            for i in range(from_i, to_i):
+                if n_active == 0:
+                    break
+                # Check if stop price is within bar
+                if i > init_i or is_open_safe:
+                    curr_high = flex_select_auto_nb(i, col, high, flex_2d)
+                    curr_low = flex_select_auto_nb(i, col, low, flex_2d)
+                else:
+                    curr_close = flex_select_auto_nb(i, col, close, flex_2d)
+                    curr_high = curr_low = curr_close
+
+                for k in range(n_params):
+                    if not active[k]:
+                        continue
+                    out_col = k * n_cols + col
+                    sl_stop = abs(sl_stops[k])
+                    ts_stop = abs(ts_stops[k])
+                    tp_stop = abs(tp_stops[k])
+                    exit_signal = False
+                    if sl_stop > 0:
+                        curr_sl_stop_price = init_open * (1 - sl_stop)
+                        if curr_low <= curr_sl_stop_price:
+                            exit_signal = True
+                            hit_price_out[i, out_col] = curr_sl_stop_price
+                            stop_type_out[i, out_col] = StopType.StopLoss
+                    if not exit_signal and ts_stop > 0:
+                        curr_ts_stop_price = max_p * (1 - ts_stop)
+                        if curr_low <= curr_ts_stop_price:
+                            exit_signal = True
+                            hit_price_out[i, out_col] = curr_ts_stop_price
+                            stop_type_out[i, out_col] = StopType.TrailStop
+                    if not exit_signal and tp_stop > 0:
+                        curr_tp_stop_price = init_open * (1 + tp_stop)
+                        if curr_high >= curr_tp_stop_price:
+                            exit_signal = True
+                            hit_price_out[i, out_col] = curr_tp_stop_price
+                            stop_type_out[i, out_col] = StopType.TakeProfit
+                    if exit_signal:
+                        exits[i, out_col] = True
+                        if first:
+                            active[k] = False
+                            n_active -= 1
+
+                # Keep track of highest high (same for all combinations)
+                if curr_high > max_p:
+                    max_p = curr_high
+    return exits
+
+
 # ############# Map and reduce ############# #
 
 
@@ -933,3 +1196,215 @@ def fshift_1d_nb(a, n):
 def fshift_nb(a, n):
     """2-dim version of `fshift_1d_nb`."""
     return fshift_1d_nb(a, n)
+
+
+# ############# Packing ############# #
+
+# Packed signals store each column as a sequence of bytes, with the signal at row i stored in
+# bit i % 8 of byte i // 8 (same layout as np.packbits with axis=0 and bitorder='little').
+# Bits past the last row are always zero.
+
+@njit(cache=True)
+def pack_nb(a):
+    """Pack a boolean array `a` into an array of `np.uint8` with `ceil(len(a) / 8)` rows."""
+    out = np.zeros(((a.shape[0] + 7) // 8, a.shape[1]), dtype=np.uint8)
+
+    for col in range(a.shape[1]):
+        for i in range(a.shape[0]):
+            if a[i, col]:
+                out[i // 8, col] |= np.uint8(1 << (i % 8))
+    return out
+
+
+@njit(cache=True)
+def unpack_1d_nb(packed, n_rows):
+    """Unpack a column of packed signals into a boolean array of length `n_rows`."""
+    out = np.empty(n_rows, dtype=np.bool_)
+
+    for i in range(n_rows):
+        out[i] = ((packed[i // 8] >> (i % 8)) & 1) == 1
+    return out
+
+
+@njit(cache=True)
+def unpack_nb(packed, n_rows):
+    """2-dim version of `unpack_1d_nb`."""
+    out = np.empty((n_rows, packed.shape[1]), dtype=np.bool_)
+
+    for col in range(packed.shape[1]):
+        out[:, col] = unpack_1d_nb(packed[:, col], n_rows)
+    return out
+
+
+@njit(cache=True)
+def nonzero_packed_1d_nb(packed):
+    """Get the indices of signals in a column of packed signals.
+
+    Skips empty bytes, such that sparse signals are found without visiting each row."""
+    out = np.empty(packed.shape[0] * 8, dtype=np.int_)
+    k = 0
+    for j in range(packed.shape[0]):
+        byte = packed[j]
+        if byte != 0:
+            for b in range(8):
+                if (byte >> b) & 1:
+                    out[k] = j * 8 + b
+                    k += 1
+    return out[:k]
+
+
+@njit(cache=True)
+def popcount_nb(packed):
+    """Count signals in each column of packed signals."""
+    out = np.zeros(packed.shape[1], dtype=np.int_)
+
+    for col in range(packed.shape[1]):
+        for j in range(packed.shape[0]):
+            x = np.int_(packed[j, col])
+            x = x - ((x >> 1) & 0x55)
+            x = (x & 0x33) + ((x >> 2) & 0x33)
+            out[col] += (x + (x >> 4)) & 0x0F
+    return out
+
+
+@njit(cache=True)
+def invert_packed_nb(packed, n_rows):
+    """Invert packed signals while keeping the bits past the last row zero."""
+    out = ~packed
+    if n_rows % 8 != 0:
+        mask = np.uint8((1 << (n_rows % 8)) - 1)
+        for col in range(packed.shape[1]):
+            out[-1, col] &= mask
+    return out
+
+
+@njit
+def map_reduce_between_packed_nb(packed, map_func_nb, map_args, reduce_func_nb, reduce_args):
+    """Packed version of `map_reduce_between_nb`."""
+    out = np.full(packed.shape[1], np.nan, dtype=np.float_)
+
+    for col in range(packed.shape[1]):
+        a_idxs = nonzero_packed_1d_nb(packed[:, col])
+        if a_idxs.shape[0] > 1:
+            map_res = np.empty(a_idxs.shape[0])
+            k = 0
+            for j in range(1, a_idxs.shape[0]):
+                map_res[k] = map_func_nb(col, a_idxs[j - 1], a_idxs[j], *map_args)
+                k += 1
+            if k > 0:
+                out[col] = reduce_func_nb(col, map_res[:k], *reduce_args)
+    return out
+
+
+@njit
+def map_reduce_between_two_packed_nb(packed_a, packed_b, map_func_nb, map_args, reduce_func_nb, reduce_args):
+    """Packed version of `map_reduce_between_two_nb`."""
+    out = np.full(packed_a.shape[1], np.nan, dtype=np.float_)
+
+    for col in range(packed_a.shape[1]):
+        a_idxs = nonzero_packed_1d_nb(packed_a[:, col])
+        if a_idxs.shape[0] > 0:
+            b_idxs = nonzero_packed_1d_nb(packed_b[:, col])
+            if b_idxs.shape[0] > 0:
+                map_res = np.empty(b_idxs.shape)
+                k = 0
+                a_j = -1
+                for j in range(b_idxs.shape[0]):
+                    to_i = b_idxs[j]
+                    while a_j + 1 < a_idxs.shape[0] and a_idxs[a_j + 1] < to_i:
+                        a_j += 1
+                    if a_j >= 0:
+                        map_res[k] = map_func_nb(col, a_idxs[a_j], to_i, *map_args)
+                        k += 1
+                if k > 0:
+                    out[col] = reduce_func_nb(col, map_res[:k], *reduce_args)
+    return out
+
+
+@njit(cache=True)
+def rank_packed_nb(packed, n_rows, reset_by=None, after_false=False, allow_gaps=False):
+    """Packed version of `rank_nb`.
+
+    `reset_by` must be packed as well. Unpacks one column at a time."""
+    out = np.zeros((n_rows, packed.shape[1]), dtype=np.int_)
+
+    for col in range(packed.shape[1]):
+        out[:, col] = rank_1d_nb(
+            unpack_1d_nb(packed[:, col], n_rows),
+            None if reset_by is None else unpack_1d_nb(reset_by[:, col], n_rows),
+            after_false=after_false,
+            allow_gaps=allow_gaps
+        )
+    return out
+
+
+@njit(cache=True)
+def nst_packed_nb(packed, n_rows, n, from_nst=False, reset_by=None, after_false=False, allow_gaps=False):
+    """Select signals with rank `n` (or at least `n` if `from_nst` is True) in packed signals.
+
+    Returns packed signals. For keyword arguments, see `rank_packed_nb`."""
+    out = np.zeros_like(packed)
+
+    for col in range(packed.shape[1]):
+        ranked = rank_1d_nb(
+            unpack_1d_nb(packed[:, col], n_rows),
+            None if reset_by is None else unpack_1d_nb(reset_by[:, col], n_rows),
+            after_false=after_false,
+            allow_gaps=allow_gaps
+        )
+        for i in range(n_rows):
+            if ranked[i] == n or (from_nst and ranked[i] > n):
+                out[i // 8, col] |= np.uint8(1 << (i % 8))
+    return out
+
+
+# ############# Sparse signals ############# #
+
+# Sparse signals store the row indices of the signals of all columns in a single sorted-per-column
+# array `idxs`, together with a 2-dim array `col_index` holding the start (inclusive) and end
+# (exclusive) position of each column in `idxs`. Empty columns have the same start and end.
+
+@njit(cache=True)
+def to_sparse_nb(a):
+    """Convert a boolean array `a` into sparse signals.
+
+    Returns `idxs` and `col_index`."""
+    idxs = np.empty(np.sum(a), dtype=np.int_)
+    col_index = np.empty((a.shape[1], 2), dtype=np.int_)
+    k = 0
+    for col in range(a.shape[1]):
+        col_index[col, 0] = k
+        for i in range(a.shape[0]):
+            if a[i, col]:
+                idxs[k] = i
+                k += 1
+        col_index[col, 1] = k
+    return idxs, col_index
+
+
+@njit(cache=True)
+def from_sparse_nb(idxs, col_index, n_rows):
+    """Convert sparse signals into a boolean array with `n_rows` rows."""
+    out = np.full((n_rows, col_index.shape[0]), False, dtype=np.bool_)
+
+    for col in range(col_index.shape[0]):
+        for k in range(col_index[col, 0], col_index[col, 1]):
+            out[idxs[k], col] = True
+    return out
+
+
+@njit(cache=True)
+def packed_to_sparse_nb(packed):
+    """Convert packed signals into sparse signals without unpacking them.
+
+    Returns `idxs` and `col_index`. See `to_sparse_nb`."""
+    idxs = np.empty(np.sum(popcount_nb(packed)), dtype=np.int_)
+    col_index = np.empty((packed.shape[1], 2), dtype=np.int_)
+    k = 0
+    for col in range(packed.shape[1]):
+        col_index[col, 0] = k
+        col_idxs = nonzero_packed_1d_nb(packed[:, col])
+        idxs[k:k + len(col_idxs)] = col_idxs
+        k += len(col_idxs)
+        col_index[col, 1] = k
+    return idxs, col_index
@@ -0,0 +1,254 @@
+"""Class for working with bit-packed signals.
+
+Stores a boolean signal array with one bit per element instead of one byte, which takes
+8 times less memory. Each column is packed separately along the index, such that operations
+processing one column at a time can unpack, or directly scan, only the column at hand.
+
+```python-repl
+>>> import vectorbt as vbt
+>>> import pandas as pd
+
+>>> sig = pd.DataFrame({
+...     'a': [True, False, False, False, False],
+...     'b': [True, False, True, False, True],
+...     'c': [True, True, True, False, False]
+... })
+>>> packed = sig.vbt.signals.pack()
+>>> packed.packed
+array([[ 1, 21,  7]], dtype=uint8)
+>>> packed.num_signals()
+a    1
+b    3
+c    3
+dtype: int64
+>>> packed.first().unpack()
+       a      b      c
+0   True   True   True
+1  False  False  False
+2  False   True  False
+3  False  False  False
+4  False   True  False
+```"""
+
+import numpy as np
+import pandas as pd
+
+from vectorbt.utils import checks
+from vectorbt.utils.config import Configured
+from vectorbt.base import reshape_fns
+from vectorbt.base.array_wrapper import ArrayWrapper, indexing_on_wrapper_meta
+from vectorbt.base.indexing import PandasIndexer
+from vectorbt.signals import nb
+
+
+def _packed_indexing_func(obj, pd_indexing_func):
+    """Perform indexing on `PackedSignals`."""
+    new_wrapper, _, _, col_idxs = indexing_on_wrapper_meta(obj.wrapper, pd_indexing_func, column_only_select=True)
+    return obj.copy(
+        wrapper=new_wrapper,
+        packed=obj.packed[:, reshape_fns.to_1d(col_idxs)]
+    )
+
+
+class PackedSignals(Configured, PandasIndexer):
+    """Exposes methods for working with bit-packed signals.
+
+    Args:
+        wrapper (ArrayWrapper): Array wrapper.
+
+            See `vectorbt.base.array_wrapper.ArrayWrapper`.
+        packed (array_like): Packed signals of type `np.uint8` as returned by `vectorbt.signals.nb.pack_nb`.
+
+            Must have `ceil(n / 8)` rows, where `n` is the length of the index of `wrapper`.
+
+    Indexing is performed on columns only.
+
+    !!! note
+        This class is meant to be immutable. To change any attribute, use `PackedSignals.copy`."""
+
+    def __init__(self, wrapper, packed):
+        checks.assert_type(wrapper, ArrayWrapper)
+        if not isinstance(packed, np.ndarray):
+            packed = np.asarray(packed)
+        checks.assert_dtype(packed, np.uint8)
+        if packed.shape != ((wrapper.shape_2d[0] + 7) // 8, wrapper.shape_2d[1]):
+            raise ValueError("Shape of packed signals doesn't match the shape of wrapper")
+
+        Configured.__init__(
+            self,
+            wrapper=wrapper,
+            packed=packed
+        )
+
+        self._wrapper = wrapper
+        self._packed = packed
+
+        PandasIndexer.__init__(self, _packed_indexing_func)
+
+    @classmethod
+    def from_signals(cls, obj, **kwargs):
+        """Pack a signal Series/DataFrame `obj`.
+
+        `**kwargs` are passed to `vectorbt.base.array_wrapper.ArrayWrapper.from_obj`."""
+        checks.assert_type(obj, (pd.Series, pd.DataFrame))
+        checks.assert_dtype(obj, np.bool)
+        wrapper = ArrayWrapper.from_obj(obj, **kwargs)
+        return cls(wrapper, nb.pack_nb(reshape_fns.to_2d(obj, raw=True)))
+
+    @property
+    def wrapper(self):
+        """Array wrapper."""
+        return self._wrapper
+
+    @property
+    def packed(self):
+        """Packed signals."""
+        return self._packed
+
+    @property
+    def n_rows(self):
+        """Number of rows in unpacked signals."""
+        return self.wrapper.shape_2d[0]
+
+    def unpack(self):
+        """Unpack signals into a boolean Series/DataFrame."""
+        return self.wrapper.wrap(nb.unpack_nb(self.packed, self.n_rows))
+
+    def num_signals(self):
+        """Count True values using `vectorbt.signals.nb.popcount_nb`."""
+        return self.wrapper.wrap_reduced(nb.popcount_nb(self.packed))
+
+    # ############# Map and reduce ############# #
+
+    def map_reduce_between(self, other=None, map_func_nb=None, map_args=None,
+                           reduce_func_nb=None, reduce_args=None):
+        """See `vectorbt.signals.nb.map_reduce_between_packed_nb`.
+
+        If `other` specified, see `vectorbt.signals.nb.map_reduce_between_two_packed_nb`.
+        `other` must be `PackedSignals` of the same shape.
+
+        See `vectorbt.signals.accessors.Signals_Accessor.map_reduce_between`."""
+        checks.assert_not_none(map_func_nb)
+        checks.assert_not_none(reduce_func_nb)
+        checks.assert_numba_func(map_func_nb)
+        checks.assert_numba_func(reduce_func_nb)
+        if map_args is None:
+            map_args = ()
+        if reduce_args is None:
+            reduce_args = ()
+        map_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in map_args])
+        reduce_args = tuple([arg.values if checks.is_pandas(arg) else arg for arg in reduce_args])
+
+        if other is None:
+            result = nb.map_reduce_between_packed_nb(
+                self.packed,
+                map_func_nb, map_args,
+                reduce_func_nb, reduce_args
+            )
+        else:
+            self._check_other(other)
+            result = nb.map_reduce_between_two_packed_nb(
+                self.packed,
+                other.packed,
+                map_func_nb, map_args,
+                reduce_func_nb, reduce_args
+            )
+        return self.wrapper.wrap_reduced(result)
+
+    def avg_distance(self, to=None, **kwargs):
+        """Calculate the average distance between True values in `self` and optionally `to`.
+
+        See `PackedSignals.map_reduce_between`."""
+        return self.map_reduce_between(
+            other=to,
+            map_func_nb=nb.distance_map_nb,
+            reduce_func_nb=nb.mean_reduce_nb,
+            **kwargs
+        )
+
+    # ############# Ranking ############# #
+
+    def rank(self, reset_by=None, after_false=False, allow_gaps=False):
+        """See `vectorbt.signals.nb.rank_packed_nb`.
+
+        `reset_by` must be `PackedSignals` of the same shape."""
+        if reset_by is not None:
+            self._check_other(reset_by)
+            reset_by = reset_by.packed
+        ranked = nb.rank_packed_nb(
+            self.packed,
+            self.n_rows,
+            reset_by=reset_by,
+            after_false=after_false,
+            allow_gaps=allow_gaps
+        )
+        return self.wrapper.wrap(ranked)
+
+    def nst(self, n, from_nst=False, reset_by=None, after_false=False, allow_gaps=False):
+        """Select signals with rank `n` without unpacking the whole array.
+
+        See `vectorbt.signals.nb.nst_packed_nb`."""
+        if reset_by is not None:
+            self._check_other(reset_by)
+            reset_by = reset_by.packed
+        packed = nb.nst_packed_nb(
+            self.packed,
+            self.n_rows,
+            n,
+            from_nst=from_nst,
+            reset_by=reset_by,
+            after_false=after_false,
+            allow_gaps=allow_gaps
+        )
+        return self.copy(packed=packed)
+
+    def first(self, **kwargs):
+        """`PackedSignals.rank` == 1."""
+        return self.nst(1, **kwargs)
+
+    def from_nst(self, n, **kwargs):
+        """`PackedSignals.rank` >= n."""
+        return self.nst(n, from_nst=True, **kwargs)
+
+    # ############# Logical operations ############# #
+
+    def _check_other(self, other):
+        """Check that `other` is `PackedSignals` of the same shape."""
+        checks.assert_type(other, PackedSignals)
+        checks.assert_shape_equal(self.packed, other.packed)
+
+    def _combine(self, others, combine_func):
+        """Combine packed signals with each in `others` using `combine_func`."""
+        packed = self.packed
+        for other in others:
+            self._check_other(other)
+            packed = combine_func(packed, other.packed)
+        return self.copy(packed=packed)
+
+    def AND(self, *others):
+        """Combine with each in `*others` using logical AND."""
+        return self._combine(others, np.bitwise_and)
+
+    def OR(self, *others):
+        """Combine with each in `*others` using logical OR."""
+        return self._combine(others, np.bitwise_or)
+
+    def XOR(self, *others):
+        """Combine with each in `*others` using logical XOR."""
+        return self._combine(others, np.bitwise_xor)
+
+    def NOT(self):
+        """Invert signals."""
+        return self.copy(packed=nb.invert_packed_nb(self.packed, self.n_rows))
+
+    def __and__(self, other):
+        return self.AND(other)
+
+    def __or__(self, other):
+        return self.OR(other)
+
+    def __xor__(self, other):
+        return self.XOR(other)
+
+    def __invert__(self):
+        return self.NOT()
@@ -35,6 +35,65 @@ def insert_argsort_nb(A, I):
         I[i + 1] = key2
 
 
+@njit(cache=True)
+def select_nb(a, k, lo=0, hi=None):
+    """Partially sort `a[lo:hi + 1]` in place such that `a[k]` holds the value it would hold if sorted.
+
+    All values to the left of `k` are then less than or equal and all values to the right are
+    greater than or equal to `a[k]`. Returns `a[k]`.
+
+    Uses quickselect with a median-of-three pivot, which takes linear time on average.
+    If partitioning doesn't converge in `2 * log2(n)` steps, sorts the remaining range instead
+    (introselect). `a` must not contain NaN."""
+    if hi is None:
+        hi = a.shape[0] - 1
+    depth = 2 * int(np.log2(hi - lo + 1)) + 1
+    while hi > lo:
+        if depth == 0:
+            a[lo:hi + 1] = np.sort(a[lo:hi + 1])
+            break
+        depth -= 1
+        mid = (lo + hi) // 2
+        if a[mid] < a[lo]:
+            a[mid], a[lo] = a[lo], a[mid]
+        if a[hi] < a[lo]:
+            a[hi], a[lo] = a[lo], a[hi]
+        if a[hi] < a[mid]:
+            a[hi], a[mid] = a[mid], a[hi]
+        pivot = a[mid]
+        i = lo
+        j = hi
+        while i <= j:
+            while a[i] < pivot:
+                i += 1
+            while a[j] > pivot:
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    return a[k]
+
+
+@njit(cache=True)
+def select_ranks_nb(a, ranks):
+    """Partially sort `a` in place such that each rank in `ranks` holds the value it would hold if sorted.
+
+    `ranks` must be sorted in ascending order. Each selection is restricted to the range
+    right of the previous rank, so selecting multiple ranks is not much slower than selecting one.
+    See `select_nb`."""
+    lo = 0
+    for r in range(ranks.shape[0]):
+        select_nb(a, ranks[r], lo, a.shape[0] - 1)
+        lo = ranks[r]
+
+
 def get_ranges_arr(starts, ends):
     """Build array from start and end indices.
 
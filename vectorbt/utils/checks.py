@@ -29,6 +29,20 @@ def is_array(arg):
     return is_pandas(arg) or isinstance(arg, np.ndarray)
 
 
+def is_memmap(arg):
+    """Determine whether `arg` is a memory-mapped array or is backed by one.
+
+    Follows the chain of `base` arrays, such that views and broadcast views of `np.memmap`
+    as well as pandas objects wrapping it are detected too."""
+    if is_pandas(arg):
+        arg = arg.values
+    while isinstance(arg, np.ndarray):
+        if isinstance(arg, np.memmap):
+            return True
+        arg = arg.base
+    return False
+
+
 def is_numba_func(arg):
     """Determine whether `arg` is a Numba-compiled function."""
     if 'NUMBA_DISABLE_JIT' in os.environ:
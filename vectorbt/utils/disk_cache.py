@@ -0,0 +1,247 @@
+"""Utilities for caching arrays on disk.
+
+Each entry is a directory named after a content hash and holding one `.npy` file per array,
+which can be loaded back as a memory map. Entries are evicted in least-recently-used order
+once the total size of the cache exceeds its limit."""
+
+import numpy as np
+import pandas as pd
+import os
+import shutil
+import pickle
+import hashlib
+import uuid
+from types import CodeType
+
+from vectorbt.utils import checks
+
+
+def update_code_hash(h, code):
+    """Update hash object `h` with the bytecode and constants of code object `code`.
+
+    Nested code objects (such as of inner functions) are hashed recursively, since their
+    representation contains a memory address."""
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            update_code_hash(h, const)
+        elif isinstance(const, frozenset):
+            # Order of elements depends upon hash randomization
+            h.update(b'frozenset')
+            h.update(repr(sorted(map(repr, const))).encode())
+        else:
+            h.update(type(const).__name__.encode())
+            h.update(repr(const).encode())
+
+
+def update_hash(h, obj):
+    """Update hash object `h` with the content of `obj`.
+
+    Arrays are hashed by their dtype, shape and data, functions by their module, qualified name
+    and (for Python and Numba functions) their bytecode. Objects enclosed by functions are not hashed,
+    thus functions created by the same factory must be told apart by an explicit identifier.
+    Containers are hashed recursively, scalars by their representation.
+
+    Raises `TypeError` for any other object, since its representation may not reflect its content."""
+    if isinstance(obj, np.ndarray):
+        obj = np.ascontiguousarray(obj)
+        h.update(b'ndarray')
+        h.update(str(obj.dtype).encode())
+        h.update(str(obj.shape).encode())
+        if obj.dtype.hasobject:
+            h.update(pickle.dumps(obj.tolist()))
+        else:
+            h.update(obj.view(np.uint8).data if obj.size > 0 else b'')
+    elif isinstance(obj, (tuple, list)):
+        h.update(type(obj).__name__.encode())
+        h.update(str(len(obj)).encode())
+        for x in obj:
+            update_hash(h, x)
+    elif isinstance(obj, dict):
+        h.update(b'dict')
+        h.update(str(len(obj)).encode())
+        for k in sorted(obj.keys(), key=repr):
+            update_hash(h, k)
+            update_hash(h, obj[k])
+    elif isinstance(obj, pd.Index):
+        h.update(type(obj).__name__.encode())
+        update_hash(h, obj.values)
+    elif checks.is_pandas(obj):
+        h.update(type(obj).__name__.encode())
+        update_hash(h, obj.values)
+        update_hash(h, obj.index.values)
+        if checks.is_frame(obj):
+            update_hash(h, obj.columns.values)
+    elif obj is None or isinstance(obj, (bool, int, float, complex, str, bytes, np.generic, np.dtype, type)):
+        h.update(type(obj).__name__.encode())
+        h.update(repr(obj).encode())
+    elif callable(obj):
+        h.update(b'callable')
+        h.update(str(getattr(obj, '__module__', '')).encode())
+        h.update(getattr(obj, '__qualname__', type(obj).__qualname__).encode())
+        func = getattr(obj, 'py_func', obj)  # Numba-compiled functions
+        code = getattr(func, '__code__', None)
+        if code is not None:
+            update_code_hash(h, code)
+    else:
+        raise TypeError(f"Cannot hash object of type {type(obj)}")
+
+
+def hash_objs(*objs):
+    """Get a hexadecimal hash of multiple objects. See `update_hash`."""
+    h = hashlib.sha1()
+    for obj in objs:
+        update_hash(h, obj)
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Content-addressed cache of arrays on disk.
+
+    Args:
+        cache_dir (str): Directory where to store the entries. Will be created if it doesn't exist.
+        max_size (int): Maximum total size of the cache in bytes.
+
+            Least recently used entries are removed once the total size exceeds this value.
+            If None, the cache can grow indefinitely.
+        mmap_mode (str): Mode passed to `np.load` to load arrays as memory maps.
+
+            Defaults to copy-on-write, such that loaded arrays are writable like freshly computed ones
+            while changes never reach the disk. Set to None to load arrays into memory.
+
+    Example:
+        ```python-repl
+        >>> import numpy as np
+        >>> from vectorbt.utils.disk_cache import DiskCache
+
+        >>> cache = DiskCache('/tmp/vbt_cache', max_size=100 * 1024 ** 2)
+        >>> key = cache.make_key('my_func', np.arange(3), (1, 2))
+        >>> cache.set(key, [np.arange(3) * 2])
+        >>> cache.get(key)
+        ([memmap([0, 2, 4])], None)
+        ```"""
+
+    def __init__(self, cache_dir, max_size=None, mmap_mode='c'):
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._mmap_mode = mmap_mode
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self):
+        """Directory where the entries are stored."""
+        return self._cache_dir
+
+    @property
+    def max_size(self):
+        """Maximum total size of the cache in bytes."""
+        return self._max_size
+
+    @property
+    def mmap_mode(self):
+        """Mode passed to `np.load`."""
+        return self._mmap_mode
+
+    @staticmethod
+    def make_key(*objs):
+        """Make a key out of objects. See `hash_objs`."""
+        return hash_objs(*objs)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def __contains__(self, key):
+        return os.path.isdir(self._entry_path(key))
+
+    def get(self, key):
+        """Get arrays and metadata stored under `key`.
+
+        Returns a tuple of a list of arrays and metadata, or None if there is no such entry.
+        Marks the entry as recently used."""
+        path = self._entry_path(key)
+        if not os.path.isdir(path):
+            return None
+        try:
+            with open(os.path.join(path, 'meta.pkl'), 'rb') as f:
+                n_arrays, meta = pickle.load(f)
+            arrays = [
+                np.load(os.path.join(path, f'arr_{i}.npy'), mmap_mode=self.mmap_mode)
+                for i in range(n_arrays)
+            ]
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            # Entry is incomplete or corrupted
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        os.utime(path)
+        return arrays, meta
+
+    def set(self, key, arrays, meta=None):
+        """Store arrays and picklable metadata under `key`.
+
+        The entry is written to a temporary directory first and then moved, such that
+        concurrent readers never see an incomplete entry. Returns whether the entry was stored."""
+        path = self._entry_path(key)
+        if os.path.isdir(path):
+            os.utime(path)
+            return True
+        try:
+            meta_bytes = pickle.dumps((len(arrays), meta))
+        except Exception:
+            return False
+        tmp_path = os.path.join(self.cache_dir, f'.tmp-{uuid.uuid4().hex}')
+        os.makedirs(tmp_path)
+        try:
+            for i, arr in enumerate(arrays):
+                np.save(os.path.join(tmp_path, f'arr_{i}.npy'), np.asarray(arr), allow_pickle=False)
+            with open(os.path.join(tmp_path, 'meta.pkl'), 'wb') as f:
+                f.write(meta_bytes)
+            os.rename(tmp_path, path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return os.path.isdir(path)
+        self.evict(keep=key)
+        return True
+
+    def entries(self):
+        """List of tuples `(key, last access time, size in bytes)`, least recently used first."""
+        out = []
+        for key in os.listdir(self.cache_dir):
+            path = self._entry_path(key)
+            if key.startswith('.') or not os.path.isdir(path):
+                continue
+            size = 0
+            for name in os.listdir(path):
+                size += os.path.getsize(os.path.join(path, name))
+            out.append((key, os.path.getmtime(path), size))
+        return sorted(out, key=lambda x: x[1])
+
+    def size(self):
+        """Total size of the cache in bytes."""
+        return sum([entry[2] for entry in self.entries()])
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the total size fits into `max_size`.
+
+        The entry under `keep` is never removed."""
+        if self.max_size is None:
+            return
+        entries = self.entries()
+        total_size = sum([entry[2] for entry in entries])
+        for key, _, size in entries:
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total_size -= size
+
+    def delete(self, key):
+        """Remove the entry under `key`."""
+        shutil.rmtree(self._entry_path(key), ignore_errors=True)
+
+    def clear(self):
+        """Remove all entries."""
+        for key in os.listdir(self.cache_dir):
+            path = self._entry_path(key)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)